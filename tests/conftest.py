@@ -0,0 +1,34 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import shutil
+import sys
+
+import pytest
+
+## Root of the repository
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+## Release models used by the tests
+RELEASE_DIR = os.path.join(REPO_DIR, "models", "adl", "release")
+
+if REPO_DIR not in sys.path:
+    sys.path.insert(0, REPO_DIR)
+
+
+@pytest.fixture
+def tools_copy(tmp_path):
+    """
+    Copies the tools folder, so that the generators writing inside it leave the
+    repository untouched.
+
+    Returns:
+        str: The folder holding the copy of the tools folder.
+    """
+    shutil.copytree(
+        os.path.join(REPO_DIR, "tools"),
+        os.path.join(tmp_path, "tools"),
+        ignore=shutil.ignore_patterns("__pycache__", "tests_intrinsics"),
+    )
+    return str(tmp_path)
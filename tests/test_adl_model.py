@@ -0,0 +1,95 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from conftest import RELEASE_DIR, REPO_DIR
+from tools import adl_model
+from tools.testing import parse
+
+sys.path.insert(0, os.path.join(REPO_DIR, "tools"))
+
+import adl_parser  # noqa: E402
+
+
+def _split_cores(adl_file, split_file):
+    # Moves the second half of the instructions and instruction fields to another
+    # <cores> element, nested below <systems>
+    tree = ET.parse(adl_file)
+    root = tree.getroot()
+    core = root.find("cores/core")
+    other_core = ET.SubElement(ET.SubElement(root.find("systems"), "cores"), "core", core.attrib)
+    for group in ("instrs", "instrfields"):
+        elements = list(core.find(group))
+        other_group = ET.SubElement(other_core, group)
+        for element in elements[len(elements) // 2:]:
+            core.find(group).remove(element)
+            other_group.append(element)
+    tree.write(split_file)
+
+
+@pytest.mark.parametrize("stream_threshold", ["0", "64"])
+@pytest.mark.parametrize("adl_name", ["rv32ic_release.adl.xml", "rv32ic_zilsd_zclsd_release.adl.xml"])
+def test_several_cores_are_merged(tmp_path, monkeypatch, adl_name, stream_threshold):
+    monkeypatch.setenv("TOOLS_ADL_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("TOOLS_ADL_STREAM_THRESHOLD", stream_threshold)
+    adl_file = os.path.join(RELEASE_DIR, adl_name)
+    split_file = str(tmp_path / adl_name)
+    _split_cores(adl_file, split_file)
+    assert len(ET.parse(split_file).getroot().findall(".//cores")) == 2
+    for view in (
+        adl_parser.parse_instructions_from_adl,
+        adl_parser.parse_instructions_aliases_from_adl,
+        adl_parser.get_instrfield_from_adl,
+        adl_parser.get_instrfield_offset,
+        adl_parser.get_alias_for_regs,
+    ):
+        assert view(split_file) == view(adl_file), view.__name__
+    split_model = parse.load_adl_model(split_file)
+    model = parse.load_adl_model(adl_file)
+    assert split_model.instructions == model.instructions
+    assert split_model.instrfields == model.instrfields
+    assert split_model.relocations == model.relocations
+
+
+@pytest.mark.parametrize("adl_name", ["rv32ic_release.adl.xml", "rv32ic_zilsd_zclsd_release.adl.xml"])
+def test_streamed_model_equals_parsed_model(monkeypatch, adl_name):
+    adl_file = os.path.join(RELEASE_DIR, adl_name)
+    monkeypatch.setenv("TOOLS_ADL_STREAM_THRESHOLD", "0")
+    assert adl_model.use_streaming(adl_file)
+    streamed = adl_model.read_model(adl_file)
+    monkeypatch.setenv("TOOLS_ADL_STREAM_THRESHOLD", "64")
+    assert not adl_model.use_streaming(adl_file)
+    parsed = adl_model.read_model(adl_file)
+    assert streamed == parsed
+    assert streamed.subtrees.keys() == parsed.subtrees.keys()
+    for tag, elements in parsed.subtrees.items():
+        assert [ET.tostring(e) for e in streamed.subtrees[tag]] == [ET.tostring(e) for e in elements], tag
+
+
+def test_streaming_removes_the_closed_element(tmp_path):
+    # Many siblings, so that iterparse attaches later ones to the parent before
+    # the end event of an earlier one is read
+    adl_file = tmp_path / "siblings.adl.xml"
+    siblings = "".join("<other>%d</other><instruction name='i%d'/>" % (i, i) for i in range(5000))
+    adl_file.write_text("<data><cores><core><instrs>%s</instrs></core></cores></data>" % siblings)
+    names = []
+    for elem, ancestors in adl_model.iter_subtrees(str(adl_file), ["instruction"]):
+        # Only the yielded subtree is left among the closed children of its parent
+        assert [child.attrib.get("name", child.text) for child in ancestors[-1]][:1] == [elem.attrib["name"]]
+        names.append(elem.attrib["name"])
+    assert names == ["i%d" % i for i in range(5000)]
+
+
+def test_missing_cores_is_rejected():
+    with pytest.raises(ValueError, match="Missing <cores>"):
+        adl_model.build_model(ET.fromstring("<data><systems/></data>"))
+
+
+def test_single_cores_is_parsed():
+    root = ET.fromstring("<data><cores><core><sched-table name='a'/></core></cores></data>")
+    assert [table.attrib["name"] for table in adl_model.build_model(root).subtrees["sched-table"]] == ["a"]
@@ -0,0 +1,58 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import shutil
+import subprocess
+import sys
+
+from conftest import RELEASE_DIR, REPO_DIR
+from tools import config
+
+
+def _copy_config(tmp_path):
+    for name in ("config.txt", "llvm_config.txt"):
+        shutil.copy(os.path.join(REPO_DIR, "tools", name), tmp_path)
+    return os.path.join(tmp_path, "config.txt"), os.path.join(tmp_path, "llvm_config.txt")
+
+
+def test_rewrite_with_the_same_size_and_time_is_parsed_again(tmp_path):
+    config_file, llvm_file = _copy_config(tmp_path)
+    assert config.load_config(config_file, llvm_file)["ADLName"].endswith("rv32ic_release.adl.xml")
+    stat = os.stat(config_file)
+    with open(config_file) as f:
+        contents = f.read()
+    with open(config_file, "w") as f:
+        f.write(contents.replace("rv32ic_release.adl.xml", "rv64ic_release.adl.xml"))
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert os.stat(config_file).st_size == stat.st_size
+    assert config.load_config(config_file, llvm_file)["ADLName"].endswith("rv64ic_release.adl.xml")
+
+
+def test_override_replaces_values_inside_the_context(tmp_path):
+    config_file, llvm_file = _copy_config(tmp_path)
+    adl_name = config.load_config(config_file, llvm_file)["ADLName"]
+    with config.override(ADLName="other.adl.xml"):
+        assert config.load_config(config_file, llvm_file)["ADLName"] == "other.adl.xml"
+        assert config.config_environment(config_file, llvm_file)["ADLName"] == "other.adl.xml"
+    assert config.load_config(config_file, llvm_file)["ADLName"] == adl_name
+
+
+def test_run_leaves_config_txt_untouched(tools_copy):
+    config_file = os.path.join(tools_copy, "tools", "config.txt")
+    with open(config_file, "rb") as f:
+        contents = f.read()
+    subprocess.run(
+        [
+            sys.executable,
+            os.path.join(tools_copy, "tools", "make_td.py"),
+            os.path.join(RELEASE_DIR, "rv32ic_zilsd_zclsd_release.adl.xml"),
+            "--output=" + os.path.join(tools_copy, "out"),
+            "--no-cache",
+        ],
+        cwd=tools_copy,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    with open(config_file, "rb") as f:
+        assert f.read() == contents
@@ -0,0 +1,80 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+
+import filecmp
+import itertools
+import os
+import subprocess
+import sys
+
+from conftest import RELEASE_DIR, REPO_DIR
+from tools.testing.encoding import coverage
+
+
+def test_exhaustive_is_the_full_product_within_the_budget():
+    assert list(coverage.exhaustive([2, 3], 6)) == list(itertools.product(range(2), range(3)))
+
+
+def test_exhaustive_is_capped_by_the_budget():
+    value_counts = [32, 32, 16]
+    cases = list(coverage.exhaustive(value_counts, 100))
+    assert len(cases) == 100
+    assert len(set(cases)) == 100
+    for position, count in enumerate(value_counts):
+        values = {case[position] for case in cases}
+        assert values <= set(range(count))
+        assert len(values) > 1
+
+
+def test_pairwise_covers_every_pair():
+    value_counts = [3, 4, 2, 5]
+    cases = list(coverage.pairwise(value_counts))
+    for first, second in itertools.combinations(range(len(value_counts)), 2):
+        assert {(case[first], case[second]) for case in cases} == set(
+            itertools.product(range(value_counts[first]), range(value_counts[second]))
+        )
+
+
+def test_random_cases_depend_only_on_the_seed():
+    value_counts = [32, 4096, 8]
+    assert list(coverage.random_cases(value_counts, 50, "0:add")) == list(
+        coverage.random_cases(value_counts, 50, "0:add")
+    )
+    assert list(coverage.random_cases(value_counts, 50, "0:add")) != list(
+        coverage.random_cases(value_counts, 50, "1:add")
+    )
+
+
+def _make_test(output_dir, *arguments):
+    return subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "tools.testing.encoding.make_test",
+            os.path.join(RELEASE_DIR, "rv32ic_release.adl.xml"),
+            "-o",
+            output_dir,
+            "--no-cache",
+            *arguments,
+        ],
+        cwd=REPO_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    ).returncode
+
+
+def test_seeded_random_coverage_is_reproducible(tmp_path):
+    first, second = str(tmp_path / "first"), str(tmp_path / "second")
+    assert _make_test(first, "--coverage", "random:20", "--seed", "7") == 0
+    assert _make_test(second, "--coverage", "random:20", "--seed", "7", "-j", "2") == 0
+    comparison = filecmp.dircmp(first, second)
+    assert comparison.left_list == comparison.right_list
+    for root, _, file_names in os.walk(first):
+        for file_name in file_names:
+            path = os.path.join(root, file_name)
+            other = os.path.join(second, os.path.relpath(path, first))
+            assert filecmp.cmp(path, other, shallow=False), path
+
+
+def test_coverage_budget_must_be_positive(tmp_path):
+    assert _make_test(str(tmp_path), "--coverage", "exhaustive", "--coverage-budget", "0") == 2
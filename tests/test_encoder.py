@@ -0,0 +1,152 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import random
+
+import numpy as np
+import pytest
+
+from conftest import RELEASE_DIR
+from tools.benchmark import encoder as encoder_benchmark
+from tools.testing import parse
+from tools.testing import utils
+from tools.testing.encoding import write_refs
+
+## Number of random test cases of each encoding for encode_batch()
+BATCH_SIZE = 2000
+
+## Operand kinds each release model must exercise
+MODELS = [
+    ("rv32ic_release.adl.xml", {"negative", "out_of_range", "enumerated"}),
+    ("rv32ic_zilsd_zclsd_release.adl.xml", {"negative", "out_of_range", "enumerated", "shift"}),
+]
+
+
+def _load(adl_name):
+    adl_model = parse.load_adl_model(os.path.join(RELEASE_DIR, adl_name))
+    instruction_map = {instruction.name: instruction for instruction in adl_model.instructions}
+    instrfield_map = {field.name: field for field in adl_model.instrfields}
+    return adl_model, instruction_map, instrfield_map
+
+
+def _immediate_edge_cases(instruction, instrfield_map):
+    # Every immediate set to values below, above and between the values of the
+    # field, the other operands keeping their first value
+    sweep = encoder_benchmark.operand_test_cases(instruction, instrfield_map, 0, random.Random(0))
+    if not sweep:
+        return []
+    defaults = sweep[0]
+    test_cases = []
+    for operand_name in defaults:
+        instrfield = instrfield_map.get(operand_name)
+        if instrfield is None or instrfield.type != "imm" or instrfield.enumerated:
+            continue
+        shift = instrfield.shift or 0
+        limit = 1 << (instrfield.width + shift)
+        for value in (-1, -limit, -limit - (1 << shift), limit, limit + (1 << shift), (1 << shift) - 1, (1 << 64) - 1):
+            test_case = defaults.copy()
+            test_case[operand_name] = hex(value)
+            test_cases.append(test_case)
+    return test_cases
+
+
+def _kinds(operand_values, instrfield_map):
+    kinds = set()
+    for operand_name, value in operand_values.items():
+        instrfield = instrfield_map.get(operand_name)
+        if instrfield is None:
+            continue
+        if instrfield.enumerated:
+            kinds.add("enumerated")
+            continue
+        number = int(value, 16)
+        if number < 0:
+            kinds.add("negative")
+        if number >= 1 << (instrfield.width + (instrfield.shift or 0)):
+            kinds.add("out_of_range")
+        if instrfield.shift:
+            kinds.add("shift")
+    return kinds
+
+
+@pytest.mark.parametrize("adl_name, expected_kinds", MODELS)
+def test_encode_matches_reference(adl_name, expected_kinds):
+    adl_model, instruction_map, instrfield_map = _load(adl_name)
+    rng = random.Random(0)
+    covered = set()
+    for instruction in adl_model.instructions:
+        encodings = encoder_benchmark.instruction_encodings(instruction, instruction_map)
+        encoders = write_refs.compile_encoders(instruction, instruction_map, instrfield_map)
+        test_cases = encoder_benchmark.operand_test_cases(instruction, instrfield_map, 16, rng)
+        test_cases += _immediate_edge_cases(instruction, instrfield_map)
+        for operand_values in test_cases:
+            expected = [
+                utils.calculate_instruction_reference(fields, instrfield_map, operand_values, is_alias=is_alias)
+                for fields, is_alias in encodings
+            ]
+            actual = [encoder.encode(operand_values) for encoder in encoders]
+            assert actual == expected, (instruction.name, operand_values)
+            covered |= _kinds(operand_values, instrfield_map)
+    assert covered >= expected_kinds
+
+
+def _signed_edge_arrays(encoder, operand_fields):
+    # Negative, out-of-range and misaligned values of every immediate, as int64
+    # arrays, and the matching test cases of encode(); enumerated operands keep
+    # their first option
+    arrays = {}
+    for operand_key, encodings in encoder.enumerated_numbers:
+        arrays[operand_key] = np.array([min(encodings, default=0)], dtype=np.int64)
+    for operand_key, _ in encoder.immediates:
+        instrfield = operand_fields[operand_key]
+        shift = instrfield.shift or 0
+        limit = 1 << (instrfield.width + shift)
+        arrays[operand_key] = np.array([-1, -limit, limit, (1 << shift) - 1, limit + (1 << shift)], dtype=np.int64)
+    count = max((len(values) for values in arrays.values()), default=1)
+    arrays = {operand_key: np.resize(values, count) for operand_key, values in arrays.items()}
+    test_cases = []
+    for index in range(count):
+        test_case = {}
+        for operand_key, values in arrays.items():
+            instrfield = operand_fields[operand_key]
+            if instrfield.enumerated:
+                options = {int(enum.name): enum.value for enum in reversed(instrfield.enumerated)}
+                test_case[operand_key] = options.get(int(values[index]))
+            else:
+                test_case[operand_key] = hex(int(values[index]))
+        test_cases.append(test_case)
+    return arrays, test_cases
+
+
+@pytest.mark.parametrize("adl_name, expected_kinds", MODELS)
+def test_encode_batch_matches_encode(adl_name, expected_kinds):
+    adl_model, instruction_map, instrfield_map = _load(adl_name)
+    rng = np.random.default_rng(0)
+    covered = set()
+    for instruction in adl_model.instructions:
+        encodings = encoder_benchmark.instruction_encodings(instruction, instruction_map)
+        encoders = write_refs.compile_encoders(instruction, instruction_map, instrfield_map)
+        for (fields, is_alias), encoder in zip(encodings, encoders):
+            operand_fields = {
+                (field_name if not is_alias else field_value): instrfield_map[field_name]
+                for field_name, field_value in fields.items()
+                if field_name in instrfield_map
+            }
+            arrays, test_cases = encoder_benchmark.batch_test_cases(fields, is_alias, instrfield_map, BATCH_SIZE, rng)
+            expected = [encoder.encode(operand_values) for operand_values in test_cases]
+            # Without operands, encode_batch() returns a single value
+            actual = np.broadcast_to(encoder.encode_batch(arrays), (BATCH_SIZE,)).tolist()
+            assert actual == expected, instruction.name
+
+            arrays, test_cases = _signed_edge_arrays(encoder, operand_fields)
+            expected = [encoder.encode(operand_values) for operand_values in test_cases]
+            actual = np.broadcast_to(encoder.encode_batch(arrays), (len(test_cases),)).tolist()
+            assert actual == expected, instruction.name
+
+            for operand_key, ranges in encoder.immediates:
+                if len(ranges) > 1:
+                    covered.add("split")
+                if operand_fields[operand_key].shift:
+                    covered.add("shift")
+    assert covered >= {"split"} | (expected_kinds & {"shift"})
@@ -0,0 +1,94 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+
+import copy
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+from conftest import RELEASE_DIR, REPO_DIR
+
+sys.path.insert(0, os.path.join(REPO_DIR, "tools"))
+
+import adl_parser  # noqa: E402
+import config  # noqa: E402
+import emitter  # noqa: E402
+import files  # noqa: E402
+
+## Configuration entry of imm_u in llvm_config.txt
+IMM_U_CONFIG = 'imm_u = {disableImmLeaf=True, AliasImmClass=uimm20_lui, ParserMatchClass=UImmAsmOperand<20, "LUI">}\n'
+
+## Suffixes of the copies of imm_u
+COPIES = ("a", "b", "c")
+
+
+def _copy_imm_u(adl_file, llvm_file, tmp_path):
+    # Adds three copies of imm_u, each used by a copy of lui, whose configuration
+    # entries only differ by AliasImmClass
+    tree = ET.parse(adl_file)
+    core = tree.getroot().find("cores/core")
+    instrfields = core.find("instrfields")
+    instrs = core.find("instrs")
+    imm_u = next(elem for elem in instrfields if elem.attrib["name"] == "imm_u")
+    lui = next(elem for elem in instrs if elem.attrib["name"] == "lui")
+    for suffix in COPIES:
+        field = copy.deepcopy(imm_u)
+        field.set("name", "imm_u_" + suffix)
+        instrfields.append(field)
+        instruction = copy.deepcopy(lui)
+        instruction.set("name", "lui_" + suffix)
+        for elem in instruction.iter():
+            if elem.attrib.get("name") == "imm_u":
+                elem.set("name", "imm_u_" + suffix)
+            if elem.text:
+                elem.text = elem.text.replace("imm_u", "imm_u_" + suffix).replace("lui ", "lui_" + suffix + " ")
+        instrs.append(instruction)
+    model_file = str(tmp_path / "imm_u_copies.adl.xml")
+    tree.write(model_file)
+
+    with open(llvm_file) as f:
+        llvm_config = f.read()
+    assert IMM_U_CONFIG in llvm_config
+    copies = "".join(
+        IMM_U_CONFIG.replace("imm_u =", "imm_u_" + suffix + " =").replace("uimm20_lui", "uimm20_lui_" + suffix)
+        for suffix in COPIES
+    )
+    llvm_config = llvm_config.replace(IMM_U_CONFIG, IMM_U_CONFIG + copies)
+    llvm_config = llvm_config.replace(" imm_u,", " imm_u, " + ", ".join("imm_u_" + suffix for suffix in COPIES) + ",", 1)
+    config_file = str(tmp_path / "llvm_config.txt")
+    with open(config_file, "w") as f:
+        f.write(llvm_config)
+    return model_file, config_file
+
+
+def test_identical_immediates_are_merged(tmp_path, monkeypatch):
+    monkeypatch.setenv("TOOLS_ADL_CACHE_DIR", str(tmp_path / "cache"))
+    model_file, llvm_file = _copy_imm_u(os.path.join(RELEASE_DIR, "rv32ic_release.adl.xml"), files.llvm_config, tmp_path)
+    monkeypatch.setattr(files, "llvm_config", llvm_file)
+    generation_context = files.GenerationContext()
+    generation_context.instrfield_classes = {"uimm20_auipc": ["imm_u_pc"], "uimm20_lui": ["imm_u"]}
+    for suffix in COPIES:
+        generation_context.instrfield_classes["uimm20_lui_" + suffix] = ["imm_u_" + suffix]
+    operands_file = str(tmp_path / "RISCVOperands_gen.td")
+    operands_file16 = str(tmp_path / "RISCVOperands16_gen.td")
+
+    with config.override(ADLName=model_file):
+        merged = files.write_imms_classes(
+            operands_file,
+            operands_file16,
+            generation_context.instrfield_classes,
+            adl_parser.parse_instructions_from_adl(model_file)[0],
+            generation_context=generation_context,
+        )
+    emitter.flush()
+    emitter.take_flushed()
+
+    assert merged == 3
+    with open(operands_file) as f:
+        lines = f.read().splitlines()
+    assert [line for line in lines if line.startswith("def uimm20_lui")] == ["def uimm20_lui : Operand<XLenVT> {"]
+    assert [line for line in lines if line.startswith("defvar")] == [
+        "defvar uimm20_lui_" + suffix + " = uimm20_lui;" for suffix in COPIES
+    ]
+    # Only differs from uimm20_lui by its parser match class
+    assert "def uimm20_auipc : Operand<XLenVT> {" in lines
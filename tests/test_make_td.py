@@ -0,0 +1,36 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+
+import json
+import os
+import subprocess
+import sys
+
+from conftest import RELEASE_DIR
+
+
+def test_options_take_their_value_as_the_next_argument(tools_copy):
+    # A folder name containing option names must not enable them
+    output_dir = os.path.join(tools_copy, "--force--no-sail")
+    profile_json = os.path.join(tools_copy, "profile.json")
+    subprocess.run(
+        [
+            sys.executable,
+            os.path.join(tools_copy, "tools", "make_td.py"),
+            os.path.join(RELEASE_DIR, "rv32ic_release.adl.xml"),
+            "--output",
+            output_dir,
+            "--jobs",
+            "2",
+            "--profile-json",
+            profile_json,
+            "--no-cache",
+        ],
+        cwd=tools_copy,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    with open(profile_json) as f:
+        stages = [stage["name"] for stage in json.load(f)["stages"]]
+    assert "sail" in stages
+    assert os.path.isfile(os.path.join(output_dir, "TD", "RISCVRegisterInfo_gen.td"))
@@ -0,0 +1,38 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+
+import json
+import os
+import subprocess
+import sys
+
+from conftest import RELEASE_DIR
+
+
+def _make_td(workspace, cache_dir, profile_json):
+    environment = dict(os.environ, TOOLS_ADL_CACHE_DIR=cache_dir)
+    subprocess.run(
+        [
+            sys.executable,
+            os.path.join(workspace, "tools", "make_td.py"),
+            os.path.join(RELEASE_DIR, "rv32ic_release.adl.xml"),
+            "--output=" + os.path.join(workspace, "out"),
+            "--force",
+            "--profile-json=" + profile_json,
+        ],
+        cwd=workspace,
+        env=environment,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    with open(profile_json) as f:
+        return json.load(f)
+
+
+def test_warm_run_does_not_parse_the_adl_file(tools_copy):
+    cache_dir = os.path.join(tools_copy, "cache")
+    cold = _make_td(tools_copy, cache_dir, os.path.join(tools_copy, "cold.json"))
+    assert cold["total"]["adl_parses"] == 1
+    warm = _make_td(tools_copy, cache_dir, os.path.join(tools_copy, "warm.json"))
+    assert warm["total"]["adl_parses"] == 0
+    assert [stage["name"] for stage in warm["stages"] if stage["adl_parses"]] == []
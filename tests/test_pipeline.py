@@ -0,0 +1,73 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+
+import filecmp
+import os
+import subprocess
+import sys
+
+from conftest import RELEASE_DIR
+
+
+def _make_td(workspace, adl_name, output_dir):
+    subprocess.run(
+        [
+            sys.executable,
+            os.path.join(workspace, "tools", "make_td.py"),
+            os.path.join(RELEASE_DIR, adl_name),
+            "--output=" + output_dir,
+        ],
+        cwd=workspace,
+        env=dict(os.environ, TOOLS_ADL_CACHE_DIR=os.path.join(workspace, "cache")),
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    generated = dict()
+    for root, dir_names, file_names in os.walk(output_dir):
+        dir_names[:] = [name for name in dir_names if name != ".stamps"]
+        for file_name in file_names:
+            path = os.path.join(root, file_name)
+            generated[os.path.relpath(path, output_dir)] = path
+    return generated
+
+
+def test_other_model_replaces_the_files_of_the_previous_run(tools_copy):
+    expected = _make_td(tools_copy, "rv32ic_release.adl.xml", os.path.join(tools_copy, "expected"))
+    output_dir = os.path.join(tools_copy, "out")
+    previous = _make_td(tools_copy, "rv32ic_zilsd_zclsd_release.adl.xml", output_dir)
+    times = {name: os.stat(path).st_mtime_ns for name, path in previous.items()}
+    unchanged = [
+        name
+        for name, path in previous.items()
+        if name in expected and filecmp.cmp(path, expected[name], shallow=False)
+    ]
+    assert unchanged
+    generated = _make_td(tools_copy, "rv32ic_release.adl.xml", output_dir)
+    assert sorted(generated) == sorted(expected)
+    for name, path in generated.items():
+        assert filecmp.cmp(path, expected[name], shallow=False), name
+    assert [name for name in unchanged if os.stat(generated[name]).st_mtime_ns != times[name]] == []
+
+
+def _test_files(workspace):
+    contents = dict()
+    for folder in (
+        "testing/intrinsics/tests_intrinsics",
+        "testing/scheduling/imt/tests",
+        "testing/scheduling/imt/tests_dependency",
+    ):
+        for root, _, file_names in os.walk(os.path.join(workspace, "tools", folder)):
+            for file_name in file_names:
+                path = os.path.join(root, file_name)
+                with open(path, "rb") as f:
+                    contents[os.path.relpath(path, workspace)] = f.read()
+    return contents
+
+
+def test_other_model_replaces_the_generated_tests(tools_copy):
+    _make_td(tools_copy, "rv32ic_release.adl.xml", os.path.join(tools_copy, "out"))
+    expected = _test_files(tools_copy)
+    _make_td(tools_copy, "rv32ic_zilsd_zclsd_release.adl.xml", os.path.join(tools_copy, "out"))
+    assert set(_test_files(tools_copy)) > set(expected)
+    _make_td(tools_copy, "rv32ic_release.adl.xml", os.path.join(tools_copy, "out"))
+    assert _test_files(tools_copy) == expected
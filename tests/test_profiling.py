@@ -0,0 +1,20 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import sys
+
+from conftest import REPO_DIR
+
+sys.path.insert(0, os.path.join(REPO_DIR, "tools"))
+
+import profiling  # noqa: E402
+
+
+def test_report_columns_fit_the_longest_stage_name():
+    profiler = profiling.Profiler()
+    profiler.add(profiling.StageProfile("a_stage_name_longer_than_the_column", skipped=True))
+    profiler.add(profiling.StageProfile("short", wall=1.0))
+    lines = profiler.report().splitlines()
+    assert lines[2].startswith("a_stage_name_longer_than_the_column (skipped) ")
+    assert len({len(line) for line in lines}) == 1
@@ -0,0 +1,35 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import sys
+
+from conftest import REPO_DIR
+
+sys.path.insert(0, os.path.join(REPO_DIR, "tools"))
+
+import adl_parser  # noqa: E402
+
+
+def test_every_listed_name_is_indexed_in_order():
+    sched_tables = {
+        "core": {
+            "alu": {"instruction_list": ["add", "ADD", "add"], "latency": 1},
+            "load": {"instruction_list": ["lw", "Add"]},
+        },
+        "other": {"alu": {"instruction_list": ["add"], "latency": 2}},
+    }
+    sched_index = adl_parser._sched_index(sched_tables)
+    assert [
+        (entry["sched_table"], entry["sched_class"], entry["instruction"])
+        for entry in sched_index["add"]
+    ] == [
+        ("core", "alu", "add"),
+        ("core", "alu", "ADD"),
+        ("core", "alu", "add"),
+        ("core", "load", "Add"),
+        ("other", "alu", "add"),
+    ]
+    assert sched_index["add"][-1]["latency"] == 2
+    assert "latency" not in sched_index["add"][3]
+    assert sorted(sched_index) == ["add", "lw"]
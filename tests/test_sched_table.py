@@ -0,0 +1,10 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+
+from tools.benchmark import sched_table
+
+
+def test_sched_tables_scale_linearly():
+    sizes = [625, 1250, 2500, 5000]
+    results = {size: min(sched_table.parse_sched_tables(size) for _ in range(5)) for size in sizes}
+    assert sched_table.fitted_exponent(results) < sched_table.MAX_EXPONENT
@@ -0,0 +1,883 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+## @package adl_model
+#
+# Single-pass builder of the parsed model of an adl.xml file
+#
+# The instructions, instruction fields and relocations of the document are parsed
+# once into the dataclasses below. The test generators use these objects directly
+# and the TD generator derives its nested dictionaries from them on first use (see
+# adl_parser), so both consumers share one traversal of the document and one entry
+# of the parsed model cache. The register files and scheduling tables, which only
+# the TD generator needs, are kept as detached element subtrees.
+#
+# Large documents are read with a streaming reader built on ET.iterparse instead
+# of ET.parse. The subtrees the model is built from are handed over as soon as
+# their closing tag is read, then cleared and detached from their parent together
+# with every other element which is closed outside such a subtree.
+#
+# Peak memory bound: at any time the element tree held in memory by the streaming
+# reader consists of the currently open ancestors and the contents of the single
+# subtree being read, so it is bounded by the size of the largest streamed subtree
+# (a few KB for an instruction) plus the depth of the document, independently of
+# the number of instructions. The 16 KB input buffer of iterparse and the parsed
+# model come on top of it.
+#
+# This module only depends on the standard library, so that it can be imported
+# both by the TD generator scripts and by the tools.testing package.
+#
+# Environment variables:
+#   TOOLS_ADL_STREAM_THRESHOLD - ADL files of at least this size, in MB, are read
+#                                with the streaming reader (default 64, 0 streams
+#                                every file)
+import copy
+import dataclasses
+import os
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+## Default size, in MB, from which ADL files are streamed
+DEFAULT_STREAM_THRESHOLD = 64
+
+## Subtrees parsed into dataclasses
+PARSED_TAGS = ["instruction", "instrfield", "reloc", "asm_config", "bit_endianness"]
+
+## Subtrees kept as elements inside AdlModel.subtrees
+KEPT_TAGS = ["regfile", "sched-table"]
+
+## Number of ADL documents parsed by the current process, reported by --profile
+parse_count = 0
+
+
+### Data Classes
+
+
+@dataclass
+class EnumOption:
+    """Represents an enumerated option with a name-value pair."""
+
+    name: str
+    value: str
+
+
+@dataclass
+class InstrField:
+    """Represents an instruction field with its encoding properties and constraints."""
+
+    name: str
+    ranges: List[List[int]] = field(default_factory=list)
+    width: Optional[int] = None
+    size: Optional[int] = None
+    shift: Optional[int] = None
+    offset: Optional[int] = None
+    sign_extension: Optional[int] = None
+    mask: Optional[str] = None
+    enumerated: List[EnumOption] = field(default_factory=list)
+    addr: Optional[str] = None
+    display: Optional[str] = None
+    type: Optional[str] = None
+    ref: Optional[str] = None
+    signed: Optional[str] = None
+    reloc: List[str] = field(default_factory=list)
+    excluded_values: List[EnumOption] = field(default_factory=list)
+    # Raw text of each property element, in document order
+    properties: Dict[str, Optional[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "InstrField":
+        """Rebuilds an instruction field from the output of dataclasses.asdict."""
+        record = dict(record)
+        record["enumerated"] = [EnumOption(**o) for o in record["enumerated"]]
+        record["excluded_values"] = [
+            EnumOption(**o) for o in record["excluded_values"]
+        ]
+        return cls(**record)
+
+
+@dataclass
+class Alias:
+    """Represents an alias mapping for an instruction."""
+
+    name: str
+    fields: Dict[str, Optional[str]]
+    # Nested representation of the <alias> element
+    definition: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Instruction:
+    """Represents a machine instruction with metadata and structure."""
+
+    name: str
+    width: int
+    syntax: str
+    dsyntax: str
+    attributes: List[str]
+    fields: Optional[Dict[str, Optional[str]]]
+    inputs: List[str]
+    outputs: List[str]
+    aliases: Optional[List[Alias]] = field(default_factory=list)
+    excluded_values: Optional[Dict[str, Optional[str]]] = None
+    intrinsic_args: List[str] = field(default_factory=list)
+    intrinsic_type: Dict[str, List[str]] = field(default_factory=dict)
+    # Raw text of each property element, in document order
+    properties: Dict[str, Optional[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "Instruction":
+        """Rebuilds an instruction from the output of dataclasses.asdict."""
+        record = dict(record)
+        if record["aliases"] is not None:
+            record["aliases"] = [Alias(**a) for a in record["aliases"]]
+        return cls(**record)
+
+
+@dataclass
+class Relocation:
+    """Represents a relocation with its properties and encoding details."""
+
+    name: str
+    abbrev: str
+    field_width: int
+    pcrel: str
+    value: int
+    right_shift: int
+    action: str
+    directive: str
+    dependency: List[str] = field(default_factory=list)
+    # Raw text of each property element, in document order
+    properties: Dict[str, Optional[str]] = field(default_factory=dict)
+
+
+@dataclass
+class AdlModel:
+    """Represents the information parsed from an ADL file."""
+
+    instructions: List[Instruction]
+    instrfields: List[InstrField]
+    relocations: List[Relocation]
+    asm_config: Optional[Tuple[str, str, str]] = None
+    asm_config_error: Optional[str] = None
+    bit_endianness: Optional[str] = None
+    # Detached <regfile> and <sched-table> elements, see KEPT_TAGS
+    subtrees: Dict[str, List[ET.Element]] = field(default_factory=dict, compare=False)
+
+    def asm_config_info(self) -> Tuple[str, str, str]:
+        """
+        Returns the architecture, attributes and mattrib strings of the <asm_config> element.
+
+        Raises:
+            ValueError: If the <asm_config> element or one of its sub-elements is missing.
+        """
+        if self.asm_config is None:
+            raise ValueError(self.asm_config_error)
+        return self.asm_config
+
+    def to_record(self) -> Dict[str, Any]:
+        """
+        Converts the model to built-in types for the parsed model cache.
+
+        The dataclasses of this module are pickled under the name of the module,
+        which is not the same for the TD generator scripts (adl_model) and for the
+        tools.testing package (tools.adl_model), so they are not stored as such.
+
+        Returns:
+            dict: The fields of the model, see from_record.
+        """
+        return dataclasses.asdict(self)
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "AdlModel":
+        """
+        Rebuilds a model from the output of to_record.
+
+        Args:
+            record: The fields of the model
+
+        Returns:
+            AdlModel: The rebuilt model
+        """
+        record = dict(record)
+        record["instructions"] = [
+            Instruction.from_record(r) for r in record["instructions"]
+        ]
+        record["instrfields"] = [InstrField.from_record(r) for r in record["instrfields"]]
+        record["relocations"] = [Relocation(**r) for r in record["relocations"]]
+        return cls(**record)
+
+
+### Streaming Reader
+
+
+def stream_threshold() -> int:
+    """
+    Returns the size from which ADL files are read with the streaming reader.
+
+    Returns:
+        int: The threshold in bytes, taken from TOOLS_ADL_STREAM_THRESHOLD (in MB)
+            or DEFAULT_STREAM_THRESHOLD.
+    """
+    try:
+        threshold = int(
+            os.environ.get("TOOLS_ADL_STREAM_THRESHOLD", DEFAULT_STREAM_THRESHOLD)
+        )
+    except ValueError:
+        threshold = DEFAULT_STREAM_THRESHOLD
+    return threshold * 1024 * 1024
+
+
+def use_streaming(adl_file: str) -> bool:
+    """
+    Checks whether an ADL file should be read with the streaming reader.
+
+    Args:
+        adl_file (str): The ADL file to read.
+
+    Returns:
+        bool: True if the file is at least as large as the stream threshold.
+
+    Raises:
+        FileNotFoundError: If the ADL file cannot be found.
+    """
+    return os.path.getsize(adl_file) >= stream_threshold()
+
+
+def iter_subtrees(adl_file: str, tags):
+    """
+    Reads an ADL file incrementally and yields the subtrees with the given tags.
+
+    A subtree is yielded when its closing tag is read, so it is complete, and it
+    is cleared as soon as the caller asks for the next one. Subtrees nested inside
+    another yielded subtree are not yielded on their own, they are part of the
+    enclosing one.
+
+    Args:
+        adl_file (str): The ADL file to read.
+        tags (Iterable[str]): The tags of the subtrees to yield.
+
+    Yields:
+        tuple[ET.Element, list[ET.Element]]: A complete subtree and its open
+            ancestors, starting with the root element. The ancestors only keep the
+            children which are still open.
+
+    Raises:
+        FileNotFoundError: If the ADL file cannot be found.
+        ET.ParseError: If the XML file cannot be parsed.
+    """
+    tags = set(tags)
+    ancestors = list()
+    depth = 0
+    for event, elem in ET.iterparse(adl_file, events=("start", "end")):
+        if event == "start":
+            ancestors.append(elem)
+            if elem.tag in tags:
+                depth += 1
+            continue
+        ancestors.pop()
+        if elem.tag in tags:
+            depth -= 1
+            if depth == 0:
+                yield elem, ancestors
+                elem.clear()
+        if depth == 0 and ancestors:
+            # iterparse reads ahead, so later siblings may already be attached to
+            # the parent: remove the closed element itself, not the last child
+            ancestors[-1].remove(elem)
+
+
+def walk_subtrees(elem: ET.Element, tags, ancestors=None):
+    """
+    Yields the subtrees with the given tags of an element tree already in memory.
+
+    The subtrees and their ancestors are the same as the ones yielded by
+    iter_subtrees for the document of the tree, in the same order.
+
+    Args:
+        elem (ET.Element): The root of the tree.
+        tags (Iterable[str]): The tags of the subtrees to yield.
+        ancestors (list | None): Used by the recursion.
+
+    Yields:
+        tuple[ET.Element, list[ET.Element]]: A subtree and its ancestors, starting
+            with the root element.
+    """
+    if ancestors is None:
+        ancestors = [elem]
+    for child in elem:
+        if child.tag in tags:
+            yield child, ancestors
+        else:
+            ancestors.append(child)
+            yield from walk_subtrees(child, tags, ancestors)
+            ancestors.pop()
+
+
+### Element Parsers
+
+
+def _properties(elem: ET.Element) -> Dict[str, Optional[str]]:
+    """
+    Collects the raw text of the property elements of an element.
+
+    Args:
+        elem: An <instruction>, <instrfield> or <reloc> element
+
+    Returns:
+        Dict[str, Optional[str]]: The text of the last child of each child element,
+            indexed by the tag of the child element, in document order
+    """
+    properties = {}
+    for child in elem:
+        for value_elem in child:
+            properties[child.tag] = value_elem.text
+    return properties
+
+
+def _nested_dict(elem: ET.Element) -> Dict[str, Any]:
+    """
+    Converts an element to nested dictionaries.
+
+    Args:
+        elem: The element to convert
+
+    Returns:
+        Dict[str, Any]: The stripped text of each leaf child and the list of the
+            converted non-leaf children, indexed by their tag
+    """
+    nested = {}
+    for child in elem:
+        if len(child) == 0:
+            nested[child.tag] = child.text.strip() if child.text else ""
+        else:
+            nested.setdefault(child.tag, []).append(_nested_dict(child))
+    return nested
+
+
+def bit_endianness(cores: ET.Element) -> str:
+    """
+    Extract bit endianness configuration from the cores element.
+
+    Args:
+        cores: The <cores> XML element
+
+    Returns:
+        str: Endianness value ("little" or "big")
+    """
+    for bit_endianness in cores.iter("bit_endianness"):
+        endianness = bit_endianness.find("str").text
+
+    return endianness
+
+
+def asm_config_info(cores: ET.Element) -> tuple[str, str, str]:
+    """
+    Extracts architecture configuration information from the <cores> XML element.
+
+    Iterates through all <asm_config> elements under the given <cores> element
+    and retrieves the text content of the <arch>, <attributes>, and <mattrib> sub-elements.
+
+    Args:
+        cores (xml.etree.ElementTree.Element): The <cores> element containing <asm_config> children.
+
+    Returns:
+        tuple[str, str, str]: A tuple containing the architecture, attributes, and mattrib strings.
+
+    Raises:
+        ValueError: If any of the required sub-elements (<arch>, <attributes>, <mattrib>) are missing,
+                    or if no <asm_config> element is found under <cores>.
+    """
+    for asm_config in cores.iter("asm_config"):
+        architecture = asm_config.find("arch/str").text
+        attributes = asm_config.find("attributes/str").text
+        mattrib = asm_config.find("mattrib/str").text
+
+        if None in (architecture, attributes, mattrib):
+            raise ValueError(
+                "Missing one of <arch>, <attributes>, or <mattrib> elements in <asm_config>"
+            )
+
+        return architecture, attributes, mattrib
+
+    raise ValueError("No <asm_config> element found under <cores>")
+
+
+def parse_aliases(aliases_elem: ET.Element) -> List[Alias]:
+    """
+    Parse alias elements from an XML aliases container.
+
+    Args:
+        aliases_elem: XML element containing alias definitions
+
+    Returns:
+        List[Alias]: List of parsed alias objects
+    """
+    aliases = []
+
+    for alias_elem in aliases_elem.findall("alias"):
+        alias_name = alias_elem.get("name")
+        fields = {}
+
+        # Iterate over all descendants of <alias>
+        for element in alias_elem.iter():
+            field_elem = element.find("field/str")
+            value_elem = element.find("value/int")
+            if value_elem is None:
+                value_elem = element.find("value/str")
+
+            if field_elem is not None and field_elem.text:
+                field = field_elem.text.strip()
+                value = (
+                    value_elem.text.strip()
+                    if value_elem is not None and value_elem.text
+                    else None
+                )
+                fields[field] = value
+
+        alias = Alias(
+            name=alias_name, fields=fields, definition=_nested_dict(alias_elem)
+        )
+        aliases.append(alias)
+
+    return aliases
+
+
+def parse_instruction(instruction: ET.Element) -> Instruction:
+    """
+    Parse an <instruction> XML element and create an Instruction object.
+
+    Args:
+        instruction: The <instruction> XML element
+
+    Returns:
+        Instruction: The parsed instruction object
+    """
+    name = instruction.get("name")
+
+    width_elem = instruction.find("width/int")
+    width = (
+        int(width_elem.text) if width_elem is not None and width_elem.text else None
+    )
+
+    syntax_elem = instruction.find("syntax/str")
+    syntax = syntax_elem.text.strip() if syntax_elem is not None else ""
+
+    dsyntax_elem = instruction.find("dsyntax/str")
+    dsyntax = dsyntax_elem.text.strip() if dsyntax_elem is not None else None
+
+    # Multiple attributes under <attributes>
+    attributes = []
+    for attr_elem in instruction.findall("attributes/attribute"):
+        attr_name = attr_elem.get("name")
+        if attr_name:
+            attributes.append(attr_name)
+
+    # Fields: name and its value as string or int
+    fields = {}
+    for field_elem in instruction.findall("fields/field"):
+        field_name = field_elem.get("name")
+        if field_name:
+            value = None
+            value_elem = field_elem.find("int")
+            if value_elem is None:
+                value_elem = field_elem.find("str")
+            value = (
+                value_elem.text.strip()
+                if value_elem is not None and value_elem.text is not None
+                else None
+            )
+            fields[field_name] = value
+
+    # Inputs and outputs
+    inputs = [e.text.strip() for e in instruction.findall("inputs/str") if e.text]
+    outputs = [e.text.strip() for e in instruction.findall("outputs/str") if e.text]
+
+    # Check if instruction is alias
+    aliases_elem = instruction.find("aliases")
+    aliases = parse_aliases(aliases_elem) if aliases_elem is not None else None
+
+    # Parse excluded_values
+    excluded_values = {}
+    excluded_values_elem = instruction.find("excluded_values")
+    if excluded_values_elem is not None:
+        for option_elem in excluded_values_elem.findall("option"):
+            option_name = option_elem.get("name")
+            if option_name:
+                str_elem = option_elem.find("str")
+                option_value = (
+                    str_elem.text.strip()
+                    if str_elem is not None and str_elem.text
+                    else None
+                )
+                excluded_values[option_name] = option_value
+
+    # Intrinsic arguments, and the instruction fields of each intrinsic type
+    intrinsic_args = []
+    for intrinsic_args_elem in instruction.iter("intrinsic_args"):
+        intrinsic_args.extend(e.text for e in intrinsic_args_elem)
+    intrinsic_type = {}
+    for intrinsic_type_elem in instruction.findall("intrinsic_type"):
+        for type_elem in intrinsic_type_elem:
+            args = [e[0].text for e in type_elem.iter("instrfield_intrinsic")]
+            if type_elem.get("name") is not None and args:
+                intrinsic_type.setdefault(type_elem.get("name"), []).extend(args)
+
+    return Instruction(
+        name=name,
+        width=width,
+        syntax=syntax,
+        dsyntax=dsyntax,
+        attributes=attributes,
+        fields=fields,
+        inputs=inputs,
+        outputs=outputs,
+        aliases=aliases,
+        excluded_values=excluded_values,
+        intrinsic_args=intrinsic_args,
+        intrinsic_type=intrinsic_type,
+        properties=_properties(instruction),
+    )
+
+
+def parse_instrfield(field_elem: ET.Element) -> InstrField:
+    """
+    Parse an <instrfield> XML element and create an InstrField object.
+
+    Args:
+        field_elem: The <instrfield> XML element
+
+    Returns:
+        InstrField: The parsed instruction field object
+    """
+    name = field_elem.get("name")
+
+    # Ranges (multiple <range><int>...</int></range> pairs)
+    ranges = []
+    for range_elem in field_elem.findall("bits/range"):
+        ints = [int(e.text) for e in range_elem.findall("int") if e.text]
+        if ints:
+            ranges.append(ints)
+
+    # Int properties
+    def get_int(tag):
+        elem = field_elem.find(f"{tag}/int")
+        return int(elem.text) if elem is not None and elem.text else None
+
+    width = get_int("width")
+    size = get_int("size")
+    shift = get_int("shift")
+    offset = get_int("offset")
+    sign_extension = get_int("sign_extension")
+
+    # String properties
+    def get_str(tag):
+        elem = field_elem.find(f"{tag}/str")
+        return elem.text.strip() if elem is not None and elem.text else None
+
+    mask = get_str("mask")
+    addr = get_str("addr")
+    display = get_str("display")
+    type = get_str("type")
+    ref = get_str("ref")
+    signed = get_str("signed")
+
+    # An instruction can generate multiple relocations
+    reloc = []
+    reloc_elem = field_elem.find("reloc")
+    if reloc_elem is not None:
+        for str_elem in reloc_elem.findall("str"):
+            if str_elem.text:
+                reloc.append(str_elem.text.strip())
+
+    # Enumerated and excluded options (if any)
+    def get_options(tag):
+        options = []
+        for opt_elem in field_elem.findall(f"{tag}/option"):
+            opt_name = opt_elem.get("name")
+            opt_value_elem = opt_elem.find("str")
+            opt_value = (
+                opt_value_elem.text.strip()
+                if opt_value_elem is not None and opt_value_elem.text
+                else None
+            )
+            options.append(EnumOption(name=opt_name, value=opt_value))
+        return options
+
+    enumerated = get_options("enumerated")
+    excluded_values = get_options("excluded_values")
+
+    return InstrField(
+        name=name,
+        ranges=ranges,
+        width=width,
+        size=size,
+        shift=shift,
+        offset=offset,
+        sign_extension=sign_extension,
+        mask=mask,
+        addr=addr,
+        display=display,
+        type=type,
+        ref=ref,
+        signed=signed,
+        reloc=reloc,
+        enumerated=enumerated,
+        excluded_values=excluded_values,
+        properties=_properties(field_elem),
+    )
+
+
+def parse_relocation(reloc_elem: ET.Element) -> Relocation:
+    """
+    Parse a <reloc> XML element and create a Relocation object.
+
+    Args:
+        reloc_elem: The <reloc> XML element
+
+    Returns:
+        Relocation: The parsed relocation object
+    """
+    name = reloc_elem.get("name")
+
+    # Parse abbrev
+    abbrev_elem = reloc_elem.find("abbrev/str")
+    abbrev = (
+        abbrev_elem.text.strip()
+        if abbrev_elem is not None and abbrev_elem.text
+        else ""
+    )
+
+    # Parse field_width
+    field_width_elem = reloc_elem.find("field_width/int")
+    field_width = (
+        int(field_width_elem.text)
+        if field_width_elem is not None and field_width_elem.text
+        else 0
+    )
+
+    # Parse pcrel
+    pcrel_elem = reloc_elem.find("pcrel/str")
+    pcrel = (
+        pcrel_elem.text.strip()
+        if pcrel_elem is not None and pcrel_elem.text
+        else ""
+    )
+
+    # Parse value
+    value_elem = reloc_elem.find("value/int")
+    value = (
+        int(value_elem.text)
+        if value_elem is not None and value_elem.text
+        else 0
+    )
+
+    # Parse right_shift
+    right_shift_elem = reloc_elem.find("right_shift/int")
+    right_shift = (
+        int(right_shift_elem.text)
+        if right_shift_elem is not None and right_shift_elem.text
+        else 0
+    )
+
+    # Parse action and clean it
+    action_elem = reloc_elem.find("action/str")
+    action = ""
+    if action_elem is not None and action_elem.text:
+        # Remove braces, newlines, spaces, semicolons and extract only the calculation
+        raw_action = action_elem.text.strip()
+        # Remove outer braces
+        raw_action = raw_action.strip("{}")
+        # Split by lines and find the line with the calculation (contains '=')
+        lines = raw_action.split("\n")
+        for line in lines:
+            line = line.strip()
+            if "=" in line and "R" in line:
+                # Remove 'R = ' and trailing semicolon, then strip spaces
+                action = line.replace("R = ", "").rstrip(";").strip()
+                break
+
+    # Parse directive
+    directive_elem = reloc_elem.find("directive/str")
+    directive = (
+        directive_elem.text.strip()
+        if directive_elem is not None and directive_elem.text
+        else ""
+    )
+
+    # Parse dependency (list of strings)
+    dependency = []
+    dependency_elem = reloc_elem.find("dependency")
+    if dependency_elem is not None:
+        for str_elem in dependency_elem.findall("str"):
+            if str_elem.text:
+                dependency.append(str_elem.text.strip())
+
+    return Relocation(
+        name=name,
+        abbrev=abbrev,
+        field_width=field_width,
+        pcrel=pcrel,
+        value=value,
+        right_shift=right_shift,
+        action=action,
+        directive=directive,
+        dependency=dependency,
+        properties=_properties(reloc_elem),
+    )
+
+
+### Model Builder
+
+
+class _ModelBuilder:
+    """
+    Builds an AdlModel from the subtrees of every <cores> element, at any depth.
+
+    The subtrees are fed in document order, either from the streaming reader or
+    from an element tree already in memory, so both paths build the same model.
+    The contents of several <cores> elements are merged in document order.
+    """
+
+    def __init__(self):
+        self.has_cores = False
+        self.instructions = []
+        self.instrfields = []
+        self.relocations = []
+        self.asm_config = None
+        self.asm_config_error = "No <asm_config> element found under <cores>"
+        self.asm_config_parsed = False
+        self.endianness = None
+        self.subtrees = {tag: [] for tag in KEPT_TAGS}
+
+    def add(self, elem: ET.Element, ancestors: List[ET.Element]):
+        """
+        Parses a complete subtree.
+
+        Args:
+            elem: A subtree with one of PARSED_TAGS or KEPT_TAGS
+            ancestors: The ancestors of the subtree, starting with the root element
+        """
+        ancestor_tags = [ancestor.tag for ancestor in ancestors]
+        if "cores" not in ancestor_tags:
+            return
+        self.has_cores = True
+
+        if elem.tag == "instruction":
+            self.instructions.append(parse_instruction(elem))
+        elif elem.tag == "instrfield":
+            self.instrfields.append(parse_instrfield(elem))
+        elif elem.tag == "reloc" and "relocations" in ancestor_tags:
+            self.relocations.append(parse_relocation(elem))
+        elif elem.tag == "asm_config" and self.asm_config_parsed is False:
+            self.asm_config_parsed = True
+            try:
+                self.asm_config = asm_config_info(elem)
+                self.asm_config_error = None
+            except ValueError as e:
+                self.asm_config_error = str(e)
+        elif elem.tag == "bit_endianness":
+            self.endianness = bit_endianness(elem)
+        elif elem.tag in KEPT_TAGS:
+            # The streaming reader clears the subtree once it is parsed
+            self.subtrees[elem.tag].append(copy.deepcopy(elem))
+
+    def model(self) -> AdlModel:
+        """
+        Returns the model built from the subtrees fed so far.
+
+        Raises:
+            ValueError: If the <cores> element is missing in the ADL file.
+        """
+        if self.has_cores is False:
+            raise ValueError("Missing <cores> element in ADL file")
+
+        return AdlModel(
+            instructions=self.instructions,
+            instrfields=self.instrfields,
+            relocations=self.relocations,
+            asm_config=self.asm_config,
+            asm_config_error=self.asm_config_error,
+            bit_endianness=self.endianness,
+            subtrees=self.subtrees,
+        )
+
+
+def build_model(root: ET.Element) -> AdlModel:
+    """
+    Builds the model of an ADL document already parsed into an element tree.
+
+    Args:
+        root: The root element of the ADL document
+
+    Returns:
+        AdlModel: The parsed model
+
+    Raises:
+        ValueError: If the <cores> element is missing in the ADL file.
+    """
+    builder = _ModelBuilder()
+    for elem, ancestors in walk_subtrees(root, PARSED_TAGS + KEPT_TAGS):
+        builder.add(elem, ancestors)
+    return builder.model()
+
+
+def stream_model(adl_file: str) -> AdlModel:
+    """
+    Builds the model of an ADL file with the streaming reader.
+
+    Args:
+        adl_file (str): Path to the ADL XML file
+
+    Returns:
+        AdlModel: The parsed model, equal to the one returned by build_model
+
+    Raises:
+        FileNotFoundError: If the ADL file cannot be found.
+        ET.ParseError: If the XML file cannot be parsed.
+        ValueError: If the <cores> element is missing in the ADL file.
+    """
+    builder = _ModelBuilder()
+    for elem, ancestors in iter_subtrees(adl_file, PARSED_TAGS + KEPT_TAGS):
+        builder.add(elem, ancestors)
+    return builder.model()
+
+
+def read_model(adl_file: str) -> AdlModel:
+    """
+    Parses an ADL file, with the streaming reader if the file is large.
+
+    Args:
+        adl_file (str): Path to the ADL XML file
+
+    Returns:
+        AdlModel: The parsed model
+
+    Raises:
+        FileNotFoundError: If the ADL file cannot be found.
+        ET.ParseError: If the XML file cannot be parsed.
+        ValueError: If the <cores> element is missing in the ADL file.
+    """
+    if use_streaming(adl_file):
+        global parse_count
+        parse_count += 1
+        return stream_model(adl_file)
+    return build_model(parse_root(adl_file))
+
+
+def parse_root(adl_file: str) -> ET.Element:
+    """
+    Parses the element tree of an ADL file.
+
+    Args:
+        adl_file (str): Path to the ADL XML file
+
+    Returns:
+        ET.Element: The root element of the document
+
+    Raises:
+        FileNotFoundError: If the ADL file cannot be found.
+        ET.ParseError: If the XML file cannot be parsed.
+    """
+    global parse_count
+    parse_count += 1
+    return ET.parse(adl_file).getroot()
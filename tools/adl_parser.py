@@ -10,6 +10,9 @@ import xml.etree.ElementTree as ET
 import registerInfo
 import utils
 import config
+import model_cache
+import adl_model
+import copy
 import re
 import os
 import sys
@@ -26,6 +29,986 @@ llvm_config = os.path.dirname(__file__).replace("\\", "/") + "/" + "llvm_config.
 config_variables = config.config_environment(config_file, llvm_config)
 
 
+""" Parsed models indexed by the absolute path of their ADL file """
+_models = dict()
+
+""" The views exposed by AdlModel """
+VIEWS = [
+    "registers",
+    "register_aliases",
+    "instrfield_offsets",
+    "instrfields",
+    "instructions",
+    "instruction_aliases",
+    "register_subregs",
+    "relocations",
+    "sched_tables",
+    "sched_index",
+    "scheduling_params",
+    "asm_config",
+]
+
+
+class AdlModel:
+    """
+    Parsed representation of an ADL XML file.
+
+    The XML document is parsed a single time into the typed model shared with the
+    test generators (see adl_model), and every view exposed by this class
+    (register files, instruction fields, instructions, aliases, relocations and
+    scheduling information) is derived from the typed objects the first time it
+    is requested. Views are memoized and each request receives its own deep copy,
+    so callers are free to modify the returned data.
+
+    A model can also be rebuilt from views loaded from the on-disk cache, in which
+    case neither the typed model nor the element tree is built unless a view is
+    missing or the element tree itself is needed.
+
+    Args:
+        adl_name (str):
+            The filename or path of the ADL XML file to parse.
+        model (adl_model.AdlModel | None):
+            The typed model of the file, read on first use if None.
+        views (dict | None):
+            Views previously built for the same file (see build_views).
+
+    Raises:
+        FileNotFoundError:
+            If the specified ADL file cannot be found.
+        xml.etree.ElementTree.ParseError:
+            If the ADL XML is malformed or cannot be parsed.
+    """
+
+    def __init__(self, adl_name, model=None, views=None):
+        self.adl_name = adl_name
+        self._root = None
+        self._model = model
+        if views is None:
+            views = dict()
+        self._views = views
+
+    @property
+    def root(self):
+        """ The root element of the ADL document, parsed on first use """
+        if self._root is None:
+            self._root = adl_model.parse_root(self.adl_name)
+        return self._root
+
+    @property
+    def model(self):
+        """ The typed model of the ADL document, read on first use """
+        if self._model is None:
+            self._model = _load_typed_model(self.adl_name)
+        return self._model
+
+    def build_views(self):
+        """
+        Builds every view of the model, so that the views can be stored in the cache.
+
+        Returns:
+            dict: The memoized views indexed by their name.
+        """
+        for name in VIEWS:
+            if name not in self._views:
+                self._views[name] = getattr(self, "_build_" + name)()
+        return self._views
+
+    def _get_view(self, name, builder):
+        """
+        Returns a private copy of a view, building it on first use.
+
+        Args:
+            name (str): The key under which the view is memoized.
+            builder (Callable[[], Any]): Function computing the view from the typed model.
+
+        Returns:
+            Any: A deep copy of the memoized view.
+        """
+        if name not in self._views:
+            self._views[name] = builder()
+        return copy.deepcopy(self._views[name])
+
+    def registers(self):
+        """ Returns the register files view, see parse_registers_from_adl """
+        return self._get_view("registers", self._build_registers)
+
+    def register_aliases(self):
+        """ Returns the register aliases view, see get_alias_for_regs """
+        return self._get_view("register_aliases", self._build_register_aliases)
+
+    def instrfield_offsets(self):
+        """ Returns the instruction field offsets view, see get_instrfield_offset """
+        return self._get_view("instrfield_offsets", self._build_instrfield_offsets)
+
+    def instrfields(self):
+        """ Returns the instruction fields view, see get_instrfield_from_adl """
+        return self._get_view("instrfields", self._build_instrfields)
+
+    def instructions(self):
+        """ Returns the instructions view, see parse_instructions_from_adl """
+        return self._get_view("instructions", self._build_instructions)
+
+    def instruction_aliases(self):
+        """ Returns the instruction aliases view, see parse_instructions_aliases_from_adl """
+        return self._get_view("instruction_aliases", self._build_instruction_aliases)
+
+    def register_subregs(self):
+        """ Returns the subregisters view, see parse_registers_subregs """
+        return self._get_view("register_subregs", self._build_register_subregs)
+
+    def relocations(self):
+        """ Returns the relocations view, see parse_relocations """
+        return self._get_view("relocations", self._build_relocations)
+
+    def sched_tables(self):
+        """ Returns the scheduling tables view, see parse_sched_table_from_adl """
+        return self._get_view("sched_tables", self._build_sched_tables)
+
+    def sched_index(self):
+        """ Returns the scheduling classes indexed by instruction, see parse_sched_index_from_adl """
+        return self._get_view("sched_index", self._build_sched_index)
+
+    def scheduling_params(self):
+        """ Returns the scheduling model parameters view, see parse_scheduling_model_params """
+        return self._get_view("scheduling_params", self._build_scheduling_params)
+
+    def asm_config(self):
+        """ Returns the architecture, attributes and mattrib strings of <asm_config>, None if it is missing or incomplete """
+        return self._get_view("asm_config", self._build_asm_config)
+
+    def _build_asm_config(self):
+        return self.model.asm_config
+
+    def _build_registers(self):
+        registers = dict()
+        for regclass in self.model.subtrees["regfile"]:
+            register_class, reginfo = _parse_regfile(regclass)
+            registers[register_class] = reginfo
+        utils.remove_ignored_attrib_regs(registers)
+        return registers
+
+    def _build_register_aliases(self):
+        alias_dict = dict()
+        for instrfield in self.model.instrfields:
+            parameters = _instrfield_parameters(instrfield)
+            if "ref" in parameters.keys():
+                alias_dict[parameters["ref"]] = parameters["aliases"]
+        return alias_dict
+
+    def _build_instrfield_offsets(self):
+        instrfield_data = dict()
+        for instrfield in self.model.instrfields:
+            instrfield_data[instrfield.name] = _instrfield_offset_parameters(instrfield)
+        return _instrfield_offsets(instrfield_data)
+
+    def _build_instrfields(self):
+        instrfield_data_ref = dict()
+        instrfield_data_imm = dict()
+        for instrfield in self.model.instrfields:
+            parameters = _instrfield_parameters(instrfield)
+            if "ref" in parameters.keys():
+                instrfield_data_ref[instrfield.name] = parameters
+            else:
+                instrfield_data_imm[instrfield.name] = parameters
+        return instrfield_data_imm, instrfield_data_ref
+
+    def _build_instructions(self):
+        instrfield_imm, instrfield_ref = self.instrfields()
+        instructions = dict()
+        sorting_attributes = list()
+        for instruction in self.model.instructions:
+            parameters = _instruction_parameters(
+                instruction, instrfield_imm, instrfield_ref
+            )
+            _add_instruction(
+                instructions, sorting_attributes, instruction.name, parameters
+            )
+        return _instruction_lists(instructions, sorting_attributes)
+
+    def _build_instruction_aliases(self):
+        instrfield_imm, instrfield_ref = self.instrfields()
+        instructions_aliases = dict()
+        for instruction in self.model.instructions:
+            parameters = _instruction_alias_parameters(
+                instruction, instrfield_imm, instrfield_ref
+            )
+            _add_instruction_alias(instructions_aliases, instruction.name, parameters)
+        return instructions_aliases
+
+    def _build_register_subregs(self):
+        registers = dict()
+        for register in self.model.subtrees["regfile"]:
+            register_name, xml_dict = _parse_regfile_subregs(register)
+            registers[register_name] = xml_dict
+        return registers
+
+    def _build_relocations(self):
+        reloc_data = dict()
+        for relocation in self.model.relocations:
+            reloc_data[relocation.name] = dict(relocation.properties)
+        return reloc_data
+
+    def _build_sched_tables(self):
+        sched_tables = self.model.subtrees["sched-table"]
+        instructions_sched = [
+            _parse_instruction_sched(instr)
+            for sched_table in sched_tables
+            for instr in sched_table.iter("instruction-sched")
+            if "name" in instr.attrib.keys()
+        ]
+        read_resources = [
+            _parse_read_resource(resource)
+            for sched_table in sched_tables
+            for resource in sched_table.iter("read_resource")
+        ]
+        # Every table of the core lists the same scheduling classes
+        instruction_sched = None
+        sched_table_dict = dict()
+        for sched_table in sched_tables:
+            if sched_table.attrib["name"] not in sched_table_dict.keys():
+                if instruction_sched is None:
+                    instruction_sched = _sched_table(instructions_sched, read_resources)
+                    sched_table_dict[sched_table.attrib["name"]] = instruction_sched
+                else:
+                    sched_table_dict[sched_table.attrib["name"]] = copy.deepcopy(
+                        instruction_sched
+                    )
+        return sched_table_dict
+
+    def _build_sched_index(self):
+        return _sched_index(self.sched_tables())
+
+    def _build_scheduling_params(self):
+        sched_table_params = dict()
+        for sched_table in self.model.subtrees["sched-table"]:
+            if sched_table.attrib["name"] not in sched_table_params.keys():
+                sched_table_params[sched_table.attrib["name"]] = {}
+            parameters = _parse_sched_table_params(sched_table)
+            sched_table_params[sched_table.attrib["name"]].update(parameters)
+        return sched_table_params
+
+
+def _parse_regfile(regclass):
+    """
+    Parses a <regfile> element.
+
+    Args:
+        regclass (ET.Element): The <regfile> element.
+
+    Returns:
+        tuple[str, registerInfo.RegisterGeneric]: The name of the register file and
+            its description.
+    """
+    attributes = list()
+    parameters = dict()
+    alias_reg_dict = dict()
+    entries = list()
+    syntax = list()
+    debug_info = dict()
+    enumerated_dict = dict()
+    register_class = regclass.attrib["name"]
+    for regfile in regclass:
+        for regclassinfo in regfile:
+            parameters[regfile.tag] = regclassinfo.text
+            for attribute in regclassinfo.iter("attribute"):
+                if attribute[0].text is not None:
+                    debug_info[regclassinfo.attrib["name"]] = attribute[0].text
+                attributes.append(attribute.attrib["name"])
+            if regfile.tag == "calling_convention":
+                enumerated_list = [
+                    option[0].text for option in regclassinfo.iter("option")
+                ]
+                if regclassinfo.attrib != {}:
+                    if (
+                        regclassinfo.attrib["name"]
+                        not in enumerated_dict.keys()
+                    ):
+                        enumerated_dict[
+                            regclassinfo.attrib["name"]
+                        ] = enumerated_list
+                    else:
+                        enumerated_dict[
+                            regclassinfo.attrib["name"]
+                        ] += enumerated_list
+            if regfile.tag == "read":
+                for attribute in regclassinfo.iter("alias"):
+                    for register in attribute[0].iter(attribute[0].tag):
+                        parameters['pseudo'] = register[0].text
+            for attribute in regclassinfo.iter("entry"):
+                entries.append(attribute.attrib["name"])
+            for syntaxelem in regclassinfo.iter("syntax"):
+                syntax.append(syntaxelem[0].text)
+            for alias_reg in regclassinfo.iter("alias_reg"):
+                for attribute in regclassinfo.iter("entry"):
+                    if attribute.attrib["name"] not in alias_reg_dict.keys():
+                        alias_reg_dict[attribute.attrib["name"]] = alias_reg[0].text
+                        break
+            parameters["calling_convention"] = enumerated_dict
+            parameters["attributes"] = attributes
+            parameters["entries"] = entries
+            parameters["syntax"] = syntax
+            parameters["alias_reg"] = alias_reg_dict
+    attributes = set(attributes)
+    debug = ""
+    prefix = ""
+    reserved_mask = ""
+    doc_info = ""
+    pseudo = ""
+    alignment = ""
+    shared = ""
+    read = ""
+    write = ""
+    if "alignment" in parameters.keys():
+        alignment = parameters["alignment"]
+    if "calling_convention" in parameters.keys():
+        calling_convention = parameters["calling_convention"]
+    if "pseudo" in parameters.keys():
+        pseudo = parameters["pseudo"]
+    if "debug" in parameters.keys():
+        debug = parameters["debug"]
+    for key in parameters.keys():
+        if key == "doc":
+            doc_info = parameters[key].strip()
+        elif key == "width":
+            width = parameters[key].strip()
+        elif key == "size":
+            size = parameters[key].strip()
+        elif key == "prefix":
+            prefix = parameters[key].strip()
+        elif key == "shared":
+            shared = parameters[key].strip()
+        elif key == "reserved_mask":
+            reserved_mask = parameters[key].strip()
+        entries = entries
+        syntax = syntax
+        alias_reg_dict = alias_reg_dict
+    if debug == "":
+        for _, value in enumerate(debug_info.values()):
+            debug = str(value)
+    reginfo = registerInfo.RegisterGeneric(
+        register_class,
+        doc_info,
+        width,
+        attributes,
+        size,
+        entries,
+        syntax,
+        debug,
+        prefix,
+        shared,
+        reserved_mask,
+        None,
+        None,
+        calling_convention,
+        pseudo,
+        alignment,
+        alias_reg_dict
+    )
+    return register_class, reginfo
+
+
+def _parse_regfile_subregs(register):
+    """
+    Parses the fields and attributes of a <regfile> element.
+
+    Args:
+        register (ET.Element): The <regfile> element.
+
+    Returns:
+        tuple[str, dict]: The name of the register file and its description.
+    """
+    xml_dict = {}
+    register_name = register.attrib["name"]
+    xml_dict["register_name"] = register_name
+    for element in register:
+        if element.tag == "doc":
+            xml_dict[element.tag] = element[0].text.strip()
+        elif element.tag == "width":
+            xml_dict[element.tag] = int(element[0].text)
+        elif element.tag == "fields":
+            fields_dict = {}
+            for field_element in element:
+                field_name = field_element.attrib["name"]
+                field_dict = {}
+                for sub_element in field_element:
+                    if sub_element.tag == "doc":
+                        field_dict[sub_element.tag] = sub_element[
+                            0
+                        ].text.strip()
+                    elif sub_element.tag == "bits":
+                        bits_dict = {}
+                        for sub_sub_element in sub_element:
+                            if sub_sub_element.tag == "range":
+                                values = [
+                                    int(value.text) for value in sub_sub_element
+                                ]
+                                bits_dict[sub_sub_element.tag] = values
+                        field_dict[sub_element.tag] = bits_dict
+                fields_dict[field_name] = field_dict
+            xml_dict[element.tag] = fields_dict
+        elif element.tag == "attributes":
+            attributes_dict = {}
+            for attribute_element in element:
+                attribute_name = attribute_element.attrib["name"]
+                attribute_list = list()
+                for sub_element in attribute_element:
+                    str_element = sub_element.find("str")
+                    if str_element is not None:
+                        attribute_list.append(sub_element.tag)
+                attributes_dict[attribute_name] = attribute_list
+            xml_dict[element.tag] = attributes_dict
+        elif element.tag == "shared":
+            xml_dict[element.tag] = element.text
+    return register_name, xml_dict
+
+
+def _option_lists(options, option_lists=None):
+    """
+    Groups the values of enumerated or excluded options by option name.
+
+    Args:
+        options (list[adl_model.EnumOption]): The options of an instruction field.
+        option_lists (dict | None): The dictionary to extend, a new one if None.
+
+    Returns:
+        dict: The values of the named options, indexed by option name.
+    """
+    if option_lists is None:
+        option_lists = dict()
+    for option in options:
+        if option.name is not None:
+            option_lists.setdefault(option.name, []).append(option.value)
+    return option_lists
+
+
+def _instrfield_parameters(instrfield):
+    """
+    Builds the parameters of an instruction field.
+
+    Args:
+        instrfield (adl_model.InstrField): The instruction field.
+
+    Returns:
+        dict: The raw properties of the instruction field, with the enumerated values
+            under "aliases" and the bit ranges under "range".
+    """
+    parameters = dict()
+    if len(instrfield.properties) == 0:
+        return parameters
+    enumerated_dict = dict()
+    for tag in instrfield.properties.keys():
+        if tag == "enumerated":
+            _option_lists(instrfield.enumerated, enumerated_dict)
+        elif tag == "excluded_values":
+            _option_lists(instrfield.excluded_values, enumerated_dict)
+    list_range = list()
+    range_tuples = list()
+    for bounds in instrfield.ranges:
+        for bound in bounds:
+            list_range.append(str(bound))
+            if len(list_range) >= 2:
+                range_tuple = (list_range[0], list_range[1])
+                if range_tuple not in range_tuples:
+                    range_tuples.append(range_tuple)
+                    list_range.clear()
+    # "aliases" and "range" follow the first property, as the parameters are
+    # ordered by the document
+    for index, (tag, value) in enumerate(instrfield.properties.items()):
+        parameters[tag] = value
+        if index == 0:
+            parameters["aliases"] = None
+            parameters["range"] = None
+    parameters["aliases"] = enumerated_dict
+    parameters["range"] = [list(range_tuple) for range_tuple in range_tuples]
+    return parameters
+
+
+def _instrfield_offset_parameters(instrfield):
+    """
+    Builds the parameters of an instruction field for the instruction field offsets.
+
+    Args:
+        instrfield (adl_model.InstrField): The instruction field.
+
+    Returns:
+        dict: The raw properties of the instruction field, with the enumerated and
+            excluded values.
+    """
+    parameters = dict(instrfield.properties)
+    if "enumerated" in parameters.keys():
+        parameters["enumerated"] = _option_lists(instrfield.enumerated)
+    if "excluded_values" in parameters.keys():
+        parameters["excluded_values"] = _option_lists(instrfield.excluded_values)
+    return parameters
+
+
+def _instrfield_offsets(instrfield_data):
+    """
+    Computes the offsets of the register instruction fields.
+
+    Args:
+        instrfield_data (dict): The parameters of every instruction field, see
+            _instrfield_offset_parameters.
+
+    Returns:
+        tuple[dict, dict]: The instruction field offsets and the parameters of the
+            register instruction fields.
+    """
+    instrfield_data_ref = dict()
+    for key in instrfield_data.keys():
+        if "ref" in instrfield_data[key].keys():
+            instrfield_data_ref[key] = instrfield_data[key]
+    instrfield_offset = utils.get_instrfield_offset(instrfield_data_ref)
+    return instrfield_offset, instrfield_data_ref
+
+
+def _field_kinds(fields, instrfield_imm, instrfield_ref, field_kinds=None):
+    """
+    Resolves the instruction fields of an instruction.
+
+    Fields with a fixed value keep it, the other ones are recorded as "reg" or "imm"
+    depending on the kind of the instruction field, or skipped if unknown.
+
+    Args:
+        fields (dict): The fields of the instruction, see adl_model.Instruction.
+        instrfield_imm (dict): The immediate instruction fields.
+        instrfield_ref (dict): The register instruction fields.
+        field_kinds (dict | None): The dictionary to extend, a new one if None.
+
+    Returns:
+        dict: The resolved fields.
+    """
+    if field_kinds is None:
+        field_kinds = dict()
+    for field_name, value in fields.items():
+        if value is not None:
+            field_kinds[field_name] = value
+        elif field_name in instrfield_ref.keys():
+            field_kinds[field_name] = "reg"
+        elif field_name in instrfield_imm.keys():
+            field_kinds[field_name] = "imm"
+    return field_kinds
+
+
+def _split_syntax(instruction, tag):
+    """
+    Splits the syntax of an instruction on commas and spaces.
+
+    Args:
+        instruction (adl_model.Instruction): The instruction.
+        tag (str): "syntax" or "dsyntax".
+
+    Returns:
+        list: The tokens of the syntax, empty if the instruction has none.
+    """
+    if instruction.properties.get(tag) is None:
+        return []
+    return re.split(r"[, ]", instruction.properties[tag])
+
+
+def _instruction_parameters(instruction, instrfield_imm, instrfield_ref):
+    """
+    Builds the parameters of an instruction.
+
+    Args:
+        instruction (adl_model.Instruction): The instruction.
+        instrfield_imm (dict): The immediate instruction fields.
+        instrfield_ref (dict): The register instruction fields.
+
+    Returns:
+        dict: The raw properties of the instruction, with the syntax, attributes,
+            fields, inputs and outputs parsed.
+    """
+    parameters = dict(instruction.properties)
+    if instruction.excluded_values:
+        parameters["excluded_values"] = {
+            name: [value] for name, value in instruction.excluded_values.items()
+        }
+    if "intrinsic_type" in parameters.keys():
+        parameters["intrinsic_type"] = copy.deepcopy(instruction.intrinsic_type)
+    parameters["syntax"] = _split_syntax(instruction, "syntax")
+    parameters["dsyntax"] = _split_syntax(instruction, "dsyntax")
+    parameters["attributes"] = list(set(instruction.attributes))
+    parameters["fields"] = [
+        _field_kinds(instruction.fields, instrfield_imm, instrfield_ref)
+    ]
+    parameters["intrinsic_args"] = list(instruction.intrinsic_args)
+    parameters["inputs"] = list(set(instruction.inputs))
+    parameters["outputs"] = list(set(instruction.outputs))
+    return parameters
+
+
+def _add_instruction(instructions, sorting_attributes, instruction, parameters):
+    """
+    Adds a parsed instruction, unless it has one of the ignored attributes.
+
+    Args:
+        instructions (dict): The instructions parsed so far.
+        sorting_attributes (list): The attributes seen so far, in order of appearance.
+        instruction (str): The name of the instruction.
+        parameters (dict): The parameters of the instruction.
+
+    Returns:
+        None
+    """
+    for attribute in parameters["attributes"]:
+        if attribute not in sorting_attributes:
+            sorting_attributes.append(attribute)
+    check_instruction = True
+    for attribute in config_variables['IgnoredAttrib']:
+        if attribute in parameters["attributes"]:
+            check_instruction = False
+            break
+    if check_instruction is True:
+        instructions[instruction] = parameters
+
+
+def _instruction_lists(instructions, sorting_attributes):
+    """
+    Splits the instructions by the kind of their operands.
+
+    Args:
+        instructions (dict): The parsed instructions.
+        sorting_attributes (list): The attributes of the instructions.
+
+    Returns:
+        tuple[dict, list, list, list]: The instructions, the instructions using only
+            registers, the instructions using immediates and the attributes.
+    """
+    list_instructions_with_regs = list()
+    list_instructions_imms = list()
+    for key in instructions.keys():
+        if (
+            "imm" not in instructions[key]["fields"][0].values()
+            and len(instructions[key]["fields"][0].values()) != 0
+        ):
+            list_instructions_with_regs.append(key)
+        elif (
+            "imm" in instructions[key]["fields"][0].values()
+            and len(instructions[key]["fields"][0].values()) != 0
+        ):
+            list_instructions_imms.append(key)
+    return (
+        instructions,
+        list_instructions_with_regs,
+        list_instructions_imms,
+        sorting_attributes,
+    )
+
+
+def _instruction_alias_parameters(instruction, instrfield_imm, instrfield_ref):
+    """
+    Builds the parameters of an instruction for the instruction aliases.
+
+    Args:
+        instruction (adl_model.Instruction): The instruction.
+        instrfield_imm (dict): The immediate instruction fields.
+        instrfield_ref (dict): The register instruction fields.
+
+    Returns:
+        dict: The raw properties of the instruction, with the aliases and their
+            definitions parsed.
+    """
+    parameters = dict(instruction.properties)
+    if "intrinsic_type" in parameters.keys():
+        parameters["intrinsic_type"] = copy.deepcopy(instruction.intrinsic_type)
+    # The definitions of the aliases replace the fields read before them
+    fields = dict()
+    for tag in instruction.properties.keys():
+        if tag == "fields":
+            _field_kinds(instruction.fields, instrfield_imm, instrfield_ref, fields)
+        elif tag == "aliases" and instruction.aliases is not None:
+            fields = dict()
+            if len(instruction.aliases) > 0:
+                fields["alias"] = [
+                    copy.deepcopy(alias.definition) for alias in instruction.aliases
+                ]
+    aliases = [alias.name for alias in instruction.aliases or [] if alias.name]
+    parameters["syntax"] = _split_syntax(instruction, "syntax")
+    parameters["dsyntax"] = _split_syntax(instruction, "dsyntax")
+    parameters["attributes"] = list(set(instruction.attributes))
+    if len(aliases) > 0:
+        parameters["aliases"] = list(set(aliases))
+    parameters["fields"] = [fields]
+    parameters["inputs"] = list(set(instruction.inputs))
+    parameters["outputs"] = list(set(instruction.outputs))
+    parameters["intrinsic_args"] = list(set(instruction.intrinsic_args))
+    return parameters
+
+
+def _add_instruction_alias(instructions_aliases, instruction, parameters):
+    """
+    Adds a parsed instruction which has aliases, unless it has every ignored attribute.
+
+    Args:
+        instructions_aliases (dict): The instruction aliases parsed so far.
+        instruction (str): The name of the instruction.
+        parameters (dict): The parameters of the instruction.
+
+    Returns:
+        None
+    """
+    check_instruction = True
+    for attribute in config_variables['IgnoredAttrib']:
+        if attribute not in parameters["attributes"]:
+            check_instruction = False
+            break
+    if check_instruction is False:
+        if "aliases" in parameters.keys():
+            instructions_aliases[instruction] = parameters
+
+
+def _parse_instruction_sched(instr):
+    """
+    Parses an <instruction-sched> element of a scheduling table.
+
+    Args:
+        instr (ET.Element): The <instruction-sched> element.
+
+    Returns:
+        tuple[str, dict, bool]: The name of the scheduling class, its parameters and
+            whether it forwards a read resource.
+    """
+    parameters = dict()
+    forwarding = False
+    instruction_name = instr.attrib["name"]
+    for instruction_info in instr:
+        if instruction_info.tag == 'instruction_list':
+            for elem in instruction_info:
+                aux = elem.text.split(",")
+            parameters[instruction_info.tag] = aux
+        else:
+            for elem in instruction_info:
+                if instruction_info.tag == "pipelines":
+                    pipeline_dict = dict()
+                    for pipeline in instruction_info:
+                        pipeline_name = pipeline.attrib['name']
+                        pipeline_tags = dict()
+                        for element in pipeline:
+                            pipeline_tags[element.tag] = element[0].text
+                        pipeline_dict[pipeline_name] = pipeline_tags
+                        parameters[instruction_info.tag] = pipeline_dict
+                elif instruction_info.tag == "forwarding":
+                    forwarding = True
+                else:
+                    parameters[instruction_info.tag] = elem.text
+    return instruction_name, parameters, forwarding
+
+
+def _parse_read_resource(resource):
+    """
+    Parses a <read_resource> element.
+
+    Args:
+        resource (ET.Element): The <read_resource> element.
+
+    Returns:
+        tuple[str, dict]: The name of the read resource and its parameters.
+    """
+    resource_dict = dict()
+    resource_name = resource.attrib['name']
+    for element in resource:
+        for element_parsed in element:
+            if element.tag == 'resource_list':
+                if element_parsed.text is not None:
+                    resource_dict[element.tag] = element_parsed.text.split(",")
+                else:
+                    resource_dict[element.tag] = []
+            else:
+                resource_dict[element.tag] = element_parsed.text
+    return resource_name, resource_dict
+
+
+def _sched_table(instructions_sched, read_resources):
+    """
+    Builds the contents of a scheduling table.
+
+    Each scheduling class with forwarding information is given the first read
+    resource not already forwarded by a previous class. The read resources are
+    walked once for the whole table, since the resources before the first one
+    not forwarded yet can never be given again.
+
+    Args:
+        instructions_sched (list): The parsed scheduling classes, see _parse_instruction_sched.
+        read_resources (list): The parsed read resources, see _parse_read_resource.
+
+    Returns:
+        dict: The parameters of the scheduling classes indexed by their name.
+    """
+    resource_forwarding = dict()
+    forwarded_resources = set()
+    # Every read resource before next_resource is already forwarded
+    next_resource = 0
+    instruction_sched = dict()
+    for instruction_name, parameters, forwarding in instructions_sched:
+        parameters = copy.deepcopy(parameters)
+        if forwarding is True and instruction_name not in resource_forwarding.keys():
+            while (
+                next_resource < len(read_resources)
+                and read_resources[next_resource][0] in forwarded_resources
+            ):
+                next_resource += 1
+            if next_resource < len(read_resources):
+                resource_name, resource_dict = read_resources[next_resource]
+                aux = dict()
+                aux[resource_name] = copy.deepcopy(resource_dict)
+                resource_forwarding[instruction_name] = aux
+                forwarded_resources.add(resource_name)
+        aux = dict()
+        if instruction_name in resource_forwarding.keys():
+            aux['forwarding'] = resource_forwarding[instruction_name]
+        instruction_sched[instruction_name] = parameters
+        instruction_sched[instruction_name].update(aux)
+    return instruction_sched
+
+
+
+def _sched_index(sched_tables):
+    """
+    Indexes the scheduling classes by the instructions they list.
+
+    Args:
+        sched_tables (dict): The scheduling tables, see _sched_table.
+
+    Returns:
+        dict: For each instruction of an <instruction_list>, in lower case, an
+            entry for every time a scheduling class lists it, in the order of
+            the scheduling tables and of the lists. Each entry holds the name
+            as listed, the name of the table and of the class, under
+            "instruction", "sched_table" and "sched_class", and the latency,
+            pipelines and forwarding information of the class when present.
+            The lower case key serves the case-insensitive lookups; the exact
+            lookups compare the "instruction" of the entries.
+    """
+    sched_index = dict()
+    for sched_table, sched_classes in sched_tables.items():
+        for sched_class, parameters in sched_classes.items():
+            sched_entry = {"sched_table": sched_table, "sched_class": sched_class}
+            for key in ["latency", "pipelines", "forwarding"]:
+                if key in parameters.keys():
+                    sched_entry[key] = parameters[key]
+            for instruction in parameters.get("instruction_list", []):
+                sched_index.setdefault(instruction.lower(), []).append(
+                    dict(sched_entry, instruction=instruction)
+                )
+    return sched_index
+
+
+def _parse_sched_table_params(sched_table):
+    """
+    Parses the parameters of a <sched-table> element.
+
+    Args:
+        sched_table (ET.Element): The <sched-table> element.
+
+    Returns:
+        dict: The parameters of the scheduling model, with the functional units.
+    """
+    parameters = dict()
+    for info in sched_table:
+        for elem in info:
+            if info.tag != 'instruction-sched':
+                    parameters[info.tag] = elem.text
+            if info.tag == 'FunctionalUnits':
+                functional_dict = dict()
+                for functional_unit in info :
+                    func_unit_dict = dict()
+                    func_unit_name = functional_unit.attrib['name']
+                    for element in functional_unit:
+                        func_unit_dict[element.tag] = element[0].text
+                    functional_dict[func_unit_name] = func_unit_dict
+                parameters[info.tag] = functional_dict
+    return parameters
+
+
+def _load_typed_model(adl_name):
+    """
+    Reads the typed model of an ADL file, going through the on-disk cache when enabled.
+
+    The typed model is stored under the same key by the test generators (see
+    tools.testing.parse.load_adl_model), so a TD run followed by a test generation
+    run reads the document only once.
+
+    Args:
+        adl_name (str): The name of the adl.xml file.
+
+    Returns:
+        adl_model.AdlModel: The typed model of the ADL file.
+    """
+    if model_cache.cache_enabled() is False:
+        return adl_model.read_model(adl_name)
+    key = model_cache.cache_key(adl_name, [adl_model.__file__])
+    record = model_cache.load("adl_model", key)
+    if record is not None:
+        return adl_model.AdlModel.from_record(record)
+    model = adl_model.read_model(adl_name)
+    model_cache.store("adl_model", key, model.to_record())
+    return model
+
+
+def load_model(adl_name: str) -> AdlModel:
+    """
+    Returns the parsed model of an ADL file, parsing the file only on first use.
+
+    Models are cached per absolute path for the lifetime of the process, so every
+    adl_parser entry point called during one generation run shares the same parsed
+    document. A cached model is discarded and the file parsed again when its
+    modification time or size changes. Across processes, the views are loaded from
+    the on-disk cache (see model_cache) when the file contents were seen before.
+
+    Args:
+        adl_name (str): The name of the adl.xml file (configured inside config.txt).
+
+    Returns:
+        AdlModel: The parsed model of the ADL file.
+
+    Raises:
+        FileNotFoundError: If the ADL file cannot be found.
+        ET.ParseError: If the XML file cannot be parsed.
+    """
+    path = os.path.abspath(adl_name)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    if path not in _models or _models[path][0] != stamp:
+        _models[path] = (stamp, _load_cached_model(adl_name))
+    return _models[path][1]
+
+
+def _load_cached_model(adl_name):
+    """
+    Creates the model of an ADL file, going through the on-disk cache when enabled.
+
+    The cache key covers the configuration files and the parser sources as well,
+    since the views depend on the ignored attributes and on the parsing code.
+
+    Args:
+        adl_name (str): The name of the adl.xml file.
+
+    Returns:
+        AdlModel: The model of the ADL file.
+    """
+    if model_cache.cache_enabled() is False:
+        return AdlModel(adl_name, adl_model.read_model(adl_name))
+    tools_dir = os.path.dirname(os.path.abspath(__file__))
+    key = model_cache.cache_key(
+        adl_name,
+        [
+            config_file,
+            llvm_config,
+            os.path.join(tools_dir, "adl_parser.py"),
+            os.path.join(tools_dir, "adl_model.py"),
+            os.path.join(tools_dir, "registerInfo.py"),
+            os.path.join(tools_dir, "utils.py"),
+        ],
+    )
+    views = model_cache.load("adl_parser", key)
+    if views is not None:
+        return AdlModel(adl_name, views=views)
+    model = AdlModel(adl_name, _load_typed_model(adl_name))
+    model_cache.store("adl_parser", key, model.build_views())
+    return model
+
+
 def parse_registers_from_adl(adl_name):
         """
         Parses an ADL XML file and extracts register file definitions.
@@ -60,203 +1043,7 @@ def parse_registers_from_adl(adl_name):
             TypeError:
                 If `adl_name` is not a string-like path.
         """
-        # Passing the path of the
-        # xml document to enable the
-        # parsing process
-        # try:
-        tree = ET.parse(adl_name)
-        # getting the parent tag of
-        # the xml document
-        root = tree.getroot()
-        registers = dict()
-        for core in root.iter("cores"):
-            for regclass in core.iter("regfile"):
-                attributes = list()
-                parameters = dict()
-                alias_reg_dict = dict()
-                entries = list()
-                syntax = list()
-                debug_info = dict()
-                enumerated_dict = dict()
-                register_class = regclass.attrib["name"]
-                for regfile in regclass:
-                    for regclassinfo in regfile:
-                        parameters[regfile.tag] = regclassinfo.text
-                        for attribute in regclassinfo.iter("attribute"):
-                            if attribute[0].text is not None:
-                                debug_info[regclassinfo.attrib["name"]] = attribute[0].text
-                            attributes.append(attribute.attrib["name"])
-                        if regfile.tag == "calling_convention":
-                            enumerated_list = [
-                                option[0].text for option in regclassinfo.iter("option")
-                            ]
-                            if regclassinfo.attrib != {}:
-                                if (
-                                    regclassinfo.attrib["name"]
-                                    not in enumerated_dict.keys()
-                                ):
-                                    enumerated_dict[
-                                        regclassinfo.attrib["name"]
-                                    ] = enumerated_list
-                                else:
-                                    enumerated_dict[
-                                        regclassinfo.attrib["name"]
-                                    ] += enumerated_list
-                        if regfile.tag == "read":
-                            for attribute in regclassinfo.iter("alias"):
-                                for register in attribute[0].iter(attribute[0].tag):
-                                    parameters['pseudo'] = register[0].text
-                        for attribute in regclassinfo.iter("entry"):
-                            entries.append(attribute.attrib["name"])
-                        for syntaxelem in regclassinfo.iter("syntax"):
-                            syntax.append(syntaxelem[0].text)
-                        for alias_reg in regclassinfo.iter("alias_reg"):
-                            for attribute in regclassinfo.iter("entry"):
-                                if attribute.attrib["name"] not in alias_reg_dict.keys():
-                                    alias_reg_dict[attribute.attrib["name"]] = alias_reg[0].text
-                                    break
-                        parameters["calling_convention"] = enumerated_dict
-                        parameters["attributes"] = attributes
-                        parameters["entries"] = entries
-                        parameters["syntax"] = syntax
-                        parameters["alias_reg"] = alias_reg_dict
-                attributes = set(attributes)
-                debug = ""
-                prefix = ""
-                reserved_mask = ""
-                doc_info = ""
-                pseudo = ""
-                alignment = ""
-                shared = ""
-                read = ""
-                write = ""
-                if "alignment" in parameters.keys():
-                    alignment = parameters["alignment"]
-                if "calling_convention" in parameters.keys():
-                    calling_convention = parameters["calling_convention"]
-                if "pseudo" in parameters.keys():
-                    pseudo = parameters["pseudo"]
-                if "debug" in parameters.keys():
-                    debug = parameters["debug"]
-                for key in parameters.keys():
-                    if key == "doc":
-                        doc_info = parameters[key].strip()
-                    elif key == "width":
-                        width = parameters[key].strip()
-                    elif key == "size":
-                        size = parameters[key].strip()
-                    elif key == "prefix":
-                        prefix = parameters[key].strip()
-                    elif key == "shared":
-                        shared = parameters[key].strip()
-                    elif key == "reserved_mask":
-                        reserved_mask = parameters[key].strip()
-                    entries = entries
-                    syntax = syntax
-                    alias_reg_dict = alias_reg_dict
-                if debug == "":
-                    for _, value in enumerate(debug_info.values()):
-                        debug = str(value)
-                reginfo = registerInfo.RegisterGeneric(
-                    register_class,
-                    doc_info,
-                    width,
-                    attributes,
-                    size,
-                    entries,
-                    syntax,
-                    debug,
-                    prefix,
-                    shared,
-                    reserved_mask,
-                    None,
-                    None,
-                    calling_convention,
-                    pseudo,
-                    alignment,
-                    alias_reg_dict
-                )
-                registers[register_class] = reginfo
-                    
-            # for regclass in core.iter("regs"):
-            #     for regs in regclass:
-            #         parameters = dict()
-            #         attributes = list()
-            #         debug_info = dict()
-            #         entries = list()
-            #         syntax = list()
-            #         register_name = regs.attrib["name"]
-            #         for reg_info in regs:
-            #             for sub_reg_info in reg_info:
-            #                 for attribute in sub_reg_info.iter("attribute"):
-            #                     if "name" in sub_reg_info.attrib["name"]:
-            #                         debug_info[sub_reg_info.attrib["name"]] = str(
-            #                             attribute[0].text
-            #                         )
-            #                     attributes.append(attribute.attrib["name"])
-            #             parameters[reg_info.tag] = sub_reg_info.text
-            #             parameters["attributes"] = attributes
-            #             registers[register_name] = parameters
-            #         if bool(attributes):
-            #             attributes = set(attributes)
-            #         if "pseudo" in parameters.keys():
-            #             pseudo = parameters["pseudo"]
-            #         debug = ""
-            #         prefix = ""
-            #         reserved_mask = ""
-            #         doc_info = ""
-            #         size = ""
-            #         shared = ""
-            #         pseudo = ""
-            #         for key in parameters.keys():
-            #             if key == "doc":
-            #                 doc_info = parameters[key].strip()
-            #             elif key == "width":
-            #                 width = parameters[key].strip()
-            #             elif key == "size":
-            #                 size = parameters[key].strip()
-            #             elif key == "prefix":
-            #                 prefix = parameters[key].strip()
-            #             elif key == "shared":
-            #                 shared = parameters[key].strip()
-            #             elif key == "reserved_mask":
-            #                 reserved_mask = parameters[key].strip()
-            #         if bool(debug_info) is not False:
-            #             for _, value in enumerate(debug_info.values()):
-            #                 debug = str(value)
-            #         reginfo2 = registerInfo.RegisterGeneric(
-            #             register_name,
-            #             doc_info,
-            #             width,
-            #             attributes,
-            #             size,
-            #             entries,
-            #             syntax,
-            #             debug,
-            #             prefix,
-            #             shared,
-            #             reserved_mask,
-            #             None,
-            #             None,
-            #             None,
-            #             pseudo,
-            #             alignment,
-            #             None
-            #         )
-                    # registers[register_name] = reginfo2
-        utils.remove_ignored_attrib_regs(registers)
-        return registers
-    # except:
-        if sys.argv[1] != "-h":
-            print("Error detected when running : " + parse_registers_from_adl.__name__)
-            print("No XML model is provided in the command line! Please run make_td.py with a proper XML file as first argument!")
-        parser = argparse.ArgumentParser()
-        parser.add_argument("file", type=str)
-        parser.add_argument("--extension", "-e", dest="extension", type=str)  # Elimină "="
-        parser.add_argument("--output", "-o", dest='output', type=str)
-        parser.add_argument("--no-sail", dest='no_sail', type=str)
-        parser.print_help(sys.stderr)
-        sys.exit(1)
+        return load_model(adl_name).registers()
 
 def get_alias_for_regs(adl_name: str) -> dict:
     """
@@ -276,47 +1063,7 @@ def get_alias_for_regs(adl_name: str) -> dict:
     """
 
     try:
-        tree = ET.parse(adl_name)
-        root = tree.getroot()
-        alias_dict = dict()
-        instrfield_dict = dict()
-        instrfield_data = dict()
-        for core in root.iter("cores"):
-            for instr_field in core.iter("instrfield"):
-                instruction_field = instr_field.attrib["name"]
-                parameters = dict()
-                enumerated_dict = dict()
-                list_range = list()
-                range_tuples = list()
-                for instr in instr_field:
-                    for elem in instr:
-                        parameters[instr.tag] = elem.text
-                        if instr.tag == "bits":
-                            for instr_bits in instr.iter("range"):
-                                for index in range(len(instr_bits)):
-                                    list_range.append(instr_bits[index].text)
-                                    if len(list_range) >= 2:
-                                        range_tuple = (list_range[0], list_range[1])
-                                        if range_tuple not in range_tuples:
-                                            range_tuples.append(range_tuple)
-                                            list_range.clear()
-                        enumerated_list = [option[0].text for option in elem.iter("option")]
-                        if elem.attrib != {}:
-                            if elem.attrib["name"] not in enumerated_dict.keys():
-                                enumerated_dict[elem.attrib["name"]] = enumerated_list
-                            else:
-                                enumerated_dict[elem.attrib["name"]] += enumerated_list
-                    parameters["aliases"] = enumerated_dict
-                    list_tuples_range = list()
-                    for elem in range_tuples:
-                        elem = list(elem)
-                        list_tuples_range.append(elem)
-                    parameters["range"] = list_tuples_range
-                instrfield_data[instruction_field] = parameters
-                if "ref" in parameters.keys():
-                    alias_dict[parameters["ref"]] = parameters["aliases"]
-                    instrfield_dict[instruction_field] = parameters["aliases"]
-        return alias_dict
+        return load_model(adl_name).register_aliases()
     except:
         if sys.argv[1] != "-h":
             print("Error detected when running : " + get_alias_for_regs.__name__)
@@ -347,54 +1094,7 @@ def get_instrfield_offset(adl_name: str) -> tuple[dict, dict]:
     """
 
     try:
-        tree = ET.parse(adl_name)
-        root = tree.getroot()
-        alias_dict = dict()
-        instrfield_dict = dict()
-        instrfield_data = dict()
-        instrfield_data_ref = dict()
-        instrfield_offset = dict()
-        for core in root.iter("cores"):
-            for instr_field in core.iter("instrfield"):
-                instruction_field = instr_field.attrib["name"]
-                parameters = dict()
-                enumerated_dict = dict()
-                exclude_values = dict()
-                for instr in instr_field:
-                    for elem in instr:
-                        parameters[instr.tag] = elem.text
-                        if instr.tag == "enumerated":
-                            enumerated_list = [
-                                option[0].text for option in elem.iter("option")
-                            ]
-                            if elem.attrib != {}:
-                                if elem.attrib["name"] not in enumerated_dict.keys():
-                                    enumerated_dict[elem.attrib["name"]] = enumerated_list
-                                else:
-                                    enumerated_dict[elem.attrib["name"]] += enumerated_list
-                        if instr.tag == "excluded_values":
-                            enumerated_list = [
-                                option[0].text for option in elem.iter("option")
-                            ]
-                            if elem.attrib != {}:
-                                if elem.attrib["name"] not in exclude_values.keys():
-                                    exclude_values[elem.attrib["name"]] = enumerated_list
-                                else:
-                                    exclude_values[elem.attrib["name"]] += enumerated_list
-                    if instr.tag == "enumerated":
-                        parameters["enumerated"] = enumerated_dict
-                    if instr.tag == "excluded_values":
-                        parameters["excluded_values"] = exclude_values
-                instrfield_data[instruction_field] = parameters
-                if "ref" in parameters.keys():
-                    if "enumerated" in parameters.keys():
-                        alias_dict[parameters["ref"]] = parameters["enumerated"]
-                        instrfield_dict[instruction_field] = parameters["enumerated"]
-        for key in instrfield_data.keys():
-            if "ref" in instrfield_data[key].keys():
-                instrfield_data_ref[key] = instrfield_data[key]
-        instrfield_offset = utils.get_instrfield_offset(instrfield_data_ref)
-        return instrfield_offset, instrfield_data_ref
+        return load_model(adl_name).instrfield_offsets()
     except:
         if sys.argv[1] != "-h":
             print("Error detected when running : " + get_instrfield_offset.__name__)
@@ -429,51 +1129,7 @@ def get_instrfield_from_adl(adl_name: str) -> tuple[dict, dict]:
     """
 
     try:
-        tree = ET.parse(adl_name)
-        root = tree.getroot()
-        instrfield_dict = dict()
-        instrfield_data_ref = dict()
-        instrfield_data_imm = dict()
-        for core in root.iter("cores"):
-            for instr_field in core.iter("instrfield"):
-                instruction_field = instr_field.attrib["name"]
-                parameters = dict()
-                enumerated_dict = dict()
-                list_range = list()
-                range_tuples = list()
-                for instr in instr_field:
-                    for elem in instr:
-                        parameters[instr.tag] = elem.text
-                        if instr.tag == "enumerated":
-                            enumerated_list = [
-                                option[0].text for option in elem.iter("option")
-                            ]
-                        if instr.tag == "bits":
-                            for instr_bits in instr.iter("range"):
-                                for index in range(len(instr_bits)):
-                                    list_range.append(instr_bits[index].text)
-                                    if len(list_range) >= 2:
-                                        range_tuple = (list_range[0], list_range[1])
-                                        if range_tuple not in range_tuples:
-                                            range_tuples.append(range_tuple)
-                                            list_range.clear()
-                        enumerated_list = [option[0].text for option in elem.iter("option")]
-                        if elem.attrib != {}:
-                            if elem.attrib["name"] not in enumerated_dict.keys():
-                                enumerated_dict[elem.attrib["name"]] = enumerated_list
-                            else:
-                                enumerated_dict[elem.attrib["name"]] += enumerated_list
-                    parameters["aliases"] = enumerated_dict
-                    list_tuples_range = list()
-                    for elem in range_tuples:
-                        elem = list(elem)
-                        list_tuples_range.append(elem)
-                    parameters["range"] = list_tuples_range
-                if "ref" in parameters.keys():
-                    instrfield_data_ref[instruction_field] = parameters
-                else:
-                    instrfield_data_imm[instruction_field] = parameters
-        return instrfield_data_imm, instrfield_data_ref
+        return load_model(adl_name).instrfields()
     except:
         if sys.argv[1] != "-h":
             print("Error detected when running : " + get_instrfield_from_adl.__name__)
@@ -507,130 +1163,7 @@ def parse_instructions_from_adl(adl_name: str) -> tuple[dict, list, list]:
     """
 
     try:
-        instrfield_imm = get_instrfield_from_adl(adl_name)[0]
-        instrfield_ref = get_instrfield_from_adl(adl_name)[1]
-        tree = ET.parse(adl_name)
-        root = tree.getroot()
-        instructions = dict()
-        sorting_attributes = list()
-        for core in root.iter("cores"):
-            for instr in core.iter("instruction"):
-                attributes = list()
-                list_fields = list()
-                instruction = instr.attrib["name"]
-                parameters = dict()
-                list_inputs = list()
-                intrinsic_args_list = list()
-                list_outputs = list()
-                fields = dict()
-                syntax_list = list()
-                dsyntax_list = list()
-                enumerated_dict = dict()
-                args_dict = dict()
-                intrinsic_parsed = False
-                for instruction_info in instr:
-                    for elem in instruction_info:
-                        parameters[instruction_info.tag] = elem.text
-                        if instruction_info.tag == "syntax":
-                            x = re.split(r"[, ]", elem.text)
-                            syntax_list.extend(x)
-                        if instruction_info.tag == "dsyntax":
-                            x = re.split(r"[, ]", elem.text)
-                            dsyntax_list.extend(x)
-                        if instruction_info.tag == "inputs":
-                            for instr_ins in instr.iter("inputs"):
-                                for index in range(len(instr_ins)):
-                                    list_inputs.append(instr_ins[index].text)
-                        if instruction_info.tag == "intrinsic_args":
-                            for intrinsic_args in instr.iter("intrinsic_args"):
-                                for index in range(len(intrinsic_args)):
-                                    if intrinsic_parsed is False:
-                                        intrinsic_args_list.append(
-                                            intrinsic_args[index].text
-                                        )
-                            intrinsic_parsed = True
-                        if instruction_info.tag == "outputs":
-                            for instr_outs in instr.iter("outputs"):
-                                for index in range(len(instr_outs)):
-                                    list_outputs.append(instr_outs[index].text)
-                        if instruction_info.tag == "excluded_values":
-                            enumerated_list = [
-                                option[0].text for option in elem.iter("option")
-                            ]
-                            if elem.attrib != {}:
-                                if elem.attrib["name"] not in enumerated_dict.keys():
-                                    if len(enumerated_list) > 0:
-                                        enumerated_dict[
-                                            elem.attrib["name"]
-                                        ] = enumerated_list
-                                else:
-                                    if len(enumerated_list) > 0:
-                                        enumerated_dict[
-                                            elem.attrib["name"]
-                                        ] += enumerated_list
-                                parameters["excluded_values"] = enumerated_dict
-                        if instruction_info.tag == "intrinsic_type":
-                            args_list = [
-                                option[0].text
-                                for option in elem.iter("instrfield_intrinsic")
-                            ]
-                            if elem.attrib != {}:
-                                if elem.attrib["name"] not in args_dict.keys():
-                                    if len(args_list) > 0:
-                                        args_dict[elem.attrib["name"]] = args_list
-                                else:
-                                    if len(args_list) > 0:
-                                        args_dict[elem.attrib["name"]] += args_list
-                                parameters["intrinsic_type"] = args_dict
-                        for attribute in instruction_info.iter("attribute"):
-                            if "name" in attribute.attrib.keys():
-                                attributes.append(attribute.attrib["name"])
-                        for field in instruction_info.iter("field"):
-                            if "name" in field.attrib.keys():
-                                if field[0].text is not None:
-                                    fields[field.attrib["name"]] = field[0].text
-                                else:
-                                    if field.attrib["name"] in instrfield_ref.keys():
-                                        fields[field.attrib["name"]] = "reg"
-                                    elif field.attrib["name"] in instrfield_imm.keys():
-                                        fields[field.attrib["name"]] = "imm"
-                list_fields.insert(len(list_fields), fields)
-                parameters["syntax"] = syntax_list
-                parameters["dsyntax"] = dsyntax_list
-                parameters["attributes"] = list(set(attributes))
-                for attribute in parameters["attributes"]:
-                    if attribute not in sorting_attributes:
-                        sorting_attributes.append(attribute)
-                parameters["fields"] = list(list_fields)
-                parameters["intrinsic_args"] = list(intrinsic_args_list)
-                parameters["inputs"] = list(set(list_inputs))
-                parameters["outputs"] = list(set(list_outputs))
-                check_instruction = True
-                for attribute in config_variables['IgnoredAttrib']:
-                    if attribute in parameters["attributes"]:
-                        check_instruction = False
-                        break
-                if check_instruction is True:
-                    instructions[instruction] = parameters
-        list_instructions_with_regs = list()
-        list_instructions_imms = list()
-        for key in instructions.keys():
-            if (
-                "imm" not in instructions[key]["fields"][0].values()
-                and len(instructions[key]["fields"][0].values()) != 0
-            ):
-                list_instructions_with_regs.append(key)
-            elif (
-                "imm" in instructions[key]["fields"][0].values()
-                and len(instructions[key]["fields"][0].values()) != 0
-            ):
-                list_instructions_imms.append(key)
-        return (
-            instructions,
-            list_instructions_with_regs,
-            list_instructions_imms,
-            sorting_attributes,
-        )
+        return load_model(adl_name).instructions()
     except:
         if sys.argv[1] != "-h":
             print("Error detected when running : " + parse_instructions_from_adl.__name__)
@@ -660,116 +1193,7 @@ def parse_instructions_aliases_from_adl(adl_name: str) -> dict:
     """
 
     try:
-        instrfield_imm = get_instrfield_from_adl(adl_name)[0]
-        instrfield_ref = get_instrfield_from_adl(adl_name)[1]
-        tree = ET.parse(adl_name)
-        root = tree.getroot()
-        instructions_aliases = dict()
-        for core in root.iter("cores"):
-            for instr in core.iter("instruction"):
-                attributes = list()
-                aliases = list()
-                list_fields = list()
-                instruction = instr.attrib["name"]
-                parameters = dict()
-                list_inputs = list()
-                list_outputs = list()
-                fields = dict()
-                syntax_list = list()
-                dsyntax_list = list()
-                miscs = dict()
-                args_dict = dict()
-                intrinsic_args_list = list()
-                for instruction_info in instr:
-                    for elem in instruction_info:
-                        parameters[instruction_info.tag] = elem.text
-                        if instruction_info.tag == "syntax":
-                            x = re.split(r"[, ]", elem.text)
-                            syntax_list.extend(x)
-                        if instruction_info.tag == "dsyntax":
-                            x = re.split(r"[, ]", elem.text)
-                            dsyntax_list.extend(x)
-                        if instruction_info.tag == "inputs":
-                            for instr_ins in instr.iter("inputs"):
-                                for index in range(len(instr_ins)):
-                                    list_inputs.append(instr_ins[index].text)
-                        if instruction_info.tag == "outputs":
-                            for instr_outs in instr.iter("outputs"):
-                                for index in range(len(instr_outs)):
-                                    list_outputs.append(instr_outs[index].text)
-                        if instruction_info.tag == "intrinsic_args":
-                            for intrinsic_args in instr.iter("intrinsic_args"):
-                                for index in range(len(intrinsic_args)):
-                                    intrinsic_args_list.append(intrinsic_args[index].text)
-                        for attribute in instruction_info.iter("attribute"):
-                            if "name" in attribute.attrib.keys():
-                                attributes.append(attribute.attrib["name"])
-                        for alias in instruction_info.iter("alias"):
-                            if "name" in alias.attrib.keys():
-                                aliases.append(alias.attrib["name"])
-                        if instruction_info.tag == "intrinsic_type":
-                            args_list = [
-                                option[0].text
-                                for option in elem.iter("instrfield_intrinsic")
-                            ]
-                            if elem.attrib != {}:
-                                if elem.attrib["name"] not in args_dict.keys():
-                                    if len(args_list) > 0:
-                                        args_dict[elem.attrib["name"]] = args_list
-                                else:
-                                    if len(args_list) > 0:
-                                        args_dict[elem.attrib["name"]] += args_list
-                                parameters["intrinsic_type"] = args_dict
-                    if instruction_info.tag == "aliases":
-                        fields = {}
-                        stack = [(instruction_info, fields)]
-                        while stack:
-                            elem, current_dict = stack.pop()
-                            for child in elem:
-                                if len(child) == 0:
-                                    current_dict[child.tag] = (
-                                        child.text.strip() if child.text else ""
-                                    )
-                                else:
-                                    if child.tag not in current_dict:
-                                        current_dict[child.tag] = []
-                                    new_dict = {}
-                                    current_dict[child.tag].append(new_dict)
-                                    stack.append((child, new_dict))
-                        for key, value in fields.items():
-                            for item in value:
-                                if "field" in item and "value" in item:
-                                    field_name = item["field"]
-                                    field_value = item["value"]
-                                    miscs[field_name] = field_value
-                        for field in instruction_info.iter("field"):
-                            if "name" in field.attrib.keys():
-                                if field[0].text is not None:
-                                    fields[field.attrib["name"]] = field[0].text
-                                else:
-                                    if field.attrib["name"] in instrfield_ref.keys():
-                                        fields[field.attrib["name"]] = "reg"
-                                    elif field.attrib["name"] in instrfield_imm.keys():
-                                        fields[field.attrib["name"]] = "imm"
-                list_fields.insert(len(list_fields), fields)
-                parameters["syntax"] = syntax_list
-                parameters["dsyntax"] = dsyntax_list
-                parameters["attributes"] = list(set(attributes))
-                if len(aliases) > 0:
-                    parameters["aliases"] = list(set(aliases))
-                parameters["fields"] = list(list_fields)
-                parameters["inputs"] = list(set(list_inputs))
-                parameters["outputs"] = list(set(list_outputs))
-                parameters["intrinsic_args"] = list(set(intrinsic_args_list))
-                check_instruction = True
-                for attribute in config_variables['IgnoredAttrib']:
-                    if attribute not in parameters["attributes"]:
-                        check_instruction = False
-                        break
-                if check_instruction is False:
-                    if "aliases" in parameters.keys():
-                        instructions_aliases[instruction] = parameters
-        return instructions_aliases
+        return load_model(adl_name).instruction_aliases()
     except:
         if sys.argv[1] != "-h":
             print("Error detected when running : " + parse_instructions_aliases_from_adl.__name__)
@@ -802,55 +1226,7 @@ def parse_registers_subregs(adl_name: str) -> dict:
     """
 
     try:
-        tree = ET.parse(adl_name)
-        root = tree.getroot()
-        registers = dict()
-        for core in root.iter("cores"):
-            for register in core.iter("regfile"):
-                xml_dict = {}
-                register_name = register.attrib["name"]
-                xml_dict["register_name"] = register_name
-                for element in register:
-                    if element.tag == "doc":
-                        xml_dict[element.tag] = element[0].text.strip()
-                    elif element.tag == "width":
-                        xml_dict[element.tag] = int(element[0].text)
-                    elif element.tag == "fields":
-                        fields_dict = {}
-                        for field_element in element:
-                            field_name = field_element.attrib["name"]
-                            field_dict = {}
-                            for sub_element in field_element:
-                                if sub_element.tag == "doc":
-                                    field_dict[sub_element.tag] = sub_element[
-                                        0
-                                    ].text.strip()
-                                elif sub_element.tag == "bits":
-                                    bits_dict = {}
-                                    for sub_sub_element in sub_element:
-                                        if sub_sub_element.tag == "range":
-                                            values = [
-                                                int(value.text) for value in sub_sub_element
-                                            ]
-                                            bits_dict[sub_sub_element.tag] = values
-                                    field_dict[sub_element.tag] = bits_dict
-                            fields_dict[field_name] = field_dict
-                        xml_dict[element.tag] = fields_dict
-                    elif element.tag == "attributes":
-                        attributes_dict = {}
-                        for attribute_element in element:
-                            attribute_name = attribute_element.attrib["name"]
-                            attribute_list = list()
-                            for sub_element in attribute_element:
-                                str_element = sub_element.find("str")
-                                if str_element is not None:
-                                    attribute_list.append(sub_element.tag)
-                            attributes_dict[attribute_name] = attribute_list
-                        xml_dict[element.tag] = attributes_dict
-                    elif element.tag == "shared":
-                        xml_dict[element.tag] = element.text
-                registers[register_name] = xml_dict
-        return registers
+        return load_model(adl_name).register_subregs()
     except:
         if sys.argv[1] != "-h":
             print("Error detected when running : " + parse_registers_subregs.__name__)
@@ -863,6 +1239,7 @@ def parse_registers_subregs(adl_name: str) -> dict:
         parser.print_help(sys.stderr)
         sys.exit(1)
 
+
 def parse_relocations(adl_name: str) -> dict:
     """
     Parses the information for relocations from an ADL file.
@@ -879,19 +1256,7 @@ def parse_relocations(adl_name: str) -> dict:
     """
 
     try:
-        tree = ET.parse(adl_name)
-        root = tree.getroot()
-        reloc_data = dict()
-        for core in root.iter("cores"):
-            for reloc_core in core.iter("relocations"):
-                for instr_field in reloc_core.iter("reloc"):
-                    reloc_name = instr_field.attrib["name"]
-                    parameters = dict()
-                    for instr in instr_field:
-                        for elem in instr:
-                            parameters[instr.tag] = elem.text
-                    reloc_data[reloc_name] = parameters
-        return reloc_data
+        return load_model(adl_name).relocations()
     except:
         if sys.argv[1] != "-h":
             print("Error detected when running : " + parse_relocations.__name__)
@@ -904,6 +1269,7 @@ def parse_relocations(adl_name: str) -> dict:
         parser.print_help(sys.stderr)
         sys.exit(1)
 
+
 def parse_sched_table_from_adl(adl_name: str) -> dict:
     """
     Parses the scheduling table from an ADL file.
@@ -919,70 +1285,29 @@ def parse_sched_table_from_adl(adl_name: str) -> dict:
         ET.ParseError: If the XML file cannot be parsed.
     """
 
-    # try:
-    tree = ET.parse(adl_name)
-    root = tree.getroot()
-    sched_table_dict = dict()
-    for core in root.iter("cores"):
-        for sched_table in core.iter("sched-table"):
-            if sched_table.attrib["name"] not in sched_table_dict.keys():
-                sched_table_dict[sched_table.attrib["name"]] = {}
-                resource_forwarding = dict()
-                pipelines = dict()
-                resources_list = list()
-                pipelines_list = list()
-                aux_pipeline = dict()
-                instruction_sched = dict()
-                for instr in core.iter("instruction-sched"):
-                    if "name" in instr.attrib.keys():
-                        parameters = dict()
-                        instruction_name = instr.attrib["name"]
-                        for instruction_info in instr:
-                            if instruction_info.tag == 'instruction_list':
-                                for elem in instruction_info:
-                                    aux = elem.text.split(",")
-                                parameters[instruction_info.tag] = aux
-                            else:
-                                for elem in instruction_info:
-                                    if instruction_info.tag == "pipelines":
-                                        pipeline_dict = dict()
-                                        for pipeline in instruction_info:
-                                            pipeline_name = pipeline.attrib['name']
-                                            pipeline_tags = dict()
-                                            for element in pipeline:
-                                                pipeline_tags[element.tag] = element[0].text
-                                            pipeline_dict[pipeline_name] = pipeline_tags
-                                            parameters[instruction_info.tag] = pipeline_dict
-                                    elif instruction_info.tag == "forwarding":
-                                        for resource in core.iter("read_resource"):
-                                            resource_dict = dict()
-                                            resources = dict()
-                                            resource_name = resource.attrib['name']
-                                            for element in resource:
-                                                for element_parsed in element:
-                                                    if element.tag == 'resource_list':
-                                                        if element_parsed.text is not None:
-                                                            resource_dict[element.tag] = element_parsed.text.split(",")
-                                                        else:
-                                                            resource_dict[element.tag] = []
-                                                    else:
-                                                        resource_dict[element.tag] = element_parsed.text
-                                            resources[resource_name] = resource_dict
-                                            if instruction_name not in resource_forwarding.keys():
-                                                if resource_name not in resources_list:
-                                                    aux = dict()
-                                                    aux[resource_name] = resource_dict
-                                                    resource_forwarding[instruction_name] = aux
-                                                    resources_list.append(resource_name)
-                                    else:
-                                        parameters[instruction_info.tag] = elem.text
-                    aux = dict()
-                    if instruction_name in resource_forwarding.keys():
-                        aux['forwarding'] = resource_forwarding[instruction_name]
-                    instruction_sched[instruction_name] = parameters
-                    instruction_sched[instruction_name].update(aux)
-                sched_table_dict[sched_table.attrib["name"]].update(instruction_sched)
-    return sched_table_dict
+    return load_model(adl_name).sched_tables()
+
+
+def parse_sched_index_from_adl(adl_name: str) -> dict:
+    """
+    Parses the scheduling classes of every instruction from an ADL file.
+
+    The scheduling generators look up the classes of an instruction in this
+    index instead of scanning the instruction list of every scheduling class.
+
+    Args:
+        adl_name (str): The ADL file from which the information will be parsed.
+
+    Returns:
+        dict: The scheduling classes indexed by instruction name, see _sched_index.
+
+    Raises:
+        FileNotFoundError: If the ADL file cannot be found.
+        ET.ParseError: If the XML file cannot be parsed.
+    """
+
+    return load_model(adl_name).sched_index()
+
 
 def parse_scheduling_model_params(adl_name: str) -> dict:
     """
@@ -1000,29 +1325,7 @@ def parse_scheduling_model_params(adl_name: str) -> dict:
     """
 
     try:
-        tree = ET.parse(adl_name)
-        root = tree.getroot()
-        sched_table_params = dict()
-        for core in root.iter("cores"):
-            for sched_table in core.iter("sched-table"):
-                if sched_table.attrib["name"] not in sched_table_params.keys():
-                    sched_table_params[sched_table.attrib["name"]] = {}
-                parameters = dict()
-                for info in sched_table:
-                    for elem in info:
-                        if info.tag != 'instruction-sched':
-                                parameters[info.tag] = elem.text
-                        if info.tag == 'FunctionalUnits':
-                            functional_dict = dict()
-                            for functional_unit in info :
-                                func_unit_dict = dict()
-                                func_unit_name = functional_unit.attrib['name']
-                                for element in functional_unit:
-                                    func_unit_dict[element.tag] = element[0].text
-                                functional_dict[func_unit_name] = func_unit_dict
-                            parameters[info.tag] = functional_dict
-                sched_table_params[sched_table.attrib["name"]].update(parameters)
-        return sched_table_params
+        return load_model(adl_name).scheduling_params()
     except:
         if sys.argv[1] != "-h":
             print("Error detected when running : " + parse_scheduling_model_params.__name__)
@@ -1034,5 +1337,3 @@ def parse_scheduling_model_params(adl_name: str) -> dict:
         parser.add_argument("--no-sail", dest='no_sail', type=str)
         parser.print_help(sys.stderr)
         sys.exit(1)
-
-
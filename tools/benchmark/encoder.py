@@ -0,0 +1,263 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+
+import argparse
+import os
+import random
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from tools.testing import parse
+from tools.testing import utils
+from tools.testing.encoding import write_refs
+
+DEFAULT_ADL = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "models",
+    "adl",
+    "release",
+    "rv32ic_zilsd_zclsd_release.adl.xml",
+)
+
+
+def operand_test_cases(
+    instruction: utils.Instruction,
+    instrfield_map: Dict[str, utils.InstrField],
+    random_cases: int,
+    rng: random.Random,
+) -> List[Dict[str, str]]:
+    """
+    Build the operand values of the test cases of an instruction.
+
+    The test cases sweep every operand while the other operands keep their last
+    value, as make_test does, followed by test cases drawing every operand at
+    random, including immediates out of the range of the field.
+
+    Args:
+        instruction: The Instruction object
+        instrfield_map: All the instruction fields of the model by name
+        random_cases: Number of random test cases
+        rng: The random generator
+
+    Returns:
+        List[Dict[str, str]]: The value of each operand of every test case
+    """
+    values: Dict[str, List[str]] = {}
+    for operand_name in utils.get_instruction_operands(instruction.syntax):
+        instrfield = instrfield_map.get(operand_name)
+        if instrfield is None:
+            values[operand_name] = [operand_name]
+        elif instrfield.enumerated:
+            values[operand_name] = [enum.value for enum in instrfield.enumerated]
+        elif instrfield.type == "imm":
+            values[operand_name] = utils.get_imm_values(
+                instrfield.width,
+                instrfield.shift or 0,
+                instrfield.sign_extension,
+                instrfield.signed,
+            )
+    defaults = {name: operand_values[-1] for name, operand_values in values.items()}
+    test_cases = []
+    for name, operand_values in values.items():
+        for value in operand_values:
+            test_case = defaults.copy()
+            test_case[name] = value
+            test_cases.append(test_case)
+    for _ in range(random_cases):
+        test_case = {}
+        for name, operand_values in values.items():
+            instrfield = instrfield_map.get(name)
+            if instrfield is not None and instrfield.type == "imm" and not instrfield.enumerated:
+                test_case[name] = hex(rng.randrange(-(1 << 32), 1 << 32))
+            else:
+                test_case[name] = rng.choice(operand_values)
+        test_cases.append(test_case)
+    return test_cases
+
+
+def batch_test_cases(
+    fields: Dict[str, str],
+    is_alias: bool,
+    instrfield_map: Dict[str, utils.InstrField],
+    count: int,
+    rng: np.random.Generator,
+) -> Tuple[Dict[str, np.ndarray], List[Dict[str, str]]]:
+    """
+    Draw random test cases of an encoding, for encode_batch() and for encode().
+
+    Registers and enumerated immediates are drawn among their option numbers and
+    one number which is not an option, immediates among all the uint64 values.
+
+    Args:
+        fields: The fields of the encoding
+        is_alias: True if the fields are the fields of an alias
+        instrfield_map: All the instruction fields of the model by name
+        count: Number of test cases
+        rng: The random generator
+
+    Returns:
+        Tuple: The array of every operand, and the operand values of every test
+            case as encode() takes them
+    """
+    arrays = {}
+    option_values = {}
+    encoder = utils.compile_instruction_encoder(fields, instrfield_map, is_alias)
+    operand_fields = {
+        (field_name if not is_alias else field_value): instrfield_map[field_name]
+        for field_name, field_value in fields.items()
+        if field_name in instrfield_map
+    }
+    for operand_key, _ in encoder.enumerated:
+        values = {}
+        for enum in operand_fields[operand_key].enumerated:
+            values.setdefault(int(enum.name), enum.value)
+        numbers = sorted(values) + [max(values, default=-1) + 1]
+        arrays[operand_key] = rng.choice(np.array(numbers, dtype=np.uint64), count)
+        option_values[operand_key] = values
+    for operand_key, _ in encoder.immediates:
+        arrays[operand_key] = rng.integers(0, 2**64, count, dtype=np.uint64)
+    test_cases = []
+    for index in range(count):
+        test_case = {}
+        for operand_key, values in arrays.items():
+            if operand_key in option_values:
+                test_case[operand_key] = option_values[operand_key].get(
+                    int(values[index])
+                )
+            else:
+                test_case[operand_key] = hex(int(values[index]))
+        test_cases.append(test_case)
+    return arrays, test_cases
+
+
+def instruction_encodings(
+    instruction: utils.Instruction, instruction_map: Dict[str, utils.Instruction]
+) -> List[Tuple[Dict[str, str], bool]]:
+    """
+    List the fields of each encoding of an instruction, as write_refs.compile_encoders() resolves them.
+
+    Args:
+        instruction: The Instruction object
+        instruction_map: All the instructions of the model by name
+
+    Returns:
+        List[Tuple[Dict[str, str], bool]]: The fields of every encoding, and
+            whether they are the fields of an alias
+    """
+    if instruction.aliases is None:
+        return [(instruction.fields, False)]
+    encodings = []
+    for alias in instruction.aliases:
+        alias_fields = instruction_map[alias.name].fields.copy()
+        alias_fields.update(alias.fields)
+        encodings.append((alias_fields, True))
+    return encodings
+
+
+def main() -> None:
+    """
+    Compares the speed of the compiled instruction encoders with
+    calculate_instruction_reference(), and of encode_batch() with encode().
+    tests/test_encoder.py checks that they all compute the same values.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the compiled instruction encoders",
+        usage="python -m tools.benchmark.encoder [adl_file] [--random N] [--batch N] [--repeat N]",
+    )
+    parser.add_argument("adl_file", type=str, nargs="?", default=DEFAULT_ADL)
+    parser.add_argument("--random", type=int, default=64)
+    parser.add_argument("--batch", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    adl_model = parse.load_adl_model(os.path.abspath(args.adl_file))
+    instruction_map = {
+        instruction.name: instruction for instruction in adl_model.instructions
+    }
+    instrfield_map = {field.name: field for field in adl_model.instrfields}
+    rng = random.Random(args.seed)
+
+    # Every test case, with the fields of each encoding to compute
+    cases = []
+    for instruction in adl_model.instructions:
+        encodings = instruction_encodings(instruction, instruction_map)
+        encoders = write_refs.compile_encoders(
+            instruction, instruction_map, instrfield_map
+        )
+        for operand_values in operand_test_cases(
+            instruction, instrfield_map, args.random, rng
+        ):
+            cases.append((instruction.name, encodings, encoders, operand_values))
+
+    reference_time = min(
+        _time(
+            lambda: [
+                utils.calculate_instruction_reference(
+                    fields, instrfield_map, operand_values, is_alias=is_alias
+                )
+                for _, encodings, _, operand_values in cases
+                for fields, is_alias in encodings
+            ]
+        )
+        for _ in range(args.repeat)
+    )
+    compiled_time = min(
+        _time(
+            lambda: [
+                encoder.encode(operand_values)
+                for _, _, encoders, operand_values in cases
+                for encoder in encoders
+            ]
+        )
+        for _ in range(args.repeat)
+    )
+    compile_time = min(
+        _time(
+            lambda: [
+                write_refs.compile_encoders(
+                    instruction, instruction_map, instrfield_map
+                )
+                for instruction in adl_model.instructions
+            ]
+        )
+        for _ in range(args.repeat)
+    )
+    print(f"ADL file: {args.adl_file} ({len(adl_model.instructions)} instructions, {len(cases)} test cases)")
+    print(f"reference:          {reference_time * 1000:9.2f} ms")
+    print(f"compiled encoders:  {compiled_time * 1000:9.2f} ms (+{compile_time * 1000:.2f} ms to compile)")
+    print(f"speedup:            {reference_time / compiled_time:9.2f}x")
+
+    # Batch encoding of random test cases, compared with the scalar encoder
+    batch_rng = np.random.default_rng(args.seed)
+    scalar_time = 0.0
+    batch_time = 0.0
+    for instruction in adl_model.instructions:
+        for (fields, is_alias), encoder in zip(
+            instruction_encodings(instruction, instruction_map),
+            write_refs.compile_encoders(instruction, instruction_map, instrfield_map),
+        ):
+            arrays, test_cases = batch_test_cases(
+                fields, is_alias, instrfield_map, args.batch, batch_rng
+            )
+            start = time.perf_counter()
+            [encoder.encode(operand_values) for operand_values in test_cases]
+            scalar_time += time.perf_counter() - start
+            start = time.perf_counter()
+            encoder.encode_batch(arrays)
+            batch_time += time.perf_counter() - start
+    print(f"scalar encoder:     {scalar_time * 1000:9.2f} ms")
+    print(f"batch encoder:      {batch_time * 1000:9.2f} ms")
+    print(f"speedup:            {scalar_time / batch_time:9.2f}x")
+
+
+def _time(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+
+import argparse
+import os
+import sys
+import time
+
+# The TD generators use flat imports relative to the tools folder
+TOOLS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+import adl_parser
+import files
+
+DEFAULT_ADL = os.path.join(
+    TOOLS_DIR, "..", "models", "adl", "release", "rv32ic_zilsd_zclsd_release.adl.xml"
+)
+
+
+def define_all_instructions(adl_file: str, shared_context: bool) -> float:
+    """
+    Generates the definition of every instruction in the ADL file.
+
+    Args:
+        adl_file: Path to the ADL XML file
+        shared_context: Build the define context once for the whole run instead
+            of once per instruction, as generate_instruction_define used to do
+
+    Returns:
+        float: Elapsed wall time in seconds
+    """
+    instructions, with_regs, with_imms, _ = adl_parser.parse_instructions_from_adl(
+        adl_file
+    )
+    start = time.perf_counter()
+    generation_context = files.GenerationContext()
+    context = None
+    if shared_context:
+        context = files.build_instruction_define_context(adl_file)
+    for key in instructions.keys():
+        if key not in with_regs and key not in with_imms:
+            continue
+        files.generate_instruction_define(
+            instructions,
+            with_regs if key in with_regs else with_imms,
+            key,
+            instructions[key]["width"],
+            [],
+            key in with_imms,
+            True,
+            [],
+            generation_context=generation_context,
+            context=(
+                context
+                if shared_context
+                else files.build_instruction_define_context(adl_file)
+            ),
+        )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """
+    Compares InstrInfo definition generation with a per-instruction context
+    against a single context shared by the whole run.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark generate_instruction_define with and without a shared context",
+        usage="python -m tools.benchmark.instruction_define [adl_file] [--repeat N]",
+    )
+    parser.add_argument("adl_file", type=str, nargs="?", default=DEFAULT_ADL)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    adl_file = os.path.abspath(args.adl_file)
+
+    instructions = adl_parser.parse_instructions_from_adl(adl_file)[0]
+    results = dict()
+    for shared_context in (False, True):
+        results[shared_context] = min(
+            define_all_instructions(adl_file, shared_context)
+            for _ in range(args.repeat)
+        )
+    print(f"ADL file: {adl_file} ({len(instructions)} instructions)")
+    print(f"per-instruction context: {results[False] * 1000:9.2f} ms")
+    print(f"shared context:          {results[True] * 1000:9.2f} ms")
+    print(f"speedup:                 {results[False] / results[True]:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,397 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+## @package scaling
+#
+# Scaling benchmark of the generation tools on synthetic ADL models
+#
+# The TD generator (main.py), the encoding test generator (make_test) and the
+# relocation test generator (make_reloc) are run as separate processes, as a
+# user runs them, on synthetic models (see synthetic_adl) of growing size. The
+# instruction, instruction field, relocation and scheduling class counts grow
+# with the scale factor, the register file size and the number of extensions do
+# not. The tools run from a scratch copy of the tools folder, because main.py
+# updates the configuration and the in-tree test folders.
+#
+# The exponent of the power law fitted on the timings of every tool is printed,
+# 1 meaning linear scaling, and the results may be saved as JSON. The compare
+# command checks the results of a change against the results of a baseline and
+# exits with status 1 when a tool got slower or used more memory:
+#
+#   python -m tools.benchmark.scaling run --json baseline.json
+#   python -m tools.benchmark.scaling run --json current.json
+#   python -m tools.benchmark.scaling compare baseline.json current.json
+import argparse
+import json
+import math
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from tools.benchmark import synthetic_adl
+
+## Folder of the generation tools
+TOOLS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+## Version of the JSON results format
+RESULTS_VERSION = 2
+
+## Benchmarked tools
+TOOLS = ("main", "make_test", "make_reloc")
+
+## Maximum symbol value given to make_reloc
+SYMBOL_MAX_VALUE = 10
+
+## Default relative increase of the median time flagged as a regression
+TIME_THRESHOLD = 0.25
+
+## Default relative increase of the peak memory flagged as a regression
+MEMORY_THRESHOLD = 0.10
+
+## Increase of the median time below which a change is never flagged, in seconds
+MIN_TIME_DELTA = 0.05
+
+
+def tool_command(tool: str, adl_file: str, output_dir: str) -> List[str]:
+    """
+    Builds the command line running a tool from the scratch workspace.
+
+    Args:
+        tool (str): One of TOOLS.
+        adl_file (str): The model.
+        output_dir (str): The folder receiving the outputs of the tool.
+
+    Returns:
+        List[str]: The command, run from the workspace folder.
+    """
+    if tool == "main":
+        return [sys.executable, os.path.join("tools", "main.py"), adl_file, "--output", output_dir, "--no-cache"]
+    if tool == "make_test":
+        return [sys.executable, "-m", "tools.testing.encoding.make_test", adl_file, "-o", output_dir, "--no-cache"]
+    if tool == "make_reloc":
+        return [
+            sys.executable,
+            "-m",
+            "tools.testing.relocations.make_reloc",
+            adl_file,
+            str(SYMBOL_MAX_VALUE),
+            "-o",
+            output_dir,
+            "--no-cache",
+        ]
+    raise ValueError("unknown tool: " + tool)
+
+
+def run_tool(tool: str, adl_file: str, workspace: str) -> tuple:
+    """
+    Runs a tool once on a model.
+
+    Args:
+        tool (str): One of TOOLS.
+        adl_file (str): The model.
+        workspace (str): The scratch folder holding the copy of the tools.
+
+    Returns:
+        tuple: The elapsed wall time in seconds, and the peak resident memory
+            of the tool process in bytes (None if the platform does not report it).
+
+    Raises:
+        RuntimeError: If the tool fails.
+    """
+    output_dir = os.path.join(workspace, "output")
+    shutil.rmtree(output_dir, ignore_errors=True)
+    env = dict(os.environ, PYTHONHASHSEED="0")
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        tool_command(tool, adl_file, output_dir),
+        cwd=workspace,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    stderr = process.stderr.read()
+    process.stderr.close()
+    peak_memory = None
+    if hasattr(os, "wait4"):
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+        peak_memory = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+    else:
+        process.wait()
+    elapsed = time.perf_counter() - start
+    shutil.rmtree(output_dir, ignore_errors=True)
+    if process.returncode != 0:
+        raise RuntimeError(f"{tool} failed on {adl_file}:\n{stderr}")
+    return elapsed, peak_memory
+
+
+def fit_exponent(scales: List[float], seconds: List[float]) -> float:
+    """
+    Fits a power law on timings, with least squares in log-log space.
+
+    Args:
+        scales (List[float]): The scale factors of the models.
+        seconds (List[float]): The timing of every model.
+
+    Returns:
+        float: The exponent of the power law, 1 for linear scaling.
+    """
+    xs = [math.log(scale) for scale in scales]
+    ys = [math.log(value) for value in seconds]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=TOOLS_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(sizes: Dict[str, int], scales: List[int], tools=TOOLS, repeat: int = 1) -> dict:
+    """
+    Times the tools on the synthetic models of every scale.
+
+    Args:
+        sizes (Dict[str, int]): The sizes of the smallest model, see synthetic_adl.generate_model().
+        scales (List[int]): The scale factors of the models, at least two of them.
+        tools: The benchmarked tools, among TOOLS.
+        repeat (int): Number of runs of every tool on every model, the median
+            time and the largest peak memory are kept.
+
+    Returns:
+        dict: The results, as written in the JSON file.
+    """
+    results = {
+        "version": RESULTS_VERSION,
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "sizes": sizes,
+        "scales": scales,
+        "tools": {tool: {"runs": []} for tool in tools},
+    }
+    with tempfile.TemporaryDirectory(prefix="adl_scaling_") as workspace:
+        shutil.copytree(
+            TOOLS_DIR,
+            os.path.join(workspace, "tools"),
+            ignore=shutil.ignore_patterns("__pycache__", ".stamps"),
+        )
+        for scale in scales:
+            model_sizes = dict(sizes)
+            for name in ("instructions", "instrfields", "relocations", "sched_entries"):
+                model_sizes[name] = sizes[name] * scale
+            adl_file = synthetic_adl.write_model(os.path.join(workspace, f"synthetic_x{scale}.adl.xml"), **model_sizes)
+            for tool in tools:
+                measures = [run_tool(tool, adl_file, workspace) for _ in range(repeat)]
+                seconds = [elapsed for elapsed, _ in measures]
+                peaks = [peak for _, peak in measures if peak is not None]
+                run = {
+                    "scale": scale,
+                    "seconds": seconds,
+                    "median": statistics.median(seconds),
+                    "peak_memory": max(peaks) if peaks else None,
+                }
+                results["tools"][tool]["runs"].append(run)
+                print(
+                    f"x{scale:<4d} {model_sizes['instructions']:6d} instructions  {tool:10s} "
+                    f"{run['median'] * 1000:10.1f} ms {_megabytes(run['peak_memory']):>9s} MB"
+                )
+    for tool in tools:
+        medians = [run["median"] for run in results["tools"][tool]["runs"]]
+        results["tools"][tool]["exponent"] = fit_exponent(scales, medians)
+    return results
+
+
+def _megabytes(size: Optional[int]) -> str:
+    return "-" if size is None else f"{size / (1024 * 1024):.1f}"
+
+
+def _increase(old: Optional[float], new: Optional[float]) -> Optional[float]:
+    if old is None or new is None or old <= 0:
+        return None
+    return new / old - 1
+
+
+def compare_results(
+    baseline: dict,
+    current: dict,
+    time_threshold: float = TIME_THRESHOLD,
+    memory_threshold: float = MEMORY_THRESHOLD,
+    min_time_delta: float = MIN_TIME_DELTA,
+) -> tuple:
+    """
+    Compares the results of two benchmark runs on the same synthetic models.
+
+    A tool regressed on a model when its median time increased by more than
+    time_threshold (and by more than min_time_delta seconds, to ignore the noise
+    of the short runs), or when its peak memory increased by more than
+    memory_threshold.
+
+    Args:
+        baseline (dict): The results of the reference run.
+        current (dict): The results of the checked run.
+        time_threshold (float): The largest accepted relative increase of the median time.
+        memory_threshold (float): The largest accepted relative increase of the peak memory.
+        min_time_delta (float): The smallest flagged increase of the median time, in seconds.
+
+    Returns:
+        tuple: The comparison table, and the list of regressions as "tool xscale: reason" strings.
+
+    Raises:
+        ValueError: If the results do not use the same format, model sizes or scales.
+    """
+    for results in (baseline, current):
+        if results.get("version") != RESULTS_VERSION:
+            raise ValueError(f"unsupported results version {results.get('version')}, expected {RESULTS_VERSION}")
+    for key in ("sizes", "scales"):
+        if baseline[key] != current[key]:
+            raise ValueError(f"the results were measured with different {key}: {baseline[key]} and {current[key]}")
+    lines = [
+        f"{'tool':10s} {'scale':>5s} {'base ms':>10s} {'ms':>10s} {'time':>7s} "
+        f"{'base MB':>9s} {'MB':>9s} {'memory':>7s}"
+    ]
+    regressions = list()
+    for tool, tool_results in current["tools"].items():
+        if tool not in baseline["tools"]:
+            continue
+        base_runs = {run["scale"]: run for run in baseline["tools"][tool]["runs"]}
+        for run in tool_results["runs"]:
+            base = base_runs[run["scale"]]
+            time_increase = _increase(base["median"], run["median"])
+            memory_increase = _increase(base["peak_memory"], run["peak_memory"])
+            flags = list()
+            if (
+                time_increase is not None
+                and time_increase > time_threshold
+                and run["median"] - base["median"] > min_time_delta
+            ):
+                flags.append(f"median time +{time_increase:.0%}")
+            if memory_increase is not None and memory_increase > memory_threshold:
+                flags.append(f"peak memory +{memory_increase:.0%}")
+            regressions.extend(f"{tool} x{run['scale']}: {flag}" for flag in flags)
+            time_change = "-" if time_increase is None else f"{time_increase:+.0%}"
+            memory_change = "-" if memory_increase is None else f"{memory_increase:+.0%}"
+            lines.append(
+                f"{tool:10s} {run['scale']:5d} {base['median'] * 1000:10.1f} {run['median'] * 1000:10.1f} "
+                f"{time_change:>7s} {_megabytes(base['peak_memory']):>9s} {_megabytes(run['peak_memory']):>9s} "
+                f"{memory_change:>7s}{'  REGRESSION' if flags else ''}"
+            )
+        lines.append(
+            f"{tool:10s} fitted exponent: {baseline['tools'][tool]['exponent']:6.2f} -> {tool_results['exponent']:6.2f}"
+        )
+    return "\n".join(lines), regressions
+
+
+def _load_results(file_name: str) -> dict:
+    with open(file_name) as f:
+        return json.load(f)
+
+
+def main() -> None:
+    """
+    Runs the benchmark and saves its results (run), or checks the results of a
+    change against a baseline, exiting with status 1 on a regression (compare).
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the scaling of the generation tools on synthetic ADL models",
+        usage="python -m tools.benchmark.scaling {run,compare} ...",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser(
+        "run",
+        help="time the tools on synthetic models",
+        usage="python -m tools.benchmark.scaling run [--instructions N] ... [--scales 1,2,4,8] [--json FILE]",
+    )
+    run_parser.add_argument("--instructions", type=int, default=64)
+    run_parser.add_argument("--instrfields", type=int, default=8)
+    run_parser.add_argument("--registers", type=int, default=32)
+    run_parser.add_argument("--extensions", type=int, default=2)
+    run_parser.add_argument("--relocations", type=int, default=16)
+    run_parser.add_argument("--sched-entries", dest="sched_entries", type=int, default=8)
+    run_parser.add_argument("--scales", type=str, default="1,2,4,8")
+    run_parser.add_argument("--tools", type=str, default=",".join(TOOLS))
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--json", dest="json_file", type=str)
+    compare_parser = commands.add_parser(
+        "compare",
+        help="check benchmark results against a baseline",
+        usage="python -m tools.benchmark.scaling compare baseline.json current.json [--time-threshold R] "
+        "[--memory-threshold R] [--min-time-delta S]",
+    )
+    compare_parser.add_argument("baseline", type=str)
+    compare_parser.add_argument("current", type=str)
+    compare_parser.add_argument("--time-threshold", dest="time_threshold", type=float, default=TIME_THRESHOLD)
+    compare_parser.add_argument("--memory-threshold", dest="memory_threshold", type=float, default=MEMORY_THRESHOLD)
+    compare_parser.add_argument("--min-time-delta", dest="min_time_delta", type=float, default=MIN_TIME_DELTA)
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        try:
+            table, regressions = compare_results(
+                _load_results(args.baseline),
+                _load_results(args.current),
+                args.time_threshold,
+                args.memory_threshold,
+                args.min_time_delta,
+            )
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Cannot compare {args.baseline} and {args.current}: {e}", file=sys.stderr)
+            sys.exit(2)
+        print(table)
+        if regressions:
+            print(f"{len(regressions)} regression(s):")
+            for regression in regressions:
+                print("  " + regression)
+            sys.exit(1)
+        print("no regression")
+        return
+
+    scales = [int(scale) for scale in args.scales.split(",")]
+    tools = args.tools.split(",")
+    if len(scales) < 2 or min(scales) < 1:
+        run_parser.error("--scales needs at least two positive scale factors")
+    if args.repeat < 1:
+        run_parser.error("--repeat needs at least one run")
+    for tool in tools:
+        if tool not in TOOLS:
+            run_parser.error(f"unknown tool {tool}, expected one of {', '.join(TOOLS)}")
+    sizes = {
+        "instructions": args.instructions,
+        "instrfields": args.instrfields,
+        "registers": args.registers,
+        "extensions": args.extensions,
+        "relocations": args.relocations,
+        "sched_entries": args.sched_entries,
+    }
+    try:
+        results = run_benchmark(sizes, scales, tools, args.repeat)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    for tool in tools:
+        print(f"{tool:10s} fitted exponent: {results['tools'][tool]['exponent']:6.2f}")
+    if args.json_file:
+        with open(args.json_file, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+
+import argparse
+import math
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+# The TD generators use flat imports relative to the tools folder
+TOOLS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+import adl_model
+import adl_parser
+
+## Largest exponent of the fitted power law still accepted as linear
+MAX_EXPONENT = 1.3
+
+
+def synthetic_sched_table(entries: int) -> ET.Element:
+    """
+    Builds a <sched-table> element in which every scheduling class forwards its own read resource.
+
+    Args:
+        entries: Number of <instruction-sched> elements
+
+    Returns:
+        ET.Element: The <sched-table> element
+    """
+    sched_table = ET.Element("sched-table", name="synthetic")
+    for index in range(entries):
+        instr = ET.SubElement(sched_table, "instruction-sched", name=f"Class{index}")
+        instruction_list = ET.SubElement(instr, "instruction_list")
+        ET.SubElement(instruction_list, "str").text = f"instr{index}"
+        latency = ET.SubElement(instr, "latency")
+        ET.SubElement(latency, "int").text = "2"
+        forwarding = ET.SubElement(instr, "forwarding")
+        resource = ET.SubElement(forwarding, "read_resource", name=f"Read{index}")
+        value = ET.SubElement(resource, "value")
+        ET.SubElement(value, "int").text = "1"
+    return sched_table
+
+
+def parse_sched_tables(entries: int) -> float:
+    """
+    Builds the scheduling tables view of a synthetic model.
+
+    Args:
+        entries: Number of scheduling classes of the model
+
+    Returns:
+        float: Elapsed wall time in seconds
+    """
+    model = adl_model.AdlModel(
+        instructions=[],
+        instrfields=[],
+        relocations=[],
+        subtrees={"regfile": [], "sched-table": [synthetic_sched_table(entries)]},
+    )
+    start = time.perf_counter()
+    sched_tables = adl_parser.AdlModel("synthetic.adl.xml", model).sched_tables()
+    elapsed = time.perf_counter() - start
+    assert len(sched_tables["synthetic"]) == entries
+    return elapsed
+
+
+def fitted_exponent(results: dict) -> float:
+    """
+    Fits a power law to the timings of the smallest and the largest model.
+
+    Args:
+        results: Elapsed wall time in seconds by number of scheduling classes
+
+    Returns:
+        float: Slope of the log-log fit, 1.0 for a linear scaling
+    """
+    smallest = min(results)
+    largest = max(results)
+    return math.log(results[largest] / results[smallest]) / math.log(largest / smallest)
+
+
+def main() -> None:
+    """
+    Checks that building the scheduling tables scales linearly with the number
+    of scheduling classes, exiting with status 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the scheduling table parsing on synthetic models",
+        usage="python -m tools.benchmark.sched_table [--entries N] [--repeat N]",
+    )
+    parser.add_argument("--entries", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sizes = [args.entries // 8, args.entries // 4, args.entries // 2, args.entries]
+    results = dict()
+    for size in sizes:
+        results[size] = min(parse_sched_tables(size) for _ in range(args.repeat))
+        print(
+            f"{size:7d} sched entries: {results[size] * 1000:9.2f} ms "
+            f"({results[size] * 1e6 / size:7.2f} us/entry)"
+        )
+    exponent = fitted_exponent(results)
+    print(f"fitted exponent:       {exponent:9.2f} (linear <= {MAX_EXPONENT})")
+    if exponent > MAX_EXPONENT:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
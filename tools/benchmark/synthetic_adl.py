@@ -0,0 +1,232 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+## @package synthetic_adl
+#
+# Generator of synthetic ADL models for the scaling benchmarks
+#
+# The release models only describe a few dozen instructions, which hides any
+# superlinear behavior of the generators. This module grows the RV32IC
+# Zilsd/Zclsd release model into a model of any size. The new elements are
+# copies of release elements (the add and slli instructions, the shamt
+# instruction field, the R_RISCV_32 relocation and the first scheduling class),
+# so the model follows the schema the generators expect, and every synthetic
+# instruction gets a distinct encoding in the custom opcode space.
+import argparse
+import copy
+import os
+import re
+import xml.etree.ElementTree as ET
+
+## Folder of the release models used as templates
+RELEASE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "models",
+    "adl",
+    "release",
+)
+
+## Model grown into the synthetic model
+BASE_MODEL = os.path.join(RELEASE_DIR, "rv32ic_zilsd_zclsd_release.adl.xml")
+
+## Model holding the shift instructions and fields missing from the base model
+SHIFT_MODEL = os.path.join(RELEASE_DIR, "rv32ic_release.adl.xml")
+
+## Major opcodes of the synthetic register-register instructions (custom-0, custom-1)
+REGISTER_OPCODES = (11, 43)
+
+## Major opcodes of the synthetic register-immediate instructions (custom-2, custom-3)
+IMMEDIATE_OPCODES = (91, 123)
+
+## Number of distinct encodings available for each kind of synthetic instruction
+MAX_ENCODINGS = 2 * 8 * 128
+
+## Registers described by the base model
+BASE_REGISTERS = 32
+
+
+def _find(parent: ET.Element, tag: str, name: str) -> ET.Element:
+    for element in parent.iter(tag):
+        if element.get("name") == name:
+            return element
+    raise ValueError(f"<{tag} name=\"{name}\"> not found in the template model")
+
+
+def _rename(element: ET.Element, names: dict) -> ET.Element:
+    """
+    Copies an element, replacing whole identifiers everywhere inside it.
+
+    Args:
+        element (ET.Element): The template element.
+        names (dict): The new identifier of every replaced identifier.
+
+    Returns:
+        ET.Element: The renamed copy.
+    """
+    text = ET.tostring(element, encoding="unicode")
+    for old, new in names.items():
+        text = re.sub(r"(?<![A-Za-z0-9.])" + re.escape(old) + r"(?![A-Za-z0-9.])", new, text)
+    return ET.fromstring(text)
+
+
+def _set_field(instruction: ET.Element, name: str, value: int):
+    _find(instruction.find("fields"), "field", name).find("int").text = str(value)
+
+
+def _encoding(index: int, opcodes: tuple) -> tuple:
+    """
+    Returns the distinct (opcode, funct3, funct7) triple of a synthetic instruction.
+    """
+    index %= MAX_ENCODINGS
+    return opcodes[index % 2], (index // 2) % 8, index // 16
+
+
+def generate_model(
+    instructions: int = 64,
+    instrfields: int = 8,
+    registers: int = 32,
+    extensions: int = 2,
+    relocations: int = 16,
+    sched_entries: int = 8,
+) -> ET.ElementTree:
+    """
+    Builds a synthetic ADL model.
+
+    Half of the synthetic instructions are register-register operations, the
+    other half shift a register by one of the synthetic immediate fields (all of
+    them are register-register operations when instrfields is 0). The
+    instructions are spread over the extensions and the scheduling classes.
+
+    Args:
+        instructions (int): Number of synthetic instructions.
+        instrfields (int): Number of synthetic immediate instruction fields.
+        registers (int): Size of the GPR register file, at least 32.
+        extensions (int): Number of extensions the synthetic instructions belong
+            to (rv32i, then xsyn1, xsyn2...).
+        relocations (int): Number of synthetic relocations.
+        sched_entries (int): Number of synthetic scheduling classes.
+
+    Returns:
+        ET.ElementTree: The model.
+
+    Raises:
+        ValueError: If a size is out of range.
+    """
+    if registers < BASE_REGISTERS:
+        raise ValueError(f"the register file holds at least {BASE_REGISTERS} registers")
+    if extensions < 1:
+        raise ValueError("the synthetic instructions belong to at least one extension")
+    tree = ET.parse(BASE_MODEL)
+    core = tree.getroot().find("cores/core")
+    shift_core = ET.parse(SHIFT_MODEL).getroot().find("cores/core")
+
+    # Register file
+    regfile = _find(core.find("regfiles"), "regfile", "GPR")
+    regfile.find("size/int").text = str(registers)
+    calling_convention = regfile.find("calling_convention")
+    for index in range(BASE_REGISTERS, registers):
+        option = ET.SubElement(calling_convention, "option", name=f"X{index}")
+        ET.SubElement(option, "str").text = "Temporary"
+    instrfields_element = core.find("instrfields")
+    for instrfield in instrfields_element:
+        enumerated = instrfield.find("enumerated")
+        if instrfield.get("name") in ("rd", "rs1", "rs2", "rx") and enumerated is not None:
+            for index in range(BASE_REGISTERS, registers):
+                option = ET.SubElement(enumerated, "option", name=str(index))
+                ET.SubElement(option, "str").text = f"x{index}"
+
+    # Instruction fields
+    immediate_names = [f"syn_imm{index}" for index in range(instrfields)]
+    if instrfields > 0:
+        instrfields_element.append(copy.deepcopy(_find(shift_core, "instrfield", "funct7_shift")))
+    shamt = _find(shift_core, "instrfield", "shamt")
+    for name in immediate_names:
+        instrfields_element.append(_rename(shamt, {"shamt": name}))
+
+    # Instructions
+    extension_names = ["rv32i"] + [f"xsyn{index}" for index in range(1, extensions)]
+    register_template = _find(core.find("instrs"), "instruction", "add")
+    shift_template = _find(shift_core, "instruction", "slli")
+    instrs = core.find("instrs")
+    names = list()
+    for index in range(instructions):
+        name = f"syn{index}"
+        if immediate_names and index % 2 == 1:
+            instruction = _rename(shift_template, {"slli": name, "shamt": immediate_names[index // 2 % instrfields]})
+            opcode, funct3, funct7 = _encoding(index // 2, IMMEDIATE_OPCODES)
+            _set_field(instruction, "funct7_shift", funct7)
+        else:
+            instruction = _rename(register_template, {"add": name})
+            opcode, funct3, funct7 = _encoding(index, REGISTER_OPCODES)
+            _set_field(instruction, "funct7", funct7)
+        _set_field(instruction, "funct3", funct3)
+        _set_field(instruction, "opcode", opcode)
+        instruction.find("attributes/attribute").set("name", extension_names[index % extensions])
+        instrs.append(instruction)
+        names.append(name)
+
+    # Relocations
+    relocations_element = core.find("relocations")
+    reloc_template = _find(relocations_element, "reloc", "R_RISCV_32")
+    for index in range(relocations):
+        reloc = _rename(reloc_template, {"R_RISCV_32": f"R_SYN_{index}"})
+        reloc.find("value/int").text = str(1000 + index)
+        relocations_element.append(reloc)
+
+    # Scheduling classes
+    sched_table = core.find("sched-tables/sched-table")
+    sched_template = sched_table.find("instruction-sched")
+    for index in range(sched_entries):
+        sched = copy.deepcopy(sched_template)
+        sched.set("name", f"SynClass{index}")
+        sched.find("instruction_list/str").text = ",".join(names[index::sched_entries])
+        for resource in sched.iter("read_resource"):
+            resource.set("name", f"ReadSyn{index}")
+        sched_table.append(sched)
+    return tree
+
+
+def write_model(file_name: str, **sizes) -> str:
+    """
+    Writes a synthetic ADL model.
+
+    Args:
+        file_name (str): The adl.xml file to write.
+        **sizes: The sizes of the model, see generate_model().
+
+    Returns:
+        str: The name of the written file.
+    """
+    tree = generate_model(**sizes)
+    tree.write(file_name, encoding="UTF-8", xml_declaration=True)
+    return file_name
+
+
+def main() -> None:
+    """
+    Writes a synthetic ADL model whose sizes are given on the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic ADL model",
+        usage="python -m tools.benchmark.synthetic_adl output.adl.xml [--instructions N] ...",
+    )
+    parser.add_argument("output", type=str)
+    parser.add_argument("--instructions", type=int, default=64)
+    parser.add_argument("--instrfields", type=int, default=8)
+    parser.add_argument("--registers", type=int, default=32)
+    parser.add_argument("--extensions", type=int, default=2)
+    parser.add_argument("--relocations", type=int, default=16)
+    parser.add_argument("--sched-entries", dest="sched_entries", type=int, default=8)
+    args = parser.parse_args()
+    write_model(
+        args.output,
+        instructions=args.instructions,
+        instrfields=args.instrfields,
+        registers=args.registers,
+        extensions=args.extensions,
+        relocations=args.relocations,
+        sched_entries=args.sched_entries,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,14 +3,166 @@
 ## @package config
 #
 # The configuration module which parses the config.txt file
+#
+# The configuration files are parsed once per process: the parsed configuration
+# is memoized and only parsed again when the contents of config.txt or
+# llvm_config.txt change.
+#
+# The values of a run which do not come from the files (the ADL file given on
+# the command line) are applied on top of the parsed configuration with
+# override(), so the configuration files are never rewritten.
 import re
 import ast
+import contextlib
+import copy
 import os
+import types
+
+## Splits a line of config.txt into its arguments
+_CONFIG_ARGS_RE = re.compile(
+    r'\.*[:\#\"a-zA-Z0-9_\-\ \\]*\/*\.*(?:\.\.\/*)*[\#\"a-zA-Z0-9_\-\ ]*\/*\.*[\#\"a-zA-Z0-9_\-\ \\]*\/*\.*[\#\"a-zA-Z0-9_\-\.\ \\]*'
+)
+
+## Splits a line of llvm_config.txt into its arguments
+_LLVM_ARGS_RE = re.compile(
+    r'\.*[\#"a-z_A-Z0-9]*\/*\:*[\#"a-z_A-Z0-9]*\/*\.*[\#"a-z_A-Z0-9]*\/*\.*[\#"a-zA-z0-9\.]*\/*[\-*a-zA-Z\/*]*'
+)
+
+## Value of XLenRI
+_XLEN_RI_RE = re.compile(r"[A-Za-z0-9]*\<[0-9\,]*\>")
+
+## Value of AsmString
+_ASM_STRING_RE = re.compile(r"[a-z_A-Z0-9]*[a-zA-Z0-9\ \#\ \"\\t\"\ \#\ a-zA-Z0-9]*")
+
+## Value of ImmAsmOperandDiagnosticType and CLUIImmAsmOperandDiagnosticType
+_DIAGNOSTIC_TYPE_RE = re.compile(r"\![a-zA-Z0-9]*[()\"a-zA-Z0-9\, ]*")
+
+## Value of FENCEDecoderMethod
+_DECODER_METHOD_RE = re.compile(r"[a-zA-Z0-9<>]*")
+
+## Splits the lines of the operands listed by ImmediateOperands into their arguments
+_OPERAND_ARGS_RE = re.compile(
+    r'[\#"a-z_A-Z0-9]*\:*[\#"a-z_A-Z0-9]*\.*[\#"a-z_A-Z0-9]*\.*[\#"a-zA-z0-9\.]*'
+)
+
+## Values of the operands listed by ImmediateOperands
+_OPERAND_VALUES_RE = re.compile(
+    r'[\#\"a-z_A-Z0-9.,*\<*\>*"]* *[\!*\#\"a-z_A-Z0-9,*\"*\)*][\!*\#\"(a-z_A-Z\<*\>*0-9\<*\>*,*\"*\)*\"]*\.*[\!*\#\"\<*\>*a-zA-z0-9,*]'
+)
+
+## Register classes of RegisterAllocationOrder
+_ALLOCATION_ORDER_RE = re.compile(r'(\w+)\s*:\s*\[(.+?)\](?=,|\})')
+
+## Words to quote inside RegisterAllocationOrder
+_WORD_RE = re.compile(r'(\b\w+\b)')
+
+## Register classes of CallingConventionAllocationOrder and CallingConventionAllocationExcluded
+_CALLING_CONVENTION_RE = re.compile(r"(\w+):\s*\[((?:\w+(?:,\s*)?)+)\](?:,\s*)?")
+
+## Registers of a calling convention register class
+_NAME_RE = re.compile(r"\w+")
+
+## "key = value" lines
+_ASSIGNMENT_RE = re.compile(r"(\w+)\s*=\s*(.+)")
+
+## Parameters of RegisterClass, RegisterClassChild and RegisterClassWrapper
+_REGISTER_CLASS_RE = re.compile(r"(\w+(?:\{\d+(?:-\d+)?\})?)=('[^']*'|!?\w+\([^)]*\)|\w+)")
+
+## Parameters of VectorRegisterClass
+_VECTOR_REGISTER_CLASS_RE = re.compile(
+    r"(\w+(?:\{\d+(?:-\d+)?\})?)=('[^']*'|!?\w+\([^)]*\)|\w+|(?:\[[^\]]*\]))"
+)
+
+## Parameters of DecoderNamespace
+_DECODER_NAMESPACE_RE = re.compile(r'(\w+)=([\w\d_]+)')
+
+## Parsed configurations indexed by the absolute paths of their files
+_configs = dict()
+
+## Values replacing the ones of the configuration files, see override()
+_overrides = dict()
+
+## Number of times the configuration files were parsed by the current process, reported by --profile
+parse_count = 0
+
+
+def _file_contents(file_name):
+    """
+    Returns the contents of a file.
+
+    Args:
+        file_name (str): The file to read.
+
+    Returns:
+        bytes: The contents of the file.
+
+    Raises:
+        FileNotFoundError: If the file cannot be found.
+    """
+    with open(file_name, "rb") as f:
+        return f.read()
+
+
+@contextlib.contextmanager
+def override(**values):
+    """
+    Replaces configuration values inside the context, for every caller of the process.
+
+    Args:
+        **values: The replaced values by configuration key (e.g. ADLName).
+
+    Yields:
+        None
+    """
+    previous = dict(_overrides)
+    _overrides.update(values)
+    try:
+        yield
+    finally:
+        _overrides.clear()
+        _overrides.update(previous)
+
+
+def load_config(config_file: str, llvm_file: str) -> types.MappingProxyType:
+    """
+    Returns the parsed configuration, parsing config.txt and llvm_config.txt only on first use.
+
+    The configuration is shared by every caller of the process and parsed again
+    only when the contents of one of the files change. The values given to
+    override() replace the ones of the files. The returned mapping is
+    read-only; the lists and dictionaries it holds are shared as well and must
+    not be modified. Callers which need to change the configuration use
+    config_environment, which returns a private copy.
+
+    Args:
+        config_file (str): The configuration file 'config.txt'.
+        llvm_file (str): A file which contains the setup required by LLVM for proper functionality.
+
+    Returns:
+        types.MappingProxyType: A read-only view of the configuration, see config_environment.
+
+    Raises:
+        FileNotFoundError: If the config file or LLVM file cannot be found.
+        IOError: If there is an error reading the files.
+    """
+    key = (os.path.abspath(config_file), os.path.abspath(llvm_file))
+    contents = (_file_contents(key[0]), _file_contents(key[1]))
+    if key not in _configs or _configs[key][0] != contents:
+        _configs[key] = (contents, _parse_config(config_file, llvm_file), dict())
+    _, config_vars, views = _configs[key]
+    overrides = tuple(sorted(_overrides.items()))
+    if overrides not in views:
+        views[overrides] = types.MappingProxyType({**config_vars, **_overrides})
+    return views[overrides]
+
 
 def config_environment(config_file: str, llvm_file: str) -> dict:
     """
     Parses each line from config.txt using regular expressions.
-    
+
+    The files are parsed once and memoized, see load_config. Each call returns
+    its own copy of the configuration, which the caller is free to modify.
+
     Args:
         config_file (str): The configuration file 'config.txt'.
         llvm_file (str): A file which contains the setup required by LLVM for proper functionality.
@@ -22,7 +174,23 @@ def config_environment(config_file: str, llvm_file: str) -> dict:
         FileNotFoundError: If the config file or LLVM file cannot be found.
         IOError: If there is an error reading the files.
     """
+    return copy.deepcopy(dict(load_config(config_file, llvm_file)))
 
+
+def _parse_config(config_file, llvm_file):
+    """
+    Parses config.txt and llvm_config.txt.
+
+    Args:
+        config_file (str): The configuration file 'config.txt'.
+        llvm_file (str): A file which contains the setup required by LLVM for proper functionality.
+
+    Returns:
+        dict: A dictionary where keys and values are the contents parsed from both files.
+    """
+
+    global parse_count
+    parse_count += 1
     config_vars = dict()
     configuration_file = open(config_file, "r")
     Lines = configuration_file.readlines()
@@ -31,10 +199,7 @@ def config_environment(config_file: str, llvm_file: str) -> dict:
             Lines.remove(line)
     for line in Lines[1:]:
         newline = line.strip()
-        x = re.findall(
-            r'\.*[:\#\"a-zA-Z0-9_\-\ \\]*\/*\.*(?:\.\.\/*)*[\#\"a-zA-Z0-9_\-\ ]*\/*\.*[\#\"a-zA-Z0-9_\-\ \\]*\/*\.*[\#\"a-zA-Z0-9_\-\.\ \\]*',
-            newline,
-        )
+        x = _CONFIG_ARGS_RE.findall(newline)
         args = [elem.strip(" ") for elem in x if elem != ""]
         if args[0] == "ADLName":
             if len(args) >= 2:
@@ -57,33 +222,26 @@ def config_environment(config_file: str, llvm_file: str) -> dict:
         newline = line.strip()
         if newline.startswith("//"):
             continue
-        x = re.findall(
-                r'\.*[\#"a-z_A-Z0-9]*\/*\:*[\#"a-z_A-Z0-9]*\/*\.*[\#"a-z_A-Z0-9]*\/*\.*[\#"a-zA-z0-9\.]*\/*[\-*a-zA-Z\/*]*',
-            newline,
-        )
+        x = _LLVM_ARGS_RE.findall(newline)
         args = [elem.strip(" ") for elem in x if elem != ""]
         if args[0] == "XLenRI":
-            x = re.findall(r"[A-Za-z0-9]*\<[0-9\,]*\>", newline)
+            x = _XLEN_RI_RE.findall(newline)
             args_len = [elem for elem in x if elem != ""]
             config_vars[args[0]] = args_len[0]
         elif args[0] == "AsmString":
-            regex = re.compile(r"[a-z_A-Z0-9]*[a-zA-Z0-9\ \#\ \"\\t\"\ \#\ a-zA-Z0-9]*")
-            x = re.findall(regex, newline)
+            x = _ASM_STRING_RE.findall(newline)
             args_len = [elem for elem in x if elem != ""]
             config_vars[args[0]] = str(args_len[1])
         elif args[0] == "ImmAsmOperandDiagnosticType":
-            regex = re.compile(r"\![a-zA-Z0-9]*[()\"a-zA-Z0-9\, ]*")
-            x = re.findall(regex, newline)
+            x = _DIAGNOSTIC_TYPE_RE.findall(newline)
             args_len = [elem for elem in x if elem != ""]
             config_vars[args[0]] = str(args_len[0])
         elif args[0] == "CLUIImmAsmOperandDiagnosticType":
-            regex = re.compile(r"\![a-zA-Z0-9]*[()\"a-zA-Z0-9\, ]*")
-            x = re.findall(regex, newline)
+            x = _DIAGNOSTIC_TYPE_RE.findall(newline)
             args_len = [elem for elem in x if elem != ""]
             config_vars[args[0]] = str(args_len[0])
         elif args[0] == "FENCEDecoderMethod":
-            regex = re.compile(r"[a-zA-Z0-9<>]*")
-            x = re.findall(regex, newline)
+            x = _DECODER_METHOD_RE.findall(newline)
             args_len = [elem for elem in x if elem != ""]
             config_vars[args[0]] = str(args_len[1])
         elif args[0] == "LLVMOtherVTAttrib":
@@ -133,16 +291,10 @@ def config_environment(config_file: str, llvm_file: str) -> dict:
             config_vars[args[0]] = instruction_operands
             for line in Lines[1:]:
                 newline = line.strip()
-                x = re.findall(
-                    r'[\#"a-z_A-Z0-9]*\:*[\#"a-z_A-Z0-9]*\.*[\#"a-z_A-Z0-9]*\.*[\#"a-zA-z0-9\.]*',
-                    newline,
-                )
+                x = _OPERAND_ARGS_RE.findall(newline)
                 args = [elem.strip(" ") for elem in x if elem != ""]
                 if args[0] in instruction_operands:
-                    regex = re.compile(
-                        r'[\#\"a-z_A-Z0-9.,*\<*\>*"]* *[\!*\#\"a-z_A-Z0-9,*\"*\)*][\!*\#\"(a-z_A-Z\<*\>*0-9\<*\>*,*\"*\)*\"]*\.*[\!*\#\"\<*\>*a-zA-z0-9,*]'
-                    )
-                    x = re.findall(regex, newline)
+                    x = _OPERAND_VALUES_RE.findall(newline)
                     args_len = [elem for elem in x if elem != ""]
                     aux_dict = dict()
                     args_len = str(args_len).split(",")
@@ -216,34 +368,33 @@ def config_environment(config_file: str, llvm_file: str) -> dict:
             llvmvflags = list(args[1:])
             config_vars[args[0]] = llvmvflags
         elif args[0] == "RegisterAllocationOrder":
-            pattern = r'(\w+)\s*:\s*\[(.+?)\](?=,|\})'
-            matches = re.findall(pattern, newline)
+            matches = _ALLOCATION_ORDER_RE.findall(newline)
             result_dict = {}
             for key, raw_values in matches:
-                    safe_values = re.sub(r'(\b\w+\b)', r'"\1"', raw_values)
+                    safe_values = _WORD_RE.sub(r'"\1"', raw_values)
                     parsed_values = ast.literal_eval(f"[{safe_values}]")
                     result_dict[key] = parsed_values
             config_vars[args[0]] = result_dict
         elif args[0] == "CallingConventionAllocationOrder":
             calling_convention = list()
-            matches = re.findall(r"(\w+):\s*\[((?:\w+(?:,\s*)?)+)\](?:,\s*)?", newline)
+            matches = _CALLING_CONVENTION_RE.findall(newline)
             for key, values in matches:
                 calling_convention.append(
-                    {key: [value.strip() for value in re.findall(r"\w+", values)]}
+                    {key: [value.strip() for value in _NAME_RE.findall(values)]}
                 )
             config_vars[args[0]] = calling_convention
         elif args[0] == "CallingConventionAllocationExcluded":
             calling_convention = list()
-            matches = re.findall(r"(\w+):\s*\[((?:\w+(?:,\s*)?)+)\](?:,\s*)?", newline)
+            matches = _CALLING_CONVENTION_RE.findall(newline)
             for key, values in matches:
                 calling_convention.append(
-                    {key: [value.strip() for value in re.findall(r"\w+", values)]}
+                    {key: [value.strip() for value in _NAME_RE.findall(values)]}
                 )
             config_vars[args[0]] = calling_convention
         elif args[0] == "XLenVTValueType" or args[0] == "XLenRIRegInfo" or args[0] == 'RegInfosPair':
             lines = line.strip().split("\n")
             for line in lines:
-                match = re.match(r"(\w+)\s*=\s*(.+)", line)
+                match = _ASSIGNMENT_RE.match(line)
                 if match:
                     key = match.group(1)
                     value = match.group(2)
@@ -251,7 +402,7 @@ def config_environment(config_file: str, llvm_file: str) -> dict:
         elif args[0] == "SubReg_GPR_Even" or args[0] == "SubReg_GPR_Odd":
             lines = line.strip().split("\n")
             for line in lines:
-                match = re.match(r"(\w+)\s*=\s*(.+)", line)
+                match = _ASSIGNMENT_RE.match(line)
                 if match:
                     key = match.group(1)
                     value = match.group(2)
@@ -259,36 +410,31 @@ def config_environment(config_file: str, llvm_file: str) -> dict:
         elif args[0] == "SubReg_GPR_Even_HW" or args[0] == "SubReg_GPR_Odd_HW":
             lines = line.strip().split("\n")
             for line in lines:
-                match = re.match(r"(\w+)\s*=\s*(.+)", line)
+                match = _ASSIGNMENT_RE.match(line)
                 if match:
                     key = match.group(1)
                     value = match.group(2)
                     config_vars[key] = value.strip()
         elif args[0] == 'RegisterClassChild':
-            pattern = r"(\w+(?:\{\d+(?:-\d+)?\})?)=('[^']*'|!?\w+\([^)]*\)|\w+)"
-            matches = re.findall(pattern, line)
+            matches = _REGISTER_CLASS_RE.findall(line)
             result = {match[0] :match[1] for match in matches}
             config_vars[args[0]] = result
         elif args[0] == 'RegisterClass':
-            pattern = r"(\w+(?:\{\d+(?:-\d+)?\})?)=('[^']*'|!?\w+\([^)]*\)|\w+)"
-            matches = re.findall(pattern, line)
+            matches = _REGISTER_CLASS_RE.findall(line)
             result = {match[0] :match[1] for match in matches}
             config_vars[args[0]] = result
         elif args[0] == "RegisterClassWrapper":
-            pattern = r"(\w+(?:\{\d+(?:-\d+)?\})?)=('[^']*'|!?\w+\([^)]*\)|\w+)"
-            matches = re.findall(pattern, line)
+            matches = _REGISTER_CLASS_RE.findall(line)
             result = {match[0] :match[1] for match in matches}
             config_vars[args[0]] = result
         elif args[0] == "VectorRegisterClass":
-            pattern = r"(\w+(?:\{\d+(?:-\d+)?\})?)=('[^']*'|!?\w+\([^)]*\)|\w+|(?:\[[^\]]*\]))"
-            matches = re.findall(pattern, line)
+            matches = _VECTOR_REGISTER_CLASS_RE.findall(line)
             result = {match[0] :match[1] for match in matches}
             config_vars[args[0]] = result
         elif args[0] == "DecoderNamespace":
             decoder_namespace = dict()
-            regex = re.compile(r'(\w+)=([\w\d_]+)')
             line = line.replace(args[0] + " = ", "")
-            dictionary = dict(re.findall(regex, line))
+            dictionary = dict(_DECODER_NAMESPACE_RE.findall(line))
             config_vars[args[0]] = dictionary
         else:
             if args[0] not in config_vars.keys():
@@ -0,0 +1,210 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+## @package emitter
+#
+# Buffered writer of the generated files
+#
+# The generators build every output from many fragments (one per register,
+# instruction, alias, intrinsic...). Instead of opening the file in append mode
+# for each fragment, they open it through this module, which collects the
+# fragments in memory, one buffer per path. The pipeline flushes the buffers
+# once the stage completes, so every file is written with a single write, and
+# only when its contents changed (see write_if_changed()), which keeps the
+# modification time of the unchanged files for the LLVM incremental build.
+#
+# open() follows the semantics of the builtin: "w" truncates the file and "a"
+# appends to it, starting from the contents on disk when the file is not
+# buffered yet. remove() is deferred until the flush as well.
+import io
+import os
+import tempfile
+from typing import Dict, Optional, Set
+
+## Buffered contents by absolute path, None for the files removed by remove()
+_buffers: Dict[str, Optional[io.StringIO]] = dict()
+
+## Files written or left unchanged by flush() since the last take_flushed()
+_flushed: Set[str] = set()
+
+## Permissions of the new files, as the builtin open() would create them
+_umask = os.umask(0)
+os.umask(_umask)
+
+
+class OutputFile:
+    """
+    File-like handle of a buffered output, returned by open().
+
+    Every write goes to the end of the current buffer of the path, like a file
+    opened in append mode, even if the buffer is truncated in the meantime by
+    another handle.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def write(self, text: str) -> int:
+        return _buffer(self.path).write(text)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _buffer(path: str) -> io.StringIO:
+    buffer = _buffers.get(path)
+    if buffer is None:
+        buffer = io.StringIO()
+        if path not in _buffers and os.path.isfile(path):
+            with io.open(path, "r") as f:
+                buffer.write(f.read())
+        _buffers[path] = buffer
+    return buffer
+
+
+def open(file_name: str, mode: str = "a") -> OutputFile:
+    """
+    Opens a generated file for writing.
+
+    Args:
+        file_name (str): The generated file.
+        mode (str): "w" to truncate the file, "a" to append to it.
+
+    Returns:
+        OutputFile: The handle writing into the buffer of the file.
+    """
+    path = os.path.abspath(file_name)
+    if mode == "w":
+        _buffers[path] = io.StringIO()
+    elif mode != "a":
+        raise ValueError("invalid output mode: " + repr(mode))
+    _buffer(path)
+    return OutputFile(path)
+
+
+def exists(file_name: str) -> bool:
+    """
+    Checks whether a generated file exists, taking the pending writes into account.
+
+    Args:
+        file_name (str): The generated file.
+
+    Returns:
+        bool: True if the file is buffered or exists on disk.
+    """
+    path = os.path.abspath(file_name)
+    if path in _buffers:
+        return _buffers[path] is not None
+    return os.path.exists(path)
+
+
+def remove(file_name: str):
+    """
+    Removes a generated file once the buffers are flushed, unless it is opened
+    again in the meantime.
+
+    Args:
+        file_name (str): The generated file.
+
+    Returns:
+        None
+    """
+    _buffers[os.path.abspath(file_name)] = None
+
+
+def remove_tree(folder: str):
+    """
+    Removes the files of a generated folder once the buffers are flushed,
+    except the ones opened again in the meantime (see remove()).
+
+    Args:
+        folder (str): The generated folder.
+
+    Returns:
+        None
+    """
+    for root, _, file_names in os.walk(folder):
+        for file_name in file_names:
+            remove(os.path.join(root, file_name))
+
+
+def write_if_changed(file_name: str, contents: str) -> bool:
+    """
+    Writes a file, unless it already holds the same contents. The file is
+    replaced atomically, so a reader never sees a partially written file.
+
+    Args:
+        file_name (str): The file.
+        contents (str): The new contents.
+
+    Returns:
+        bool: True if the file was written.
+    """
+    try:
+        with io.open(file_name, "r") as f:
+            if f.read() == contents:
+                return False
+        mode = os.stat(file_name).st_mode & 0o7777
+    except (OSError, UnicodeDecodeError):
+        mode = 0o666 & ~_umask
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_name), suffix=".tmp")
+    try:
+        with io.open(fd, "w") as f:
+            f.write(contents)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, file_name)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return True
+
+
+def flush() -> int:
+    """
+    Writes the buffered files and applies the pending removals.
+
+    Returns:
+        int: The number of files written.
+    """
+    written = 0
+    try:
+        for path, buffer in _buffers.items():
+            if buffer is None:
+                if os.path.isfile(path):
+                    os.remove(path)
+                _flushed.discard(path)
+                continue
+            if write_if_changed(path, buffer.getvalue()):
+                written += 1
+            _flushed.add(path)
+    finally:
+        _buffers.clear()
+    return written
+
+
+def take_flushed() -> Set[str]:
+    """
+    Returns the files written or left unchanged by flush() since the previous
+    call, and starts a new record.
+
+    Returns:
+        Set[str]: The absolute paths of the files.
+    """
+    flushed = set(_flushed)
+    _flushed.clear()
+    return flushed
+
+
+def discard():
+    """
+    Drops the buffered files and the pending removals, leaving the files on disk unchanged.
+
+    Returns:
+        None
+    """
+    _buffers.clear()
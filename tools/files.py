@@ -11,17 +11,18 @@ import config
 import adl_parser
 import re
 import legalDisclaimer
+import emitter
 import num2words
 import os
 import numpy as np
-import shutil
-import make_td
 import xml.etree.ElementTree as ET
 import random
 import operator
 import word2number
 import pathlib
 import sys
+import dataclasses
+from typing import Any, Dict, List, Optional
 
 config_file = "config.txt"
 llvm_config = "llvm_config.txt"
@@ -31,76 +32,102 @@ for fname in os.listdir("."):
 config_file = os.path.dirname(__file__).replace("\\", "/") + "/" + "config.txt"
 llvm_config = os.path.dirname(__file__).replace("\\", "/") + "/" + "llvm_config.txt"
 
-## A dictionary where the key represents the register file and the value are the associated registers
-registers_define = dict()
 
-## A dictionary which contains all the register classes defined, including subclasses and all the instruction fields
-# for a given register class
-register_classes = dict()
+@dataclasses.dataclass
+class GenerationContext:
+    """
+    Carries the information the generation stages pass to each other.
+
+    A new context is created for every run of main.run_pipeline() and handed
+    to each stage, so that stages can run in worker processes (see pipeline)
+    and repeated runs inside one interpreter do not see each other's tables.
+    """
+
+    ## The LLVM target (riscv32 or riscv64) selected on the command line, None if not specified
+    target: Optional[str] = None
+
+    ## The ADL file selected on the command line, replacing the ADLName of config.txt while the stages run
+    adl_path: Optional[str] = None
+
+    ## A dictionary where the key represents the register file and the value are the associated registers
+    registers_define: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    ## A dictionary which contains all the register classes defined, including subclasses and all the instruction fields
+    ## for a given register class
+    register_classes: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
-## A dictionary which contains all the instruction fields classes that have to be defined in RISCVOperands.td together
-# with all the instruction fields reference by a certain class.
-instrfield_classes = dict()
+    ## A dictionary which contains all the instruction fields classes that have to be defined in RISCVOperands.td together
+    ## with all the instruction fields reference by a certain class.
+    instrfield_classes: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
-## A dictionary which contains alias information which are used for developing
-alias_instruction_syntax_dict = dict()
+    ## A dictionary which contains alias information which are used for developing
+    alias_instruction_syntax_dict: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
-## A dictionary containing all instructions that have load/store attributes defined in the ADL file
-instructions_load_store = dict()
+    ## A dictionary containing all instructions that have load/store attributes defined in the ADL file
+    instructions_load_store: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
-## A dictionary which contains all the register references
-register_references = list()
+    ## A dictionary which contains all the register references
+    register_references: List[Any] = dataclasses.field(default_factory=list)
 
-## A dictionary which contains all the register pairs generated
-register_pairs = dict()
+    ## A dictionary which contains all the register pairs generated
+    register_pairs: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
-## A dictionary which contains instruction fields for each register class 
-reg_instrfields = dict()
+    ## A dictionary which contains instruction fields for each register class
+    reg_instrfields: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
-## A dictionary which contains values available for instruction fields
-instrfields_values = dict()
+    ## A dictionary which contains values available for instruction fields
+    instrfields_values: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
-## A dictionary in which information generated about scheduling is gathered
-scheduling_instr_info = dict()
+    ## A dictionary in which information generated about scheduling is gathered
+    scheduling_instr_info: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
-## A dictionary containing scheduling tests structure for each instruction
-scheduling_tests_struct = dict()
+    ## A dictionary containing scheduling tests structure for each instruction
+    scheduling_tests_struct: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
-## A dictionary containing aliases based on the ABI for register classes 
-alias_register_dict = dict()
+    ## A dictionary containing aliases based on the ABI for register classes
+    alias_register_dict: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
-## A dictionary containing instruction encodings used for sail description
-instruction_encoding_dict = dict()
+    ## A dictionary containing instruction encodings used for sail description
+    instruction_encoding_dict: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
-## A dictionary containing register usages for each scheduling tests for dependency
-sched_app_regs_dep  = dict()
+    ## A dictionary containing register usages for each scheduling tests for dependency
+    sched_app_regs_dep: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
-## A dictionary containing register usages for each scheduling tests 
-sched_app_regs = dict()
+    ## A dictionary containing register usages for each scheduling tests
+    sched_app_regs: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
-# A dictionary containing special instruction latency and throughput information
-aux_scheduling_table_param = dict()
+    ## A dictionary containing special instruction latency and throughput information
+    aux_scheduling_table_param: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
-# A global list to store memory operand registers
-memory_operands_registers_list = list()
+    ## A list to store memory operand registers
+    memory_operands_registers_list: List[Any] = dataclasses.field(default_factory=list)
 
-# A global list which store already printed extensions
-attributes_list = list()
+    ## A list which store already printed extensions
+    attributes_list: List[Any] = dataclasses.field(default_factory=list)
 
-# A global list which store already printed extensions for intrinsics
-attributes_list_intrinsics = list()
+    ## A list which store already printed extensions for intrinsics
+    attributes_list_intrinsics: List[Any] = dataclasses.field(default_factory=list)
 
-# Singleton list for generating operands
-singleton_list = list()
+    ## Singleton list for generating operands
+    singleton_list: List[Any] = dataclasses.field(default_factory=list)
 
-# A dict containing instructions registers used
-instruction_registers_used_ins = dict()
+    ## A dict containing instructions registers used
+    instruction_registers_used_ins: Dict[str, Any] = dataclasses.field(default_factory=dict)
 
-# A dict containing instructions registers used
-instruction_registers_used_outs = dict()
+    ## A dict containing instructions registers used
+    instruction_registers_used_outs: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    ## A dictionary containing a map between a register class and its width
+    register_classes_width: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+
+## Names of the GenerationContext tables through which the stages pass information to each other
+GENERATION_STATE = tuple(
+    state.name
+    for state in dataclasses.fields(GenerationContext)
+    if state.name not in ("target", "adl_path")
+)
 
-# A dictionary containing a map between a register class and its width
-register_classes_width = dict()
 
 def generate_let(let_key: str, let_value: str) -> str:
     """
@@ -139,7 +166,8 @@ def generate_SP_register_class(
     namespace: str, 
     width: int, 
     XLenVT: str, 
-    XLenRI: str
+    XLenRI: str,
+    generation_context: GenerationContext
 ) -> str:
     """
     Generates the SP register class for TableGen.
@@ -151,6 +179,7 @@ def generate_SP_register_class(
         width (int): Register width in bits.
         XLenVT (str): Register XLenVT value.
         XLenRI (str): Register XLenRI value.
+        generation_context (GenerationContext): The state shared by the generation stages.
     
     Returns:
         str: The string representing the SP register class from RegisterInfo.td.
@@ -197,7 +226,7 @@ def generate_SP_register_class(
             + register_class_used + "<("
         )
     content = "add" + " "
-    register_classes_width[class_name] = width
+    generation_context.register_classes_width[class_name] = width
     content += sp_key + ")>; {\n"
     let = "\tlet RegInfos = " + config_variables["XLenRI_key"] + ";\n"
     if register_class_used == "RegisterClass":
@@ -210,8 +239,8 @@ def generate_SP_register_class(
     register_alias_sp = register_alias_sp.replace('["', "")
     register_alias_sp = register_alias_sp.replace('"]', "")
     list_reg.append(register_alias_sp)
-    register_classes[class_name] = list_reg
-    register_references.append(class_name)
+    generation_context.register_classes[class_name] = list_reg
+    generation_context.register_references.append(class_name)
     return def_class
 
 
@@ -344,7 +373,8 @@ def generate_register_classes_extended():
     
 
 def generate_registers_by_prefix(
-    name, reg_class, class_name, prefix, dwarf, size, alias_dict
+    name, reg_class, class_name, prefix, dwarf, size, alias_dict,
+    generation_context
 ):
     """
     Generates the GPR register file based on a given register prefix.
@@ -357,6 +387,7 @@ def generate_registers_by_prefix(
         dwarf (int): DWARF register debug information index.
         size (int): Register size in bits.
         alias_dict (dict): Dictionary mapping each register to its alias.
+        generation_context (GenerationContext): The state shared by the generation stages.
 
     Returns:
         tuple: A tuple consisting of a string and a dictionary.
@@ -491,7 +522,7 @@ def generate_registers_by_prefix(
             alias_register = alias_dict[str.upper(reg_class)][str(i)]
             alias = str(alias_dict[str.upper(reg_class)][str(i)])
             alias = alias.replace("'", '"')
-            alias_register_dict[str.upper(prefix) + str(i)] = alias.split(", ")[0].replace("[\"", "").replace("\"]", "").replace("\"", "")
+            generation_context.alias_register_dict[str.upper(prefix) + str(i)] = alias.split(", ")[0].replace("[\"", "").replace("\"]", "").replace("\"", "")
             subreg_found = False
             subreg_list = list()
             for element in list_subregs:
@@ -584,13 +615,16 @@ def generate_registers_by_prefix(
             registers_generated += "\n}"
     if subregs_def != "":
         registers_generated = subregs_def + registers_generated
-    registers_define[reg_class] = registers
+    generation_context.registers_define[reg_class] = registers
     return registers_generated, registers_aliases, additional_register_classes
 
-def generate_vector_register():
+def generate_vector_register(generation_context):
     """
     Generates the definition for vector register classes.
 
+    Args:
+        generation_context (GenerationContext): The state shared by the generation stages.
+
     Returns:
         Any: The definition for the vector register classes.
     """
@@ -636,6 +670,7 @@ def generate_vector_register():
                                 registers[register].debug,
                                 int(registers[register].size),
                                 alias_regs,
+                                generation_context=generation_context,
                             )
     for register in registers.keys():
         register_list = list()
@@ -700,7 +735,8 @@ def generate_vector_register():
         return ""
     
 def generate_registers_by_name(
-    name, reg_class, class_name, entry, syntax, start_index, alias_dict
+    name, reg_class, class_name, entry, syntax, start_index, alias_dict,
+    generation_context
 ):
     """
     Generates the CSR or other generic register file definition.
@@ -713,6 +749,7 @@ def generate_registers_by_name(
         syntax (str): Register syntax representation.
         start_index (int): Starting index for the register file.
         alias_dict (dict): Dictionary mapping each register to its alias.
+        generation_context (GenerationContext): The state shared by the generation stages.
 
     Returns:
         str: String representing the CSR or other generic register file.
@@ -753,7 +790,7 @@ def generate_registers_by_name(
                 check = True
                 alias = str(alias_dict[str.upper(reg_class)][entry[i]][0])
                 alias = alias.replace("'", "")
-                alias_register_dict[syntax[i]] = alias_print.split(", ")[0].replace("['", "").replace("']", "").replace("\"", "")
+                generation_context.alias_register_dict[syntax[i]] = alias_print.split(", ")[0].replace("['", "").replace("']", "").replace("\"", "")
                 define_register = "def " + syntax[i] + " : "
                 if list_size >= 1:
                     if alias.upper() in registers_subregs.keys():
@@ -864,7 +901,7 @@ def generate_registers_by_name(
                     registers_generated += "\t" + register + "\n"
     if let_name != "":
         registers_generated += "}"
-    registers_define[reg_class] = registers
+    generation_context.registers_define[reg_class] = registers
     return subregs_def + let_name + registers_generated
 
 
@@ -879,7 +916,8 @@ def define_register_class(
     offset,
     instrfield_width,
     shift,
-    excluded_values
+    excluded_values,
+    generation_context
 ):
     """
     Generates (defines) a register class.
@@ -896,6 +934,7 @@ def define_register_class(
         instrfield_width (int): Register width from instruction field, in bits.
         shift (int): Shift value applied to register encoding/fields.
         excluded_values (dict | list | None): Specifies disallowed values for certain registers.
+        generation_context (GenerationContext): The state shared by the generation stages.
 
     Returns:
         Any: A register class object/definition.
@@ -946,7 +985,7 @@ def define_register_class(
             + "\n"
             + "\t"
         )
-    register_classes_width[class_name] = width
+    generation_context.register_classes_width[class_name] = width
     content = "add" + " "
     register_allocation = ""
     first_dump = False
@@ -1020,8 +1059,8 @@ def define_register_class(
     list_values = register_allocation_copy.split(", ")
     if '' in list_values:
         list_values.remove('')
-    if class_name not in instrfields_values.keys():
-        instrfields_values[class_name] = list_values
+    if class_name not in generation_context.instrfields_values.keys():
+        generation_context.instrfields_values[class_name] = list_values
     content += register_allocation.rstrip(", \n") + "\n\t)> {\n"
     let = "\tlet RegInfos = " + config_variables["XLenRI_key"] + ";\n"
     if register_class_defined == 'RegisterClass':
@@ -1035,7 +1074,8 @@ def define_register_class(
 
 
 def generate_file(
-    regclass, file_name, config_variables, alias_dict, offset_dict, instrfield_ref_dict):
+    regclass, file_name, config_variables, alias_dict, offset_dict, instrfield_ref_dict,
+    generation_context):
     """
     Writes register-specific content into `RegisterInfo.td`.
 
@@ -1046,13 +1086,13 @@ def generate_file(
         alias_dict (dict): Dictionary mapping each register to its alias.
         offset_dict (dict): Dictionary mapping each register file to its offset.
         instrfield_ref_dict (dict): Dictionary describing the fields of a register file.
+        generation_context (GenerationContext): The state shared by the generation stages.
 
     Returns:
         str: The generated contents for `RISCVRegisterInfo.td`.
     """
-    f = open(file_name, "a")
+    f = emitter.open(file_name, "a")
     instructions = adl_parser.parse_instructions_from_adl(config_variables["ADLName"])[0]
-    global register_classes
     additional_register_classes = dict()
     for key in regclass.keys():
         if 'vector' not in regclass[key].attributes:
@@ -1065,6 +1105,7 @@ def generate_file(
                     regclass[key].debug,
                     int(regclass[key].size),
                     alias_dict,
+                    generation_context=generation_context,
                 )[2]
     check_register_class_width = list()
     f.write(generate_namespace(config_variables["Namespace"]))
@@ -1188,7 +1229,7 @@ def generate_file(
                         )
                         f.write("\n")
                         check_register_class_width.append(regclass[key].width)
-    if len(sys.argv) > 2 and sys.argv[2].split("=")[1] == "riscv64":
+    if generation_context.target == "riscv64":
         rv64_content = ""
         size = math.log(int(config_variables["LLVMRegBasicWidth"]), 2)
         rv64_content += "def sub_" + config_variables["LLVMRegBasicWidth"] + ": SubRegIndex<" + config_variables["LLVMRegBasicWidth"] + ">;\n"
@@ -1294,7 +1335,7 @@ def generate_file(
         f.write(sub_reg_odd)
     f.write("}\n")
     f.write(generate_register_classes_extended())
-    f.write(generate_vector_register())
+    f.write(generate_vector_register(generation_context=generation_context))
     f.write("\n")
     list_instrfield_offset = dict()
     for key in regclass.keys():
@@ -1317,14 +1358,14 @@ def generate_file(
                             instrfield_ref_dict[instr_key]["offset"]
                         ] = (instr_key + " ")
             if instrfield_ref_dict[instr_key]["offset"] == "0":
-                register_classes[key] = list_instrfield
+                generation_context.register_classes[key] = list_instrfield
     for key in regclass.keys():
         for regs in list_instrfield_offset.keys():
             elem = list_instrfield_offset[regs]
             elem = list(str(elem).split(" "))
             if "" in elem:
                 elem.remove("")
-            register_classes[key + "_" + regs] = elem
+            generation_context.register_classes[key + "_" + regs] = elem
     for key in regclass.keys():
         list_instrfield = list()
         register_aliases = dict()
@@ -1334,17 +1375,17 @@ def generate_file(
                     if instrfield_ref_dict[instr_key]["offset"] == "0":
                         list_instrfield.append(instr_key)
                 if instrfield_ref_dict[instr_key]["offset"] == "0":
-                    register_classes[key] = list_instrfield
+                    generation_context.register_classes[key] = list_instrfield
             if utils.check_register_class_prefix(regclass, key) is True:
                 list_merged_instr = list()
-                for elem_key in register_classes.keys():
+                for elem_key in generation_context.register_classes.keys():
                     if elem_key not in regclass.keys():
-                        if register_classes[elem_key][0] in instrfield_ref_dict.keys():
+                        if generation_context.register_classes[elem_key][0] in instrfield_ref_dict.keys():
                             if (
-                                instrfield_ref_dict[register_classes[elem_key][0]]["ref"]
+                                instrfield_ref_dict[generation_context.register_classes[elem_key][0]]["ref"]
                                 == key
                             ):
-                                list_merged_instr += register_classes[elem_key]
+                                list_merged_instr += generation_context.register_classes[elem_key]
                 for instr_key in instrfield_ref_dict.keys():
                     if "excluded_values" in instrfield_ref_dict[instr_key].keys():
                         if len(list_merged_instr) != 0:
@@ -1368,6 +1409,7 @@ def generate_file(
                             regclass[key].debug,
                             int(regclass[key].size),
                             alias_dict,
+                            generation_context=generation_context,
                         )[0]
                     )
                     register_aliases = generate_registers_by_prefix(
@@ -1378,18 +1420,19 @@ def generate_file(
                         regclass[key].debug,
                         int(regclass[key].size),
                         alias_dict,
+                        generation_context=generation_context,
                     )[1]
                     f.write("\n\n")
             else:
                 list_merged_instr = list()
-                for elem_key in register_classes.keys():
+                for elem_key in generation_context.register_classes.keys():
                     if elem_key not in regclass.keys():
-                        if len(register_classes[elem_key]) > 0 and register_classes[elem_key][0] in instrfield_ref_dict.keys():
+                        if len(generation_context.register_classes[elem_key]) > 0 and generation_context.register_classes[elem_key][0] in instrfield_ref_dict.keys():
                             if (
-                                instrfield_ref_dict[register_classes[elem_key][0]]["ref"]
+                                instrfield_ref_dict[generation_context.register_classes[elem_key][0]]["ref"]
                                 == key
                             ):
-                                list_merged_instr += register_classes[elem_key]
+                                list_merged_instr += generation_context.register_classes[elem_key]
                 list_merged_instr += list_instrfield
                 if len(list_merged_instr) != 0 and not (regclass[key].pseudo != ""):
                     f.write("//" + "Register Class " + key + " : " + regclass[key].doc_info)
@@ -1410,6 +1453,7 @@ def generate_file(
                             regclass[key].syntax,
                             regclass[key].debug,
                             alias_dict,
+                            generation_context=generation_context,
                         )
                     )
                     f.write("\n\n")
@@ -1419,14 +1463,14 @@ def generate_file(
                     offset = elem[1]
                     shift = elem[2]
                     if offset != "0":
-                        list_instrfield_offset = register_classes[key + "_" + offset]
+                        list_instrfield_offset = generation_context.register_classes[key + "_" + offset]
                     if offset != "0":
                         list_instrfield_offset_cpy = list_instrfield_offset.copy()
                         for instr_key in instrfield_ref_dict.keys():
                             if "excluded_values" in instrfield_ref_dict[instr_key].keys():
                                 if instr_key in list_instrfield_offset:
                                     list_instrfield_offset_cpy.remove(instr_key)
-                                    register_classes[
+                                    generation_context.register_classes[
                                         key + "_" + offset
                                     ] = list_instrfield_offset_cpy
                         if len(list_instrfield_offset_cpy) != 0 and not (
@@ -1448,12 +1492,12 @@ def generate_file(
                             excluded_values = ""
                             if offset != "0":
                                 class_name = class_name + "_" + offset
-                            if str(excluded_values).upper() in registers_define[str.lower(key)]:
+                            if str(excluded_values).upper() in generation_context.registers_define[str.lower(key)]:
                                 class_name += "No" + str(excluded_values)
                             if "alias" + class_name in config_variables.keys():
                                 class_name = config_variables["alias" + class_name]
-                            if class_name not in reg_instrfields.keys():
-                                reg_instrfields[class_name] = sorted(list_instrfield_offset_cpy)
+                            if class_name not in generation_context.reg_instrfields.keys():
+                                generation_context.reg_instrfields[class_name] = sorted(list_instrfield_offset_cpy)
                     else:
                         if len(list_instrfield) != 0 and not (regclass[key].pseudo != ""):
                             f.write(
@@ -1466,12 +1510,12 @@ def generate_file(
                             class_name = key
                             if offset != "0":
                                 class_name = class_name + "_" + offset
-                            if str(excluded_values).upper() in registers_define[str.lower(key)]:
+                            if str(excluded_values).upper() in generation_context.registers_define[str.lower(key)]:
                                 class_name += "No" + str(excluded_values)
                             if "alias" + class_name in config_variables.keys():
                                 class_name = config_variables["alias" + class_name]
-                            if class_name not in reg_instrfields.keys():
-                                reg_instrfields[class_name] = sorted(list_instrfield)
+                            if class_name not in generation_context.reg_instrfields.keys():
+                                generation_context.reg_instrfields[class_name] = sorted(list_instrfield)
                     if (len(list_instrfield_offset) != 0 or len(list_instrfield) != 0) and (
                         not (regclass[key].pseudo != "")
                     ):
@@ -1480,7 +1524,7 @@ def generate_file(
                                 key,
                                 config_variables,
                                 config_variables["Namespace"],
-                                registers_define[str.lower(key)],
+                                generation_context.registers_define[str.lower(key)],
                                 regclass_alignment,
                                 config_variables["XLenVT"],
                                 str(config_variables["XLenRI"]),
@@ -1488,6 +1532,7 @@ def generate_file(
                                 instrfield_width,
                                 shift,
                                 "",
+                                generation_context=generation_context,
                             )
                         )
                         f.write("\n\n")
@@ -1501,6 +1546,7 @@ def generate_file(
                             regclass_alignment,
                             config_variables["XLenVT"],
                             str(config_variables["XLenRI"]),
+                            generation_context=generation_context,
                         )
                     )
                     f.write("\n\n")
@@ -1528,14 +1574,14 @@ def generate_file(
                             excluded_values_value = excluded_values[instr_key][0]
                             if offset != "0":
                                 class_name = class_name + "_" + offset
-                            if str(excluded_values_value).upper() in registers_define[str.lower(key)]:
+                            if str(excluded_values_value).upper() in generation_context.registers_define[str.lower(key)]:
                                 class_name += "No" + str(excluded_values_value)
                             if "alias" + class_name in config_variables.keys():
                                 class_name = config_variables["alias" + class_name]
-                            if class_name not in reg_instrfields.keys():
-                                reg_instrfields[class_name] = sorted(list_instrfield)
-                            if class_name not in reg_instrfields.keys():
-                                reg_instrfields[class_name] = sorted(instr_key)
+                            if class_name not in generation_context.reg_instrfields.keys():
+                                generation_context.reg_instrfields[class_name] = sorted(list_instrfield)
+                            if class_name not in generation_context.reg_instrfields.keys():
+                                generation_context.reg_instrfields[class_name] = sorted(instr_key)
                             offset = instrfield_ref_dict[instr_key]["offset"]
                             instrfield_width = 2 ** int(
                                 instrfield_ref_dict[instr_key]["width"]
@@ -1545,7 +1591,7 @@ def generate_file(
                                     key,
                                     config_variables,
                                     config_variables["Namespace"],
-                                    registers_define[str.lower(key)],
+                                    generation_context.registers_define[str.lower(key)],
                                     regclass_alignment,
                                     config_variables["XLenVT"],
                                     str(config_variables["XLenRI"]),
@@ -1553,11 +1599,12 @@ def generate_file(
                                     instrfield_width,
                                     shift,
                                     excluded_values[instr_key][0],
+                                    generation_context=generation_context,
                                 )
                             )
                             f.write("\n\n")
     register_classes_copy = dict()
-    for register in register_classes.keys():
+    for register in generation_context.register_classes.keys():
         instrfield_list = list()
         for reg in instrfield_ref_dict.keys():
             if register.startswith(instrfield_ref_dict[reg]["ref"]) and "_" in register:
@@ -1571,10 +1618,42 @@ def generate_file(
                     instrfield_list.append(reg)
         register_classes_copy[register] = instrfield_list
     register_classes_copy["SP"] = "sp"
-    register_classes = register_classes_copy.copy()
+    generation_context.register_classes = register_classes_copy.copy()
     f.close()
 
 
+def build_instruction_define_context(adl_name):
+    """
+    Gathers the model information needed by generate_instruction_define.
+
+    The context is built once per generation run and shared by every instruction
+    definition, so the cost of emitting an instruction no longer depends on the
+    size of the ADL file.
+
+    Args:
+        adl_name (str): The ADL file from which the information is parsed.
+
+    Returns:
+        dict: A dictionary containing the configuration variables, the immediate and
+            reference instruction fields, the reference instruction fields data, the
+            register aliases, the register files, the scheduling tables and the names
+            of all the instructions parsed from the ADL file.
+    """
+    instrfield_imm, instrfield_ref = adl_parser.get_instrfield_from_adl(adl_name)
+    context = dict()
+    context["config_variables"] = config.load_config(config_file, llvm_config)
+    context["instrfield_imm"] = instrfield_imm
+    context["instrfield_ref"] = instrfield_ref
+    context["instrfield_data_ref"] = adl_parser.get_instrfield_offset(adl_name)[1]
+    context["register_aliases"] = adl_parser.get_alias_for_regs(adl_name)
+    context["registers"] = adl_parser.parse_registers_from_adl(adl_name)
+    context["sched_tables"] = adl_parser.parse_sched_table_from_adl(adl_name)
+    context["instruction_names"] = list(
+        adl_parser.parse_instructions_from_adl(adl_name)[0].keys()
+    )
+    return context
+
+
 def generate_instruction_define(
     instructions,
     list_instructions,
@@ -1583,7 +1662,9 @@ def generate_instruction_define(
     schedule,
     hasImm,
     disableEncoding,
-    extension_list
+    extension_list,
+    generation_context,
+    context=None,
 ):
     """
     Generates the definition for a specific instruction.
@@ -1597,18 +1678,23 @@ def generate_instruction_define(
         hasImm (bool): Whether the instruction uses immediates (vs. only registers/constants).
         disableEncoding (bool): Whether encoding should be disabled for this instruction.
         extension_list (list[str]): Extensions provided by the user via command line.
+        context (dict | None): Model information built by build_instruction_define_context.
+            When missing, it is built for this call only.
+        generation_context (GenerationContext): The state shared by the generation stages.
 
     Returns:
         str: The generated content for the instruction definition.
     """
-    config_variables = config.config_environment(config_file, llvm_config)
-    instrfield_imm = adl_parser.get_instrfield_from_adl(config_variables["ADLName"])[0]
-    instrfield_ref = adl_parser.get_instrfield_from_adl(config_variables["ADLName"])[1]
-    instrfield_data_ref = adl_parser.get_instrfield_offset(config_variables["ADLName"])[
-        1
-    ]
-    registers = adl_parser.get_alias_for_regs(config_variables["ADLName"])
-    regs_prefix = adl_parser.parse_registers_from_adl(config_variables["ADLName"])
+    if context is None:
+        context = build_instruction_define_context(
+            config.load_config(config_file, llvm_config)["ADLName"]
+        )
+    config_variables = context["config_variables"]
+    instrfield_imm = context["instrfield_imm"]
+    instrfield_ref = context["instrfield_ref"]
+    instrfield_data_ref = context["instrfield_data_ref"]
+    registers = context["register_aliases"]
+    regs_prefix = context["registers"]
     define = "def "
     content = ""
     sideEffects = False
@@ -1620,7 +1706,7 @@ def generate_instruction_define(
     attributes_list_instruction = list()
     predicate_checked = False
     rv_predicate = ""
-    if ("BaseArchitecture" in config_variables.keys()) and (len(sys.argv) > 2 and sys.argv[2].split("=")[1] == "riscv32"):
+    if ("BaseArchitecture" in config_variables.keys()) and generation_context.target == "riscv32":
         rv_predicate = "Is" + config_variables["BaseArchitecture"].upper()
     if len(extension_list) > 0:
         for extension in extension_list:
@@ -1798,14 +1884,14 @@ def generate_instruction_define(
                     list_regs.append("$" + instrfield)
     for instrfield in syntax_elements[1:]:
         if instrfield in instrfield_data_ref.keys():
-            for reg_key in register_classes.keys():
+            for reg_key in generation_context.register_classes.keys():
                 if reg_key in regs_prefix.keys() and regs_prefix[reg_key].pseudo != "":
                     ref = regs_prefix[reg_key].pseudo
-                    if ref not in register_references:
+                    if ref not in generation_context.register_references:
                         if ref is not None:
-                            register_references.append(ref)
+                            generation_context.register_references.append(ref)
                 else:
-                    if instrfield in register_classes[reg_key]:
+                    if instrfield in generation_context.register_classes[reg_key]:
                         if "alias" + reg_key in config_variables.keys():
                             if (
                                 "excluded_values"
@@ -1828,15 +1914,15 @@ def generate_instruction_define(
                                             "excluded_values"
                                         ][instrfield][0]
                                     ]
-                                    if ref not in register_references:
+                                    if ref not in generation_context.register_references:
                                         if ref is not None:
-                                            register_references.append(ref)
+                                            generation_context.register_references.append(ref)
                                 else:
                                     if "alias" + reg_key in config_variables.keys():
                                         ref = config_variables["alias" + reg_key]
-                                        if ref not in register_references:
+                                        if ref not in generation_context.register_references:
                                             if ref is not None:
-                                                register_references.append(ref)
+                                                generation_context.register_references.append(ref)
                             else:
                                 if "alias" + reg_key in config_variables.keys():
                                     if (
@@ -1844,15 +1930,15 @@ def generate_instruction_define(
                                         in "alias" + reg_key
                                     ):
                                         ref = config_variables["alias" + reg_key]
-                                        if ref not in register_references:
+                                        if ref not in generation_context.register_references:
                                             if ref is not None:
-                                                register_references.append(ref)
+                                                generation_context.register_references.append(ref)
                                         break
                         else:
                             ref = reg_key
-                            if ref not in register_references:
+                            if ref not in generation_context.register_references:
                                 if ref is not None:
-                                    register_references.append(ref)
+                                    generation_context.register_references.append(ref)
                             break
             outs = str(instructions[key]["outputs"])
             ins = str(instructions[key]["inputs"])
@@ -1866,8 +1952,8 @@ def generate_instruction_define(
             if instructions[key]["fields"][0][instrfield] == "imm":
                 ins_instruction.insert(len(ins_instruction), instrfield)
             ref_imm = ""
-            for instr_key in instrfield_classes.keys():
-                if instrfield in instrfield_classes[instr_key]:
+            for instr_key in generation_context.instrfield_classes.keys():
+                if instrfield in generation_context.instrfield_classes[instr_key]:
                     if (
                         instrfield_imm[instrfield]["width"] in str(instr_key).lower()
                     ) or (
@@ -2036,7 +2122,7 @@ def generate_instruction_define(
     outs = re.split(r"[()]", outs)
     ins = re.split(r"[()]", ins)
     memory_operand_registers = list()
-    registers_parsed = adl_parser.parse_registers_from_adl(config_variables["ADLName"])
+    registers_parsed = regs_prefix
     register_pair_app_ins = dict()
     register_pair_app_outs = dict()
     for register in instrfield_ref:
@@ -2093,7 +2179,7 @@ def generate_instruction_define(
                 for register in instrfield_ref:
                     if register in element and register in ins:
                         memory_operand_registers.append(register)
-                        memory_operands_registers_list.append(register)
+                        generation_context.memory_operands_registers_list.append(register)
     for element in ins:
         if element not in instrfield_ref:
             for register in instrfield_ref:
@@ -2109,7 +2195,7 @@ def generate_instruction_define(
                         ):
                             if index not in memory_operand_registers:
                                 memory_operand_registers.append(index)
-                                memory_operands_registers_list.append(index)
+                                generation_context.memory_operands_registers_list.append(index)
                                 break
     action = action.replace("{", "").replace("}", "").replace("\n", "")
     action = action.lstrip(" ")
@@ -2142,15 +2228,15 @@ def generate_instruction_define(
                     if register_used not in memory_operand_registers:
                         if register_used != "":
                             memory_operand_registers.append(register_used)
-                            memory_operands_registers_list.append(register_used)
+                            generation_context.memory_operands_registers_list.append(register_used)
             break
     check_reference_pairs = list()
     ins.sort()
     for instrfield in ins:
         ref = ""
         if instrfield in instrfield_ref.keys():
-            for reg_key in register_classes.keys():
-                if instrfield in register_classes[reg_key]:
+            for reg_key in generation_context.register_classes.keys():
+                if instrfield in generation_context.register_classes[reg_key]:
                     if "alias" + reg_key in config_variables.keys():
                         ref = config_variables["alias" + reg_key]
                         if (
@@ -2170,24 +2256,24 @@ def generate_instruction_define(
                             else:
                                 ref += "P"
                                 check_reference_pairs.append(ref)
-                            if ref not in register_pairs.keys():
+                            if ref not in generation_context.register_pairs.keys():
                                 list_aux = list()
                                 list_aux.append(instrfield)
-                                register_pairs[ref] = list_aux
-                            elif ref in register_pairs.keys():
+                                generation_context.register_pairs[ref] = list_aux
+                            elif ref in generation_context.register_pairs.keys():
                                 list_aux = list()
-                                list_aux.extend(register_pairs[ref])
+                                list_aux.extend(generation_context.register_pairs[ref])
                                 list_aux.append(instrfield)
-                                register_pairs[ref] = list_aux
+                                generation_context.register_pairs[ref] = list_aux
                         if "load" in instructions[key]["attributes"]:
                             if instrfield in memory_operand_registers:
                                 ref += "Mem"
                         elif "store" in instructions[key]["attributes"]:
                             if instrfield in memory_operand_registers:
                                 ref += "Mem"
-                        if ref not in register_references:
+                        if ref not in generation_context.register_references:
                             if ref is not None:
-                                register_references.append(ref)
+                                generation_context.register_references.append(ref)
                     else:
                         ref = reg_key
                         if (
@@ -2207,24 +2293,24 @@ def generate_instruction_define(
                             else:
                                 ref += "P"
                                 check_reference_pairs.append(ref)
-                            if ref not in register_pairs.keys():
+                            if ref not in generation_context.register_pairs.keys():
                                 list_aux = list()
                                 list_aux.append(instrfield)
-                                register_pairs[ref] = list_aux
-                            elif ref in register_pairs.keys():
+                                generation_context.register_pairs[ref] = list_aux
+                            elif ref in generation_context.register_pairs.keys():
                                 list_aux = list()
-                                list_aux.extend(register_pairs[ref])
+                                list_aux.extend(generation_context.register_pairs[ref])
                                 list_aux.append(instrfield)
-                                register_pairs[ref] = list_aux
+                                generation_context.register_pairs[ref] = list_aux
                         if "load" in instructions[key]["attributes"]:
                             if instrfield in memory_operand_registers:
                                 ref += "Mem"
                         elif "store" in instructions[key]["attributes"]:
                             if instrfield in memory_operand_registers:
                                 ref += "Mem"
-                        if ref not in register_references:
+                        if ref not in generation_context.register_references:
                             if ref is not None:
-                                register_references.append(ref)
+                                generation_context.register_references.append(ref)
             if instrfield not in regs_in:
                 regs_in.insert(len(regs_in), instrfield)
                 instrfield_regs_ins.insert(
@@ -2233,8 +2319,8 @@ def generate_instruction_define(
     for instrfield in outs:
         ref = ""
         if instrfield in instrfield_ref.keys():
-            for reg_key in register_classes.keys():
-                if instrfield in register_classes[reg_key]:
+            for reg_key in generation_context.register_classes.keys():
+                if instrfield in generation_context.register_classes[reg_key]:
                     if "alias" + reg_key in config_variables.keys():
                         if "excluded_values" in instrfield_data_ref[instrfield]:
                             for element in instrfield_data_ref[instrfield][
@@ -2277,18 +2363,18 @@ def generate_instruction_define(
                             else:
                                 ref += "P"
                                 check_reference_pairs.append(ref)
-                            if ref not in register_pairs.keys():
+                            if ref not in generation_context.register_pairs.keys():
                                 list_aux = list()
                                 list_aux.append(instrfield)
-                                register_pairs[ref] = list_aux
-                            elif ref in register_pairs.keys():
+                                generation_context.register_pairs[ref] = list_aux
+                            elif ref in generation_context.register_pairs.keys():
                                 list_aux = list()
-                                list_aux.extend(register_pairs[ref])
+                                list_aux.extend(generation_context.register_pairs[ref])
                                 list_aux.append(instrfield)
-                                register_pairs[ref] = list_aux
-                        if ref not in register_references:
+                                generation_context.register_pairs[ref] = list_aux
+                        if ref not in generation_context.register_references:
                             if ref is not None:
-                                register_references.append(ref)
+                                generation_context.register_references.append(ref)
                     else:
                         ref = reg_key
                         if (
@@ -2308,18 +2394,18 @@ def generate_instruction_define(
                             else:
                                 ref += "P"
                                 check_reference_pairs.append(ref)
-                            if ref not in register_pairs.keys():
+                            if ref not in generation_context.register_pairs.keys():
                                 list_aux = list()
                                 list_aux.append(instrfield)
-                                register_pairs[ref] = list_aux
-                            elif ref in register_pairs.keys():
+                                generation_context.register_pairs[ref] = list_aux
+                            elif ref in generation_context.register_pairs.keys():
                                 list_aux = list()
-                                list_aux.extend(register_pairs[ref])
+                                list_aux.extend(generation_context.register_pairs[ref])
                                 list_aux.append(instrfield)
-                                register_pairs[ref] = list_aux
-                        if ref not in register_references:
+                                generation_context.register_pairs[ref] = list_aux
+                        if ref not in generation_context.register_references:
                             if ref is not None:
-                                register_references.append(ref)
+                                generation_context.register_references.append(ref)
             if instrfield not in regs_out:
                 regs_out.insert(len(regs_out), instrfield)
                 instrfield_regs_outs.insert(
@@ -2328,8 +2414,8 @@ def generate_instruction_define(
     for instrfield in ins:
         ref = ""
         if instrfield in instrfield_ref.keys():
-            for reg_key in register_classes.keys():
-                if instrfield in register_classes[reg_key]:
+            for reg_key in generation_context.register_classes.keys():
+                if instrfield in generation_context.register_classes[reg_key]:
                     if "alias" + reg_key in config_variables.keys():
                         if "excluded_values" in instrfield_data_ref[instrfield]:
                             for element in instrfield_data_ref[instrfield][
@@ -2372,18 +2458,18 @@ def generate_instruction_define(
                             else:
                                 ref += "P"
                                 check_reference_pairs.append(ref)
-                            if ref not in register_pairs.keys():
+                            if ref not in generation_context.register_pairs.keys():
                                 list_aux = list()
                                 list_aux.append(instrfield)
-                                register_pairs[ref] = list_aux
-                            elif ref in register_pairs.keys():
+                                generation_context.register_pairs[ref] = list_aux
+                            elif ref in generation_context.register_pairs.keys():
                                 list_aux = list()
-                                list_aux.extend(register_pairs[ref])
+                                list_aux.extend(generation_context.register_pairs[ref])
                                 list_aux.append(instrfield)
-                                register_pairs[ref] = list_aux
-                        if ref not in register_references:
+                                generation_context.register_pairs[ref] = list_aux
+                        if ref not in generation_context.register_references:
                             if ref is not None:
-                                register_references.append(ref)
+                                generation_context.register_references.append(ref)
                     else:
                         ref = reg_key
                         if (
@@ -2403,26 +2489,26 @@ def generate_instruction_define(
                             else:
                                 ref += "P"
                                 check_reference_pairs.append(ref)
-                            if ref not in register_pairs.keys():
+                            if ref not in generation_context.register_pairs.keys():
                                 list_aux = list()
                                 list_aux.append(instrfield)
-                                register_pairs[ref] = list_aux
-                            elif ref in register_pairs.keys():
+                                generation_context.register_pairs[ref] = list_aux
+                            elif ref in generation_context.register_pairs.keys():
                                 list_aux = list()
-                                list_aux.extend(register_pairs[ref])
+                                list_aux.extend(generation_context.register_pairs[ref])
                                 list_aux.append(instrfield)
-                                register_pairs[ref] = list_aux
-                        if ref not in register_references:
+                                generation_context.register_pairs[ref] = list_aux
+                        if ref not in generation_context.register_references:
                             if ref is not None:
-                                register_references.append(ref)
+                                generation_context.register_references.append(ref)
             if instrfield not in regs_in:
                 regs_in.insert(len(regs_out), instrfield)
                 instrfield_regs_ins.insert(
                     len(instrfield_regs_ins), ref + ":" + "$" + instrfield
                 )
-    alias_dict = adl_parser.get_alias_for_regs(config_variables["ADLName"])
+    alias_dict = registers
     for elem in instructions[key]["inputs"]:
-        for regclass in register_classes:
+        for regclass in generation_context.register_classes:
             if regclass in elem:
                 ins = re.split(r"[()]", elem)
                 for elem_ins in ins:
@@ -2431,8 +2517,8 @@ def generate_instruction_define(
                             reg_in = alias_dict[regclass][elem_ins]
                             reg_in = reg_in[0]
                             regclass_cpy = ""
-                            for register_new_class in register_classes.keys():
-                                if reg_in in register_classes[register_new_class]:
+                            for register_new_class in generation_context.register_classes.keys():
+                                if reg_in in generation_context.register_classes[register_new_class]:
                                     regclass_cpy = register_new_class
                             if regclass_cpy != "" and regclass_cpy != regclass:
                                 exitValue = False
@@ -2443,8 +2529,8 @@ def generate_instruction_define(
                                 elif "store" in instructions[key]["attributes"]:
                                     if regclass_cpy.lower() in memory_operand_registers:
                                         regclass_cpy += "Mem"
-                                if regclass_cpy not in register_references:
-                                    register_references.append(regclass_cpy)
+                                if regclass_cpy not in generation_context.register_references:
+                                    generation_context.register_references.append(regclass_cpy)
                                 for reg in regs_in:
                                     if reg in instrfield_data_ref:
                                         exitValue = True
@@ -2467,14 +2553,14 @@ def generate_instruction_define(
                                 elif "store" in instructions[key]["attributes"]:
                                     if regclass.lower() in memory_operand_registers:
                                         regclass += "Mem"
-                                if regclass not in register_references:
-                                    register_references.append(regclass)
+                                if regclass not in generation_context.register_references:
+                                    generation_context.register_references.append(regclass)
                                 instrfield_regs_ins.insert(
                                     0, regclass + ":" + "$" + reg_in
                                 )
                                 decoderMethodRegs.append(reg_in)
     for elem in instructions[key]["inputs"]:
-        for regclass in register_classes:
+        for regclass in generation_context.register_classes:
             if regclass in elem:
                 ins = re.split(r"[()]", elem)
                 for elem_ins in ins:
@@ -2497,22 +2583,22 @@ def generate_instruction_define(
                                 else:
                                     regclass += "P"
                                     check_reference_pairs.append(regclass)
-                                if regclass not in register_pairs.keys():
+                                if regclass not in generation_context.register_pairs.keys():
                                     list_aux = list()
                                     list_aux.append(reg_in)
-                                    register_pairs[regclass] = list_aux
-                                elif regclass in register_pairs.keys():
+                                    generation_context.register_pairs[regclass] = list_aux
+                                elif regclass in generation_context.register_pairs.keys():
                                     list_aux = list()
-                                    list_aux.extend(register_pairs[regclass])
+                                    list_aux.extend(generation_context.register_pairs[regclass])
                                     list_aux.append(reg_in)
-                                    register_pairs[regclass] = list_aux
+                                    generation_context.register_pairs[regclass] = list_aux
                                 instrfield_regs_ins.insert(
                                     len(instrfield_regs_ins),
                                     regclass + ":" + "$" + reg_in,
                                 )
                                 decoderMethodRegs.append(reg_out)
     for elem in instructions[key]["outputs"]:
-        for regclass in register_classes:
+        for regclass in generation_context.register_classes:
             if regclass in elem:
                 outs = re.split(r"[()]", elem)
                 for elem_outs in outs:
@@ -2535,17 +2621,17 @@ def generate_instruction_define(
                                 else:
                                     regclass += "P"
                                     check_reference_pairs.append(regclass)
-                                if regclass not in register_pairs.keys():
+                                if regclass not in generation_context.register_pairs.keys():
                                     list_aux = list()
                                     list_aux.append(reg_out)
-                                    register_pairs[regclass] = list_aux
-                                elif regclass in register_pairs.keys():
+                                    generation_context.register_pairs[regclass] = list_aux
+                                elif regclass in generation_context.register_pairs.keys():
                                     list_aux = list()
-                                    list_aux.extend(register_pairs[regclass])
+                                    list_aux.extend(generation_context.register_pairs[regclass])
                                     list_aux.append(reg_out)
-                                    register_pairs[regclass] = list_aux
+                                    generation_context.register_pairs[regclass] = list_aux
                             if reg_out not in instrfield_imm.keys() and reg_out not in instrfield_ref.keys():
-                                if reg_out.upper() in register_classes.keys():
+                                if reg_out.upper() in generation_context.register_classes.keys():
                                     regclass =  reg_out.upper()
                             instrfield_regs_outs.insert(
                                 len(instrfield_regs_outs),
@@ -2559,8 +2645,8 @@ def generate_instruction_define(
         for syntax_element in syntax_elem:
             if syntax_element in instrfield_imm.keys():
                 ref_imm = ""
-                for instr_key in instrfield_classes.keys():
-                    instrfield_classes_list = instrfield_classes[instr_key].split(" ")
+                for instr_key in generation_context.instrfield_classes.keys():
+                    instrfield_classes_list = generation_context.instrfield_classes[instr_key].split(" ")
                     for element in instrfield_classes_list:
                         if syntax_element == element:
                             ref_imm = str(instr_key).lower()
@@ -2630,26 +2716,26 @@ def generate_instruction_define(
                                             ref_imm + ":" + "$" + syntax_element,
                                         )                            
     for reg_pair in check_reference_pairs:
-        if reg_pair not in register_pairs.keys():
+        if reg_pair not in generation_context.register_pairs.keys():
             list_aux = list()
             list_aux.append(reg_pair)
-            register_pairs[reg_pair] = list_aux
-    for reg_pair in register_references:
+            generation_context.register_pairs[reg_pair] = list_aux
+    for reg_pair in generation_context.register_references:
         if "No" in reg_pair:
             aux = reg_pair.split("No")[0]
             if aux.endswith("P"):
-                if reg_pair not in register_pairs.keys():
+                if reg_pair not in generation_context.register_pairs.keys():
                     list_aux = list()
                     list_aux.append(reg_pair)
-                    register_pairs[reg_pair] = list_aux
+                    generation_context.register_pairs[reg_pair] = list_aux
         else:
             if reg_pair.endswith("P"):
                 aux = reg_pair[::-1].replace("P", "")
-                if aux in register_references:
-                    if reg_pair not in register_pairs.keys():
+                if aux in generation_context.register_references:
+                    if reg_pair not in generation_context.register_pairs.keys():
                         list_aux = list()
                         list_aux.append(reg_pair)
-                        register_pairs[reg_pair] = list_aux
+                        generation_context.register_pairs[reg_pair] = list_aux
 
     constraint = ""
     disableEncodingLet = ""
@@ -2870,7 +2956,7 @@ def generate_instruction_define(
     write_sched = ""
     read_sched = ""
     read_resource = False
-    scheduling_table_dict = adl_parser.parse_sched_table_from_adl(config_variables["ADLName"])
+    scheduling_table_dict = context["sched_tables"]
     for sched_key in scheduling_table_dict.keys():
             for key_instr in scheduling_table_dict[sched_key].keys():
                 if 'instruction_list' in scheduling_table_dict[sched_key][key_instr].keys():
@@ -2878,11 +2964,11 @@ def generate_instruction_define(
                         if 'forwarding' in scheduling_table_dict[sched_key][key_instr].keys():
                             read_resource = True
                             break
-    if key in scheduling_instr_info.keys():
-        if 'write' in scheduling_instr_info[key].keys():
-            write_sched = scheduling_instr_info[key]['write']
-        if 'read' in scheduling_instr_info[key].keys():
-            read_sched = scheduling_instr_info[key]['read']
+    if key in generation_context.scheduling_instr_info.keys():
+        if 'write' in generation_context.scheduling_instr_info[key].keys():
+            write_sched = generation_context.scheduling_instr_info[key]['write']
+        if 'read' in generation_context.scheduling_instr_info[key].keys():
+            read_sched = generation_context.scheduling_instr_info[key]['read']
         scheduling_list = list()
         for element in instrfield_regs_outs:
             register = element.split(":$")[1]
@@ -3017,14 +3103,13 @@ def generate_instruction_define(
                                             scheduling_list.append(read_sched.replace("'", ""))
                                             scheduling_original_list.append(read_sched.replace("'", ""))
         schedule = str(scheduling_list).replace("'", "")
-    instructions_parsed = adl_parser.parse_instructions_from_adl(config_variables["ADLName"])[0]
-    for instruction in instructions_parsed.keys():
+    for instruction in context["instruction_names"]:
         if instruction == instruction_fixed:
             scheduling_list = list()
             if len(instrfield_regs_outs) == 0 and len(instrfield_regs_ins) == 0:
-                if instruction in scheduling_instr_info.keys():
-                    if 'write' in scheduling_instr_info[instruction].keys():
-                        write_sched = scheduling_instr_info[instruction]['write']
+                if instruction in generation_context.scheduling_instr_info.keys():
+                    if 'write' in generation_context.scheduling_instr_info[instruction].keys():
+                        write_sched = generation_context.scheduling_instr_info[instruction]['write']
                         scheduling_list.append(write_sched.replace("'", ""))
                     schedule = str(scheduling_list).replace("'", "")
             else:
@@ -3034,15 +3119,15 @@ def generate_instruction_define(
                         check = True
                 if check is False:
                     if len(instrfield_regs_outs) == 0:
-                        if instruction in scheduling_instr_info.keys():
-                            if 'write' in scheduling_instr_info[instruction].keys():
-                                write_sched = scheduling_instr_info[instruction]['write']
+                        if instruction in generation_context.scheduling_instr_info.keys():
+                            if 'write' in generation_context.scheduling_instr_info[instruction].keys():
+                                write_sched = generation_context.scheduling_instr_info[instruction]['write']
                                 scheduling_list.append(write_sched.replace("'", ""))
                             schedule = str(scheduling_list).replace("'", "")
-    instruction_registers_used_outs[key] = instrfield_regs_outs
+    generation_context.instruction_registers_used_outs[key] = instrfield_regs_outs
     instrfield_regs_outs = str(instrfield_regs_outs)
     instrfield_regs_ins_list = instrfield_regs_ins
-    instruction_registers_used_ins[key] = instrfield_regs_ins
+    generation_context.instruction_registers_used_ins[key] = instrfield_regs_ins
     instrfield_regs_ins = str(instrfield_regs_ins)
     for reg in regs_in:
         if reg in regs_out:
@@ -3121,11 +3206,11 @@ def generate_instruction_define(
     else:
         syntax = ""
     if "load" in instructions[key]["attributes"]:
-        instructions_load_store[key] = (
+        generation_context.instructions_load_store[key] = (
             str(instrfield_regs_outs) + ", " + str(instrfield_regs_ins)
         )
     if "store" in instructions[key]["attributes"]:
-        instructions_load_store[key] = (
+        generation_context.instructions_load_store[key] = (
             str(instrfield_regs_outs) + ", " + str(instrfield_regs_ins)
         )
     syntax = str(syntax).replace("'", "")
@@ -3134,14 +3219,14 @@ def generate_instruction_define(
     syntax = syntax.replace('"', "")
     syntax = syntax.replace(" ,", "")
     if instrfield_regs_outs != "" and instrfield_regs_ins != "":
-        alias_instruction_syntax_dict[key] = (
+        generation_context.alias_instruction_syntax_dict[key] = (
             instrfield_regs_outs + ", " + instrfield_regs_ins
         )
     else:
         if instrfield_regs_outs == "":
-            alias_instruction_syntax_dict[key] = instrfield_regs_ins
+            generation_context.alias_instruction_syntax_dict[key] = instrfield_regs_ins
         elif instrfield_regs_ins == "":
-            alias_instruction_syntax_dict[key] = instrfield_regs_outs
+            generation_context.alias_instruction_syntax_dict[key] = instrfield_regs_outs
     if width == config_variables["LLVMStandardInstructionWidth"]:
         if hasImm is True:
             if "isBranch" in instructions[key]["attributes"]:
@@ -3659,9 +3744,9 @@ def generate_instruction_define(
                         + ";"
                     )
     sorted_dict = dict(sorted(instruction_encoding_list.items(), key = lambda x: x[0], reverse = True))
-    instruction_encoding_dict[key] = sorted_dict
-    for elem in instruction_encoding_dict[key].keys():
-        content += "\t" + instruction_encoding_dict[key][elem] + "\n"
+    generation_context.instruction_encoding_dict[key] = sorted_dict
+    for elem in generation_context.instruction_encoding_dict[key].keys():
+        content += "\t" + generation_context.instruction_encoding_dict[key][elem] + "\n"
     if 'branch' in instructions[key]["attributes"]:
         isBranch = "\tlet isBranch = 1;\n"
         isTerminator = "\tlet isTerminator = 1;\n"
@@ -3772,7 +3857,7 @@ def generate_instruction_define(
     
 
 
-def generate_file_instructions(file_name, extensions_list):
+def generate_file_instructions(file_name, extensions_list, generation_context):
     """
     Writes the instruction definitions into `RISCVInstrInfo.td` for each instruction
     parsed from the ADL input.
@@ -3780,28 +3865,25 @@ def generate_file_instructions(file_name, extensions_list):
     Args:
         file_name (str): ADL file name (or path) parsed to gather instruction information.
         extensions_list (list[str]): List of extensions provided by the user via the command line.
+        generation_context (GenerationContext): The state shared by the generation stages.
 
     Returns:
         str: The generated content for `RISCVInstrInfo.td`.
     """
     config_variables = config.config_environment(config_file, llvm_config)
-    instructions = adl_parser.parse_instructions_from_adl(config_variables["ADLName"])[
-        0
-    ]
-    list_instructions_with_regs = adl_parser.parse_instructions_from_adl(
-        config_variables["ADLName"]
-    )[1]
-    list_instructions_with_imms = adl_parser.parse_instructions_from_adl(
-        config_variables["ADLName"]
-    )[2]
+    (
+        instructions,
+        list_instructions_with_regs,
+        list_instructions_with_imms,
+        sorting_attributes,
+    ) = adl_parser.parse_instructions_from_adl(config_variables["ADLName"])
     instrfield_imm = adl_parser.get_instrfield_from_adl(config_variables["ADLName"])[0]
+    define_context = build_instruction_define_context(config_variables["ADLName"])
+    instruction_views = load_instruction_views()
     instruction_map = dict()
     for instruction in instructions.keys():
         instruction_map[instruction] = False
     file_name_cpy = file_name
-    sorting_attributes = adl_parser.parse_instructions_from_adl(
-        config_variables["ADLName"]
-    )[3]
     sorting_attributes_copy = sorting_attributes.copy()
     if len(extensions_list) > 0:
         for element in sorting_attributes_copy:
@@ -3814,7 +3896,7 @@ def generate_file_instructions(file_name, extensions_list):
     for attribute in sorting_attributes:
         changed_file_name = False
         if "LLVMExt" + str(attribute).capitalize() not in config_variables.keys():
-            f = open(file_name, "a")
+            f = emitter.open(file_name, "a")
             for key in instructions.keys():
                 if "ignored" not in instructions[key]["attributes"]:
                     for attribute in instructions[key]["attributes"]:
@@ -3848,13 +3930,14 @@ def generate_file_instructions(file_name, extensions_list):
                                                 hasImm,
                                                 disableEncoding,
                                                 extensions_list,
+                                                context=define_context,
+                                                generation_context=generation_context,
                                             )
                                         )
                                         f.write("\n")
-                                        if generate_pattern_for_instructions(key) != "":
-                                            f.write(
-                                                generate_pattern_for_instructions(key)
-                                            )
+                                        pattern = generate_pattern_for_instructions(key, generation_context, instruction_views)
+                                        if pattern != "":
+                                            f.write(pattern)
                                             f.write("\n\n")
                                         else:
                                             f.write("\n")
@@ -4067,16 +4150,16 @@ def generate_file_instructions(file_name, extensions_list):
                                                                         )
                                                             if (
                                                                 instr_field_classname
-                                                                in instrfield_classes.keys()
+                                                                in generation_context.instrfield_classes.keys()
                                                             ):
-                                                                instrfield_classes[
+                                                                generation_context.instrfield_classes[
                                                                     instr_field_classname
                                                                 ] += (field + " ")
                                                             elif (
                                                                 instr_field_classname
-                                                                not in instrfield_classes.keys()
+                                                                not in generation_context.instrfield_classes.keys()
                                                             ):
-                                                                instrfield_classes[
+                                                                generation_context.instrfield_classes[
                                                                     instr_field_classname
                                                                 ] = (field + " ")
                                                     else:
@@ -4244,16 +4327,16 @@ def generate_file_instructions(file_name, extensions_list):
                                                                     )
                                                         if (
                                                             instr_field_classname
-                                                            in instrfield_classes.keys()
+                                                            in generation_context.instrfield_classes.keys()
                                                         ):
-                                                            instrfield_classes[
+                                                            generation_context.instrfield_classes[
                                                                 instr_field_classname
                                                             ] += (field + " ")
                                                         elif (
                                                             instr_field_classname
-                                                            not in instrfield_classes.keys()
+                                                            not in generation_context.instrfield_classes.keys()
                                                         ):
-                                                            instrfield_classes[
+                                                            generation_context.instrfield_classes[
                                                                 instr_field_classname
                                                             ] = (field + " ")
                                                     disableEncoding = True
@@ -4267,13 +4350,14 @@ def generate_file_instructions(file_name, extensions_list):
                                                 hasImm,
                                                 disableEncoding,
                                                 extensions_list,
+                                                context=define_context,
+                                                generation_context=generation_context,
                                             )
                                         )
                                         f.write("\n")
-                                        if generate_pattern_for_instructions(key) != "":
-                                            f.write(
-                                                generate_pattern_for_instructions(key)
-                                            )
+                                        pattern = generate_pattern_for_instructions(key, generation_context, instruction_views)
+                                        if pattern != "":
+                                            f.write(pattern)
                                             f.write("\n\n")
                                         else:
                                             f.write("\n")
@@ -4302,14 +4386,14 @@ def generate_file_instructions(file_name, extensions_list):
                     file_name = file_name + ".td"
                 changed_file_name = True
             if changed_file_name is True:
-                if os.path.exists(file_name):
-                    os.remove(file_name)
+                if emitter.exists(file_name):
+                    emitter.remove(file_name)
                 legalDisclaimer.get_copyright(file_name)
                 #legalDisclaimer.get_generated_file(file_name)
             else:
                 file_name = file_name_cpy
-            f = open(file_name, "a")
-            if ("BaseArchitecture" in config_variables.keys()) and len(sys.argv) > 2 and sys.argv[2].split("=")[1] == "riscv32":
+            f = emitter.open(file_name, "a")
+            if ("BaseArchitecture" in config_variables.keys()) and generation_context.target == "riscv32":
                 rv_predicate = "Is" + config_variables["BaseArchitecture"].upper()
             for key in instructions.keys():
                 if "ignored" not in instructions[key]["attributes"]:
@@ -4332,11 +4416,14 @@ def generate_file_instructions(file_name, extensions_list):
                                         hasImm,
                                         disableEncoding,
                                         extensions_list,
+                                        context=define_context,
+                                        generation_context=generation_context,
                                     )
                                 )
                                 f.write("\n")
-                                if generate_pattern_for_instructions(key) != "":
-                                    f.write(generate_pattern_for_instructions(key))
+                                pattern = generate_pattern_for_instructions(key, generation_context, instruction_views)
+                                if pattern != "":
+                                    f.write(pattern)
                                     f.write("\n\n")
                                 else:
                                     f.write("\n")
@@ -4517,16 +4604,16 @@ def generate_file_instructions(file_name, extensions_list):
                                                                 )
                                                     if (
                                                         instr_field_classname
-                                                        in instrfield_classes.keys()
+                                                        in generation_context.instrfield_classes.keys()
                                                     ):
-                                                        instrfield_classes[
+                                                        generation_context.instrfield_classes[
                                                             instr_field_classname
                                                         ] += (field + " ")
                                                     elif (
                                                         instr_field_classname
-                                                        not in instrfield_classes.keys()
+                                                        not in generation_context.instrfield_classes.keys()
                                                     ):
-                                                        instrfield_classes[
+                                                        generation_context.instrfield_classes[
                                                             instr_field_classname
                                                         ] = (field + " ")
                                             else:
@@ -4626,18 +4713,18 @@ def generate_file_instructions(file_name, extensions_list):
                                                             )
                                                 if (
                                                     instr_field_classname
-                                                    in instrfield_classes.keys()
+                                                    in generation_context.instrfield_classes.keys()
                                                 ):
                                                     if field in config_variables.keys():
                                                         if (
-                                                            instrfield_classes[
+                                                            generation_context.instrfield_classes[
                                                                 instr_field_classname
                                                             ]
                                                             in config_variables.keys()
                                                         ):
                                                             for (
                                                                 elem
-                                                            ) in instrfield_classes[
+                                                            ) in generation_context.instrfield_classes[
                                                                 instr_field_classname
                                                             ]:
                                                                 if (
@@ -4656,7 +4743,7 @@ def generate_file_instructions(file_name, extensions_list):
                                                                             )
                                                                         ]
                                                                     ):
-                                                                        instrfield_classes[
+                                                                        generation_context.instrfield_classes[
                                                                             instr_field_classname
                                                                             + "_"
                                                                             + field
@@ -4664,34 +4751,34 @@ def generate_file_instructions(file_name, extensions_list):
                                                                             field + " "
                                                                         )
                                                         else:
-                                                            instrfield_classes[
+                                                            generation_context.instrfield_classes[
                                                                 instr_field_classname
                                                                 + "_"
                                                                 + field
                                                             ] = (field + " ")
                                                     else:
-                                                        instrfield_classes[
+                                                        generation_context.instrfield_classes[
                                                             instr_field_classname
                                                         ] += (field + " ")
                                                 elif (
                                                     instr_field_classname
-                                                    not in instrfield_classes.keys()
+                                                    not in generation_context.instrfield_classes.keys()
                                                 ):
                                                     if (
                                                         instr_field_classname
                                                         + "_"
                                                         + field
-                                                        in instrfield_classes.keys()
+                                                        in generation_context.instrfield_classes.keys()
                                                     ):
                                                         if (
                                                             field
-                                                            not in instrfield_classes[
+                                                            not in generation_context.instrfield_classes[
                                                                 instr_field_classname
                                                                 + "_"
                                                                 + field
                                                             ]
                                                         ):
-                                                            instrfield_classes[
+                                                            generation_context.instrfield_classes[
                                                                 instr_field_classname
                                                             ] = (field + " ")
                                                     else:
@@ -4699,11 +4786,11 @@ def generate_file_instructions(file_name, extensions_list):
                                                             field
                                                             not in config_variables.keys()
                                                         ):
-                                                            instrfield_classes[
+                                                            generation_context.instrfield_classes[
                                                                 instr_field_classname
                                                             ] = (field + " ")
                                                         else:
-                                                            instrfield_classes[
+                                                            generation_context.instrfield_classes[
                                                                 instr_field_classname
                                                                 + "_"
                                                                 + field
@@ -4719,20 +4806,23 @@ def generate_file_instructions(file_name, extensions_list):
                                         hasImm,
                                         disableEncoding,
                                         extensions_list,
+                                        context=define_context,
+                                        generation_context=generation_context,
                                     )
                                 )
                                 f.write("\n")
-                                if generate_pattern_for_instructions(key) != "":
-                                    f.write(generate_pattern_for_instructions(key))
+                                pattern = generate_pattern_for_instructions(key, generation_context, instruction_views)
+                                if pattern != "":
+                                    f.write(pattern)
                                     f.write("\n\n")
                                 else:
                                     f.write("\n")
             f.close()
-    for key in instrfield_classes.keys():
-        list_instrs = instrfield_classes[key].split(" ")
+    for key in generation_context.instrfield_classes.keys():
+        list_instrs = generation_context.instrfield_classes[key].split(" ")
         list_instrs.remove("")
         list_instrs = set(list_instrs)
-        instrfield_classes.update({key: list(list_instrs)})
+        generation_context.instrfield_classes.update({key: list(list_instrs)})
 
 
 def generate_define_instruction_class(
@@ -4922,8 +5012,73 @@ def generate_constraint_define(
     return content
 
 
+def get_encoding_layout_signature(instruction, instrfield_imm, instrfield_ref):
+    """
+    Computes the canonical bit layout of an instruction encoding.
+
+    Two instructions with the same signature place the same kind of fields on the
+    same bits, so they share their instruction format.
+
+    Args:
+        instruction (dict): Instruction parsed from the ADL file.
+        instrfield_imm (dict): The immediate instruction fields parsed from the ADL file.
+        instrfield_ref (dict): The register instruction fields parsed from the ADL file.
+
+    Returns:
+        tuple: The width of the instruction and the (msb, lsb, kind) tuples of its
+            fields ordered from the most significant bit, where kind is the name of
+            the opcode fields, "fixed" for the other fields holding a constant value
+            and "reg" or "imm" for the operands.
+    """
+    layout = list()
+    for instrfield, value in instruction["fields"][0].items():
+        if instrfield in instrfield_imm:
+            ranges = instrfield_imm[instrfield]["range"]
+        elif instrfield in instrfield_ref:
+            ranges = instrfield_ref[instrfield]["range"]
+        else:
+            continue
+        if instrfield in ("opcode", "op_c"):
+            kind = instrfield
+        elif value in ("reg", "imm"):
+            kind = value
+        else:
+            kind = "fixed"
+        for msb, lsb in ranges:
+            layout.append((int(msb), int(lsb), kind))
+    layout.sort(key=lambda bits: (-bits[0], -bits[1], bits[2]))
+    return instruction["width"], tuple(layout)
+
+
+def group_instructions_by_layout(instructions, instruction_names, instrfield_imm, instrfield_ref):
+    """
+    Groups instructions by the signature of their encoding layout.
+
+    Args:
+        instructions (dict): Dictionary containing all instructions parsed from the ADL file.
+        instruction_names (set[str]): Names of the instructions to group.
+        instrfield_imm (dict): The immediate instruction fields parsed from the ADL file.
+        instrfield_ref (dict): The register instruction fields parsed from the ADL file.
+
+    Returns:
+        dict: The names of the instructions, in the order of the ADL file, for every
+            layout signature (see get_encoding_layout_signature), in the order in
+            which the layouts first appear.
+    """
+    layouts = dict()
+    for key in instructions.keys():
+        if key in instruction_names:
+            signature = get_encoding_layout_signature(instructions[key], instrfield_imm, instrfield_ref)
+            layouts.setdefault(signature, list()).append(key)
+    return layouts
+
+
 def generate_instruction_format(file_name, file_name_c): 
     """ Generates the contents of the `RISCVInstrFormats.td` file. 
+
+    The instructions are grouped by encoding layout, and the format of every
+    instruction width is computed once, from the first layout of that width.
+
     Args: 
         file_name (str): ADL file parsed to gather all needed information. 
         file_name_c (str): Additional ADL or configuration file used during generation. 
@@ -4931,60 +5086,32 @@ def generate_instruction_format(file_name, file_name_c):
         str: The generated content of the `RISCVInstrFormats.td` file. """
         
     config_variables = config.config_environment(config_file, llvm_config)
-    instructions = adl_parser.parse_instructions_from_adl(config_variables["ADLName"])[
-        0
-    ]
-    list_instructions_with_regs = adl_parser.parse_instructions_from_adl(
-        config_variables["ADLName"]
-    )[1]
-    list_instructions_with_imms = adl_parser.parse_instructions_from_adl(
-        config_variables["ADLName"]
-    )[2]
-    instruction_width_list = list()
-    instrfield_imm = adl_parser.get_instrfield_from_adl(config_variables["ADLName"])[0]
+    (
+        instructions,
+        list_instructions_with_regs,
+        list_instructions_with_imms,
+    ) = adl_parser.parse_instructions_from_adl(config_variables["ADLName"])[:3]
+    instruction_width_list = set()
+    instrfield_imm, instrfield_ref = adl_parser.get_instrfield_from_adl(config_variables["ADLName"])[:2]
+    layouts = group_instructions_by_layout(
+        instructions,
+        set(list_instructions_with_regs) | set(list_instructions_with_imms),
+        instrfield_imm,
+        instrfield_ref,
+    )
     instruction_opcode = dict()
-    for key in instructions.keys():
-        if key in list_instructions_with_regs:
-            if instructions[key]["width"] not in instruction_width_list:
-                instruction_width_list.append(instructions[key]["width"])
-                instruction_opcode_dict = dict()
-                for instrfield in instructions[key]["fields"][0].keys():
-                    if "opcode" == instrfield:
-                        instruction_opcode_dict[
-                            instrfield_imm[instrfield]["width"]
-                        ] = instrfield_imm[instrfield]["range"]
-                        instruction_opcode[
-                            instructions[key]["width"]
-                        ] = instruction_opcode_dict
-                for instrfield in instructions[key]["fields"][0].keys():
-                    if "op_c" == instrfield:
-                        instruction_opcode_dict[
-                            instrfield_imm[instrfield]["width"]
-                        ] = instrfield_imm[instrfield]["range"]
-                        instruction_opcode[
-                            instructions[key]["width"]
-                        ] = instruction_opcode_dict
-        elif key in list_instructions_with_imms:
-            if instructions[key]["width"] not in instruction_width_list:
-                instruction_width_list.append(instructions[key]["width"])
-                instruction_opcode_dict = dict()
-                for instrfield in instructions[key]["fields"][0].keys():
-                    if "opcode" == instrfield:
-                        instruction_opcode_dict[
-                            instrfield_imm[instrfield]["width"]
-                        ] = instrfield_imm[instrfield]["range"]
-                        instruction_opcode[
-                            instructions[key]["width"]
-                        ] = instruction_opcode_dict
-                for instrfield in instructions[key]["fields"][0].keys():
-                    if "op_c" == instrfield:
-                        instruction_opcode_dict[
-                            instrfield_imm[instrfield]["width"]
-                        ] = instrfield_imm[instrfield]["range"]
-                        instruction_opcode[
-                            instructions[key]["width"]
-                        ] = instruction_opcode_dict
-    f = open(file_name, "a")
+    for (width, _), layout_instructions in layouts.items():
+        if width not in instruction_width_list:
+            instruction_width_list.add(width)
+            key = layout_instructions[0]
+            instruction_opcode_dict = dict()
+            for opcode_field in ("opcode", "op_c"):
+                if opcode_field in instructions[key]["fields"][0].keys():
+                    instruction_opcode_dict[
+                        instrfield_imm[opcode_field]["width"]
+                    ] = instrfield_imm[opcode_field]["range"]
+                    instruction_opcode[width] = instruction_opcode_dict
+    f = emitter.open(file_name, "a")
     f.write(
         generate_instruction_format_define(
             config_variables["InstructionFormat"],
@@ -5043,9 +5170,9 @@ def generate_instruction_format(file_name, file_name_c):
             file_name = file_name_c + file_name
             if os.getcwd().endswith("tools"):
                 file_name = os.path.abspath(file_name)
-            if os.path.exists(config_variables["InstructionFormatFile" + width]):
-                os.remove(config_variables["InstructionFormatFile" + width])
-            g = open(file_name, "a")
+            if emitter.exists(config_variables["InstructionFormatFile" + width]):
+                emitter.remove(config_variables["InstructionFormatFile" + width])
+            g = emitter.open(file_name, "a")
             legalDisclaimer.get_copyright(file_name)
             opcode = list(instruction_opcode[width].keys())
             opcode_range = list(instruction_opcode[width].values())
@@ -5073,7 +5200,49 @@ def generate_instruction_format(file_name, file_name_c):
     f.close()
 
 
-def generate_imms_class(key, instructions, immediate_key):
+def build_imms_table(instructions, instrfield_classes):
+    """
+    Gathers the information needed by generate_imms_class for every immediate.
+
+    The table is built once per RISCVOperands.td generation and shared by every
+    immediate class, so generating a class only looks at the instructions using
+    its immediate instead of parsing the ADL file and scanning all the instructions.
+
+    Args:
+        instructions (dict): Dictionary containing all instructions parsed from the ADL file.
+        instrfield_classes (dict): The immediate classes and the instruction fields they reference.
+
+    Returns:
+        dict: A dictionary containing the configuration variables, the immediate
+            instruction fields and, for every immediate of instrfield_classes, the
+            names of the instructions using it (in the order of the ADL file), the
+            OperandParser override from the configuration (None if not overridden)
+            and the shift of the immediate.
+    """
+    config_variables = config.load_config(config_file, llvm_config)
+    instrfield_imm = adl_parser.get_instrfield_from_adl(config_variables["ADLName"])[0]
+    immediates = dict()
+    for key in instrfield_classes:
+        for imm_key in instrfield_classes[key]:
+            immediates[imm_key] = {"instructions": list(), "operand_parser": None, "shift": 0}
+    for instruction_key in instructions.keys():
+        for field in instructions[instruction_key]["fields"][0].keys():
+            if field in immediates:
+                immediates[field]["instructions"].append(instruction_key)
+    for imm_key in immediates:
+        if imm_key in instrfield_imm:
+            immediates[imm_key]["shift"] = int(instrfield_imm[imm_key]["shift"])
+        if immediates[imm_key]["instructions"] and imm_key in config_variables.keys():
+            if '"OperandParser"' in config_variables[imm_key].keys():
+                immediates[imm_key]["operand_parser"] = config_variables[imm_key]['"OperandParser"'].replace("\"", "")
+    table = dict()
+    table["config_variables"] = config_variables
+    table["instrfield_imm"] = instrfield_imm
+    table["immediates"] = immediates
+    return table
+
+
+def generate_imms_class(key, instructions, immediate_key, generation_context, imms_table=None):
     """
     Generates the definition for an immediate type used in instructions.
 
@@ -5085,12 +5254,18 @@ def generate_imms_class(key, instructions, immediate_key):
         instructions (dict): Dictionary containing all instructions parsed from the ADL file.
         immediate_key (str): Guard used to ensure that the generated immediate type
             corresponds to the correct instruction immediate.
+        generation_context (GenerationContext): The state shared by the generation stages.
+        imms_table (dict | None): Immediate information built by build_imms_table.
+            When missing, it is built for this call only.
 
     Returns:
         str: Definition string for the specified immediate type.
     """
-    config_variables = config.config_environment(config_file, llvm_config)
-    instrfield_imm = adl_parser.get_instrfield_from_adl(config_variables["ADLName"])[0]
+    if imms_table is None:
+        imms_table = build_imms_table(instructions, generation_context.instrfield_classes)
+    config_variables = imms_table["config_variables"]
+    instrfield_imm = imms_table["instrfield_imm"]
+    immediates = imms_table["immediates"]
     namespace = config_variables["Namespace"]
     OperandParser = "Operand<XLenVT>"
     ImmLeaf = ""
@@ -5098,19 +5273,13 @@ def generate_imms_class(key, instructions, immediate_key):
     sign_extension = ""
     decoderMethod = ""
     check_key = immediate_key
-    for imm_key in instrfield_classes[key]:
-        if imm_key == check_key:
-            if imm_key in config_variables.keys():
-                    for instuction_key in instructions.keys():
-                        if imm_key in instructions[instuction_key]["fields"][0].keys():
-                            if imm_key in config_variables.keys():
-                                if '"OperandParser"' in config_variables[imm_key].keys():
-                                    OperandParser = config_variables[imm_key]['"OperandParser"'].replace("\"", "")
+    if immediates[check_key]["operand_parser"] is not None:
+        OperandParser = immediates[check_key]["operand_parser"]
 
-    for imm_key in instrfield_classes[key]:
+    for imm_key in generation_context.instrfield_classes[key]:
         if imm_key == check_key:
-            if int(instrfield_imm[imm_key]["shift"]) != 0:
-                for instuction_key in instructions.keys():
+            if immediates[imm_key]["shift"] != 0:
+                for instuction_key in immediates[imm_key]["instructions"]:
                     if imm_key in instructions[instuction_key]["fields"][0].keys():
                         if "excluded_values" in instructions[instuction_key].keys():
                             for elem in range(
@@ -5473,7 +5642,7 @@ def generate_imms_class(key, instructions, immediate_key):
                                     )
                                 break
             else:
-                for instuction_key in instructions.keys():
+                for instuction_key in immediates[imm_key]["instructions"]:
                     if imm_key in instructions[instuction_key]["fields"][0].keys():
                         if "excluded_values" in instructions[instuction_key].keys():
                             for elem in range(
@@ -5800,8 +5969,8 @@ def generate_imms_class(key, instructions, immediate_key):
                                     )
                                     break
     if "Non" in key:
-        for instruction in instructions.keys():
-            imm_class = instrfield_classes[key][0]
+        for instruction in immediates[generation_context.instrfield_classes[key][0]]["instructions"]:
+            imm_class = generation_context.instrfield_classes[key][0]
             if imm_class in instructions[instruction]["fields"][0].keys():
                 instruction_key = instruction
                 if "excluded_values" in instructions[instruction_key].keys():
@@ -5825,11 +5994,11 @@ def generate_imms_class(key, instructions, immediate_key):
                             )
                             + ") && ",
                         )
-    for imm_key in instrfield_classes[key]:
+    for imm_key in generation_context.instrfield_classes[key]:
         if imm_key == check_key:
             if imm_key in config_variables.keys():
                 if '"AliasImmClass"' in config_variables[imm_key].keys():
-                    for instuction_key in instructions.keys():
+                    for instuction_key in immediates[imm_key]["instructions"]:
                         if imm_key in instructions[instuction_key]["fields"][0].keys():
                             if '"disableImmLeaf"' in config_variables[imm_key].keys():
                                 if "reloc" in instrfield_imm[imm_key].keys():
@@ -5876,8 +6045,8 @@ def generate_imms_class(key, instructions, immediate_key):
     one_extended = ""
     if statement == "":
         forLoop = False
-        for instruction_key in instructions.keys():
-            for imm_key in instrfield_classes[key]:
+        for instruction_key in immediates[check_key]["instructions"]:
+            for imm_key in generation_context.instrfield_classes[key]:
                 if imm_key == check_key:
                     reloc = ""
                     if "reloc" in instrfield_imm[imm_key].keys():
@@ -6098,12 +6267,12 @@ def generate_imms_class(key, instructions, immediate_key):
             if forLoop is True:
                 break
         if one_extended == "":
-            for imm_key in instrfield_classes[key]:
+            for imm_key in generation_context.instrfield_classes[key]:
                 if imm_key == check_key:
                     if "one_extended" in instrfield_imm[imm_key].keys():
                         one_extended = instrfield_imm[imm_key]["one_extended"]
         if forLoop is False:
-            for imm_key in instrfield_classes[key]:
+            for imm_key in generation_context.instrfield_classes[key]:
                 if imm_key == check_key:
                     if imm_key in config_variables.keys():
                         aliasEnabled = True
@@ -6239,10 +6408,10 @@ def generate_imms_class(key, instructions, immediate_key):
                             )
     content = ""
     size = ""
-    for imm_key in instrfield_classes[key]:
+    for imm_key in generation_context.instrfield_classes[key]:
         if imm_key == check_key:
             if imm_key in config_variables.keys():
-                for instuction_key in instructions.keys():
+                for instuction_key in immediates[imm_key]["instructions"]:
                     if imm_key in instructions[instuction_key]["fields"][0].keys():
                         if "signed" in instrfield_imm[imm_key].keys():
                             if "sign_extension" in instrfield_imm[imm_key].keys():
@@ -6421,10 +6590,10 @@ def generate_imms_class(key, instructions, immediate_key):
                                             + int(instrfield_imm[imm_key]["shift"])
                                         )
                                         break
-    for imm_key in instrfield_classes[key]:
+    for imm_key in generation_context.instrfield_classes[key]:
         if imm_key == check_key:
             if "signed" in instrfield_imm[imm_key].keys():
-                for instuction_key in instructions.keys():
+                for instuction_key in immediates[imm_key]["instructions"]:
                     if imm_key in instructions[instuction_key]["fields"][0].keys():
                         if "excluded_values" in instructions[instuction_key].keys():
                             if instrfield_imm[imm_key]["shift"] == "0":
@@ -7615,7 +7784,7 @@ def generate_imms_class(key, instructions, immediate_key):
                                         break
                 break
             else:
-                for instuction_key in instructions.keys():
+                for instuction_key in immediates[imm_key]["instructions"]:
                     if imm_key in instructions[instuction_key]["fields"][0].keys():
                         if "excluded_values" in instructions[instuction_key].keys():
                             if instrfield_imm[imm_key]["shift"] == "0":
@@ -8649,8 +8818,8 @@ def generate_imms_class(key, instructions, immediate_key):
                 break
     forLoop = False
     if "Non" in key:
-        for instruction in instructions.keys():
-            imm_class = instrfield_classes[key][0]
+        for instruction in immediates[generation_context.instrfield_classes[key][0]]["instructions"]:
+            imm_class = generation_context.instrfield_classes[key][0]
             if imm_class in instructions[instruction]["fields"][0].keys():
                 instruction_key = instruction
                 if "excluded_values" in instructions[instruction_key].keys():
@@ -8684,8 +8853,8 @@ def generate_imms_class(key, instructions, immediate_key):
                             + '"'
                             + ">",
                         )
-    for instruction_key in instructions.keys():
-        for imm_key in instrfield_classes[key]:
+    for instruction_key in immediates[check_key]["instructions"]:
+        for imm_key in generation_context.instrfield_classes[key]:
             if imm_key == check_key:
                 reloc = ""
                 if "reloc" in instrfield_imm[imm_key].keys():
@@ -8706,8 +8875,8 @@ def generate_imms_class(key, instructions, immediate_key):
         if forLoop is True:
             break
     encoderMethod = ""
-    for instruction_key in instructions.keys():
-        for imm_key in instrfield_classes[key]:
+    for instruction_key in immediates[check_key]["instructions"]:
+        for imm_key in generation_context.instrfield_classes[key]:
             if imm_key == check_key:
                 reloc = ""
                 if imm_key in instructions[instruction_key]["fields"][0]:
@@ -8735,7 +8904,7 @@ def generate_imms_class(key, instructions, immediate_key):
         )
     if encoderMethod != "" and encoderMethod is not False:
         content += encoderMethod
-    for imm_key in instrfield_classes[key]:
+    for imm_key in generation_context.instrfield_classes[key]:
         if imm_key == check_key:
             if str(imm_key).lower() in config_variables.keys():
                 if '"PrintMethod"' in config_variables[imm_key].keys():
@@ -8745,12 +8914,12 @@ def generate_imms_class(key, instructions, immediate_key):
                         + ";\n"
                     )
                     break
-    for imm_key in instrfield_classes[key]:
+    for imm_key in generation_context.instrfield_classes[key]:
         if imm_key == check_key:
             if "signed" in instrfield_imm[imm_key].keys():
                 if instrfield_imm[imm_key]["signed"] == "true":
                     if "sign_extension" in instrfield_imm[imm_key].keys():
-                        for instruction in instructions.keys():
+                        for instruction in immediates[imm_key]["instructions"]:
                             if imm_key in instructions[instruction]["fields"][0]:
                                 if imm_key in config_variables.keys():
                                     if (
@@ -8849,7 +9018,7 @@ def generate_imms_class(key, instructions, immediate_key):
                                         break
                         break
                     else:
-                        for instruction in instructions.keys():
+                        for instruction in immediates[imm_key]["instructions"]:
                             if imm_key in instructions[instruction]["fields"][0]:
                                 if imm_key in config_variables.keys():
                                     if (
@@ -8948,7 +9117,7 @@ def generate_imms_class(key, instructions, immediate_key):
                         break
             else:
                 if "sign_extension" in instrfield_imm[imm_key].keys():
-                    for instruction in instructions.keys():
+                    for instruction in immediates[imm_key]["instructions"]:
                         if imm_key in instructions[instruction]["fields"][0]:
                             if imm_key in config_variables.keys():
                                 if (
@@ -9003,7 +9172,7 @@ def generate_imms_class(key, instructions, immediate_key):
                                 break
                     break
                 else:
-                    for instruction in instructions.keys():
+                    for instruction in immediates[imm_key]["instructions"]:
                         if imm_key in instructions[instruction]["fields"][0]:
                             if imm_key in config_variables.keys():
                                 if (
@@ -9078,8 +9247,8 @@ def generate_imms_class(key, instructions, immediate_key):
                                 break
                     break
     if "Non" in key:
-        for instruction in instructions.keys():
-            imm_class = instrfield_classes[key][0]
+        for instruction in immediates[generation_context.instrfield_classes[key][0]]["instructions"]:
+            imm_class = generation_context.instrfield_classes[key][0]
             if imm_class in instructions[instruction]["fields"][0].keys():
                 instruction_key = instruction
                 if "excluded_values" in instructions[instruction_key].keys():
@@ -9102,7 +9271,7 @@ def generate_imms_class(key, instructions, immediate_key):
                             )
                             + ") &&",
                         )
-    for imm_key in instrfield_classes[key]:
+    for imm_key in generation_context.instrfield_classes[key]:
         if imm_key == check_key:
             if imm_key in config_variables.keys():
                 if '"DisableEncoderMethod"' not in config_variables[imm_key].keys():
@@ -9156,7 +9325,7 @@ def generate_imms_class(key, instructions, immediate_key):
                     break
     if int(instrfield_imm[imm_key]["shift"]) == 0:
         if "nonzero" not in statement and "Imm != 0" not in ImmLeaf:
-            for instruction in instructions.keys():
+            for instruction in immediates[imm_key]["instructions"]:
                 if imm_key in instructions[instruction]["fields"][0]:
                     if (
                         instructions[instruction]["width"]
@@ -9219,8 +9388,8 @@ def generate_imms_class(key, instructions, immediate_key):
         content = str(content).replace("(Imm != 0) && ", "")
         content = str(content).replace(', "NonZero"', "")
     forLoop = False
-    for instruction_key in instructions.keys():
-        for imm_key in instrfield_classes[key]:
+    for instruction_key in immediates[check_key]["instructions"]:
+        for imm_key in generation_context.instrfield_classes[key]:
             if imm_key == check_key:
                 reloc = ""
                 if "reloc" in instrfield_imm[imm_key].keys():
@@ -9285,28 +9454,55 @@ def generate_riscv_operand():
     content = "\tlet OperandNamespace =" + "\"" + "RISCVOp" + "\"" + ";\n}"
     return statement + content
     
-def write_imms_classes(filename, filenameC, instrfield_classes, instructions):
+def get_imm_class_signature(content):
+    """
+    Computes the structural signature of an immediate type definition.
+
+    Two definitions with the same signature only differ by the name of the
+    defined operand: they have the same width, shift, signedness, sign extension,
+    parser, encoder and decoder.
+
+    Args:
+        content (str): Definition string generated by generate_imms_class.
+
+    Returns:
+        tuple: The name of the defined operand and the definition without this name,
+            (None, content) if the content does not start with a definition.
+    """
+    match = re.match(r"\s*def\s+(\w+)\s*:", content)
+    if match is None:
+        return None, content
+    return match.group(1), content[: match.start(1)] + content[match.end(1) :]
+
+
+def write_imms_classes(filename, filenameC, instrfield_classes, instructions, generation_context):
     """
     Writes the generated content for immediate types used in instructions to the appropriate files.
 
     This function receives the set of immediate types (instrfield_classes),
     generates their definitions using `generate_imms_class`, and writes the
-    resulting content into the specified output files.
+    resulting content into the specified output files. When an immediate type
+    has the same structural signature as one already written to the same file,
+    it is written as a defvar referencing the first definition, and the number
+    of merged immediate types is reported.
 
     Args:
         filename (str): Name of the file where the immediate type definitions will be written.
         filenameC (str): Name of the file where compressed immediate type definitions will be written.
         instrfield_classes (list[str] | list[Any]): Immediate types that must be defined.
         instructions (dict): Dictionary containing all instructions parsed from the ADL file.
+        generation_context (GenerationContext): The state shared by the generation stages.
 
     Returns:
-        None: Writes generated content to the specified files.
+        int: The number of immediate types merged into a structurally identical definition.
     """
     this_instructions = instructions
-    f = open(filename, "a")
-    g = open(filenameC, "a")
+    f = emitter.open(filename, "a")
+    g = emitter.open(filenameC, "a")
     config_variables = config.config_environment(config_file, llvm_config)
-    instrfield_imm = adl_parser.get_instrfield_from_adl(config_variables["ADLName"])[0]
+    imms_table = build_imms_table(instructions, instrfield_classes)
+    instrfield_imm = imms_table["instrfield_imm"]
+    immediates = imms_table["immediates"]
     namespace = config_variables["Namespace"]
     OperandParser = "Operand<XLenVT> "
     statement = ""
@@ -9369,12 +9565,11 @@ def write_imms_classes(filename, filenameC, instrfield_classes, instructions):
     f.write("\n\n")
     f.write(generate_riscv_operand())
     f.write("\n\n")
-    dumped_info = list()
-    buffer = ""
+    dumped_info = set()
     for key in instrfield_classes:
         for imm_key in instrfield_classes[key]:
             content_dumped = False
-            for instruction in instructions.keys():
+            for instruction in immediates[imm_key]["instructions"]:
                 if imm_key in instructions[instruction]["fields"][0].keys():
                     already_printed = False
                     define_content = ""
@@ -9460,7 +9655,7 @@ def write_imms_classes(filename, filenameC, instrfield_classes, instructions):
                             if define_content in dumped_info:
                                 content_dumped = True
                             else:
-                                dumped_info.append(define_content)
+                                dumped_info.add(define_content)
                             if already_printed is False:
                                 if content_dumped is False:
                                     if (
@@ -9476,76 +9671,100 @@ def write_imms_classes(filename, filenameC, instrfield_classes, instructions):
                                         g.write(define_content)
                                         g.write("\n")
                                         already_printed = True
+    generated_classes = set()
+    defined_keys = set(generation_context.singleton_list)
+    canonical_classes = dict()
+    merged_classes = 0
     for key in instrfield_classes:
         for imm_key in instrfield_classes[key]:
-            exitFor = False
-            sameInstruction = False
-            if exitFor is False:
-                for instuction_key in instructions.keys():
-                    if sameInstruction is False:
-                        if imm_key in instructions[instuction_key]["fields"][0].keys():
-                            if (
-                                instructions[instuction_key]["width"]
-                                == config_variables["LLVMStandardInstructionWidth"]
-                            ):
-                                content_generated = generate_imms_class(
-                                    key, this_instructions, imm_key
-                                )
-                                if content_generated not in buffer:
-                                    if key not in singleton_list:
-                                        singleton_list.append(key)
-                                        f.write(
-                                            generate_imms_class(
-                                                key, this_instructions, imm_key
-                                            )
-                                        )
-                                        f.write("\n\n")
-                                        exitFor = True
-                                        sameInstruction = True
-                                        buffer += content_generated
-                                break
-                            else:
-                                content_generated = generate_imms_class(
-                                    key, this_instructions, imm_key
-                                )
-                                if content_generated not in buffer:
-                                    if key not in singleton_list:
-                                        singleton_list.append(key)
-                                        g.write(
-                                            generate_imms_class(
-                                                key, this_instructions, imm_key
-                                            )
-                                        )
-                                        g.write("\n\n")
-                                        exitFor = True
-                                        sameInstruction = True
-                                        buffer += content_generated
-                                break
+            if not immediates[imm_key]["instructions"] or key in defined_keys:
+                continue
+            instuction_key = immediates[imm_key]["instructions"][0]
+            content_generated = generate_imms_class(
+                key, this_instructions, imm_key,
+                generation_context=generation_context,
+                imms_table=imms_table,
+            )
+            if content_generated in generated_classes:
+                continue
+            generated_classes.add(content_generated)
+            defined_keys.add(key)
+            generation_context.singleton_list.append(key)
+            if (
+                instructions[instuction_key]["width"]
+                == config_variables["LLVMStandardInstructionWidth"]
+            ):
+                output_file = f
+            else:
+                output_file = g
+            name, signature = get_imm_class_signature(content_generated)
+            if name is not None and (output_file.path, signature) in canonical_classes:
+                output_file.write(
+                    "defvar " + name + " = " + canonical_classes[(output_file.path, signature)] + ";"
+                )
+                merged_classes += 1
+            else:
+                if name is not None:
+                    canonical_classes[(output_file.path, signature)] = name
+                output_file.write(content_generated)
+            output_file.write("\n\n")
     f.close()
     g.close()
+    if merged_classes > 0:
+        print("Merged " + str(merged_classes) + " structurally identical immediate operand classes")
+    return merged_classes
+
+
+def load_instruction_views():
+    """
+    Fetches the ADL views read by generate_instruction_alias and generate_pattern_for_instructions.
+
+    Every call to a view of adl_parser returns a deep copy of the parsed data, so
+    the views are fetched once per generated file and shared by all the
+    instructions and aliases written to it. The functions receiving them only
+    read them.
+
+    Returns:
+        dict: The instructions, instruction aliases, register files, register
+            aliases and instruction fields (immediates and references) of the ADL file.
+    """
+    config_variables = config.config_environment(config_file, llvm_config)
+    instrfields = adl_parser.get_instrfield_from_adl(config_variables["ADLName"])
+    views = dict()
+    views["instructions"] = adl_parser.parse_instructions_from_adl(config_variables["ADLName"])
+    views["instructions_aliases"] = adl_parser.parse_instructions_aliases_from_adl(
+        config_variables["ADLName"]
+    )
+    views["registers"] = adl_parser.parse_registers_from_adl(config_variables["ADLName"])
+    views["alias_regs"] = adl_parser.get_alias_for_regs(config_variables["ADLName"])
+    views["instrfield_imm"] = instrfields[0]
+    views["instrfield_ref"] = instrfields[1]
+    return views
 
 
-def generate_instruction_alias(key):
+def generate_instruction_alias(key, generation_context, instruction_views=None):
     """
     Generates the definition content for an instruction alias based on
     information parsed from the ADL file.
 
     Args:
         key (str): The alias name for which the definition will be generated.
+        generation_context (GenerationContext): The state shared by the generation stages.
+        instruction_views (dict | None): Views returned by load_instruction_views.
+            When missing, they are fetched for this call only.
 
     Returns:
         str: Generated content representing the instruction alias definition.
     """
-    config_variables = config.config_environment(config_file, llvm_config)
+    if instruction_views is None:
+        instruction_views = load_instruction_views()
     define = "def"
-    registers = adl_parser.parse_registers_from_adl(config_variables["ADLName"])
-    instructions_aliases = adl_parser.parse_instructions_aliases_from_adl(
-        config_variables["ADLName"]
-    )
-    instructions = adl_parser.parse_instructions_from_adl(config_variables["ADLName"])
-    instrfield_ref = adl_parser.get_instrfield_from_adl(config_variables["ADLName"])[1]
-    regfiles = adl_parser.parse_registers_from_adl(config_variables["ADLName"])
-    alias_regs = adl_parser.get_alias_for_regs(config_variables["ADLName"])
+    registers = instruction_views["registers"]
+    instructions_aliases = instruction_views["instructions_aliases"]
+    instructions = instruction_views["instructions"]
+    instrfield_ref = instruction_views["instrfield_ref"]
+    regfiles = instruction_views["registers"]
+    alias_regs = instruction_views["alias_regs"]
     alias_regs_copy = alias_regs.copy()
     for key_reg in alias_regs.keys():
         if key_reg not in registers.keys():
@@ -9621,11 +9840,11 @@ def generate_instruction_alias(key):
         field_values[key_elem] = misc_value[key_elem]
     alias_instruction_syntax_dict_copy = ""
     alias_cpy = list()
-    if alias in alias_instruction_syntax_dict.keys():
-        alias_cpy = list(alias_instruction_syntax_dict[alias].split(","))
-        alias_instruction_syntax_dict_copy = alias_instruction_syntax_dict[alias]
-    registers = adl_parser.get_instrfield_from_adl(config_variables["ADLName"])[1]
-    registers_ref = adl_parser.parse_registers_from_adl(config_variables["ADLName"])
+    if alias in generation_context.alias_instruction_syntax_dict.keys():
+        alias_cpy = list(generation_context.alias_instruction_syntax_dict[alias].split(","))
+        alias_instruction_syntax_dict_copy = generation_context.alias_instruction_syntax_dict[alias]
+    registers = instruction_views["instrfield_ref"]
+    registers_ref = instruction_views["registers"]
     for source in sources_dict.keys():
         for element in alias_instruction_syntax_dict_copy.split(","):
             element = element.strip(" ")
@@ -9661,8 +9880,8 @@ def generate_instruction_alias(key):
                     element = element.strip(" ")
                     if field_values[field] != "":
                         if field in registers:
-                            for regclass in register_classes.keys():
-                                if field in register_classes[regclass]:
+                            for regclass in generation_context.register_classes.keys():
+                                if field in generation_context.register_classes[regclass]:
                                     if regclass in registers_ref.keys():
                                         register_ref = registers_ref[regclass].prefix
                                     if register_ref == "":
@@ -9683,9 +9902,9 @@ def generate_instruction_alias(key):
             element = element.strip(" ")
             element = element.split(":$")
             if len(element) > 1:
-                if element[0] not in register_classes.keys():
-                    for regclass in register_classes.keys():
-                        if field in register_classes[regclass]:
+                if element[0] not in generation_context.register_classes.keys():
+                    for regclass in generation_context.register_classes.keys():
+                        if field in generation_context.register_classes[regclass]:
                             if field == element[0]:
                                 alias_instruction_syntax_list = (
                                     alias_instruction_syntax_list.replace(
@@ -9767,7 +9986,7 @@ def generate_instruction_alias(key):
     return define + " : " + statement
 
 
-def write_instructions_aliases(file_name, file_name_c, extensions_list):
+def write_instructions_aliases(file_name, file_name_c, extensions_list, generation_context):
     """
     Writes the generated alias definitions into the specified output files.
 
@@ -9780,6 +9999,7 @@ def write_instructions_aliases(file_name, file_name_c, extensions_list):
         file_name_c (str): File in which compressed alias definitions will be written.
         extensions_list (list[str]): List of extensions for which intrinsics and
             alias definitions should be generated. If empty, all extensions are used.
+        generation_context (GenerationContext): The state shared by the generation stages.
 
     Returns:
         None: Writes the generated alias definition content to the output files.
@@ -9791,6 +10011,7 @@ def write_instructions_aliases(file_name, file_name_c, extensions_list):
     instructions_aliases = adl_parser.parse_instructions_aliases_from_adl(
         config_variables["ADLName"]
     )
+    instruction_views = load_instruction_views()
     section_delimiter = "//===---------------------------------------------------------------------===//\n"
     section_delimiter += "// Aliases\n"
     section_delimiter += "//===---------------------------------------------------------------------===//\n"
@@ -9830,25 +10051,27 @@ def write_instructions_aliases(file_name, file_name_c, extensions_list):
                                     )
                                 else:
                                     new_file_name = file_name_c.replace(".td", file_extension + ".td")
-                                f = open(new_file_name, "a")
+                                f = emitter.open(new_file_name, "a")
                                 if new_file_name not in section_delimiter_dump.keys():
                                     f.write(section_delimiter)
                                     section_delimiter_dump[new_file_name] = True
-                                f.write(generate_instruction_alias(key))
+                                f.write(generate_instruction_alias(key, generation_context, instruction_views))
                                 f.write("\n")
-                                if generate_pattern_for_instructions(key) != "":
-                                    f.write(generate_pattern_for_instructions(key))
+                                pattern = generate_pattern_for_instructions(key, generation_context, instruction_views)
+                                if pattern != "":
+                                    f.write(pattern)
                                     f.write("\n")
                                 f.close()
                             else:
-                                f = open(file_name, "a")
+                                f = emitter.open(file_name, "a")
                                 if file_name not in section_delimiter_dump.keys():
                                     f.write(section_delimiter)
                                     section_delimiter_dump[file_name] = True
-                                f.write(generate_instruction_alias(key))
+                                f.write(generate_instruction_alias(key, generation_context, instruction_views))
                                 f.write("\n")
-                                if generate_pattern_for_instructions(key) != "":
-                                    f.write(generate_pattern_for_instructions(key))
+                                pattern = generate_pattern_for_instructions(key, generation_context, instruction_views)
+                                if pattern != "":
+                                    f.write(pattern)
                                     f.write("\n")
                                 f.close()
                 else:
@@ -9875,25 +10098,27 @@ def write_instructions_aliases(file_name, file_name_c, extensions_list):
                                 )
                             else:
                                 new_file_name = file_name_c.replace(".td", file_extension + ".td")
-                            f = open(new_file_name, "a")
+                            f = emitter.open(new_file_name, "a")
                             if new_file_name not in section_delimiter_dump.keys():
                                 f.write(section_delimiter)
                                 section_delimiter_dump[new_file_name] = True
-                            f.write(generate_instruction_alias(key))
+                            f.write(generate_instruction_alias(key, generation_context, instruction_views))
                             f.write("\n")
-                            if generate_pattern_for_instructions(key) != "":
-                                f.write(generate_pattern_for_instructions(key))
+                            pattern = generate_pattern_for_instructions(key, generation_context, instruction_views)
+                            if pattern != "":
+                                f.write(pattern)
                                 f.write("\n")
                             f.close()
                         else:
-                            f = open(file_name, "a")
+                            f = emitter.open(file_name, "a")
                             if file_name not in section_delimiter_dump.keys():
                                 f.write(section_delimiter)
                                 section_delimiter_dump[file_name] = True
-                            f.write(generate_instruction_alias(key))
+                            f.write(generate_instruction_alias(key, generation_context, instruction_views))
                             f.write("\n")
-                            if generate_pattern_for_instructions(key) != "":
-                                f.write(generate_pattern_for_instructions(key))
+                            pattern = generate_pattern_for_instructions(key, generation_context, instruction_views)
+                            if pattern != "":
+                                f.write(pattern)
                                 f.write("\n")
                             f.close()
 
@@ -9910,7 +10135,7 @@ def write_calling_convention(file_name):
         str: The generated calling convention information.
     """
     config_variables = config.config_environment(config_file, llvm_config)
-    f = open(file_name, "a")
+    f = emitter.open(file_name, "a")
     content = ""
     statement = ""
     registers_parsed = adl_parser.parse_registers_from_adl(config_variables["ADLName"])
@@ -9996,7 +10221,7 @@ def generate_relocation_define(file_name):
     Returns:
         str: Generated relocation definition content.
     """
-    f = open(file_name, "a")
+    f = emitter.open(file_name, "a")
     config_variables = config.config_environment(config_file, llvm_config)
     relocations = adl_parser.parse_relocations(config_variables["ADLName"])
     statement = ""
@@ -10008,7 +10233,7 @@ def generate_relocation_define(file_name):
     f.close()
 
 
-def generate_intrinsics(file_name, extensions_list):
+def generate_intrinsics(file_name, extensions_list, generation_context):
     """
     Generates LLVM intrinsic definitions for the instructions parsed from the ADL file.
 
@@ -10019,6 +10244,7 @@ def generate_intrinsics(file_name, extensions_list):
         file_name (str): Name of the file in which the intrinsic definitions will be generated.
         extensions_list (list[str]): List of extensions for which intrinsics should be generated.
             If empty, intrinsics are generated for all available extensions.
+        generation_context (GenerationContext): The state shared by the generation stages.
 
     Returns:
         str: The generated intrinsic definitions.
@@ -10197,16 +10423,16 @@ def generate_intrinsics(file_name, extensions_list):
                     for fname in os.listdir("."):
                         list_dir.append(fname)
                     if once_print is False:
-                        if extension not in attributes_list_intrinsics:
+                        if extension not in generation_context.attributes_list_intrinsics:
                             legalDisclaimer.get_copyright(file_name_cpy)
                             once_print = True
-                    f = open(file_name_cpy, "a")
+                    f = emitter.open(file_name_cpy, "a")
                     f.write(statement)
                     f.write("\n")
                     f.close()
         if once_print is True:
-            attributes_list_intrinsics.append(extension)
-    attributes_list_intrinsics.clear()
+            generation_context.attributes_list_intrinsics.append(extension)
+    generation_context.attributes_list_intrinsics.clear()
     for alias in aliases.keys():
         statement = ""
         if "intrinsic" in aliases[alias].keys():
@@ -10346,18 +10572,18 @@ def generate_intrinsics(file_name, extensions_list):
                     file_name_cpy = file_name_cpy.replace(".td", "") + extension + ".td"
             if extension_checked == False:
                 if once_print is False:
-                    if extension not in attributes_list:
+                    if extension not in generation_context.attributes_list:
                         legalDisclaimer.get_copyright(file_name_cpy)
                         once_print = True
-                f = open(file_name_cpy, "a")
+                f = emitter.open(file_name_cpy, "a")
                 f.write(statement)
                 f.write("\n")
                 f.close()
         if once_print is True:
-            attributes_list_intrinsics.append(extension)
+            generation_context.attributes_list_intrinsics.append(extension)
 
 
-def generate_accumulator_register(file_name, abi_name, register_class, namespace):
+def generate_accumulator_register(file_name, abi_name, register_class, namespace, generation_context):
     """
     Generates the accumulator register definition used by LLVM.
 
@@ -10367,6 +10593,7 @@ def generate_accumulator_register(file_name, abi_name, register_class, namespace
         abi_name (str): ABI information required for the LLVM register definition.
         register_class (str): Register class to which the accumulator belongs.
         namespace (str): Namespace required for generating the LLVM register definition.
+        generation_context (GenerationContext): The state shared by the generation stages.
 
     Returns:
         str: Generated accumulator register definition as a string.
@@ -10375,7 +10602,7 @@ def generate_accumulator_register(file_name, abi_name, register_class, namespace
     registers = adl_parser.parse_registers_from_adl(config_variables["ADLName"])
     define = ""
     content = ""
-    f = open(file_name, "a")
+    f = emitter.open(file_name, "a")
     for key in registers.keys():
         if "accumulator" in registers[key].attributes:
             let_name = ""
@@ -10428,7 +10655,7 @@ def generate_accumulator_register(file_name, abi_name, register_class, namespace
                 + content
                 + "> {\n"
             )
-            register_classes_width[key] =  registers[key].width
+            generation_context.register_classes_width[key] =  registers[key].width
             statement += "\tlet Size = " + registers[key].size + ";" + "\n}"
             if let_name != "":
                 define += "\n}"
@@ -10438,23 +10665,26 @@ def generate_accumulator_register(file_name, abi_name, register_class, namespace
     f.close()
 
 
-def generate_pattern_for_instructions(instruction_key):
+def generate_pattern_for_instructions(instruction_key, generation_context, instruction_views=None):
     """
     Generates a pattern definition for a given instruction.
 
     Args:
         instruction_key (str): The instruction for which the pattern is generated.
+        generation_context (GenerationContext): The state shared by the generation stages.
+        instruction_views (dict | None): Views returned by load_instruction_views.
+            When missing, they are fetched for this call only.
 
     Returns:
         str: The generated instruction pattern as a string.
     """
+    if instruction_views is None:
+        instruction_views = load_instruction_views()
     config_variables = config.config_environment(config_file, llvm_config)
-    instructions = adl_parser.parse_instructions_from_adl(config_variables["ADLName"])[
-        0
-    ]
-    registers = adl_parser.parse_registers_from_adl(config_variables["ADLName"])
-    instrfields = adl_parser.get_instrfield_from_adl(config_variables["ADLName"])[1]
-    instrfields_imm  = adl_parser.get_instrfield_from_adl(config_variables["ADLName"])[0]
+    instructions = instruction_views["instructions"][0]
+    registers = instruction_views["registers"]
+    instrfields = instruction_views["instrfield_ref"]
+    instrfields_imm = instruction_views["instrfield_imm"]
     for key in instructions.keys():
         intrinsic_outputs = list()
         intrinsic_inputs = list()
@@ -10502,12 +10732,12 @@ def generate_pattern_for_instructions(instruction_key):
                                     ]
                                 ):
                                     if 'load' in instructions[instruction_key]['attributes']:
-                                        if argument_list[1].replace(")", "") in memory_operands_registers_list:
+                                        if argument_list[1].replace(")", "") in generation_context.memory_operands_registers_list:
                                             arguments += argument_list[0] + "Mem"
                                         else:
                                             arguments += argument_list[0]
                                     elif 'store' in instructions[instruction_key]['attributes']:
-                                        if argument_list[1].replace(")", "") in memory_operands_registers_list:
+                                        if argument_list[1].replace(")", "") in generation_context.memory_operands_registers_list:
                                             arguments += argument_list[0] + "Mem"
                                         else:
                                             arguments += argument_list[0]
@@ -10581,12 +10811,12 @@ def generate_pattern_for_instructions(instruction_key):
                                         ]["ref"]
                                     ):
                                         if 'load' in instructions[instruction_key]['attributes']:
-                                            if argument_list[1].replace(")", "") in memory_operands_registers_list:
+                                            if argument_list[1].replace(")", "") in generation_context.memory_operands_registers_list:
                                                 arguments += argument_list[0] + "Mem"
                                             else:
                                                 arguments += argument_list[0]
                                         elif 'store' in instructions[instruction_key]['attributes']:
-                                            if argument_list[1].replace(")", "") in memory_operands_registers_list:
+                                            if argument_list[1].replace(")", "") in generation_context.memory_operands_registers_list:
                                                 arguments += argument_list[0] + "Mem"
                                             else:
                                                 arguments += argument_list[0]
@@ -10662,7 +10892,7 @@ def generate_pattern_for_instructions(instruction_key):
                         if "+1" in instrfield:
                             instrfield_destination = instrfield.strip(" ").split("+")[0]
                             ref = instrfields[instrfield_destination]['ref']
-                            register_classes_width[instrfields[instrfield_destination]['ref']+"P"] = 2 * int(registers[ref.upper()].width)
+                            generation_context.register_classes_width[instrfields[instrfield_destination]['ref']+"P"] = 2 * int(registers[ref.upper()].width)
                             break
                 for instrfield in instructions[instruction_key]['inputs']:
                     if "(" in instrfield:
@@ -10670,22 +10900,22 @@ def generate_pattern_for_instructions(instruction_key):
                         if "+1" in instrfield:
                             instrfield_destination = instrfield.strip(" ").split("+")[0]
                             ref = instrfields[instrfield_destination]['ref']
-                            register_classes_width[instrfields[instrfield_destination]['ref']+"P"] = 2 * int(registers[ref.upper()].width)
+                            generation_context.register_classes_width[instrfields[instrfield_destination]['ref']+"P"] = 2 * int(registers[ref.upper()].width)
                             break
                 if instrfield_destination in instrfields.keys():
                     max_width = 0
-                    return_class = str(instruction_registers_used_outs[instruction_key]).split("$")[0].replace(":", "").replace("[", "").replace("'", "")
-                    if return_class in register_classes_width.keys():
+                    return_class = str(generation_context.instruction_registers_used_outs[instruction_key]).split("$")[0].replace(":", "").replace("[", "").replace("'", "")
+                    if return_class in generation_context.register_classes_width.keys():
                         if max_width == 0:
-                            max_width = int(register_classes_width[return_class])
-                        elif int(register_classes_width[return_class]) > max_width:
-                            max_width = int(register_classes_width[return_class])
-                    return_class = str(instruction_registers_used_ins[instruction_key]).split("$")[0].replace(":", "").replace("[", "").replace("'", "")
-                    if return_class in register_classes_width.keys():    
+                            max_width = int(generation_context.register_classes_width[return_class])
+                        elif int(generation_context.register_classes_width[return_class]) > max_width:
+                            max_width = int(generation_context.register_classes_width[return_class])
+                    return_class = str(generation_context.instruction_registers_used_ins[instruction_key]).split("$")[0].replace(":", "").replace("[", "").replace("'", "")
+                    if return_class in generation_context.register_classes_width.keys():    
                         if max_width == 0:
-                            max_width = int(register_classes_width[return_class])
-                        elif int(register_classes_width[return_class]) > max_width:
-                            max_width = int(register_classes_width[return_class])
+                            max_width = int(generation_context.register_classes_width[return_class])
+                        elif int(generation_context.register_classes_width[return_class]) > max_width:
+                            max_width = int(generation_context.register_classes_width[return_class])
                     if max_width != 0:
                         return_type = "i" + str(max_width)
                 extension = ""
@@ -10711,7 +10941,7 @@ def generate_pattern_for_instructions(instruction_key):
                     return_type += " "
                 if syntax == "":
                     if arguments != "":
-                        arguments = " " + str(instruction_registers_used_ins[instruction_key]).replace("[", "").replace("]", "").replace("'", "")
+                        arguments = " " + str(generation_context.instruction_registers_used_ins[instruction_key]).replace("[", "").replace("]", "").replace("'", "")
                     if extension in config_variables["ExtensionPrefixed"]:
                         if return_type != "":
                             statement = (
@@ -10768,7 +10998,7 @@ def generate_pattern_for_instructions(instruction_key):
                             )
                 else:
                     if arguments != "":
-                        arguments = " " + str(instruction_registers_used_ins[instruction_key]).replace("[", "").replace("]", "").replace("'", "")
+                        arguments = " " + str(generation_context.instruction_registers_used_ins[instruction_key]).replace("[", "").replace("]", "").replace("'", "")
                     if (
                         "ExtensionPrefixed" in config_variables.keys()
                         and extension in config_variables["ExtensionPrefixed"]
@@ -10833,7 +11063,7 @@ def generate_pattern_for_instructions(instruction_key):
             return statement
 
 
-def generate_builtin(file_name, header_name, extensions_list):
+def generate_builtin(file_name, header_name, extensions_list, generation_context):
     """
     Generates builtin definitions and a corresponding header used for naming
     conventions required by LLVM.
@@ -10849,6 +11079,7 @@ def generate_builtin(file_name, header_name, extensions_list):
         extensions_list (list[str]): List of extensions for which builtin
             definitions should be generated. If empty, all extensions
             are included.
+        generation_context (GenerationContext): The state shared by the generation stages.
 
     Returns:
         None: The function writes the builtin definitions to the two
@@ -11050,24 +11281,24 @@ def generate_builtin(file_name, header_name, extensions_list):
                     header_name_cpy = header_name_cpy.replace(".h", "")
                     header_name_cpy += extension + ".h"
                     if once_print is False:
-                        if extension not in attributes_list:
+                        if extension not in generation_context.attributes_list:
                             legalDisclaimer.get_copyright(file_name_cpy)
                             once_print = True
-                    f = open(file_name_cpy, "a")
+                    f = emitter.open(file_name_cpy, "a")
                     f.write(statement)
                     f.write("\n")
                     f.close()
                     if naming_definition != "":
                         if once_print_header is False:
-                            if extension not in attributes_list:
+                            if extension not in generation_context.attributes_list:
                                 legalDisclaimer.get_copyright(header_name_cpy)
                                 once_print_header = True
-                        g = open(header_name_cpy, "a")
+                        g = emitter.open(header_name_cpy, "a")
                         g.write(naming_definition)
                         g.write("\n")
                         g.close()
                     if once_print_header is True and once_print is True:
-                        attributes_list.append(extension)
+                        generation_context.attributes_list.append(extension)
                         
 def generate_intrinsic_tests(folder, include_path):
     """
@@ -11087,17 +11318,13 @@ def generate_intrinsic_tests(folder, include_path):
     """
     include_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', include_path)
     config_variables = config.config_environment(config_file, llvm_config)
-    tree = ET.parse(config_variables["ADLName"])
-    root = tree.getroot()
     mattrib = ""
     architecture = ""
     attributes = ""
     extension = ""
-    for cores in root.iter("cores"):
-        for asm_config in cores.iter("asm_config"):
-            architecture = asm_config.find("arch").find("str").text
-            attributes = asm_config.find("attributes").find("str").text
-            mattrib = asm_config.find("mattrib").find("str").text
+    asm_config = adl_parser.load_model(config_variables["ADLName"]).asm_config()
+    if asm_config is not None:
+        architecture, attributes, mattrib = asm_config
     if mattrib is not None:
         mattrib = mattrib.replace("+", "").replace(",", "")
         mattrib =  attributes
@@ -11135,8 +11362,8 @@ def generate_intrinsic_tests(folder, include_path):
             os.chmod(folder_name, 0o777)
     if os.path.exists(folder_name):
         os.chmod(folder_name, 0o777)
-        shutil.rmtree(folder_name, ignore_errors=True)
-        os.makedirs(folder_name)
+        # The tests of the previous run which are not generated again
+        emitter.remove_tree(folder_name)
     for key in instructions.keys():
         character = "int *values_set"
         character2 = "*values_set"
@@ -11239,7 +11466,7 @@ def generate_intrinsic_tests(folder, include_path):
                 "test_" + customize_name.replace("__", "").replace(".", "_") + ".c"
             )
             legalDisclaimer.get_copyright(folder_name + "/" + file_name)
-            f = open(folder_name + "/" + file_name, "a")
+            f = emitter.open(folder_name + "/" + file_name, "a")
             f.write(
                 include_lib
                 + command1
@@ -11251,7 +11478,7 @@ def generate_intrinsic_tests(folder, include_path):
             f.close()
 
 
-def generate_operand_mem_wrapper_class(file_name):
+def generate_operand_mem_wrapper_class(file_name, generation_context):
     """
     Generates the register–memory operand wrapper definitions required by LLVM 17.
 
@@ -11261,6 +11488,7 @@ def generate_operand_mem_wrapper_class(file_name):
     Args:
         file_name (str): Name of the file for which the memory operand wrapper
             definitions will be generated.
+        generation_context (GenerationContext): The state shared by the generation stages.
 
     Returns:
         str: Generated definition mapping register classes to the appropriate
@@ -11278,10 +11506,10 @@ def generate_operand_mem_wrapper_class(file_name):
     list_ref = list()
     check_list = list()
     for key in instructions.keys():
-        if key in instructions_load_store.keys():
-            list_ref = instructions_load_store[key].split(", ")
+        if key in generation_context.instructions_load_store.keys():
+            list_ref = generation_context.instructions_load_store[key].split(", ")
             for element in list_ref:
-                if element.split(":$")[0] in register_references:
+                if element.split(":$")[0] in generation_context.register_references:
                     if "Mem" in element:
                         if element.split(":$")[0] not in check_list:
                             definition += (
@@ -11295,19 +11523,20 @@ def generate_operand_mem_wrapper_class(file_name):
     list_dir = list()
     for fname in os.listdir("."):
         list_dir.append(fname)
-    f = open(file_name, "a")
+    f = emitter.open(file_name, "a")
     legalDisclaimer.get_copyright(file_name)
     f.write(content + definition)
     f.close()
 
 
-def generate_register_pairs(file_name):
+def generate_register_pairs(file_name, generation_context):
     """
     Generates the definitions for register pairs used by LLVM.
 
     Args:
         file_name (str): Name of the file in which the register pair
             definitions will be written.
+        generation_context (GenerationContext): The state shared by the generation stages.
 
     Returns:
         str: Generated content containing the definitions for register pairs.
@@ -11318,14 +11547,14 @@ def generate_register_pairs(file_name):
     registers = adl_parser.parse_registers_from_adl(config_variables["ADLName"])
     calling_convention_pairs = dict()
     alias_dict = adl_parser.get_alias_for_regs(config_variables["ADLName"])
-    for register in register_pairs.keys():
+    for register in generation_context.register_pairs.keys():
         register_width = ""
         register_offset = ""
         calling_convention_ref = ""
         width = ""
         offset = ""
         ref = ""
-        for element in register_pairs[register]:
+        for element in generation_context.register_pairs[register]:
             if element in instrfield_data_ref.keys():
                 width = instrfield_data_ref[element]["width"]
                 offset = instrfield_data_ref[element]["offset"]
@@ -11388,8 +11617,8 @@ def generate_register_pairs(file_name):
     index_dummy = 0
     for register in registers.keys():
         register_pair_check = False
-        for register_pair in register_pairs.keys():
-            for element in register_pairs[register_pair]:
+        for register_pair in generation_context.register_pairs.keys():
+            for element in generation_context.register_pairs[register_pair]:
                 if element in instrfield_data_ref.keys() and instrfield_data_ref[element]['ref'] == register.upper():
                     register_pair_check = True
                     break
@@ -11411,8 +11640,8 @@ def generate_register_pairs(file_name):
     check_reg_pair = False
     for register in registers.keys():
         register_pair_check = False
-        for register_pair in register_pairs.keys():
-            for element in register_pairs[register_pair]:
+        for register_pair in generation_context.register_pairs.keys():
+            for element in generation_context.register_pairs[register_pair]:
                 if element in instrfield_data_ref.keys() and instrfield_data_ref[element]['ref'] == register.upper():
                     register_pair_check = True
                     break
@@ -11460,7 +11689,7 @@ def generate_register_pairs(file_name):
                     reg_pair_content += "\t}\n"
             if check_register is True:
                 reg_pair_content += "}\n"
-    f = open(file_name, "a")
+    f = emitter.open(file_name, "a")
     if check_reg_pair is True:
         f.write(def_dummy_reg_pair)
         f.write(def_add_dummy)
@@ -11591,7 +11820,7 @@ def generate_register_pairs(file_name):
             def_class = statement + content + let + "}"
             comment = "// Register Class " + register + " : Register Pair\n"
             def_class = comment + def_class
-            f = open(file_name, "a")
+            f = emitter.open(file_name, "a")
             f.write(def_class)
             f.write("\n\n")
             f.close()
@@ -11648,12 +11877,12 @@ def generate_register_pairs(file_name):
             def_class = statement + content
             comment = "// Register Class " + register + " : Register Pair\n"
             def_class = comment + def_class
-            f = open(file_name, "a")
+            f = emitter.open(file_name, "a")
             f.write(def_class)
             f.write("\n\n")
             f.close()
 
-def generate_sched_tests(path, extension_list):
+def generate_sched_tests(path, extension_list, generation_context):
     """
     Generates scheduling tests based on the scheduling table parsed from the XML input.
 
@@ -11665,6 +11894,7 @@ def generate_sched_tests(path, extension_list):
         path (str): Path to the folder where the scheduling tests will be generated.
         extension_list (list[str]): List of extensions for which scheduling tests
             should be generated. If empty, all extensions are considered.
+        generation_context (GenerationContext): The state shared by the generation stages.
 
     Returns:
         str: Generated scheduling tests for the instructions parsed from the XML.
@@ -11672,6 +11902,7 @@ def generate_sched_tests(path, extension_list):
     config_variables = config.config_environment(config_file, llvm_config)
     instructions = adl_parser.parse_instructions_from_adl(config_variables["ADLName"])[0]
     scheduling_table_dict = adl_parser.parse_sched_table_from_adl(config_variables["ADLName"])
+    sched_index = adl_parser.parse_sched_index_from_adl(config_variables["ADLName"])
     instrfield_imm = adl_parser.get_instrfield_from_adl(config_variables["ADLName"])[0]
     register_parsed = adl_parser.parse_registers_from_adl(config_variables["ADLName"])
     instrfields = adl_parser.get_instrfield_from_adl(config_variables["ADLName"])[1]
@@ -11685,15 +11916,14 @@ def generate_sched_tests(path, extension_list):
         path = path + "tests"
     else:
         path = path + "/tests"
-    if os.path.exists(path):
-        shutil.rmtree(path, ignore_errors=True)
+    # The tests of the previous run which are not generated again
+    emitter.remove_tree(path)
     if os.path.exists(path) is False:
         os.makedirs(path)
         os.chmod(path, 0o777)
     path_dependency = path.replace(os.path.basename(os.path.normpath(path)), os.path.basename(os.path.normpath(path)) + "_dependency/")                                   
     sched_parameters = adl_parser.parse_scheduling_model_params(config_variables['ADLName'])
-    if os.path.exists(path_dependency):
-        shutil.rmtree(path_dependency, ignore_errors=True)
+    emitter.remove_tree(path_dependency)
     if not os.path.exists(path_dependency):
         os.makedirs(path_dependency)
         os.chmod(path_dependency, 0o777)
@@ -11706,509 +11936,527 @@ def generate_sched_tests(path, extension_list):
         data_test = dict()
         test_content_display = ""
         test_content_display_non = ""
-        for sched_key in scheduling_table_dict.keys():
-            for key_instr in scheduling_table_dict[sched_key].keys():
-                if 'instruction_list' in scheduling_table_dict[sched_key][key_instr].keys():
-                    if 'latency' in scheduling_table_dict[sched_key][key_instr].keys():
-                        for element in scheduling_table_dict[sched_key][key_instr]['instruction_list']:
-                            if instr == element.lower() and 'aliases' not in instructions[instr].keys():
-                                syntax = instructions[instr]['syntax']
-                                while '' in syntax:
-                                    syntax.remove('')
-                                inputs = instructions[instr]['inputs']
-                                outputs = instructions[instr]['outputs']
-                                destination_reg = ""
-                                destination_dependency = ""
-                                destinations_list = list()
-                                run_llvm_mca = "// RUN: %llvm-mca -mtriple=riscv32 -mattr="" -mcpu=" + sched_key + " " + "-timeline --timeline-max-cycles=0 -iterations=1"
-                                run_compare = "// RUN: cat %s.txt | %filecheck %s\n"
-                                destination_ref = ""
-                                for index in range(0, 2):
-                                    random.seed(len(instr) + index)
-                                    sources_list = list()
-                                    imms_list = list()
-                                    sources_imms_list = list()
-                                    destination_fixed = False
-                                    source_field = ""
-                                    for element in syntax[1:]:
-                                        element_not_found = False
-                                        if element_not_found is False:
-                                            for output_element in outputs:
-                                                if element in output_element:
-                                                    if output_element not in inputs:
-                                                        for key in reg_instrfields.keys():
-                                                            if element in reg_instrfields[key]:
-                                                                if destination_fixed is False:
-                                                                    destination_field = key
-                                                                    destination_fixed = True
-                                                                    element_not_found = True
-                                                                break
-                                                        for register in register_parsed.keys():
-                                                            if element in register_classes[register]:
-                                                                if destination_field == "" and register_parsed[key].pseudo != "":
-                                                                    destination_field = register_parsed[key].pseudo
-                                                        if destination_field != "":
-                                                            if len(instrfields_values[destination_field]) > 0:
-                                                                destination_reg = random.choice(instrfields_values[destination_field])
-                                                                numbers = re.findall(r'\d+\d*', destination_reg)
-                                                                while "".join(numbers) != "" and int("".join(numbers)) % 2:
-                                                                    destination_reg = random.choice(instrfields_values[destination_field])
-                                                                    numbers = re.findall(r'\d+\d*', destination_reg)
-                                                                alias = alias_register_dict[destination_reg]
-                                                                destination_reg = alias
-                                                                destinations_list.append(destination_reg)
-                                                                destination_regclass = destination_field
-                                                                if destination_dependency == "":
-                                                                    destination_dependency = destination_reg
-                                                                if index >= 1 and destination_dependency == destination_reg:
-                                                                    destination_reg = random.choice(instrfields_values[destination_field])
-                                                                    numbers = re.findall(r'\d+\d*', destination_reg)
-                                                                    while "".join(numbers) != "" and int("".join(numbers)) % 2:
-                                                                        destination_reg = random.choice(instrfields_values[destination_field])
-                                                                        numbers = re.findall(r'\d+\d*', destination_reg)
-                                                                    alias = alias_register_dict[destination_reg]
-                                                                    destination_reg = alias
-                                                                    destinations_list.append(destination_reg)
-                                                                    destination_regclass = destination_field
-                                                            break
-                                        if element_not_found is False:
-                                            for input_element in inputs:
-                                                if element in input_element:
-                                                    for key in reg_instrfields.keys():
-                                                        if element in reg_instrfields[key]:
-                                                            source_field = key
-                                                            element_not_found = True
-                                                            break
-                                                    for register in register_parsed.keys():
-                                                            if element in register_classes[register]:
-                                                                if source_field == "":
-                                                                    if register in register_parsed.keys() and register_parsed[register].pseudo != "":
-                                                                        source_field = register_parsed[register].pseudo
-                                                    if source_field in reg_instrfields.keys():
-                                                        if len(instrfields_values[source_field]) > 0:
-                                                            source_reg = random.choice(instrfields_values[source_field])
-                                                            numbers = re.findall(r'\d+\d*', source_reg)
-                                                            while "".join(numbers) != "" and int("".join(numbers)) % 2:
-                                                                source_reg = random.choice(instrfields_values[source_field])
-                                                                numbers = re.findall(r'\d+\d*', source_reg)
-                                                            alias = alias_register_dict[source_reg]
-                                                            source_reg = alias
-                                                            if source_reg not in sources_list:
-                                                                if source_reg != destination_reg and source_reg not in destinations_list:
-                                                                    sources_list.append(source_reg.lower())
-                                                                    break
-                                                                else:
-                                                                    source_reg = random.choice(instrfields_values[source_field])
-                                                                    numbers = re.findall(r'\d+\d*', source_reg)
-                                                                    while "".join(numbers) != "" and int("".join(numbers)) % 2:
-                                                                        source_reg = random.choice(instrfields_values[source_field])
-                                                                        numbers = re.findall(r'\d+\d*', source_reg)
-                                                                    alias = alias_register_dict[source_reg]
-                                                                    source_reg = alias
-                                                                    if source_reg not in sources_list and source_reg not in destinations_list:
-                                                                        sources_list.append(source_reg.lower())
+        # Every listed name matching the instruction regardless of case
+        for sched_entry in sched_index.get(instr, []):
+            if 'latency' in sched_entry.keys() and 'aliases' not in instructions[instr].keys():
+                sched_key = sched_entry['sched_table']
+                key_instr = sched_entry['sched_class']
+                syntax = instructions[instr]['syntax']
+                while '' in syntax:
+                    syntax.remove('')
+                inputs = instructions[instr]['inputs']
+                outputs = instructions[instr]['outputs']
+                destination_reg = ""
+                destination_dependency = ""
+                destinations_list = list()
+                run_llvm_mca = "// RUN: %llvm-mca -mtriple=riscv32 -mattr="" -mcpu=" + sched_key + " " + "-timeline --timeline-max-cycles=0 -iterations=1"
+                run_compare = "// RUN: cat %s.txt | %filecheck %s\n"
+                destination_ref = ""
+                for index in range(0, 2):
+                    random.seed(len(instr) + index)
+                    sources_list = list()
+                    imms_list = list()
+                    sources_imms_list = list()
+                    destination_fixed = False
+                    source_field = ""
+                    for element in syntax[1:]:
+                        element_not_found = False
+                        if element_not_found is False:
+                            for output_element in outputs:
+                                if element in output_element:
+                                    if output_element not in inputs:
+                                        for key in generation_context.reg_instrfields.keys():
+                                            if element in generation_context.reg_instrfields[key]:
+                                                if destination_fixed is False:
+                                                    destination_field = key
+                                                    destination_fixed = True
+                                                    element_not_found = True
+                                                break
+                                        for register in register_parsed.keys():
+                                            if element in generation_context.register_classes[register]:
+                                                if destination_field == "" and register_parsed[key].pseudo != "":
+                                                    destination_field = register_parsed[key].pseudo
+                                        if destination_field != "":
+                                            if len(generation_context.instrfields_values[destination_field]) > 0:
+                                                destination_reg = random.choice(generation_context.instrfields_values[destination_field])
+                                                numbers = re.findall(r'\d+\d*', destination_reg)
+                                                while "".join(numbers) != "" and int("".join(numbers)) % 2:
+                                                    destination_reg = random.choice(generation_context.instrfields_values[destination_field])
+                                                    numbers = re.findall(r'\d+\d*', destination_reg)
+                                                alias = generation_context.alias_register_dict[destination_reg]
+                                                destination_reg = alias
+                                                destinations_list.append(destination_reg)
+                                                destination_regclass = destination_field
+                                                if destination_dependency == "":
+                                                    destination_dependency = destination_reg
+                                                if index >= 1 and destination_dependency == destination_reg:
+                                                    destination_reg = random.choice(generation_context.instrfields_values[destination_field])
+                                                    numbers = re.findall(r'\d+\d*', destination_reg)
+                                                    while "".join(numbers) != "" and int("".join(numbers)) % 2:
+                                                        destination_reg = random.choice(generation_context.instrfields_values[destination_field])
+                                                        numbers = re.findall(r'\d+\d*', destination_reg)
+                                                    alias = generation_context.alias_register_dict[destination_reg]
+                                                    destination_reg = alias
+                                                    destinations_list.append(destination_reg)
+                                                    destination_regclass = destination_field
+                                            break
+                        if element_not_found is False:
+                            for input_element in inputs:
+                                if element in input_element:
+                                    for key in generation_context.reg_instrfields.keys():
+                                        if element in generation_context.reg_instrfields[key]:
+                                            source_field = key
+                                            element_not_found = True
+                                            break
+                                    for register in register_parsed.keys():
+                                            if element in generation_context.register_classes[register]:
+                                                if source_field == "":
+                                                    if register in register_parsed.keys() and register_parsed[register].pseudo != "":
+                                                        source_field = register_parsed[register].pseudo
+                                    if source_field in generation_context.reg_instrfields.keys():
+                                        if len(generation_context.instrfields_values[source_field]) > 0:
+                                            source_reg = random.choice(generation_context.instrfields_values[source_field])
+                                            numbers = re.findall(r'\d+\d*', source_reg)
+                                            while "".join(numbers) != "" and int("".join(numbers)) % 2:
+                                                source_reg = random.choice(generation_context.instrfields_values[source_field])
+                                                numbers = re.findall(r'\d+\d*', source_reg)
+                                            alias = generation_context.alias_register_dict[source_reg]
+                                            source_reg = alias
+                                            if source_reg not in sources_list:
+                                                if source_reg != destination_reg and source_reg not in destinations_list:
+                                                    sources_list.append(source_reg.lower())
+                                                    break
+                                                else:
+                                                    source_reg = random.choice(generation_context.instrfields_values[source_field])
+                                                    numbers = re.findall(r'\d+\d*', source_reg)
+                                                    while "".join(numbers) != "" and int("".join(numbers)) % 2:
+                                                        source_reg = random.choice(generation_context.instrfields_values[source_field])
+                                                        numbers = re.findall(r'\d+\d*', source_reg)
+                                                    alias = generation_context.alias_register_dict[source_reg]
+                                                    source_reg = alias
+                                                    if source_reg not in sources_list and source_reg not in destinations_list:
+                                                        sources_list.append(source_reg.lower())
+                                                        break
+                                            else:
+                                                source_reg = random.choice(generation_context.instrfields_values[source_field])
+                                                numbers = re.findall(r'\d+\d*', source_reg)
+                                                while "".join(numbers) != "" and int("".join(numbers)) % 2:
+                                                    source_reg = random.choice(generation_context.instrfields_values[source_field])
+                                                    numbers = re.findall(r'\d+\d*', source_reg)
+                                                alias = generation_context.alias_register_dict[source_reg]
+                                                source_reg = alias
+                                                if source_reg != destination_reg and source_reg not in destinations_list:
+                                                    sources_list.append(source_reg.lower())
+                                                    break
+                                                else:
+                                                    source_reg = random.choice(generation_context.instrfields_values[source_field])
+                                                    numbers = re.findall(r'\d+\d*', source_reg)
+                                                    while "".join(numbers) != "" and int("".join(numbers)) % 2:
+                                                        source_reg = random.choice(generation_context.instrfields_values[source_field])
+                                                        numbers = re.findall(r'\d+\d*', source_reg)
+                                                    alias = generation_context.alias_register_dict[source_reg]
+                                                    source_reg = alias
+                                                    if source_reg not in sources_list and source_reg not in destinations_list:
+                                                        sources_list.append(source_reg.lower())
+                                                        break
+                        if element_not_found is False:    
+                            for imm in instrfield_imm:
+                                if imm == element.split("(")[0]:
+                                    reg = element.replace(imm, "")
+                                    for input_element in inputs:
+                                        if reg.replace("(", "").replace(")", "") in input_element:
+                                            for key in generation_context.reg_instrfields.keys():
+                                                if reg.replace("(", "").replace(")", "") in generation_context.reg_instrfields[key]:
+                                                    source_field = key
+                                                    element_not_found = True
+                                                    break
+                                        else:
+                                            for instrfield in instrfields.keys():
+                                                for key_value in instrfields[instrfield]['aliases'].keys():
+                                                    if reg.replace("(", "").replace(")", "") in instrfields[instrfield]['aliases'][key_value]:
+                                                        source_field = key
+                                                        element_not_found = True
+                                                        break
+                                    if reg != "" and source_field != "":
+                                        if source_field in generation_context.reg_instrfields.keys():
+                                            if len(generation_context.instrfields_values[source_field]):
+                                                reg_value = random.choice(generation_context.instrfields_values[source_field])
+                                                checked = False
+                                                for key in register_parsed.keys():
+                                                    prefix = register_parsed[key].prefix
+                                                    size = register_parsed[key].size
+                                                    offset = int(0)
+                                                    if reg.replace("(", "").replace(")", "") in instrfields.keys():
+                                                        offset = int(instrfields[reg.replace("(", "").replace(")", "")]['offset'])
+                                                        width = int(2 ** int(instrfields[reg.replace("(", "").replace(")", "")]['width']))
+                                                    index_reg = 0
+                                                    if prefix != "":
+                                                        if prefix.upper() in reg_value:
+                                                            register_value = reg_value.replace(prefix.upper(), "")
+                                                            while int(register_value) < offset or int(register_value) >= width + offset:
+                                                                reg_value = random.choice(generation_context.instrfields_values[source_field])
+                                                                register_value = reg_value.replace(prefix.upper(), "")
+                                                            while checked is False and index_reg <= int(size):
+                                                                for input in inputs:
+                                                                    if key + "(" + str(register_value) + ")" in input:
+                                                                        reg_value = prefix.upper() + str(register_value)
+                                                                        checked = True
                                                                         break
-                                                            else:
-                                                                source_reg = random.choice(instrfields_values[source_field])
-                                                                numbers = re.findall(r'\d+\d*', source_reg)
-                                                                while "".join(numbers) != "" and int("".join(numbers)) % 2:
-                                                                    source_reg = random.choice(instrfields_values[source_field])
-                                                                    numbers = re.findall(r'\d+\d*', source_reg)
-                                                                alias = alias_register_dict[source_reg]
-                                                                source_reg = alias
-                                                                if source_reg != destination_reg and source_reg not in destinations_list:
-                                                                    sources_list.append(source_reg.lower())
-                                                                    break
                                                                 else:
-                                                                    source_reg = random.choice(instrfields_values[source_field])
-                                                                    numbers = re.findall(r'\d+\d*', source_reg)
-                                                                    while "".join(numbers) != "" and int("".join(numbers)) % 2:
-                                                                        source_reg = random.choice(instrfields_values[source_field])
-                                                                        numbers = re.findall(r'\d+\d*', source_reg)
-                                                                    alias = alias_register_dict[source_reg]
-                                                                    source_reg = alias
-                                                                    if source_reg not in sources_list and source_reg not in destinations_list:
-                                                                        sources_list.append(source_reg.lower())
-                                                                        break
-                                        if element_not_found is False:    
-                                            for imm in instrfield_imm:
-                                                if imm == element.split("(")[0]:
-                                                    reg = element.replace(imm, "")
-                                                    for input_element in inputs:
-                                                        if reg.replace("(", "").replace(")", "") in input_element:
-                                                            for key in reg_instrfields.keys():
-                                                                if reg.replace("(", "").replace(")", "") in reg_instrfields[key]:
-                                                                    source_field = key
-                                                                    element_not_found = True
-                                                                    break
+                                                                    register_value = index_reg
+                                                                    index_reg += 1
+                                                alias = generation_context.alias_register_dict[reg_value]
+                                                reg_value = alias
+                                                if instrfield_imm[imm]['shift'] != '0':
+                                                    imm_value = int(instrfield_imm[imm]['shift'])
+                                                    imm_value = 2 ** imm_value
+                                                    if 'one_extended' in instrfield_imm[imm].keys():
+                                                        if instrfield_imm[imm]['one_extended'] == 'true':
+                                                            imm_value = str("-" + str(imm_value))
                                                         else:
-                                                            for instrfield in instrfields.keys():
-                                                                for key_value in instrfields[instrfield]['aliases'].keys():
-                                                                    if reg.replace("(", "").replace(")", "") in instrfields[instrfield]['aliases'][key_value]:
-                                                                        source_field = key
-                                                                        element_not_found = True
-                                                                        break
-                                                    if reg != "" and source_field != "":
-                                                        if source_field in reg_instrfields.keys():
-                                                            if len(instrfields_values[source_field]):
-                                                                reg_value = random.choice(instrfields_values[source_field])
-                                                                checked = False
-                                                                for key in register_parsed.keys():
-                                                                    prefix = register_parsed[key].prefix
-                                                                    size = register_parsed[key].size
-                                                                    offset = int(0)
-                                                                    if reg.replace("(", "").replace(")", "") in instrfields.keys():
-                                                                        offset = int(instrfields[reg.replace("(", "").replace(")", "")]['offset'])
-                                                                        width = int(2 ** int(instrfields[reg.replace("(", "").replace(")", "")]['width']))
-                                                                    index_reg = 0
-                                                                    if prefix != "":
-                                                                        if prefix.upper() in reg_value:
-                                                                            register_value = reg_value.replace(prefix.upper(), "")
-                                                                            while int(register_value) < offset or int(register_value) >= width + offset:
-                                                                                reg_value = random.choice(instrfields_values[source_field])
-                                                                                register_value = reg_value.replace(prefix.upper(), "")
-                                                                            while checked is False and index_reg <= int(size):
-                                                                                for input in inputs:
-                                                                                    if key + "(" + str(register_value) + ")" in input:
-                                                                                        reg_value = prefix.upper() + str(register_value)
-                                                                                        checked = True
-                                                                                        break
-                                                                                else:
-                                                                                    register_value = index_reg
-                                                                                    index_reg += 1
-                                                                alias = alias_register_dict[reg_value]
-                                                                reg_value = alias
-                                                                if instrfield_imm[imm]['shift'] != '0':
-                                                                    imm_value = int(instrfield_imm[imm]['shift'])
-                                                                    imm_value = 2 ** imm_value
-                                                                    if 'one_extended' in instrfield_imm[imm].keys():
-                                                                        if instrfield_imm[imm]['one_extended'] == 'true':
-                                                                            imm_value = str("-" + str(imm_value))
-                                                                        else:
-                                                                            imm_value = (str(imm_value))
-                                                                    else:
-                                                                        imm_value = str(imm_value)
-                                                                else:
-                                                                    imm_value = str(2)
-                                                                source_reg = element.replace(imm, imm_value).replace(reg, "(" + reg_value + ")")
-                                                                if source_reg not in imms_list:
-                                                                    if source_reg != destination_reg:
-                                                                        imms_list.append(source_reg.lower())
-                                                                    else:
-                                                                        if len(instrfields_values[source_field]) > 0:
-                                                                            source_reg = random.choice(instrfields_values[source_field])
-                                                                            numbers = re.findall(r'\d+\d*', source_reg)
-                                                                        while "".join(numbers) != "" and int("".join(numbers)) % 2:
-                                                                            if len(instrfields_values[source_field]) > 0:
-                                                                                source_reg = random.choice(instrfields_values[source_field])
-                                                                                numbers = re.findall(r'\d+\d*', source_reg)
-                                                                        alias = alias_register_dict[reg_value]
-                                                                        source_reg = alias
-                                                                        if source_reg not in imms_list:
-                                                                            imms_list.append(source_reg.lower())
-                                                                else:
-                                                                    source_reg = random.choice(instrfields_values[source_field])
+                                                            imm_value = (str(imm_value))
+                                                    else:
+                                                        imm_value = str(imm_value)
+                                                else:
+                                                    imm_value = str(2)
+                                                source_reg = element.replace(imm, imm_value).replace(reg, "(" + reg_value + ")")
+                                                if source_reg not in imms_list:
+                                                    if source_reg != destination_reg:
+                                                        imms_list.append(source_reg.lower())
+                                                    else:
+                                                        if len(generation_context.instrfields_values[source_field]) > 0:
+                                                            source_reg = random.choice(generation_context.instrfields_values[source_field])
+                                                            numbers = re.findall(r'\d+\d*', source_reg)
+                                                        while "".join(numbers) != "" and int("".join(numbers)) % 2:
+                                                            if len(generation_context.instrfields_values[source_field]) > 0:
+                                                                source_reg = random.choice(generation_context.instrfields_values[source_field])
+                                                                numbers = re.findall(r'\d+\d*', source_reg)
+                                                        alias = generation_context.alias_register_dict[reg_value]
+                                                        source_reg = alias
+                                                        if source_reg not in imms_list:
+                                                            imms_list.append(source_reg.lower())
+                                                else:
+                                                    source_reg = random.choice(generation_context.instrfields_values[source_field])
+                                                    numbers = re.findall(r'\d+\d*', source_reg)
+                                                    while "".join(numbers) != "" and int("".join(numbers)) % 2:
+                                                        if len(generation_context.instrfields_values[source_field]) > 0:
+                                                            source_reg = random.choice(generation_context.instrfields_values[source_field])
+                                                            numbers = re.findall(r'\d+\d*', source_reg)
+                                                    alias = generation_context.alias_register_dict[reg_value]
+                                                    source_reg = alias
+                                                    if source_reg != destination_reg:
+                                                        imms_list.append(source_reg.lower())
+                                                    else:
+                                                        if len(generation_context.instrfields_values[source_field]) > 0:
+                                                            source_reg = random.choice(generation_context.instrfields_values[source_field])
+                                                            numbers = re.findall(r'\d+\d*', source_reg)
+                                                            while "".join(numbers) != "" and int("".join(numbers)) % 2:
+                                                                if len(generation_context.instrfields_values[source_field]) > 0:
+                                                                    source_reg = random.choice(generation_context.instrfields_values[source_field])
                                                                     numbers = re.findall(r'\d+\d*', source_reg)
-                                                                    while "".join(numbers) != "" and int("".join(numbers)) % 2:
-                                                                        if len(instrfields_values[source_field]) > 0:
-                                                                            source_reg = random.choice(instrfields_values[source_field])
-                                                                            numbers = re.findall(r'\d+\d*', source_reg)
-                                                                    alias = alias_register_dict[reg_value]
-                                                                    source_reg = alias
-                                                                    if source_reg != destination_reg:
-                                                                        imms_list.append(source_reg.lower())
-                                                                    else:
-                                                                        if len(instrfields_values[source_field]) > 0:
-                                                                            source_reg = random.choice(instrfields_values[source_field])
-                                                                            numbers = re.findall(r'\d+\d*', source_reg)
-                                                                            while "".join(numbers) != "" and int("".join(numbers)) % 2:
-                                                                                if len(instrfields_values[source_field]) > 0:
-                                                                                    source_reg = random.choice(instrfields_values[source_field])
-                                                                                    numbers = re.findall(r'\d+\d*', source_reg)
-                                                                            alias = alias_register_dict[reg_value]
-                                                                            source_reg = alias
-                                                                            if source_reg not in imms_list:
-                                                                                imms_list.append(source_reg.lower())
+                                                            alias = generation_context.alias_register_dict[reg_value]
+                                                            source_reg = alias
+                                                            if source_reg not in imms_list:
+                                                                imms_list.append(source_reg.lower())
+                                    else:
+                                        if 'aliases' in instrfield_imm[imm].keys():
+                                            if instrfield_imm[imm]['aliases'] != {}:
+                                                for key in instrfield_imm[imm]['aliases'].keys():
+                                                    imms_list.append(instrfield_imm[imm]['aliases'][key][0])
+                                                    break
+                                            else:
+                                                if instrfield_imm[imm]['shift'] != '0':
+                                                    value = int(instrfield_imm[imm]['shift'])
+                                                    value = 2 ** value
+                                                    if 'one_extended' in instrfield_imm[imm].keys():
+                                                        if instrfield_imm[imm]['one_extended'] == 'true':
+                                                            imms_list.append(str("-" + str(value)))
+                                                        else:
+                                                            imms_list.append(str(value))
                                                     else:
-                                                        if 'aliases' in instrfield_imm[imm].keys():
-                                                            if instrfield_imm[imm]['aliases'] != {}:
-                                                                for key in instrfield_imm[imm]['aliases'].keys():
-                                                                    imms_list.append(instrfield_imm[imm]['aliases'][key][0])
-                                                                    break
-                                                            else:
-                                                                if instrfield_imm[imm]['shift'] != '0':
-                                                                    value = int(instrfield_imm[imm]['shift'])
-                                                                    value = 2 ** value
-                                                                    if 'one_extended' in instrfield_imm[imm].keys():
-                                                                        if instrfield_imm[imm]['one_extended'] == 'true':
-                                                                            imms_list.append(str("-" + str(value)))
-                                                                        else:
-                                                                            imms_list.append(str(value))
-                                                                    else:
-                                                                        imms_list.append(str(value))
-                                                                else:
-                                                                    imms_list.append(str(2))
-                                        if element_not_found is False:
-                                            if element not in outputs:
-                                                if element not in instrfield_imm:
-                                                    for key in reg_instrfields.keys():
-                                                        for output in outputs:
-                                                            if key in output:
-                                                                register = output.split(key)[1]
-                                                                prefix = register_parsed[key].prefix
-                                                                if prefix != "":
-                                                                    register = prefix + register.replace("(", "").replace(")", "").replace("?", "")
-                                                                    if register.upper() in alias_register_dict:
-                                                                        alias = alias_register_dict[register.upper()]
-                                                                        if alias in syntax[1:]:
-                                                                            destination_reg = alias
-                                                                            break
-                                        if element_not_found is False:
-                                            if element not in inputs:
-                                                if element not in instrfield_imm:
-                                                    for key in reg_instrfields.keys():
-                                                        for input in inputs:
-                                                            if key in input:
-                                                                register = input.split(key)[1]
-                                                                prefix = register_parsed[key].prefix
-                                                                if prefix != "":
-                                                                    register = prefix + register.replace("(", "").replace(")", "").replace("?", "")
-                                                                    if register.upper() in alias_register_dict:
-                                                                        alias = alias_register_dict[register.upper()]
-                                                                        if alias in syntax[1:]:
-                                                                            if alias not in sources_list and alias != destination_reg and alias not in destinations_list:
-                                                                                sources_list.append(alias)
-                                                                                break
-                                        for element in imms_list:
-                                            if element not in sources_imms_list:
-                                                sources_imms_list.append(element)
-                                                imms_list = list()
-                                            elif element in sources_imms_list:
-                                                if len(sources_imms_list) < (len(syntax) -1):
-                                                    sources_imms_list.append(element)
-                                        for element in sources_list:
-                                            if element not in sources_imms_list:
-                                                sources_imms_list.append(element)
-                                    test_started = False
-                                    if destination_reg != "":
-                                        for element_syntax in syntax[1:]:
-                                            if element_syntax in instrfield_data_ref.keys():
-                                                if 'enumerated' in instrfield_data_ref[element_syntax].keys():
-                                                    for _ in instrfield_data_ref[element_syntax]['enumerated'].keys():
-                                                        if destination_reg.lower() in instrfield_data_ref[element_syntax]['enumerated'][_]:
+                                                        imms_list.append(str(value))
+                                                else:
+                                                    imms_list.append(str(2))
+                        if element_not_found is False:
+                            if element not in outputs:
+                                if element not in instrfield_imm:
+                                    for key in generation_context.reg_instrfields.keys():
+                                        for output in outputs:
+                                            if key in output:
+                                                register = output.split(key)[1]
+                                                prefix = register_parsed[key].prefix
+                                                if prefix != "":
+                                                    register = prefix + register.replace("(", "").replace(")", "").replace("?", "")
+                                                    if register.upper() in generation_context.alias_register_dict:
+                                                        alias = generation_context.alias_register_dict[register.upper()]
+                                                        if alias in syntax[1:]:
+                                                            destination_reg = alias
+                                                            break
+                        if element_not_found is False:
+                            if element not in inputs:
+                                if element not in instrfield_imm:
+                                    for key in generation_context.reg_instrfields.keys():
+                                        for input in inputs:
+                                            if key in input:
+                                                register = input.split(key)[1]
+                                                prefix = register_parsed[key].prefix
+                                                if prefix != "":
+                                                    register = prefix + register.replace("(", "").replace(")", "").replace("?", "")
+                                                    if register.upper() in generation_context.alias_register_dict:
+                                                        alias = generation_context.alias_register_dict[register.upper()]
+                                                        if alias in syntax[1:]:
+                                                            if alias not in sources_list and alias != destination_reg and alias not in destinations_list:
+                                                                sources_list.append(alias)
+                                                                break
+                        for element in imms_list:
+                            if element not in sources_imms_list:
+                                sources_imms_list.append(element)
+                                imms_list = list()
+                            elif element in sources_imms_list:
+                                if len(sources_imms_list) < (len(syntax) -1):
+                                    sources_imms_list.append(element)
+                        for element in sources_list:
+                            if element not in sources_imms_list:
+                                sources_imms_list.append(element)
+                    test_started = False
+                    if destination_reg != "":
+                        for element_syntax in syntax[1:]:
+                            if element_syntax in instrfield_data_ref.keys():
+                                if 'enumerated' in instrfield_data_ref[element_syntax].keys():
+                                    for _ in instrfield_data_ref[element_syntax]['enumerated'].keys():
+                                        if destination_reg.lower() in instrfield_data_ref[element_syntax]['enumerated'][_]:
+                                            test_content = syntax[0] + " " + destination_reg.lower() + ", "
+                                            regex_content = syntax[0] + " " + r'{{\-*\{*[0-9]*[a-z]*\,*\(*[a-z]*[0-9]*\-*\+*\)*[a-z]*\}*}}' + ", "
+                                            test_started = True
+                                            break
+                            else:
+                                for input in inputs:
+                                    for register in register_parsed.keys():
+                                        if register.upper() in input:
+                                            input = input.replace(register.upper(), "")
+                                            input = input.replace("(", "").replace(")", "")
+                                            for _ in instrfield_data_ref.keys():
+                                                if 'enumerated' in instrfield_data_ref[_].keys():
+                                                    if input.strip("?") in instrfield_data_ref[_]['enumerated'].keys():
+                                                        if destination_reg.lower() in instrfield_data_ref[_]['enumerated'][input.strip("?")]:
                                                             test_content = syntax[0] + " " + destination_reg.lower() + ", "
                                                             regex_content = syntax[0] + " " + r'{{\-*\{*[0-9]*[a-z]*\,*\(*[a-z]*[0-9]*\-*\+*\)*[a-z]*\}*}}' + ", "
                                                             test_started = True
                                                             break
-                                            else:
-                                                for input in inputs:
-                                                    for register in register_parsed.keys():
-                                                        if register.upper() in input:
-                                                            input = input.replace(register.upper(), "")
-                                                            input = input.replace("(", "").replace(")", "")
-                                                            for _ in instrfield_data_ref.keys():
-                                                                if 'enumerated' in instrfield_data_ref[_].keys():
-                                                                    if input.strip("?") in instrfield_data_ref[_]['enumerated'].keys():
-                                                                        if destination_reg.lower() in instrfield_data_ref[_]['enumerated'][input.strip("?")]:
-                                                                            test_content = syntax[0] + " " + destination_reg.lower() + ", "
-                                                                            regex_content = syntax[0] + " " + r'{{\-*\{*[0-9]*[a-z]*\,*\(*[a-z]*[0-9]*\-*\+*\)*[a-z]*\}*}}' + ", "
-                                                                            test_started = True
-                                                                            break
-                                    else:
-                                        test_content = syntax[0] + " "
-                                        regex_content = syntax[0] + " "
-                                    if test_started is False:
-                                        test_content = syntax[0] + " "
-                                        regex_content = syntax[0] + " "
-                                    if index == 0:
-                                        test_content_copy = test_content
-                                    index_value = 0
-                                    for element in syntax[1:]:
-                                        if element in instrfield_imm.keys():
-                                            for value in instrfield_imm[element]['aliases'].keys():
-                                                if sources_imms_list[index_value] not in instrfield_imm[element]['aliases'][value]:
-                                                    if len(sources_imms_list) > len(syntax[1:]):
-                                                        sources_imms_list.remove(sources_imms_list[index_value])
+                    else:
+                        test_content = syntax[0] + " "
+                        regex_content = syntax[0] + " "
+                    if test_started is False:
+                        test_content = syntax[0] + " "
+                        regex_content = syntax[0] + " "
+                    if index == 0:
+                        test_content_copy = test_content
+                    index_value = 0
+                    for element in syntax[1:]:
+                        if element in instrfield_imm.keys():
+                            for value in instrfield_imm[element]['aliases'].keys():
+                                if sources_imms_list[index_value] not in instrfield_imm[element]['aliases'][value]:
+                                    if len(sources_imms_list) > len(syntax[1:]):
+                                        sources_imms_list.remove(sources_imms_list[index_value])
+                                        break
+                            index_value += 1
+                    index_value = -1
+                    for element in syntax[1:]:
+                        if index_value < len(sources_imms_list)-1:
+                            index_value += 1
+                        check = False 
+                        if element in instrfield_imm.keys():
+                            value_replaced = ""
+                            for value in instrfield_imm[element]['aliases'].keys():
+                                index_replaced = random.choice(list(instrfield_imm[element]['aliases'].keys()))
+                                value_replaced = instrfield_imm[element]['aliases'][index_replaced][0]
+                                while value_replaced in sources_imms_list:
+                                    index_replaced = random.choice(list(instrfield_imm[element]['aliases'].keys()))
+                                    value_replaced = instrfield_imm[element]['aliases'][index_replaced][0]
+                            if len(instrfield_imm[element]['aliases'].values()) > 0:
+                                if sources_imms_list[index_value] and sources_imms_list[index_value] not in instrfield_imm[element]['aliases'].values():
+                                    if len(sources_imms_list) == len(syntax[1:]):
+                                        sources_imms_list.remove(sources_imms_list[index_value])
+                                        sources_imms_list.insert(index_value, value_replaced)
+                    test_content_elements = list()
+                    for source in sources_imms_list:
+                        test_content_elements.append(source)
+                        if "-" in source and source.replace("-", "+") in test_content_elements:
+                            source_reg = source.replace("-", "")
+                            test_content += source_reg + ", "
+                            test_content_elements.remove(source)
+                            test_content_elements.append(source_reg)
+                        elif "+" in source and source.replace("+", "-") in test_content_elements:
+                            source_reg = source.replace("+", "-")
+                            test_content += source_reg + ", "
+                            test_content_elements.remove(source)
+                            test_content_elements.append(source_reg)
+                        else:
+                            test_content += source + ", "
+                        if index > 0 and test_content_copy.split(",")[0].replace(instr, "").strip(" ") != "":
+                            if source == test_content_copy.split(",")[0].replace(instr, "").strip(" "):
+                                while source_reg == source:
+                                    if len(generation_context.instrfields_values[source_field]) > 0:
+                                        source_reg = random.choice(generation_context.instrfields_values[source_field])
+                                        alias = generation_context.alias_register_dict[source_reg]
+                                        source_reg = alias
+                                        if "-" in source_reg:
+                                            if source_reg.replace("+", "-") in test_content_elements:
+                                                source_reg = source
+                                        elif "+" in source_reg:
+                                            if source_reg.replace("-", "+") in test_content_elements:
+                                                source_reg = source
+                                test_content = test_content.replace(source, source_reg)
+                        regex_content += r'{{\-*\{*[0-9]*[a-z]*\,*\(*[a-z]*[0-9]*\-*\+*\)*[a-z]*\}*}}' + ", "
+                    test_elements = test_content.rstrip(", ").split(" ")
+                    index_elem = -1
+                    while len(test_elements[1:]) < len(syntax[1:]) and index_elem < len(syntax[1:]):
+                        for element in syntax[1:]:
+                            index_elem += 1
+                            if element in instrfield_data_ref.keys():
+                                element_searched = random.choice(list(instrfield_data_ref[element]['enumerated'].values())[int(instrfield_data_ref[element]['offset']):])
+                                if len(element_searched) > 1:
+                                    prefix = register_parsed[instrfield_data_ref[element]['ref']].prefix
+                                    for element_found in element_searched:
+                                        if prefix in element_found:
+                                            prefix_elem = element_found
+                                            break
+                                    for element_found in element_searched:
+                                        if prefix not in element_found:
+                                            if element_found not in test_elements:
+                                                if len(test_elements[1:]) < len(syntax[1:]):
+                                                    code_element_found = re.sub(r'[a-z]+', '', prefix_elem)
+                                                    if code_element_found != '' and int(code_element_found) % 2 == 0 and element_found not in scheduling_list_app.keys():    
+                                                        test_elements.insert(index_elem+1, element_found)
+                                                        test_elements[0] = test_elements[0].replace(",", "")
+                                                        test_content = test_elements[0] + " " + ", ".join(test_elements[1:]).replace("'", "").replace("[", "").replace("]", "")
+                                                        test_content = test_content.rstrip(" ")
+                                                        regex_content += r'{{\-*\{*[0-9]*[a-z]*\,*\(*[a-z]*[0-9]*\-*\+*\)*[a-z]*\}*}}' + ", "
+                                                        scheduling_list_app[element_found] = 1
                                                         break
-                                            index_value += 1
-                                    index_value = -1
-                                    for element in syntax[1:]:
-                                        if index_value < len(sources_imms_list)-1:
-                                            index_value += 1
-                                        check = False 
-                                        if element in instrfield_imm.keys():
-                                            value_replaced = ""
-                                            for value in instrfield_imm[element]['aliases'].keys():
-                                                index_replaced = random.choice(list(instrfield_imm[element]['aliases'].keys()))
-                                                value_replaced = instrfield_imm[element]['aliases'][index_replaced][0]
-                                                while value_replaced in sources_imms_list:
-                                                    index_replaced = random.choice(list(instrfield_imm[element]['aliases'].keys()))
-                                                    value_replaced = instrfield_imm[element]['aliases'][index_replaced][0]
-                                            if len(instrfield_imm[element]['aliases'].values()) > 0:
-                                                if sources_imms_list[index_value] and sources_imms_list[index_value] not in instrfield_imm[element]['aliases'].values():
-                                                    if len(sources_imms_list) == len(syntax[1:]):
-                                                        sources_imms_list.remove(sources_imms_list[index_value])
-                                                        sources_imms_list.insert(index_value, value_replaced)
-                                    test_content_elements = list()
-                                    for source in sources_imms_list:
-                                        test_content_elements.append(source)
-                                        if "-" in source and source.replace("-", "+") in test_content_elements:
-                                            source_reg = source.replace("-", "")
-                                            test_content += source_reg + ", "
-                                            test_content_elements.remove(source)
-                                            test_content_elements.append(source_reg)
-                                        elif "+" in source and source.replace("+", "-") in test_content_elements:
-                                            source_reg = source.replace("+", "-")
-                                            test_content += source_reg + ", "
-                                            test_content_elements.remove(source)
-                                            test_content_elements.append(source_reg)
+                    test_content = test_content.rstrip(", ")
+                    regex_content = regex_content.rstrip(", ")
+                    if instr.endswith(".s"):
+                        file_name = path + "/" + "test_" +  instr.replace(".s", "_s") + "_" + instr.replace(".s", "_s") + ".s"
+                    else:
+                        file_name = path + "/" + "test_" +  instr + "_" + instr + ".s"
+                    scheduling_tests_list.append(regex_content)
+                    if len(extension_list) > 0:
+                        for attrib in instructions[instr]['attributes']:
+                            if attrib in extension_list:
+                                extension_checked = True
+                                break
+                    else:
+                        extension_checked = True
+                    test_elements = test_content.split(",")
+                    index_elem_test = 0
+                    for element in test_elements:
+                        index_elem_test +=1
+                        if instr in element:
+                            element = element.replace(instr, "")
+                            element = element.strip(" ")
+                            for syntax_elem in syntax[1:]:
+                                if syntax_elem in instrfield_imm.keys():
+                                    if 'aliases' in instrfield_imm[syntax_elem].keys() and instrfield_imm[syntax_elem]['aliases'] != {}:
+                                        index_list = random.choice(list(instrfield_imm[syntax_elem]['aliases'].keys()))
+                                        if syntax[index_elem_test] in instrfield_data_ref.keys():
+                                            if 'ref' in instrfield_imm[syntax_elem].keys():
+                                                if instrfield_data_ref[syntax[index_elem_test]]['ref'] == instrfield_imm[syntax_elem]['ref']:
+                                                    test_content = test_content.replace(element, instrfield_imm[syntax_elem]['aliases'][index_list][0])
                                         else:
-                                            test_content += source + ", "
-                                        if index > 0 and test_content_copy.split(",")[0].replace(instr, "").strip(" ") != "":
-                                            if source == test_content_copy.split(",")[0].replace(instr, "").strip(" "):
-                                                while source_reg == source:
-                                                    if len(instrfields_values[source_field]) > 0:
-                                                        source_reg = random.choice(instrfields_values[source_field])
-                                                        alias = alias_register_dict[source_reg]
-                                                        source_reg = alias
-                                                        if "-" in source_reg:
-                                                            if source_reg.replace("+", "-") in test_content_elements:
-                                                                source_reg = source
-                                                        elif "+" in source_reg:
-                                                            if source_reg.replace("-", "+") in test_content_elements:
-                                                                source_reg = source
-                                                test_content = test_content.replace(source, source_reg)
-                                        regex_content += r'{{\-*\{*[0-9]*[a-z]*\,*\(*[a-z]*[0-9]*\-*\+*\)*[a-z]*\}*}}' + ", "
-                                    test_elements = test_content.rstrip(", ").split(" ")
-                                    index_elem = -1
-                                    while len(test_elements[1:]) < len(syntax[1:]) and index_elem < len(syntax[1:]):
-                                        for element in syntax[1:]:
-                                            index_elem += 1
-                                            if element in instrfield_data_ref.keys():
-                                                element_searched = random.choice(list(instrfield_data_ref[element]['enumerated'].values())[int(instrfield_data_ref[element]['offset']):])
-                                                if len(element_searched) > 1:
-                                                    prefix = register_parsed[instrfield_data_ref[element]['ref']].prefix
-                                                    for element_found in element_searched:
-                                                        if prefix in element_found:
-                                                            prefix_elem = element_found
-                                                            break
-                                                    for element_found in element_searched:
-                                                        if prefix not in element_found:
-                                                            if element_found not in test_elements:
-                                                                if len(test_elements[1:]) < len(syntax[1:]):
-                                                                    code_element_found = re.sub(r'[a-z]+', '', prefix_elem)
-                                                                    if code_element_found != '' and int(code_element_found) % 2 == 0 and element_found not in scheduling_list_app.keys():    
-                                                                        test_elements.insert(index_elem+1, element_found)
-                                                                        test_elements[0] = test_elements[0].replace(",", "")
-                                                                        test_content = test_elements[0] + " " + ", ".join(test_elements[1:]).replace("'", "").replace("[", "").replace("]", "")
-                                                                        test_content = test_content.rstrip(" ")
-                                                                        regex_content += r'{{\-*\{*[0-9]*[a-z]*\,*\(*[a-z]*[0-9]*\-*\+*\)*[a-z]*\}*}}' + ", "
-                                                                        scheduling_list_app[element_found] = 1
-                                                                        break
-                                    test_content = test_content.rstrip(", ")
-                                    regex_content = regex_content.rstrip(", ")
-                                    if instr.endswith(".s"):
-                                        file_name = path + "/" + "test_" +  instr.replace(".s", "_s") + "_" + instr.replace(".s", "_s") + ".s"
-                                    else:
-                                        file_name = path + "/" + "test_" +  instr + "_" + instr + ".s"
-                                    scheduling_tests_list.append(regex_content)
-                                    if len(extension_list) > 0:
-                                        for attrib in instructions[instr]['attributes']:
-                                            if attrib in extension_list:
-                                                extension_checked = True
-                                                break
-                                    else:
-                                        extension_checked = True
-                                    test_elements = test_content.split(",")
-                                    index_elem_test = 0
-                                    for element in test_elements:
-                                        index_elem_test +=1
-                                        if instr in element:
-                                            element = element.replace(instr, "")
-                                            element = element.strip(" ")
-                                            for syntax_elem in syntax[1:]:
-                                                if syntax_elem in instrfield_imm.keys():
-                                                    if 'aliases' in instrfield_imm[syntax_elem].keys() and instrfield_imm[syntax_elem]['aliases'] != {}:
-                                                        index_list = random.choice(list(instrfield_imm[syntax_elem]['aliases'].keys()))
-                                                        if syntax[index_elem_test] in instrfield_data_ref.keys():
-                                                            if 'ref' in instrfield_imm[syntax_elem].keys():
-                                                                if instrfield_data_ref[syntax[index_elem_test]]['ref'] == instrfield_imm[syntax_elem]['ref']:
-                                                                    test_content = test_content.replace(element, instrfield_imm[syntax_elem]['aliases'][index_list][0])
-                                                        else:
-                                                            if element in instrfield_imm[syntax_elem]['aliases'].values():
-                                                                test_content = test_content.replace(element, instrfield_imm[syntax_elem]['aliases'][index_list][0])
-                                                if 'latency' in scheduling_table_dict[sched_key][key_instr].keys():
-                                                    latency = scheduling_table_dict[sched_key][key_instr]['latency']
-                                                throughput_list = list()
-                                                if syntax_elem in instrfield_imm.keys():
-                                                    if 'aliases' in instrfield_imm[syntax_elem].keys() and instrfield_imm[syntax_elem]['aliases'] != {}:
-                                                        index_list = random.choice(list(instrfield_imm[syntax_elem]['aliases'].keys()))
-                                                        if 'sizeof(inputs)' in latency:
-                                                            latency = latency.replace('sizeof(inputs)', str(len(instrfield_imm[syntax_elem]['aliases'][index_list][0].split(","))))
-                                                            latency = eval(str(latency))
-                                                        elif 'sizeof(outputs)' in latency:
-                                                            latency = latency.replace('sizeof(outputs)', str(len(instrfield_imm[syntax_elem]['aliases'][index_list][0].split(","))))
-                                                            latency = eval(str(latency))
-                                                        for pipeline in scheduling_table_dict[sched_key][key_instr]['pipelines'].keys():
-                                                            throughput = scheduling_table_dict[sched_key][key_instr]['pipelines'][pipeline]['throughput']
-                                                            if 'sizeof(inputs)' in throughput:
-                                                                throughput = throughput.replace('sizeof(inputs)', str(len(instrfield_imm[syntax_elem]['aliases'][index_list][0].split(","))))
-                                                                throughput = eval(throughput)
-                                                                throughput_list.append(str(throughput))
-                                                            elif 'sizeof(outputs)' in throughput:
-                                                                throughput = throughput.replace('sizeof(outputs)', str(len(instrfield_imm[syntax_elem]['aliases'][index_list][0].split(","))))
-                                                                throughput = eval(throughput)
-                                                                throughput_list.append(str(throughput))
-                                                        if instr in aux_scheduling_table_param.keys():
-                                                            if int(latency) >  int(aux_scheduling_table_param[instr]['latency']):
-                                                                aux_scheduling_table_param[instr] = {'latency' : latency, 'throughput' : throughput_list}
-                                                        else:
-                                                            aux_scheduling_table_param[instr] = {'latency' : latency, 'throughput' : throughput_list}
-                                    if extension_checked is True:
-                                        file_name = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', file_name)
-                                        f = open(file_name, "a")
-                                        if index == 0:
-                                            legalDisclaimer.get_copyright(file_name)
-                                            f.write(run_llvm_mca + " " + "%s" + " &> %s.txt")
-                                            f.write("\n")
-                                            f.write(run_compare)
-                                            f.write("\n\n")
-                                        if ',,' in test_content:
-                                            test_content = test_content.replace(",,", ",")
-                                        f.write(test_content)
-                                        test_content_display_non += test_content + "\n"
-                                        f.write("\n")
-                                        f.close()
-                                    if index < 1:
-                                        test_content_dep = test_content
-                                        for source in test_content_dep.split(" ")[1:]:
-                                            if re.sub(r'[0-9]+\(+\)*', '', source).replace(")", "").strip(", ") in scheduling_list_app.keys():
-                                                value = scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', source).replace(")", "").strip(", ")]
-                                                scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', source.replace(")", "")).strip(", ")] = value + 1
-                                            else:
+                                            if element in instrfield_imm[syntax_elem]['aliases'].values():
+                                                test_content = test_content.replace(element, instrfield_imm[syntax_elem]['aliases'][index_list][0])
+                                if 'latency' in scheduling_table_dict[sched_key][key_instr].keys():
+                                    latency = scheduling_table_dict[sched_key][key_instr]['latency']
+                                throughput_list = list()
+                                if syntax_elem in instrfield_imm.keys():
+                                    if 'aliases' in instrfield_imm[syntax_elem].keys() and instrfield_imm[syntax_elem]['aliases'] != {}:
+                                        index_list = random.choice(list(instrfield_imm[syntax_elem]['aliases'].keys()))
+                                        if 'sizeof(inputs)' in latency:
+                                            latency = latency.replace('sizeof(inputs)', str(len(instrfield_imm[syntax_elem]['aliases'][index_list][0].split(","))))
+                                            latency = eval(str(latency))
+                                        elif 'sizeof(outputs)' in latency:
+                                            latency = latency.replace('sizeof(outputs)', str(len(instrfield_imm[syntax_elem]['aliases'][index_list][0].split(","))))
+                                            latency = eval(str(latency))
+                                        for pipeline in scheduling_table_dict[sched_key][key_instr]['pipelines'].keys():
+                                            throughput = scheduling_table_dict[sched_key][key_instr]['pipelines'][pipeline]['throughput']
+                                            if 'sizeof(inputs)' in throughput:
+                                                throughput = throughput.replace('sizeof(inputs)', str(len(instrfield_imm[syntax_elem]['aliases'][index_list][0].split(","))))
+                                                throughput = eval(throughput)
+                                                throughput_list.append(str(throughput))
+                                            elif 'sizeof(outputs)' in throughput:
+                                                throughput = throughput.replace('sizeof(outputs)', str(len(instrfield_imm[syntax_elem]['aliases'][index_list][0].split(","))))
+                                                throughput = eval(throughput)
+                                                throughput_list.append(str(throughput))
+                                        if instr in generation_context.aux_scheduling_table_param.keys():
+                                            if int(latency) >  int(generation_context.aux_scheduling_table_param[instr]['latency']):
+                                                generation_context.aux_scheduling_table_param[instr] = {'latency' : latency, 'throughput' : throughput_list}
+                                        else:
+                                            generation_context.aux_scheduling_table_param[instr] = {'latency' : latency, 'throughput' : throughput_list}
+                    if extension_checked is True:
+                        file_name = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', file_name)
+                        f = emitter.open(file_name, "a")
+                        if index == 0:
+                            legalDisclaimer.get_copyright(file_name)
+                            f.write(run_llvm_mca + " " + "%s" + " &> %s.txt")
+                            f.write("\n")
+                            f.write(run_compare)
+                            f.write("\n\n")
+                        if ',,' in test_content:
+                            test_content = test_content.replace(",,", ",")
+                        f.write(test_content)
+                        test_content_display_non += test_content + "\n"
+                        f.write("\n")
+                        f.close()
+                    if index < 1:
+                        test_content_dep = test_content
+                        for source in test_content_dep.split(" ")[1:]:
+                            if re.sub(r'[0-9]+\(+\)*', '', source).replace(")", "").strip(", ") in scheduling_list_app.keys():
+                                value = scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', source).replace(")", "").strip(", ")]
+                                scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', source.replace(")", "")).strip(", ")] = value + 1
+                            else:
                                                 
-                                                scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', source).replace(")", "").strip(", ")] = 1
-                                        regex_content_dep = regex_content
+                                scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', source).replace(")", "").strip(", ")] = 1
+                        regex_content_dep = regex_content
+                    else:
+                        destination_register = test_content_dep.split(",")[0].replace(instr, "")
+                        if destination_dependency != "":
+                            if len(sources_list) >= 1:
+                                if destination_regclass == source_field:
+                                    list_index = sources_imms_list.index(sources_list[-1])
+                                    sources_imms_list.remove(sources_list[-1])
+                                    sources_imms_list.insert(list_index, destination_register.lower())
+                                    if re.sub(r'[0-9]+\(+\)*', '', destination_register.lower()).replace(")", "").strip(", ") in scheduling_list_app.keys():
+                                        value = scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', destination_register.lower()).replace(")", "").strip(", ")]
+                                        scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', destination_register.lower()).replace(")", "").strip(", ")] = value + 1
                                     else:
-                                        destination_register = test_content_dep.split(",")[0].replace(instr, "")
-                                        if destination_dependency != "":
-                                            if len(sources_list) >= 1:
-                                                if destination_regclass == source_field:
-                                                    list_index = sources_imms_list.index(sources_list[-1])
-                                                    sources_imms_list.remove(sources_list[-1])
-                                                    sources_imms_list.insert(list_index, destination_register.lower())
-                                                    if re.sub(r'[0-9]+\(+\)*', '', destination_register.lower()).replace(")", "").strip(", ") in scheduling_list_app.keys():
-                                                        value = scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', destination_register.lower()).replace(")", "").strip(", ")]
-                                                        scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', destination_register.lower()).replace(")", "").strip(", ")] = value + 1
-                                                    else:
-                                                        scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', destination_register.lower()).replace(")", "").strip(", ")] = 1
-                                        test_started = False
-                                        if destination_reg != "":
-                                            for element_syntax in syntax[1:]:
-                                                if element_syntax in instrfield_data_ref.keys():
-                                                    if 'enumerated' in instrfield_data_ref[element_syntax].keys():
-                                                        for _ in instrfield_data_ref[element_syntax]['enumerated'].keys():
-                                                            if destination_reg.lower() in instrfield_data_ref[element_syntax]['enumerated'][_]:
+                                        scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', destination_register.lower()).replace(")", "").strip(", ")] = 1
+                        test_started = False
+                        if destination_reg != "":
+                            for element_syntax in syntax[1:]:
+                                if element_syntax in instrfield_data_ref.keys():
+                                    if 'enumerated' in instrfield_data_ref[element_syntax].keys():
+                                        for _ in instrfield_data_ref[element_syntax]['enumerated'].keys():
+                                            if destination_reg.lower() in instrfield_data_ref[element_syntax]['enumerated'][_]:
+                                                test_content_dep = syntax[0] + " " + destination_reg.lower() + ", "
+                                                if re.sub(r'[0-9]+\(+\)*', '', destination_reg.lower()).replace(")", "").strip(", ") in scheduling_list_app.keys():
+                                                    value = scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', destination_reg.lower()).replace(")", "").strip(", ")]
+                                                    scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', destination_reg.lower()).replace(")", "").strip(", ")] = value + 1
+                                                else:
+                                                    scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', destination_reg.lower()).replace(")", "").strip(", ")] = 1
+                                                regex_content_dep = syntax[0] + " " + r'{{\-*\{*[0-9]*[a-z]*\,*\(*[a-z]*[0-9]*\-*\+*\)*[a-z]*\}*}}' + ", "
+                                                test_started = True
+                                                break
+                                else:
+                                    for input in inputs:
+                                        for register in register_parsed.keys():
+                                            if register.upper() in input:
+                                                input = input.replace(register.upper(), "")
+                                                input = input.replace("(", "").replace(")", "")
+                                                for _ in instrfield_data_ref.keys():
+                                                    if 'enumerated' in instrfield_data_ref[_].keys():
+                                                        if input.strip("?") in instrfield_data_ref[_]['enumerated'].keys():
+                                                            if destination_reg.lower() in instrfield_data_ref[_]['enumerated'][input.strip("?")]:
                                                                 test_content_dep = syntax[0] + " " + destination_reg.lower() + ", "
                                                                 if re.sub(r'[0-9]+\(+\)*', '', destination_reg.lower()).replace(")", "").strip(", ") in scheduling_list_app.keys():
                                                                     value = scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', destination_reg.lower()).replace(")", "").strip(", ")]
@@ -12217,112 +12465,93 @@ def generate_sched_tests(path, extension_list):
                                                                     scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', destination_reg.lower()).replace(")", "").strip(", ")] = 1
                                                                 regex_content_dep = syntax[0] + " " + r'{{\-*\{*[0-9]*[a-z]*\,*\(*[a-z]*[0-9]*\-*\+*\)*[a-z]*\}*}}' + ", "
                                                                 test_started = True
-                                                                break
-                                                else:
-                                                    for input in inputs:
-                                                        for register in register_parsed.keys():
-                                                            if register.upper() in input:
-                                                                input = input.replace(register.upper(), "")
-                                                                input = input.replace("(", "").replace(")", "")
-                                                                for _ in instrfield_data_ref.keys():
-                                                                    if 'enumerated' in instrfield_data_ref[_].keys():
-                                                                        if input.strip("?") in instrfield_data_ref[_]['enumerated'].keys():
-                                                                            if destination_reg.lower() in instrfield_data_ref[_]['enumerated'][input.strip("?")]:
-                                                                                test_content_dep = syntax[0] + " " + destination_reg.lower() + ", "
-                                                                                if re.sub(r'[0-9]+\(+\)*', '', destination_reg.lower()).replace(")", "").strip(", ") in scheduling_list_app.keys():
-                                                                                    value = scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', destination_reg.lower()).replace(")", "").strip(", ")]
-                                                                                    scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', destination_reg.lower()).replace(")", "").strip(", ")] = value + 1
-                                                                                else:
-                                                                                    scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', destination_reg.lower()).replace(")", "").strip(", ")] = 1
-                                                                                regex_content_dep = syntax[0] + " " + r'{{\-*\{*[0-9]*[a-z]*\,*\(*[a-z]*[0-9]*\-*\+*\)*[a-z]*\}*}}' + ", "
-                                                                                test_started = True
-                                                                                break        
-                                        else:
-                                            test_content_dep = syntax[0] + " "
-                                            regex_content_dep = syntax[0] + " "
-                                        if test_started is False:
-                                            test_content_dep = syntax[0] + " "
-                                            regex_content_dep = syntax[0] + " "
-                                        fields = instructions[instr]['fields']
-                                        inputs = instructions[instr]['inputs']
-                                        for source in sources_imms_list:
-                                            if destination_register not in source:
-                                                if "(" in source:
-                                                    for element in fields[0]:
-                                                        check = True
-                                                        if element in instrfields.keys():
-                                                            for element_in in inputs:
-                                                                if "(" in element_in:
-                                                                    if element in element_in.split("(")[1].replace(")", "").replace(" ", "").replace("+1", ""):
-                                                                        check = False
-                                                                        break
-                                                        if check is False:
-                                                            if element in instrfields.keys():
+                                                                break        
+                        else:
+                            test_content_dep = syntax[0] + " "
+                            regex_content_dep = syntax[0] + " "
+                        if test_started is False:
+                            test_content_dep = syntax[0] + " "
+                            regex_content_dep = syntax[0] + " "
+                        fields = instructions[instr]['fields']
+                        inputs = instructions[instr]['inputs']
+                        for source in sources_imms_list:
+                            if destination_register not in source:
+                                if "(" in source:
+                                    for element in fields[0]:
+                                        check = True
+                                        if element in instrfields.keys():
+                                            for element_in in inputs:
+                                                if "(" in element_in:
+                                                    if element in element_in.split("(")[1].replace(")", "").replace(" ", "").replace("+1", ""):
+                                                        check = False
+                                                        break
+                                        if check is False:
+                                            if element in instrfields.keys():
+                                                check_instrfield = False
+                                                for elem in instructions[instr]['syntax']:
+                                                    for instrfield in instrfield_imm.keys():
+                                                        if instrfield in elem:
+                                                            if instrfield + "(" + element + ")" == elem:
+                                                                check_instrfield = True
+                                                                source = source.replace(source.split("(")[1], destination_register.strip(" ") + ")")
+                                                            else:
                                                                 check_instrfield = False
-                                                                for elem in instructions[instr]['syntax']:
-                                                                    for instrfield in instrfield_imm.keys():
-                                                                        if instrfield in elem:
-                                                                            if instrfield + "(" + element + ")" == elem:
-                                                                                check_instrfield = True
-                                                                                source = source.replace(source.split("(")[1], destination_register.strip(" ") + ")")
-                                                                            else:
-                                                                                check_instrfield = False
-                                                                if check_instrfield is True:
-                                                                    source = source.replace(source.split("(")[1], destination_register.strip(" ") + ")")
-                                            test_content_dep += source + ", "
-                                            if re.sub(r'[0-9]+\(+\)*', '', source).replace(")", "").strip(", ") in scheduling_list_app.keys():
-                                                value = scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', source).replace(")", "").strip(", ")]
-                                                scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', source).replace(")", "").strip(", ")] = value + 1
-                                            else:
-                                                scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', source).replace(")", "").strip(", ")] = 1
-                                            regex_content_dep += r'{{\-*\{*[0-9]*[a-z]*\,*\(*[a-z]*[0-9]*\-*\+*\)*[a-z]*\}*}}' + ", "
-                                        test_elements = test_content_dep.rstrip(", ").split(" ")
-                                        index_elem = -1
-                                        while len(test_elements[1:]) < len(syntax[1:]) and index_elem < len(syntax[1:]):
-                                            for element in syntax[1:]:
-                                                index_elem += 1
-                                                if element in instrfield_data_ref.keys():
-                                                    element_searched = random.choice(list(instrfield_data_ref[element]['enumerated'].values())[int(instrfield_data_ref[element]['offset']):])
-                                                    if len(element_searched) > 1:
-                                                        prefix = register_parsed[instrfield_data_ref[element]['ref']].prefix
-                                                        for element_found in element_searched:
-                                                            if prefix in element_found:
-                                                                prefix_elem = element_found
-                                                                break
-                                                        for element_found in element_searched:
-                                                            if prefix not in element_found:
-                                                                if element_found not in test_elements:
-                                                                    if len(test_elements[1:]) < len(syntax[1:]):
-                                                                        code_element_found = re.sub(r'[a-z]+', '', prefix_elem)
-                                                                        if code_element_found != '' and int(code_element_found) % 2 == 0 and element_found not in scheduling_list_app.keys():    
-                                                                            test_elements.insert(index_elem+1, element_found)
-                                                                            test_elements[0] = test_elements[0].replace(",", "")
-                                                                            test_content_dep = test_elements[0] + " " + ", ".join(test_elements[1:]).replace("'", "").replace("[", "").replace("]", "")
-                                                                            test_content_dep = test_content_dep.rstrip(" ")
-                                                                            regex_content_dep += r'{{\-*\{*[0-9]*[a-z]*\,*\(*[a-z]*[0-9]*\-*\+*\)*[a-z]*\}*}}' + ", "
-                                                                            scheduling_list_app[element_found] = 1
-                                                                            break                  
-                                        test_content_dep = test_content_dep.rstrip(", ")
-                                        regex_content_dep = regex_content_dep.rstrip(", ")
-                                    if instr.endswith(".s"):
-                                        file_name_dep = path_dependency + "test_" +  instr.replace(".s", "_s") + "_" + instr.replace(".s", "_s") + ".s"
-                                    else:
-                                        file_name_dep = path_dependency + "test_" +  instr + "_" + instr + ".s"
-                                    if extension_checked is True:
-                                        f = open(file_name_dep, "a")
-                                        if index == 0:
-                                            legalDisclaimer.get_copyright(file_name_dep)
-                                            f.write(run_llvm_mca + " " + "%s" + " &> %s.txt")
-                                            f.write("\n")
-                                            f.write(run_compare)
-                                            f.write("\n\n")
-                                        if ',,' in test_content_dep:
-                                            test_content_dep = test_content_dep.replace(",,", ",")
-                                        f.write(test_content_dep)
-                                        test_content_display += test_content_dep + "\n"
-                                        scheduling_tests_list_dep.append(regex_content_dep)
-                                        f.write("\n")
-                                        f.close()
+                                                if check_instrfield is True:
+                                                    source = source.replace(source.split("(")[1], destination_register.strip(" ") + ")")
+                            test_content_dep += source + ", "
+                            if re.sub(r'[0-9]+\(+\)*', '', source).replace(")", "").strip(", ") in scheduling_list_app.keys():
+                                value = scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', source).replace(")", "").strip(", ")]
+                                scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', source).replace(")", "").strip(", ")] = value + 1
+                            else:
+                                scheduling_list_app[re.sub(r'[0-9]+\(+\)*', '', source).replace(")", "").strip(", ")] = 1
+                            regex_content_dep += r'{{\-*\{*[0-9]*[a-z]*\,*\(*[a-z]*[0-9]*\-*\+*\)*[a-z]*\}*}}' + ", "
+                        test_elements = test_content_dep.rstrip(", ").split(" ")
+                        index_elem = -1
+                        while len(test_elements[1:]) < len(syntax[1:]) and index_elem < len(syntax[1:]):
+                            for element in syntax[1:]:
+                                index_elem += 1
+                                if element in instrfield_data_ref.keys():
+                                    element_searched = random.choice(list(instrfield_data_ref[element]['enumerated'].values())[int(instrfield_data_ref[element]['offset']):])
+                                    if len(element_searched) > 1:
+                                        prefix = register_parsed[instrfield_data_ref[element]['ref']].prefix
+                                        for element_found in element_searched:
+                                            if prefix in element_found:
+                                                prefix_elem = element_found
+                                                break
+                                        for element_found in element_searched:
+                                            if prefix not in element_found:
+                                                if element_found not in test_elements:
+                                                    if len(test_elements[1:]) < len(syntax[1:]):
+                                                        code_element_found = re.sub(r'[a-z]+', '', prefix_elem)
+                                                        if code_element_found != '' and int(code_element_found) % 2 == 0 and element_found not in scheduling_list_app.keys():    
+                                                            test_elements.insert(index_elem+1, element_found)
+                                                            test_elements[0] = test_elements[0].replace(",", "")
+                                                            test_content_dep = test_elements[0] + " " + ", ".join(test_elements[1:]).replace("'", "").replace("[", "").replace("]", "")
+                                                            test_content_dep = test_content_dep.rstrip(" ")
+                                                            regex_content_dep += r'{{\-*\{*[0-9]*[a-z]*\,*\(*[a-z]*[0-9]*\-*\+*\)*[a-z]*\}*}}' + ", "
+                                                            scheduling_list_app[element_found] = 1
+                                                            break                  
+                        test_content_dep = test_content_dep.rstrip(", ")
+                        regex_content_dep = regex_content_dep.rstrip(", ")
+                    if instr.endswith(".s"):
+                        file_name_dep = path_dependency + "test_" +  instr.replace(".s", "_s") + "_" + instr.replace(".s", "_s") + ".s"
+                    else:
+                        file_name_dep = path_dependency + "test_" +  instr + "_" + instr + ".s"
+                    if extension_checked is True:
+                        f = emitter.open(file_name_dep, "a")
+                        if index == 0:
+                            legalDisclaimer.get_copyright(file_name_dep)
+                            f.write(run_llvm_mca + " " + "%s" + " &> %s.txt")
+                            f.write("\n")
+                            f.write(run_compare)
+                            f.write("\n\n")
+                        if ',,' in test_content_dep:
+                            test_content_dep = test_content_dep.replace(",,", ",")
+                        f.write(test_content_dep)
+                        test_content_display += test_content_dep + "\n"
+                        scheduling_tests_list_dep.append(regex_content_dep)
+                        f.write("\n")
+                        f.close()
         scheduling_list_app.clear()
         first = ""
         index = 0
@@ -12382,7 +12611,6 @@ def generate_sched_tests(path, extension_list):
             index += 1
         scheduling_list_app_non.clear()
         index = 0
-        instrfield_data_ref = adl_parser.get_instrfield_offset(config_variables["ADLName"])[1]
         first = ""
         for element in test_content_display_non.split("\n"):
             registers = element.split(" ")[1: ]
@@ -12439,11 +12667,11 @@ def generate_sched_tests(path, extension_list):
             index += 1
         data_test['data-dep'] = scheduling_tests_list_dep
         data_test['no-dep'] = scheduling_tests_list
-        sched_app_regs[instr] = scheduling_list_app_non
-        sched_app_regs_dep[instr] = scheduling_list_app
-        scheduling_tests_struct[instr] = data_test
+        generation_context.sched_app_regs[instr] = scheduling_list_app_non
+        generation_context.sched_app_regs_dep[instr] = scheduling_list_app
+        generation_context.scheduling_tests_struct[instr] = data_test
         
-def generate_scheduling_table(file_name, schedule_file):
+def generate_scheduling_table(file_name, schedule_file, generation_context):
     """
     Generates the scheduling table description and the associated scheduling model.
 
@@ -12455,6 +12683,7 @@ def generate_scheduling_table(file_name, schedule_file):
         file_name (str): Name of the file in which the scheduling model will be generated.
         schedule_file (str): Name of the file in which the scheduling resources
             should be defined.
+        generation_context (GenerationContext): The state shared by the generation stages.
 
     Returns:
         tuple[str, str]: The generated content for both the scheduling model file
@@ -12463,6 +12692,7 @@ def generate_scheduling_table(file_name, schedule_file):
     config_variables = config.config_environment(config_file, llvm_config)
     instructions = adl_parser.parse_instructions_from_adl(config_variables["ADLName"])[0]
     scheduling_table_dict = adl_parser.parse_sched_table_from_adl(config_variables["ADLName"])
+    sched_index = adl_parser.parse_sched_index_from_adl(config_variables["ADLName"])
     registers = adl_parser.get_alias_for_regs(config_variables["ADLName"])
     instructions_inputs_outputs = dict()
     latency_list = list()
@@ -12508,13 +12738,21 @@ def generate_scheduling_table(file_name, schedule_file):
                     if x is not None:
                         input_elem = input.replace(instrfield_ref[instrfield]['ref'], "").replace("(", "").replace(")", "").replace("?", "").replace("/p", "")
                         prefix = register_parsed[instrfield_ref[instrfield]['ref']].prefix
-                        if prefix.upper() + input_elem in alias_register_dict.keys():
-                            if alias_register_dict[prefix.upper() + input_elem] in instructions[instruction]['syntax'][1:]:
-                                list_instrfields.append(alias_register_dict[prefix.upper() + input_elem])
+                        if prefix.upper() + input_elem in generation_context.alias_register_dict.keys():
+                            if generation_context.alias_register_dict[prefix.upper() + input_elem] in instructions[instruction]['syntax'][1:]:
+                                list_instrfields.append(generation_context.alias_register_dict[prefix.upper() + input_elem])
                                 check = True
                                 break
         if len(list_instrfields) > 0:
             scheduling_instrfields_dict[instruction] = list_instrfields
+    sched_class_instructions = dict()
+    for key in instructions.keys():
+        for sched_entry in sched_index.get(key.lower(), []):
+            sched_class_key = (sched_entry['sched_table'], sched_entry['sched_class'])
+            sched_class_keys = sched_class_instructions.setdefault(sched_class_key, [])
+            # Listed with the exact name, once per class even if listed several times
+            if sched_entry['instruction'] == key and sched_class_keys[-1:] != [key]:
+                sched_class_keys.append(key)
     for sched_key in scheduling_table_dict.keys():
         generate_schedule_definition_read = ""
         generate_schedule_definition_write= ""
@@ -12522,17 +12760,15 @@ def generate_scheduling_table(file_name, schedule_file):
             read_sched_enabled = False
             write_sched_enabled = False
             activate_load = False
-            for key in instructions.keys():
-                if 'instruction_list' in scheduling_table_dict[sched_key][key_instr].keys():
-                    if key in scheduling_table_dict[sched_key][key_instr]['instruction_list']:
-                        if len(instructions_inputs_outputs[key]['inputs']):
-                            read_sched_enabled = True
-                        if len(instructions_inputs_outputs[key]['outputs']):
-                            write_sched_enabled = True
-                        if 'branch' or 'store' in instructions[key]['attributes']:
-                            write_sched_enabled = True
-                        if 'load' in instructions[key]['attributes']:
-                            activate_load = True
+            for key in sched_class_instructions.get((sched_key, key_instr), []):
+                if len(instructions_inputs_outputs[key]['inputs']):
+                    read_sched_enabled = True
+                if len(instructions_inputs_outputs[key]['outputs']):
+                    write_sched_enabled = True
+                if 'branch' or 'store' in instructions[key]['attributes']:
+                    write_sched_enabled = True
+                if 'load' in instructions[key]['attributes']:
+                    activate_load = True
             scheduling_instr_res = dict()
             if write_sched_enabled is True:
                 generate_schedule_definition_write += "def " + "Write" + key_instr + " :" + "SchedWrite;\n"
@@ -12545,17 +12781,15 @@ def generate_scheduling_table(file_name, schedule_file):
                 else:
                     generate_schedule_definition_read += "def " + "Read" + key_instr + " :" + "SchedRead;\n"
                     scheduling_instr_res['read'] = "Read" + key_instr
-            for key in instructions.keys():
-                if 'instruction_list' in scheduling_table_dict[sched_key][key_instr].keys():
-                    if key in scheduling_table_dict[sched_key][key_instr]['instruction_list']:
-                        if key not in scheduling_instr_info.keys():
-                            scheduling_instr_info[key] = scheduling_instr_res
+            for key in sched_class_instructions.get((sched_key, key_instr), []):
+                if key not in generation_context.scheduling_instr_info.keys():
+                    generation_context.scheduling_instr_info[key] = scheduling_instr_res
         for sched_key in scheduling_table_dict.keys():
             for sched_class in scheduling_table_dict[sched_key].keys():
                 generate_read = ""
-                for instruction in scheduling_instrfields_dict.keys():
+                for instruction in sched_class_instructions.get((sched_key, sched_class), []):
                     index = 1
-                    if instruction in scheduling_table_dict[sched_key][sched_class]['instruction_list']:
+                    if instruction in scheduling_instrfields_dict.keys():
                         if len(scheduling_instrfields_dict[instruction]) > 1:
                             for _ in scheduling_instrfields_dict[instruction]:
                                 if len(re.findall(r'\d+', sched_class)) > 0:
@@ -12583,7 +12817,7 @@ def generate_scheduling_table(file_name, schedule_file):
                         if generate_read != "":
                             if 'forwarding' in scheduling_table_dict[sched_key][sched_class].keys():
                                 generate_schedule_definition_read = generate_schedule_definition_read.replace("def " + "Read" + sched_class + " :" + "SchedRead;\n", generate_read)                        
-        f = open(file_name, "a")
+        f = emitter.open(file_name, "a")
         legalDisclaimer.get_copyright(file_name)
         f.write(generate_schedule_definition_write)
         f.write("\n\n")
@@ -12640,9 +12874,9 @@ def generate_scheduling_table(file_name, schedule_file):
                         for element in resource_cycle_list.keys():
                             if element == sched_class:
                                 for instruction in scheduling_table_dict[sched_key][element]['instruction_list']:
-                                    if instruction in aux_scheduling_table_param.keys():
+                                    if instruction in generation_context.aux_scheduling_table_param.keys():
                                         if 'latency' in scheduling_table_dict[sched_key][element].keys():
-                                            scheduling_table_dict[sched_key][element]['latency'] = aux_scheduling_table_param[instruction]['latency']
+                                            scheduling_table_dict[sched_key][element]['latency'] = generation_context.aux_scheduling_table_param[instruction]['latency']
                                     if 'load' in instructions[instruction]['attributes']:
                                         if 'latency' in scheduling_table_dict[sched_key][element].keys():
                                             if str(scheduling_table_dict[sched_key][element]['latency']).isdigit():
@@ -12656,8 +12890,8 @@ def generate_scheduling_table(file_name, schedule_file):
                                     for pipeline in scheduling_table_dict[sched_key][element]['pipelines'].keys():
                                         if pipeline in scheduling_table_dict[sched_key][element]['pipelines'].keys():
                                             if pipeline in scheduling_table_dict[sched_key][element]['pipelines'].keys():
-                                                if instruction in aux_scheduling_table_param.keys():
-                                                    for elem_throughput in aux_scheduling_table_param[instruction]['throughput']:
+                                                if instruction in generation_context.aux_scheduling_table_param.keys():
+                                                    for elem_throughput in generation_context.aux_scheduling_table_param[instruction]['throughput']:
                                                         scheduling_table_dict[sched_key][element]['pipelines'][pipeline]['throughput'] = elem_throughput
                                                 if str(scheduling_table_dict[sched_key][element]['pipelines'][pipeline]['throughput']).isdigit():
                                                     throughput_list.append(int(scheduling_table_dict[sched_key][element]['pipelines'][pipeline]['throughput']))
@@ -12714,9 +12948,9 @@ def generate_scheduling_table(file_name, schedule_file):
                 if 'forwarding' in scheduling_table_dict[sched_key][sched_class].keys(): 
                     for element in scheduling_table_dict[sched_key][sched_class]['forwarding'].keys():  
                         if sched_class not in class_dict.keys():
-                            for instruction in scheduling_instrfields_dict.keys():
+                            for instruction in sched_class_instructions.get((sched_key, sched_class), []):
                                 index = 1
-                                if instruction in scheduling_table_dict[sched_key][sched_class]['instruction_list']:
+                                if instruction in scheduling_instrfields_dict.keys():
                                     if len(scheduling_instrfields_dict[instruction]) > 1:
                                         for _ in scheduling_instrfields_dict[instruction]:
                                             if 'store' in instructions[instruction]['attributes']:
@@ -12753,7 +12987,7 @@ def generate_scheduling_table(file_name, schedule_file):
         define_read_content += "}"
         sched_file_name = schedule_file + "RISCVSched" + sched_key.upper() + ".td"
         sched_file_name = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', sched_file_name)
-        f = open(sched_file_name, "a")
+        f = emitter.open(sched_file_name, "a")
         legalDisclaimer.get_copyright(sched_file_name)
         f.write(sched_statement + content)
         f.write("\n")
@@ -12765,7 +12999,7 @@ def generate_scheduling_table(file_name, schedule_file):
         f.close()
         
         
-def generate_scheduling_ref(path, extension_list):
+def generate_scheduling_ref(path, extension_list, generation_context):
     """
     Generates scheduling reference files for the scheduling tests.
 
@@ -12779,12 +13013,14 @@ def generate_scheduling_ref(path, extension_list):
         extension_list (list[str]): List of enabled extensions for which
             scheduling references should be generated. If empty, references
             for all extensions are produced.
+        generation_context (GenerationContext): The state shared by the generation stages.
 
     Returns:
         str: Generated scheduling reference content for the tests.
     """
     config_variables = config.config_environment(config_file, llvm_config)
     scheduling_table_dict = adl_parser.parse_sched_table_from_adl(config_variables["ADLName"])
+    sched_index = adl_parser.parse_sched_index_from_adl(config_variables["ADLName"])
     sched_parameters = adl_parser.parse_scheduling_model_params(config_variables['ADLName'])
     instructions = adl_parser.parse_instructions_from_adl(config_variables["ADLName"])[0]
     registers = adl_parser.get_alias_for_regs(config_variables["ADLName"])
@@ -12797,584 +13033,590 @@ def generate_scheduling_ref(path, extension_list):
         path = path + "/tests"
     instructions_list_generated = list()
     path_dependency = path.replace(os.path.basename(os.path.normpath(path)), os.path.basename(os.path.normpath(path)) + "_dependency")
+    sched_class_instructions = dict()
+    for key in generation_context.scheduling_tests_struct.keys():
+        for sched_entry in sched_index.get(key.lower(), []):
+            sched_class_key = (sched_entry['sched_table'], sched_entry['sched_class'])
+            sched_class_keys = sched_class_instructions.setdefault(sched_class_key, [])
+            # Listed with the exact name, once per class even if listed several times
+            if sched_entry['instruction'] == key and sched_class_keys[-1:] != [key]:
+                sched_class_keys.append(key)
     for sched in scheduling_table_dict.keys():
         for sched_class in scheduling_table_dict[sched].keys():
-            for key in scheduling_tests_struct.keys():
+            for key in sched_class_instructions.get((sched, sched_class), []):
                 extension_checked = False
                 dual_issue_throughput_activated = False
-                if len(scheduling_tests_struct[key]) > 0:
-                    if 'instruction_list' in scheduling_table_dict[sched][sched_class].keys():
-                        if key in scheduling_table_dict[sched][sched_class]['instruction_list']:
-                            if 'latency' in scheduling_table_dict[sched][sched_class].keys():
-                                inputs_list = list()
-                                outputs_list = list()
-                                for register in instructions[key]['inputs']:
-                                    for reg_key in registers.keys():
-                                        if reg_key in register:
-                                            inputs_list.append(register)
-                                for register in instructions[key]['outputs']:
-                                    for reg_key in registers.keys():
-                                        if reg_key in register:
-                                            outputs_list.append(register)
-                                if key in aux_scheduling_table_param.keys():
-                                    scheduling_table_dict[sched][sched_class]['latency'] = aux_scheduling_table_param[key]['latency']
-                                if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
-                                    for pipeline in scheduling_table_dict[sched][sched_class]['pipelines'].keys():
-                                        if key in aux_scheduling_table_param.keys():
-                                            for elem_throughput in aux_scheduling_table_param[key]['throughput']:
-                                                scheduling_table_dict[sched][sched_class]['pipelines'][pipeline]['throughput'] = elem_throughput
-                                if 'latency' in scheduling_table_dict[sched][sched_class].keys():
-                                    if str(scheduling_table_dict[sched][sched_class]['latency']).isdigit():
-                                        latency = int(scheduling_table_dict[sched][sched_class]['latency'])
+                if len(generation_context.scheduling_tests_struct[key]) > 0:
+                    if 'latency' in scheduling_table_dict[sched][sched_class].keys():
+                        inputs_list = list()
+                        outputs_list = list()
+                        for register in instructions[key]['inputs']:
+                            for reg_key in registers.keys():
+                                if reg_key in register:
+                                    inputs_list.append(register)
+                        for register in instructions[key]['outputs']:
+                            for reg_key in registers.keys():
+                                if reg_key in register:
+                                    outputs_list.append(register)
+                        if key in generation_context.aux_scheduling_table_param.keys():
+                            scheduling_table_dict[sched][sched_class]['latency'] = generation_context.aux_scheduling_table_param[key]['latency']
+                        if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
+                            for pipeline in scheduling_table_dict[sched][sched_class]['pipelines'].keys():
+                                if key in generation_context.aux_scheduling_table_param.keys():
+                                    for elem_throughput in generation_context.aux_scheduling_table_param[key]['throughput']:
+                                        scheduling_table_dict[sched][sched_class]['pipelines'][pipeline]['throughput'] = elem_throughput
+                        if 'latency' in scheduling_table_dict[sched][sched_class].keys():
+                            if str(scheduling_table_dict[sched][sched_class]['latency']).isdigit():
+                                latency = int(scheduling_table_dict[sched][sched_class]['latency'])
+                        reference = ""
+                        reference += ""
+                        row1 = ""
+                        row2 = ""
+                        index = 0
+                        reference += row1 + "\n" + row2 + "\n"
+                        reference_old = row1 + "\n" + row2 + "\n"
+                        test = ""
+                        test_content_dep = ""
+                        throughput = 0
+                        if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
+                            for pipeline in scheduling_table_dict[sched][sched_class]['pipelines']:
+                                if str(scheduling_table_dict[sched][sched_class]['pipelines'][pipeline]['throughput']).isdigit():
+                                    throughput += int(scheduling_table_dict[sched][sched_class]['pipelines'][pipeline]['throughput'])
+                        for instruction in generation_context.scheduling_tests_struct[key]['data-dep']:
+                            if key not in instructions_list_generated:
+                                instructions_list_generated.append(key)
+                            if index % 2 == 0 or index == 0:
+                                index = 0
+                                index_list = list()
+                                index_list.append(0)
+                                index_list.append(index)
+                                index_str = str(index_list).replace(" ", "")
+                                index_str += "     "
+                                timeline = "D"
+                                for _ in range(throughput - 1):
+                                    timeline += "e"
+                                timeline += "E"
+                                index_str += timeline + "   " + instruction
                                 reference = ""
                                 reference += ""
-                                row1 = ""
-                                row2 = ""
                                 index = 0
-                                reference += row1 + "\n" + row2 + "\n"
-                                reference_old = row1 + "\n" + row2 + "\n"
-                                test = ""
-                                test_content_dep = ""
-                                throughput = 0
-                                if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
-                                    for pipeline in scheduling_table_dict[sched][sched_class]['pipelines']:
-                                        if str(scheduling_table_dict[sched][sched_class]['pipelines'][pipeline]['throughput']).isdigit():
-                                            throughput += int(scheduling_table_dict[sched][sched_class]['pipelines'][pipeline]['throughput'])
-                                for instruction in scheduling_tests_struct[key]['data-dep']:
-                                    if key not in instructions_list_generated:
-                                        instructions_list_generated.append(key)
-                                    if index % 2 == 0 or index == 0:
-                                        index = 0
-                                        index_list = list()
-                                        index_list.append(0)
-                                        index_list.append(index)
-                                        index_str = str(index_list).replace(" ", "")
-                                        index_str += "     "
-                                        timeline = "D"
-                                        for _ in range(throughput - 1):
-                                            timeline += "e"
-                                        timeline += "E"
-                                        index_str += timeline + "   " + instruction
-                                        reference = ""
-                                        reference += ""
-                                        index = 0
-                                        if index == 0 or index % 2 == 0:
-                                            reference += "\n" + "// CHECK: " + len('-NEXT') * " " + index_str
-                                        test += reference + "\n"
-                                        timeline_ref = timeline
-                                    else:
-                                        index_list = list()
-                                        index_list.append(0)
-                                        index_list.append(index)
-                                        index_str = str(index_list).replace(" ", "")
-                                        index_str += "     "
-                                        timeline_string = ""
-                                        timeline_index = 0
-                                        timeline_counter = 0
-                                        timeline = ""
-                                        if 'latency' in scheduling_table_dict[sched][sched_class].keys():
-                                            if str(scheduling_table_dict[sched][sched_class]['latency']).isdigit():
-                                                latency = int(int(int(scheduling_table_dict[sched][sched_class]['latency'])))
-                                            if 'single_issue' in scheduling_table_dict[sched][sched_class].keys():
-                                                dual_issue_throughput_activated = True
-                                        if int(sched_parameters[sched]['IssueWidth']) > 1:
-                                            for element in sched_app_regs_dep[key]:
-                                                if sched_app_regs_dep[key][element] >= 2:
-                                                    if element.isdigit() is False:
-                                                        destination = instructions[key]['syntax'][1]
-                                                        if destination in instrfield_data_ref.keys():
-                                                            for instrfield_key in instrfield_data_ref[destination]['enumerated'].keys():
-                                                                if element in instrfield_data_ref[destination]['enumerated'][instrfield_key]:
-                                                                    dual_issue_throughput_activated = True
-                                                                    break
-                                                        else:
-                                                            for _ in instrfield_data_ref.keys():
-                                                                if 'enumerated' in instrfield_data_ref[_].keys():
-                                                                    for instrfield_key in instrfield_data_ref[_]['enumerated'].keys():
-                                                                        if element in instrfield_data_ref[_]['enumerated'][instrfield_key]:
-                                                                            if instructions[key]['syntax'][1] == element:
-                                                                                dual_issue_throughput_activated = True
-                                                                                break
-                                            if dual_issue_throughput_activated is True:
-                                                if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
-                                                    if len(scheduling_table_dict[sched][sched_class]['pipelines']) == 1:
-                                                        throughput -= 1
-                                        if dual_issue_throughput_activated is False:
-                                            if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
-                                                if len(scheduling_table_dict[sched][sched_class]['pipelines']) == 1:
-                                                    if latency == throughput:
-                                                        throughput -= 1
-                                        while timeline_counter <= throughput:
-                                            if throughput > 0 or (throughput == 0 and dual_issue_throughput_activated is True):
-                                                if timeline_counter == 0:
-                                                    timeline_string += "."
-                                                    timeline_index += 1
-                                                elif timeline_index < 5:
-                                                    timeline_string += " "
-                                                    timeline_index += 1
-                                                elif timeline_index == 5:
-                                                    timeline_string += "."
-                                                    timeline_index = 1
-                                                else:
-                                                    timeline_index += 1
-                                            timeline_counter += 1
-                                        if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
-                                            if len(scheduling_table_dict[sched][sched_class]['pipelines']) > 1:
-                                                if dual_issue_throughput_activated is True:
-                                                    if len(timeline_string) > throughput:
-                                                        timeline_string = timeline_string[:-1]
-                                                elif dual_issue_throughput_activated is False:
-                                                    if len(timeline_string) >= throughput and timeline_string.endswith(" "):
-                                                        timeline_string = timeline_string.rstrip(" ")
-                                                        if throughput <= len(timeline_string):
-                                                            diff = len(timeline_string) - throughput -1
-                                                            if diff < 0:
-                                                                diff = -1 * diff
-                                                            timeline_string = timeline_string[:-diff]
-                                                    else:
-                                                        diff = len(timeline_string) - throughput -1
-                                                        timeline_string = timeline_string[:-diff]
-                                        if test != "":
-                                            timeline += timeline_string
-                                        timeline += "D"
-                                        if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
-                                            if len(scheduling_table_dict[sched][sched_class]['pipelines']) > 1:
-                                                for _ in range(throughput - 1):
-                                                    timeline += "e"
-                                            else:
-                                                for _ in range(throughput):
-                                                    timeline += "e"
-                                        timeline += "E"
-                                        if int(sched_parameters[sched]['IssueWidth']) == 1:
-                                            index_str += timeline + "   " + instruction
-                                        elif int(sched_parameters[sched]['IssueWidth']) > 1:
-                                            index_str += timeline + "   " + instruction
-                                        timeline_string = ""
-                                        timeline_index = 0
-                                        timeline_counter = 0
-                                        while timeline_counter <= throughput:
-                                            if throughput > 0 or (throughput == 0 and dual_issue_throughput_activated is True):
-                                                if len(timeline_ref + timeline_string) % 5 == 0:
-                                                    if len(timeline_ref + timeline_string) > len(timeline_ref):
-                                                        timeline_string += "."
-                                                        timeline_index = 1
-                                                    else:
-                                                        timeline_string += " "
-                                                        timeline_index += 1
-                                                elif timeline_index < 5:
-                                                    timeline_string += " "
-                                                    timeline_index += 1
-                                                elif timeline_index == 5:
-                                                    timeline_string += "."
-                                                    timeline_index = 1
+                                if index == 0 or index % 2 == 0:
+                                    reference += "\n" + "// CHECK: " + len('-NEXT') * " " + index_str
+                                test += reference + "\n"
+                                timeline_ref = timeline
+                            else:
+                                index_list = list()
+                                index_list.append(0)
+                                index_list.append(index)
+                                index_str = str(index_list).replace(" ", "")
+                                index_str += "     "
+                                timeline_string = ""
+                                timeline_index = 0
+                                timeline_counter = 0
+                                timeline = ""
+                                if 'latency' in scheduling_table_dict[sched][sched_class].keys():
+                                    if str(scheduling_table_dict[sched][sched_class]['latency']).isdigit():
+                                        latency = int(int(int(scheduling_table_dict[sched][sched_class]['latency'])))
+                                    if 'single_issue' in scheduling_table_dict[sched][sched_class].keys():
+                                        dual_issue_throughput_activated = True
+                                if int(sched_parameters[sched]['IssueWidth']) > 1:
+                                    for element in generation_context.sched_app_regs_dep[key]:
+                                        if generation_context.sched_app_regs_dep[key][element] >= 2:
+                                            if element.isdigit() is False:
+                                                destination = instructions[key]['syntax'][1]
+                                                if destination in instrfield_data_ref.keys():
+                                                    for instrfield_key in instrfield_data_ref[destination]['enumerated'].keys():
+                                                        if element in instrfield_data_ref[destination]['enumerated'][instrfield_key]:
+                                                            dual_issue_throughput_activated = True
+                                                            break
                                                 else:
-                                                    timeline_index += 1
-                                            timeline_counter += 1
+                                                    for _ in instrfield_data_ref.keys():
+                                                        if 'enumerated' in instrfield_data_ref[_].keys():
+                                                            for instrfield_key in instrfield_data_ref[_]['enumerated'].keys():
+                                                                if element in instrfield_data_ref[_]['enumerated'][instrfield_key]:
+                                                                    if instructions[key]['syntax'][1] == element:
+                                                                        dual_issue_throughput_activated = True
+                                                                        break
+                                    if dual_issue_throughput_activated is True:
                                         if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
-                                            if len(scheduling_table_dict[sched][sched_class]['pipelines']) > 1:
-                                                if dual_issue_throughput_activated is True:
-                                                    while len(timeline_string) >= throughput:
-                                                        timeline_string = timeline_string[:-1]
-                                                    timeline_string += "."
-                                                elif dual_issue_throughput_activated is False:
-                                                    if len(timeline_string) >= throughput and timeline_string.endswith(" "):
-                                                        timeline_string = timeline_string.rstrip(" ")
-                                                        timeline_string += "."
-                                                    else:
-                                                        diff = len(timeline_string) - throughput -1
-                                                        if diff < 0:
-                                                            diff = -1 * diff
-                                                        timeline_string = timeline_string[:-diff]
-                                                        timeline_string += "."
-                                        len_row1 = len(timeline)
-                                        if int(sched_parameters[sched]['IssueWidth']) > 1:
-                                                if timeline_string.endswith('.') is False:
-                                                    if throughput > 0 or (throughput == 0 and dual_issue_throughput_activated is True):
-                                                        timeline_string = timeline_string[:-1] + "."
-                                                if len(timeline_ref) % 5 == 0 and timeline_ref.endswith(".") is False:
-                                                    timeline_string = timeline_string.replace(timeline_string[0], ".", 1)
-                                                test = test.replace(timeline_ref, timeline_ref + timeline_string)
-                                                if index == 0:
-                                                    index_str = "// CHECK: " + index_str
-                                                elif index > 0:
-                                                    index_str = "// CHECK-NEXT: " + index_str
-                                                if index_str not in test:
-                                                    test += index_str
-                                        else:
-                                            if timeline_string.endswith('.') is False:
-                                                timeline_string = timeline_string[:-1] + "."
-                                            if len(timeline_ref) % 5 == 0:
-                                                timeline_string = "." + timeline_string[1:]
-                                            if len(timeline_ref) % 5 == 0 and timeline_ref.endswith(".") is False:
-                                                timeline_string = timeline_string.replace(timeline_string[0], ".", 1)
-                                            test = test.replace(timeline_ref, timeline_ref + timeline_string)
-                                            if index == 0:
-                                                index_str = "// CHECK: " + index_str
-                                            elif index > 0:
-                                                index_str = "// CHECK-NEXT: " + index_str
-                                            if index_str not in test:
-                                                test += index_str
-                                    index += 1
-                                    if index % 2 == 0:
-                                        indices = ""
-                                        row1 = ""
-                                        row2 = ""
-                                        row2_checked = False
-                                        row1_checked = False
-                                        for digit in range(len_row1):
-                                            indices += str(digit % 10)
-                                        if len(indices) <= 10:
-                                            if row2_checked is False:
-                                                row2 += indices
-                                                row2_checked = True
-                                        elif len(indices) > 10:
-                                            len_index = 10
-                                            length = len(indices)
-                                            last_limit = 0
-                                            while length >= 0:
-                                                if row2_checked is False:
-                                                    limit = length - last_limit
-                                                    if last_limit == 0:
-                                                        row2 += indices[:len_index]
-                                                        row1 += 10 * " "
-                                                    else:
-                                                        if limit > 10:
-                                                            row2 += indices[last_limit:last_limit+10]
-                                                            last_limit = last_limit + 10
-                                                            row1 += 10 * " "
-                                                        else:
-                                                            row2 += indices[last_limit:length]
-                                                            row1 += (length - last_limit) * " "
-                                                    row2_checked = True
-                                                    length -= len_index
-                                                    last_limit = len_index
-                                                elif row1_checked is False:
-                                                    if length >= last_limit:
-                                                        limit = length - last_limit
-                                                    else:
-                                                        last_limit = length
-                                                        limit = last_limit
-                                                    if limit > 10:
-                                                        row1 += indices[last_limit:last_limit+10]
-                                                        last_limit = last_limit + 10
-                                                        row2 += 10 * " "
-                                                    else:
-                                                        row1 += indices[-last_limit:]
-                                                        row2 += (last_limit) * " "
-                                                    length -= len_index
-                                                    row1_checked = True
-                                                if row1_checked is True and row2_checked is True:
-                                                    row2_checked = False
-                                                    row1_checked = False
-                                        if key.endswith(".s"):
-                                            file_name = path_dependency + "/" + "test_" + key.replace(".s", "_s") + "_" + key.replace(".s", "_s") + ".s" 
-                                        else:
-                                            file_name = path_dependency + "/" + "test_" + key + "_" + key + ".s" 
-                                        if len(extension_list) > 0:
-                                            if extension_checked is False:
-                                                for attrib in instructions[key]['attributes']:
-                                                    if attrib in extension_list:
-                                                        extension_checked = True
-                                                        break
+                                            if len(scheduling_table_dict[sched][sched_class]['pipelines']) == 1:
+                                                throughput -= 1
+                                if dual_issue_throughput_activated is False:
+                                    if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
+                                        if len(scheduling_table_dict[sched][sched_class]['pipelines']) == 1:
+                                            if latency == throughput:
+                                                throughput -= 1
+                                while timeline_counter <= throughput:
+                                    if throughput > 0 or (throughput == 0 and dual_issue_throughput_activated is True):
+                                        if timeline_counter == 0:
+                                            timeline_string += "."
+                                            timeline_index += 1
+                                        elif timeline_index < 5:
+                                            timeline_string += " "
+                                            timeline_index += 1
+                                        elif timeline_index == 5:
+                                            timeline_string += "."
+                                            timeline_index = 1
                                         else:
-                                            extension_checked = True
-                                        if extension_checked is True:
-                                            f = open(file_name, "a")
-                                            f.write(test + "\n")
-                                            test_content_dep += test
-                                            f.write("\n\n")
-                                            f.close()
-                                        test = ""
-                                throughput = 0
-                                dual_issue_throughput_activated = False
+                                            timeline_index += 1
+                                    timeline_counter += 1
                                 if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
-                                    for pipeline in scheduling_table_dict[sched][sched_class]['pipelines']:
-                                        if str(scheduling_table_dict[sched][sched_class]['pipelines'][pipeline]['throughput']).isdigit():
-                                            throughput += int(scheduling_table_dict[sched][sched_class]['pipelines'][pipeline]['throughput'])
-                                for instruction in scheduling_tests_struct[key]['no-dep']:
-                                    if index % 2 == 0 or index == 0:
-                                        for element in sched_app_regs[key]:
-                                                    if sched_app_regs[key][element] >= 2:
-                                                        if element.isdigit() is False:
-                                                            destination = instructions[key]['syntax'][1]
-                                                            if destination in instrfield_data_ref.keys():
-                                                                for instrfield_key in instrfield_data_ref[destination]['enumerated'].keys():
-                                                                    if element in instrfield_data_ref[destination]['enumerated'][instrfield_key]:
-                                                                        dual_issue_throughput_activated = True
-                                                                        break
-                                                            else:
-                                                                for _ in instrfield_data_ref.keys():
-                                                                    if 'enumerated' in instrfield_data_ref[_].keys():
-                                                                        for instrfield_key in instrfield_data_ref[_]['enumerated'].keys():
-                                                                            if element in instrfield_data_ref[_]['enumerated'][instrfield_key]:
-                                                                                dual_issue_throughput_activated = True
-                                                                                break
-                                        if dual_issue_throughput_activated is False:
-                                            if 'latency' in scheduling_table_dict[sched][sched_class].keys():
-                                                if latency == throughput:
-                                                    if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
-                                                        if len(scheduling_table_dict[sched][sched_class]['pipelines']) == 1:
-                                                            if int(sched_parameters[sched]['IssueWidth']) > 1:
-                                                                throughput -= 1
-                                        index = 0
-                                        index_list = list()
-                                        index_list.append(0)
-                                        index_list.append(index)
-                                        index_str = str(index_list).replace(" ", "")
-                                        index_str += "     "
-                                        timeline = "D"
-                                        for _ in range(throughput-1):
+                                    if len(scheduling_table_dict[sched][sched_class]['pipelines']) > 1:
+                                        if dual_issue_throughput_activated is True:
+                                            if len(timeline_string) > throughput:
+                                                timeline_string = timeline_string[:-1]
+                                        elif dual_issue_throughput_activated is False:
+                                            if len(timeline_string) >= throughput and timeline_string.endswith(" "):
+                                                timeline_string = timeline_string.rstrip(" ")
+                                                if throughput <= len(timeline_string):
+                                                    diff = len(timeline_string) - throughput -1
+                                                    if diff < 0:
+                                                        diff = -1 * diff
+                                                    timeline_string = timeline_string[:-diff]
+                                            else:
+                                                diff = len(timeline_string) - throughput -1
+                                                timeline_string = timeline_string[:-diff]
+                                if test != "":
+                                    timeline += timeline_string
+                                timeline += "D"
+                                if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
+                                    if len(scheduling_table_dict[sched][sched_class]['pipelines']) > 1:
+                                        for _ in range(throughput - 1):
                                             timeline += "e"
-                                        timeline += "E"
-                                        index_str += timeline + "   " + instruction
-                                        reference = ""
-                                        reference += ""
-                                        index = 0
-                                        if index == 0 or index % 2 == 0:
-                                            reference += "\n" + "// CHECK: " + len('-NEXT') * " " + index_str
-                                        test += reference + "\n"
-                                        timeline_ref = timeline
                                     else:
-                                        index_list = list()
-                                        index_list.append(0)
-                                        index_list.append(index)
-                                        index_str = str(index_list).replace(" ", "")
-                                        index_str += "     "
-                                        timeline_string = ""
-                                        timeline_index = 0
-                                        timeline_counter = 0
-                                        timeline = ""
-                                        while timeline_counter <= throughput:
-                                            if timeline_counter == 0:
+                                        for _ in range(throughput):
+                                            timeline += "e"
+                                timeline += "E"
+                                if int(sched_parameters[sched]['IssueWidth']) == 1:
+                                    index_str += timeline + "   " + instruction
+                                elif int(sched_parameters[sched]['IssueWidth']) > 1:
+                                    index_str += timeline + "   " + instruction
+                                timeline_string = ""
+                                timeline_index = 0
+                                timeline_counter = 0
+                                while timeline_counter <= throughput:
+                                    if throughput > 0 or (throughput == 0 and dual_issue_throughput_activated is True):
+                                        if len(timeline_ref + timeline_string) % 5 == 0:
+                                            if len(timeline_ref + timeline_string) > len(timeline_ref):
                                                 timeline_string += "."
-                                                timeline_index += 1
-                                            elif timeline_index < 5:
+                                                timeline_index = 1
+                                            else:
                                                 timeline_string += " "
                                                 timeline_index += 1
-                                            elif timeline_index == 5:
+                                        elif timeline_index < 5:
+                                            timeline_string += " "
+                                            timeline_index += 1
+                                        elif timeline_index == 5:
+                                            timeline_string += "."
+                                            timeline_index = 1
+                                        else:
+                                            timeline_index += 1
+                                    timeline_counter += 1
+                                if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
+                                    if len(scheduling_table_dict[sched][sched_class]['pipelines']) > 1:
+                                        if dual_issue_throughput_activated is True:
+                                            while len(timeline_string) >= throughput:
+                                                timeline_string = timeline_string[:-1]
+                                            timeline_string += "."
+                                        elif dual_issue_throughput_activated is False:
+                                            if len(timeline_string) >= throughput and timeline_string.endswith(" "):
+                                                timeline_string = timeline_string.rstrip(" ")
                                                 timeline_string += "."
-                                                timeline_index = 1
                                             else:
-                                                timeline_index += 1
-                                            timeline_counter += 1
-                                        if len(timeline_string) > throughput:
-                                            timeline_string = timeline_string[:-1]
-                                            if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
-                                                if len(scheduling_table_dict[sched][sched_class]['pipelines']) > 1:
-                                                    for element in scheduling_table_dict[sched][sched_class]['pipelines'].keys():
-                                                        if str(scheduling_table_dict[sched][sched_class]['pipelines'][element]['throughput']).isdigit():
-                                                            if int(scheduling_table_dict[sched][sched_class]['pipelines'][element]['throughput']) != throughput:
-                                                                timeline_string = timeline_string[:-int(scheduling_table_dict[sched][sched_class]['pipelines'][element]['throughput'])]
-                                                                break
-                                        if dual_issue_throughput_activated is False:
-                                            if len(timeline_string) > throughput and throughput == 0:
-                                                if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
-                                                    if len(scheduling_table_dict[sched][sched_class]['pipelines']) > 1:
-                                                        timeline_string = timeline_string[:-1]
-                                        if test != "":
-                                            timeline += timeline_string
-                                        timeline += "D"
-                                        for _ in range(throughput-1):
-                                            timeline += "e"
-                                        timeline += "E"
-                                        if int(sched_parameters[sched]['IssueWidth']) == 1:
-                                            index_str += timeline + "   " + instruction
-                                        elif int(sched_parameters[sched]['IssueWidth']) > 1:
-                                            if 'single_issue' in scheduling_table_dict[sched][sched_class].keys():
-                                                if scheduling_table_dict[sched][sched_class]['single_issue'] == 'true':
-                                                    index_str += timeline + "   " + instruction
+                                                diff = len(timeline_string) - throughput -1
+                                                if diff < 0:
+                                                    diff = -1 * diff
+                                                timeline_string = timeline_string[:-diff]
+                                                timeline_string += "."
+                                len_row1 = len(timeline)
+                                if int(sched_parameters[sched]['IssueWidth']) > 1:
+                                        if timeline_string.endswith('.') is False:
+                                            if throughput > 0 or (throughput == 0 and dual_issue_throughput_activated is True):
+                                                timeline_string = timeline_string[:-1] + "."
+                                        if len(timeline_ref) % 5 == 0 and timeline_ref.endswith(".") is False:
+                                            timeline_string = timeline_string.replace(timeline_string[0], ".", 1)
+                                        test = test.replace(timeline_ref, timeline_ref + timeline_string)
+                                        if index == 0:
+                                            index_str = "// CHECK: " + index_str
+                                        elif index > 0:
+                                            index_str = "// CHECK-NEXT: " + index_str
+                                        if index_str not in test:
+                                            test += index_str
+                                else:
+                                    if timeline_string.endswith('.') is False:
+                                        timeline_string = timeline_string[:-1] + "."
+                                    if len(timeline_ref) % 5 == 0:
+                                        timeline_string = "." + timeline_string[1:]
+                                    if len(timeline_ref) % 5 == 0 and timeline_ref.endswith(".") is False:
+                                        timeline_string = timeline_string.replace(timeline_string[0], ".", 1)
+                                    test = test.replace(timeline_ref, timeline_ref + timeline_string)
+                                    if index == 0:
+                                        index_str = "// CHECK: " + index_str
+                                    elif index > 0:
+                                        index_str = "// CHECK-NEXT: " + index_str
+                                    if index_str not in test:
+                                        test += index_str
+                            index += 1
+                            if index % 2 == 0:
+                                indices = ""
+                                row1 = ""
+                                row2 = ""
+                                row2_checked = False
+                                row1_checked = False
+                                for digit in range(len_row1):
+                                    indices += str(digit % 10)
+                                if len(indices) <= 10:
+                                    if row2_checked is False:
+                                        row2 += indices
+                                        row2_checked = True
+                                elif len(indices) > 10:
+                                    len_index = 10
+                                    length = len(indices)
+                                    last_limit = 0
+                                    while length >= 0:
+                                        if row2_checked is False:
+                                            limit = length - last_limit
+                                            if last_limit == 0:
+                                                row2 += indices[:len_index]
+                                                row1 += 10 * " "
                                             else:
-                                                for element in sched_app_regs[key]:
-                                                    if sched_app_regs[key][element] >= 2:
-                                                        if element.isdigit() is False:
-                                                            destination = instructions[key]['syntax'][1]
-                                                            if destination in instrfield_data_ref.keys():
-                                                                for instrfield_key in instrfield_data_ref[destination]['enumerated'].keys():
-                                                                    if element in instrfield_data_ref[destination]['enumerated'][instrfield_key]:
-                                                                        dual_issue_throughput_activated = True
-                                                                        break
-                                                            else:
-                                                                for _ in instrfield_data_ref.keys():
-                                                                    if 'enumerated' in instrfield_data_ref[_].keys():
-                                                                        for instrfield_key in instrfield_data_ref[_]['enumerated'].keys():
-                                                                            if element in instrfield_data_ref[_]['enumerated'][instrfield_key]:
-                                                                                dual_issue_throughput_activated = True
-                                                                                break
-                                        if dual_issue_throughput_activated is False:
-                                            if 'latency' in scheduling_table_dict[sched][sched_class].keys():
-                                                if latency == throughput:
-                                                    if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
-                                                        if len(scheduling_table_dict[sched][sched_class]['pipelines']) == 1:
-                                                            if int(sched_parameters[sched]['IssueWidth']) > 1:
-                                                                throughput -= 1
-                                        timeline_string = ""
-                                        timeline_index = 0
-                                        timeline_counter = 0
-                                        while timeline_counter <= throughput:
-                                            if len(timeline_ref + timeline_string) % 5 == 0:
-                                                if len(timeline_ref + timeline_string) > len(timeline_ref):
-                                                    timeline_string += "."
-                                                    timeline_index = 1
+                                                if limit > 10:
+                                                    row2 += indices[last_limit:last_limit+10]
+                                                    last_limit = last_limit + 10
+                                                    row1 += 10 * " "
                                                 else:
-                                                    timeline_string += " "
-                                                    timeline_index += 1
-                                            elif timeline_index < 5:
-                                                timeline_string += " "
-                                                timeline_index += 1
-                                            elif timeline_index == 5:
-                                                timeline_string += "."
-                                                timeline_index = 1
+                                                    row2 += indices[last_limit:length]
+                                                    row1 += (length - last_limit) * " "
+                                            row2_checked = True
+                                            length -= len_index
+                                            last_limit = len_index
+                                        elif row1_checked is False:
+                                            if length >= last_limit:
+                                                limit = length - last_limit
                                             else:
-                                                timeline_index += 1
-                                            timeline_counter += 1
-                                        if len(timeline_string) > throughput:
-                                            timeline_string = timeline_string[:-1]
+                                                last_limit = length
+                                                limit = last_limit
+                                            if limit > 10:
+                                                row1 += indices[last_limit:last_limit+10]
+                                                last_limit = last_limit + 10
+                                                row2 += 10 * " "
+                                            else:
+                                                row1 += indices[-last_limit:]
+                                                row2 += (last_limit) * " "
+                                            length -= len_index
+                                            row1_checked = True
+                                        if row1_checked is True and row2_checked is True:
+                                            row2_checked = False
+                                            row1_checked = False
+                                if key.endswith(".s"):
+                                    file_name = path_dependency + "/" + "test_" + key.replace(".s", "_s") + "_" + key.replace(".s", "_s") + ".s" 
+                                else:
+                                    file_name = path_dependency + "/" + "test_" + key + "_" + key + ".s" 
+                                if len(extension_list) > 0:
+                                    if extension_checked is False:
+                                        for attrib in instructions[key]['attributes']:
+                                            if attrib in extension_list:
+                                                extension_checked = True
+                                                break
+                                else:
+                                    extension_checked = True
+                                if extension_checked is True:
+                                    f = emitter.open(file_name, "a")
+                                    f.write(test + "\n")
+                                    test_content_dep += test
+                                    f.write("\n\n")
+                                    f.close()
+                                test = ""
+                        throughput = 0
+                        dual_issue_throughput_activated = False
+                        if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
+                            for pipeline in scheduling_table_dict[sched][sched_class]['pipelines']:
+                                if str(scheduling_table_dict[sched][sched_class]['pipelines'][pipeline]['throughput']).isdigit():
+                                    throughput += int(scheduling_table_dict[sched][sched_class]['pipelines'][pipeline]['throughput'])
+                        for instruction in generation_context.scheduling_tests_struct[key]['no-dep']:
+                            if index % 2 == 0 or index == 0:
+                                for element in generation_context.sched_app_regs[key]:
+                                            if generation_context.sched_app_regs[key][element] >= 2:
+                                                if element.isdigit() is False:
+                                                    destination = instructions[key]['syntax'][1]
+                                                    if destination in instrfield_data_ref.keys():
+                                                        for instrfield_key in instrfield_data_ref[destination]['enumerated'].keys():
+                                                            if element in instrfield_data_ref[destination]['enumerated'][instrfield_key]:
+                                                                dual_issue_throughput_activated = True
+                                                                break
+                                                    else:
+                                                        for _ in instrfield_data_ref.keys():
+                                                            if 'enumerated' in instrfield_data_ref[_].keys():
+                                                                for instrfield_key in instrfield_data_ref[_]['enumerated'].keys():
+                                                                    if element in instrfield_data_ref[_]['enumerated'][instrfield_key]:
+                                                                        dual_issue_throughput_activated = True
+                                                                        break
+                                if dual_issue_throughput_activated is False:
+                                    if 'latency' in scheduling_table_dict[sched][sched_class].keys():
+                                        if latency == throughput:
                                             if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
-                                                if len(scheduling_table_dict[sched][sched_class]['pipelines']) > 1:
-                                                    for element in scheduling_table_dict[sched][sched_class]['pipelines'].keys():
-                                                        if str(scheduling_table_dict[sched][sched_class]['pipelines'][element]['throughput']).isdigit():
-                                                            if int(scheduling_table_dict[sched][sched_class]['pipelines'][element]['throughput']) != throughput:
-                                                                timeline_string = timeline_string[:-int(scheduling_table_dict[sched][sched_class]['pipelines'][element]['throughput'])]
+                                                if len(scheduling_table_dict[sched][sched_class]['pipelines']) == 1:
+                                                    if int(sched_parameters[sched]['IssueWidth']) > 1:
+                                                        throughput -= 1
+                                index = 0
+                                index_list = list()
+                                index_list.append(0)
+                                index_list.append(index)
+                                index_str = str(index_list).replace(" ", "")
+                                index_str += "     "
+                                timeline = "D"
+                                for _ in range(throughput-1):
+                                    timeline += "e"
+                                timeline += "E"
+                                index_str += timeline + "   " + instruction
+                                reference = ""
+                                reference += ""
+                                index = 0
+                                if index == 0 or index % 2 == 0:
+                                    reference += "\n" + "// CHECK: " + len('-NEXT') * " " + index_str
+                                test += reference + "\n"
+                                timeline_ref = timeline
+                            else:
+                                index_list = list()
+                                index_list.append(0)
+                                index_list.append(index)
+                                index_str = str(index_list).replace(" ", "")
+                                index_str += "     "
+                                timeline_string = ""
+                                timeline_index = 0
+                                timeline_counter = 0
+                                timeline = ""
+                                while timeline_counter <= throughput:
+                                    if timeline_counter == 0:
+                                        timeline_string += "."
+                                        timeline_index += 1
+                                    elif timeline_index < 5:
+                                        timeline_string += " "
+                                        timeline_index += 1
+                                    elif timeline_index == 5:
+                                        timeline_string += "."
+                                        timeline_index = 1
+                                    else:
+                                        timeline_index += 1
+                                    timeline_counter += 1
+                                if len(timeline_string) > throughput:
+                                    timeline_string = timeline_string[:-1]
+                                    if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
+                                        if len(scheduling_table_dict[sched][sched_class]['pipelines']) > 1:
+                                            for element in scheduling_table_dict[sched][sched_class]['pipelines'].keys():
+                                                if str(scheduling_table_dict[sched][sched_class]['pipelines'][element]['throughput']).isdigit():
+                                                    if int(scheduling_table_dict[sched][sched_class]['pipelines'][element]['throughput']) != throughput:
+                                                        timeline_string = timeline_string[:-int(scheduling_table_dict[sched][sched_class]['pipelines'][element]['throughput'])]
+                                                        break
+                                if dual_issue_throughput_activated is False:
+                                    if len(timeline_string) > throughput and throughput == 0:
+                                        if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
+                                            if len(scheduling_table_dict[sched][sched_class]['pipelines']) > 1:
+                                                timeline_string = timeline_string[:-1]
+                                if test != "":
+                                    timeline += timeline_string
+                                timeline += "D"
+                                for _ in range(throughput-1):
+                                    timeline += "e"
+                                timeline += "E"
+                                if int(sched_parameters[sched]['IssueWidth']) == 1:
+                                    index_str += timeline + "   " + instruction
+                                elif int(sched_parameters[sched]['IssueWidth']) > 1:
+                                    if 'single_issue' in scheduling_table_dict[sched][sched_class].keys():
+                                        if scheduling_table_dict[sched][sched_class]['single_issue'] == 'true':
+                                            index_str += timeline + "   " + instruction
+                                    else:
+                                        for element in generation_context.sched_app_regs[key]:
+                                            if generation_context.sched_app_regs[key][element] >= 2:
+                                                if element.isdigit() is False:
+                                                    destination = instructions[key]['syntax'][1]
+                                                    if destination in instrfield_data_ref.keys():
+                                                        for instrfield_key in instrfield_data_ref[destination]['enumerated'].keys():
+                                                            if element in instrfield_data_ref[destination]['enumerated'][instrfield_key]:
+                                                                dual_issue_throughput_activated = True
                                                                 break
-                                        if dual_issue_throughput_activated is False:
-                                            if len(timeline_string) > throughput and throughput == 0:
-                                                if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
-                                                    if len(scheduling_table_dict[sched][sched_class]['pipelines']) > 1:
-                                                        timeline_string = timeline_string[:-1]
-                                        if timeline_string.endswith(" ") and len(timeline_string) > throughput:
-                                            timeline_string = timeline_string.rstrip(" ")
+                                                    else:
+                                                        for _ in instrfield_data_ref.keys():
+                                                            if 'enumerated' in instrfield_data_ref[_].keys():
+                                                                for instrfield_key in instrfield_data_ref[_]['enumerated'].keys():
+                                                                    if element in instrfield_data_ref[_]['enumerated'][instrfield_key]:
+                                                                        dual_issue_throughput_activated = True
+                                                                        break
+                                if dual_issue_throughput_activated is False:
+                                    if 'latency' in scheduling_table_dict[sched][sched_class].keys():
+                                        if latency == throughput:
+                                            if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
+                                                if len(scheduling_table_dict[sched][sched_class]['pipelines']) == 1:
+                                                    if int(sched_parameters[sched]['IssueWidth']) > 1:
+                                                        throughput -= 1
+                                timeline_string = ""
+                                timeline_index = 0
+                                timeline_counter = 0
+                                while timeline_counter <= throughput:
+                                    if len(timeline_ref + timeline_string) % 5 == 0:
+                                        if len(timeline_ref + timeline_string) > len(timeline_ref):
                                             timeline_string += "."
-                                        if int(sched_parameters[sched]['IssueWidth']) > 1:
-                                            if 'single_issue' not in scheduling_table_dict[sched][sched_class].keys():
-                                                if dual_issue_throughput_activated is True:
-                                                    if timeline_string.endswith('.') is False:
-                                                        timeline_string = timeline_string[:-1] + "."
-                                                        if len(timeline_ref) % 5 == 0 and timeline_ref.endswith(".") is False:
-                                                            timeline_string = timeline_string.replace(timeline_string[0], ".", 1)
-                                                        test = test.replace(timeline_ref, timeline_ref + timeline_string)
-                                                index_str += timeline_ref
-                                                if index == 0:
-                                                    index_str = "// CHECK: " + index_str
-                                                elif index > 0:
-                                                    index_str = "// CHECK-NEXT: " + index_str
-                                                if index_str not in test:
-                                                    test += index_str + "   " + instruction
-                                            elif dual_issue_throughput_activated is True:
-                                                if timeline_string.endswith('.') is False:
-                                                    timeline_string = timeline_string[:-1] + "."
-                                                if len(timeline_ref) % 5 == 0 and timeline_ref.endswith(".") is False:
-                                                    timeline_string = timeline_string.replace(timeline_string[0], ".", 1)
-                                                test = test.replace(timeline_ref, timeline_ref + timeline_string)
-                                                if index == 0:
-                                                    index_str = "// CHECK: " + index_str
-                                                elif index > 0:
-                                                    index_str = "// CHECK-NEXT: " + index_str
-                                                if index_str not in test:
-                                                    test += index_str
-                                            else:
-                                                if timeline_string.endswith('.') is False:
-                                                    if len(timeline_string) != 0 and throughput != 0:
-                                                        timeline_string = timeline_string[:-1] + "."
+                                            timeline_index = 1
+                                        else:
+                                            timeline_string += " "
+                                            timeline_index += 1
+                                    elif timeline_index < 5:
+                                        timeline_string += " "
+                                        timeline_index += 1
+                                    elif timeline_index == 5:
+                                        timeline_string += "."
+                                        timeline_index = 1
+                                    else:
+                                        timeline_index += 1
+                                    timeline_counter += 1
+                                if len(timeline_string) > throughput:
+                                    timeline_string = timeline_string[:-1]
+                                    if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
+                                        if len(scheduling_table_dict[sched][sched_class]['pipelines']) > 1:
+                                            for element in scheduling_table_dict[sched][sched_class]['pipelines'].keys():
+                                                if str(scheduling_table_dict[sched][sched_class]['pipelines'][element]['throughput']).isdigit():
+                                                    if int(scheduling_table_dict[sched][sched_class]['pipelines'][element]['throughput']) != throughput:
+                                                        timeline_string = timeline_string[:-int(scheduling_table_dict[sched][sched_class]['pipelines'][element]['throughput'])]
+                                                        break
+                                if dual_issue_throughput_activated is False:
+                                    if len(timeline_string) > throughput and throughput == 0:
+                                        if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
+                                            if len(scheduling_table_dict[sched][sched_class]['pipelines']) > 1:
+                                                timeline_string = timeline_string[:-1]
+                                if timeline_string.endswith(" ") and len(timeline_string) > throughput:
+                                    timeline_string = timeline_string.rstrip(" ")
+                                    timeline_string += "."
+                                if int(sched_parameters[sched]['IssueWidth']) > 1:
+                                    if 'single_issue' not in scheduling_table_dict[sched][sched_class].keys():
+                                        if dual_issue_throughput_activated is True:
+                                            if timeline_string.endswith('.') is False:
+                                                timeline_string = timeline_string[:-1] + "."
                                                 if len(timeline_ref) % 5 == 0 and timeline_ref.endswith(".") is False:
                                                     timeline_string = timeline_string.replace(timeline_string[0], ".", 1)
                                                 test = test.replace(timeline_ref, timeline_ref + timeline_string)
-                                                if index == 0:
-                                                    index_str = "// CHECK: " + index_str
-                                                elif index > 0:
-                                                    index_str = "// CHECK-NEXT: " + index_str
-                                                if index_str not in test:
-                                                    test += index_str
-                                        else:
-                                            if timeline_string.endswith('.') is False:
+                                        index_str += timeline_ref
+                                        if index == 0:
+                                            index_str = "// CHECK: " + index_str
+                                        elif index > 0:
+                                            index_str = "// CHECK-NEXT: " + index_str
+                                        if index_str not in test:
+                                            test += index_str + "   " + instruction
+                                    elif dual_issue_throughput_activated is True:
+                                        if timeline_string.endswith('.') is False:
+                                            timeline_string = timeline_string[:-1] + "."
+                                        if len(timeline_ref) % 5 == 0 and timeline_ref.endswith(".") is False:
+                                            timeline_string = timeline_string.replace(timeline_string[0], ".", 1)
+                                        test = test.replace(timeline_ref, timeline_ref + timeline_string)
+                                        if index == 0:
+                                            index_str = "// CHECK: " + index_str
+                                        elif index > 0:
+                                            index_str = "// CHECK-NEXT: " + index_str
+                                        if index_str not in test:
+                                            test += index_str
+                                    else:
+                                        if timeline_string.endswith('.') is False:
+                                            if len(timeline_string) != 0 and throughput != 0:
                                                 timeline_string = timeline_string[:-1] + "."
-                                            if len(timeline_ref) % 5 == 0:
-                                                timeline_string = "." + timeline_string[1:]
-                                            if len(timeline_ref) % 5 == 0 and timeline_ref.endswith(".") is False:
-                                                timeline_string = timeline_string.replace(timeline_string[0], ".", 1)
-                                            test = test.replace(timeline_ref, timeline_ref + timeline_string)
-                                            if index == 0:
-                                                index_str = "// CHECK: " + index_str
-                                            elif index > 0:
-                                                index_str = "// CHECK-NEXT: " + index_str
-                                            if index_str not in test:
-                                                test += index_str
-                                    len_row1 = len(timeline)
-                                    index += 1
-                                    if index % 2 == 0:
-                                        indices = ""
-                                        row1 = ""
-                                        row2 = ""
-                                        row2_checked = False
-                                        row1_checked = False
-                                        for digit in range(len_row1):
-                                            indices += str(digit % 10)
-                                        if len(indices) <= 10:
-                                            if row2_checked is False:
-                                                row2 += indices
-                                                row2_checked = True
-                                        elif len(indices) > 10:
-                                            len_index = 10
-                                            length = len(indices)
-                                            last_limit = 0
-                                            while length >= 0:
-                                                if row2_checked is False:
-                                                    limit = length - last_limit
-                                                    if last_limit == 0:
-                                                        row2 += indices[:len_index]
-                                                        row1 += 10 * " "
-                                                    else:
-                                                        if limit > 10:
-                                                            row2 += indices[last_limit:last_limit+10]
-                                                            last_limit = last_limit + 10
-                                                            row1 += 10 * " "
-                                                        else:
-                                                            row2 += indices[last_limit:length]
-                                                            row1 += (length - last_limit) * " "
-                                                    row2_checked = True
-                                                    length -= len_index
-                                                    last_limit = len_index
-                                                elif row1_checked is False:
-                                                    if length >= last_limit:
-                                                        limit = length - last_limit
-                                                    else:
-                                                        last_limit = length
-                                                        limit = last_limit
-                                                    if limit > 10:
-                                                        row1 += indices[last_limit:last_limit+10]
-                                                        last_limit = last_limit + 10
-                                                        row2 += 10 * " "
-                                                    else:
-                                                        row1 += indices[-last_limit:]
-                                                        row2 += (last_limit) * " "
-                                                    length -= len_index
-                                                    row1_checked = True
-                                                if row1_checked is True and row2_checked is True:
-                                                    row2_checked = False
-                                                    row1_checked = False
-                                        if key.endswith(".s"):
-                                            file_name = path + "/" + "test_" +  key.replace(".s", "_s") + "_" + key.replace(".s", "_s") + ".s" 
-                                        else:
-                                            file_name = path + "/" + "test_" +  key + "_" + key + ".s"
-                                        if len(extension_list) > 0:
-                                            if extension_checked is False:
-                                                for attrib in instructions[key]['attributes']:
-                                                    if attrib in extension_list:
-                                                        extension_checked = True
-                                                        break
-                                        else:
-                                            extension_checked = True
-                                        if extension_checked is True:
-                                            if 'single_issue' in scheduling_table_dict[sched][sched_class].keys():
-                                                dual_issue_throughput_activated = True
-                                            if dual_issue_throughput_activated is True:
-                                                if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
-                                                    if len(scheduling_table_dict[sched][sched_class]['pipelines']) == 1:
-                                                        test = test_content_dep
-                                            f = open(file_name, "a")
-                                            f.write(test + "\n")
-                                            f.write("\n\n")
-                                            f.close()
-                                        test = ""
+                                        if len(timeline_ref) % 5 == 0 and timeline_ref.endswith(".") is False:
+                                            timeline_string = timeline_string.replace(timeline_string[0], ".", 1)
+                                        test = test.replace(timeline_ref, timeline_ref + timeline_string)
+                                        if index == 0:
+                                            index_str = "// CHECK: " + index_str
+                                        elif index > 0:
+                                            index_str = "// CHECK-NEXT: " + index_str
+                                        if index_str not in test:
+                                            test += index_str
+                                else:
+                                    if timeline_string.endswith('.') is False:
+                                        timeline_string = timeline_string[:-1] + "."
+                                    if len(timeline_ref) % 5 == 0:
+                                        timeline_string = "." + timeline_string[1:]
+                                    if len(timeline_ref) % 5 == 0 and timeline_ref.endswith(".") is False:
+                                        timeline_string = timeline_string.replace(timeline_string[0], ".", 1)
+                                    test = test.replace(timeline_ref, timeline_ref + timeline_string)
+                                    if index == 0:
+                                        index_str = "// CHECK: " + index_str
+                                    elif index > 0:
+                                        index_str = "// CHECK-NEXT: " + index_str
+                                    if index_str not in test:
+                                        test += index_str
+                            len_row1 = len(timeline)
+                            index += 1
+                            if index % 2 == 0:
+                                indices = ""
+                                row1 = ""
+                                row2 = ""
+                                row2_checked = False
+                                row1_checked = False
+                                for digit in range(len_row1):
+                                    indices += str(digit % 10)
+                                if len(indices) <= 10:
+                                    if row2_checked is False:
+                                        row2 += indices
+                                        row2_checked = True
+                                elif len(indices) > 10:
+                                    len_index = 10
+                                    length = len(indices)
+                                    last_limit = 0
+                                    while length >= 0:
+                                        if row2_checked is False:
+                                            limit = length - last_limit
+                                            if last_limit == 0:
+                                                row2 += indices[:len_index]
+                                                row1 += 10 * " "
+                                            else:
+                                                if limit > 10:
+                                                    row2 += indices[last_limit:last_limit+10]
+                                                    last_limit = last_limit + 10
+                                                    row1 += 10 * " "
+                                                else:
+                                                    row2 += indices[last_limit:length]
+                                                    row1 += (length - last_limit) * " "
+                                            row2_checked = True
+                                            length -= len_index
+                                            last_limit = len_index
+                                        elif row1_checked is False:
+                                            if length >= last_limit:
+                                                limit = length - last_limit
+                                            else:
+                                                last_limit = length
+                                                limit = last_limit
+                                            if limit > 10:
+                                                row1 += indices[last_limit:last_limit+10]
+                                                last_limit = last_limit + 10
+                                                row2 += 10 * " "
+                                            else:
+                                                row1 += indices[-last_limit:]
+                                                row2 += (last_limit) * " "
+                                            length -= len_index
+                                            row1_checked = True
+                                        if row1_checked is True and row2_checked is True:
+                                            row2_checked = False
+                                            row1_checked = False
+                                if key.endswith(".s"):
+                                    file_name = path + "/" + "test_" +  key.replace(".s", "_s") + "_" + key.replace(".s", "_s") + ".s" 
+                                else:
+                                    file_name = path + "/" + "test_" +  key + "_" + key + ".s"
+                                if len(extension_list) > 0:
+                                    if extension_checked is False:
+                                        for attrib in instructions[key]['attributes']:
+                                            if attrib in extension_list:
+                                                extension_checked = True
+                                                break
+                                else:
+                                    extension_checked = True
+                                if extension_checked is True:
+                                    if 'single_issue' in scheduling_table_dict[sched][sched_class].keys():
+                                        dual_issue_throughput_activated = True
+                                    if dual_issue_throughput_activated is True:
+                                        if 'pipelines' in scheduling_table_dict[sched][sched_class].keys():
+                                            if len(scheduling_table_dict[sched][sched_class]['pipelines']) == 1:
+                                                test = test_content_dep
+                                    f = emitter.open(file_name, "a")
+                                    f.write(test + "\n")
+                                    f.write("\n\n")
+                                    f.close()
+                                test = ""
     aliases = adl_parser.parse_instructions_aliases_from_adl(config_variables['ADLName'])
     for instruction in instructions:
         check = False      
@@ -13384,7 +13626,7 @@ def generate_scheduling_ref(path, extension_list):
                     print("Scheduling is not supported for instruction " + instruction)
                     break  
                                            
-def generate_sail_description(path, extensions_list):
+def generate_sail_description(path, extensions_list, generation_context):
     """
     Generates Sail descriptions for the instructions defined in the XML input.
 
@@ -13397,6 +13639,7 @@ def generate_sail_description(path, extensions_list):
         extensions_list (list[str]): List of enabled extensions for which Sail
             descriptions should be generated. If empty, all supported extensions
             are considered.
+        generation_context (GenerationContext): The state shared by the generation stages.
 
     Returns:
         str: Generated Sail descriptions for the supported instructions.
@@ -13414,22 +13657,22 @@ def generate_sail_description(path, extensions_list):
             for instr in instructions.keys():
                 if element in instructions[instr]['attributes']:
                     file_name = path.replace("ext", element.lower())
-                    if os.path.exists(file_name):
-                        os.remove(file_name)
+                    if emitter.exists(file_name):
+                        emitter.remove(file_name)
     else:
         for element in config_variables.keys():
             for instr in instructions.keys():
                 if element.startswith("LLVMExt"):
                     if element.replace("LLVMExt", "").lower() in instructions[instr]['attributes']:
                         file_name = path.replace("ext", element.replace("LLVMExt", "").lower())
-                        if os.path.exists(file_name):
-                            os.remove(file_name)
+                        if emitter.exists(file_name):
+                            emitter.remove(file_name)
     if len(extensions_list) > 0:
         for element in extensions_list:
             for instr in instructions.keys():
                 if element in instructions[instr]['attributes']:
                     file_name = path.replace("ext", element.lower())
-                    f = open(file_name, 'a')
+                    f = emitter.open(file_name, 'a')
                     legalDisclaimer.add_sail_license(file_name)
                     f.write("\n\n")
                     f.close()
@@ -13441,7 +13684,7 @@ def generate_sail_description(path, extensions_list):
                     if element.replace("LLVMExt", "").lower() in instructions[instr]['attributes']:
                         file_name = path.replace("ext", element.replace("LLVMExt", "").lower())
                         file_name = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', file_name)
-                        f = open(file_name, 'a')
+                        f = emitter.open(file_name, 'a')
                         legalDisclaimer.add_sail_license(file_name)
                         f.write("\n\n")
                         f.close()
@@ -13466,7 +13709,7 @@ def generate_sail_description(path, extensions_list):
                                                 sys_reg_list.append(attribute)
             if len(sys_reg_list) > 0:
                 file_name = path.replace("ext", element)
-                f = open(file_name, 'a')
+                f = emitter.open(file_name, 'a')
                 extension_set = element.replace("LLVMExt", "").capitalize()
                 main_extension = extension_set
                 instruction_extension_enum = ""
@@ -13520,7 +13763,7 @@ def generate_sail_description(path, extensions_list):
                 if len(sys_reg_list) > 0:
                     file_name = path.replace("ext", element.replace("LLVMExt", "").lower())
                     file_name = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', file_name)
-                    f = open(file_name, 'a')
+                    f = emitter.open(file_name, 'a')
                     extension_set = element.replace("LLVMExt", "").capitalize()
                     instruction_extension_enum = "enum clause extension = " + "Ext_" + extension_set + "\n"
                     if "BaseArchitecture" in config_variables.keys():
@@ -13540,7 +13783,7 @@ def generate_sail_description(path, extensions_list):
         base_arch = [s for s in re.findall(r'\d+\d*', config_variables['BaseArchitecture'])]
     for instr in instructions.keys():
         if_activated = False
-        if instr in instruction_encoding_dict.keys():
+        if instr in generation_context.instruction_encoding_dict.keys():
             prefixed = False
             prefix_attrib = ""
             for extension in extensions_list:
@@ -13581,8 +13824,8 @@ def generate_sail_description(path, extensions_list):
             if if_statement.endswith(" & "):
                 if_statement = if_statement.rstrip(" & ")
             if if_statement != if_statement_copy:
-                for element in instruction_encoding_dict[instr].keys():
-                    value = instruction_encoding_dict[instr][element].split("=")[1].strip(" ").replace(";", "")
+                for element in generation_context.instruction_encoding_dict[instr].keys():
+                    value = generation_context.instruction_encoding_dict[instr][element].split("=")[1].strip(" ").replace(";", "")
                     if value in instrfields.keys() and value in instructions[instr]['fields'][0].keys():
                         if str(2 ** int(instrfields[value]['width'])) == config_variables['LLVMRegBasicWidth']:
                             content += "encdec_reg(" + value + ")" + " @ "
@@ -13590,7 +13833,7 @@ def generate_sail_description(path, extensions_list):
                             content += "encdec_creg(" + value + ")" + " @ "
                         reg_list.append(value)
                     elif value.isdigit():
-                        let_instr = instruction_encoding_dict[instr][element].split("=")[0]
+                        let_instr = generation_context.instruction_encoding_dict[instr][element].split("=")[0]
                         let_instr = let_instr.replace("let Inst{", "")
                         let_instr = let_instr.replace("}", "")
                         end = let_instr.split("-")[0]
@@ -13818,8 +14061,8 @@ def generate_sail_description(path, extensions_list):
                             if instrfield.endswith("?"):
                                 instrfield = instrfield.rstrip("?")
                                 end_mark = True
-                            if instrfield in alias_register_dict.keys():
-                                register_alias = alias_register_dict[instrfield]
+                            if instrfield in generation_context.alias_register_dict.keys():
+                                register_alias = generation_context.alias_register_dict[instrfield]
                                 if register == 'GPR':
                                     if register_alias not in function_list and register_alias not in ast_clause_list:
                                         content_function += "\tlet " + register_alias + "_val" + " = "
@@ -13842,8 +14085,8 @@ def generate_sail_description(path, extensions_list):
                             instrfield = prefix.upper() + element
                             if instrfield.endswith("?"):
                                 instrfield = instrfield.rstrip("?")
-                            if instrfield in alias_register_dict.keys():
-                                register_alias = alias_register_dict[instrfield]
+                            if instrfield in generation_context.alias_register_dict.keys():
+                                register_alias = generation_context.alias_register_dict[instrfield]
                                 if register == 'GPR':
                                     if register_alias not in function_list and register_alias not in ast_clause_list:
                                         content_function += "\tlet " + register_alias + "_val" + " = "
@@ -14513,8 +14756,8 @@ def generate_sail_description(path, extensions_list):
                                         element = prefix.upper() + op1.replace("?", "")
                                         if element.endswith("?"):
                                             element = element.rstrip("?")
-                                        if element in alias_register_dict.keys():
-                                            alias = alias_register_dict[element]
+                                        if element in generation_context.alias_register_dict.keys():
+                                            alias = generation_context.alias_register_dict[element]
                                             op1 = alias
                             else:
                                 if ref in right_op1:
@@ -14523,8 +14766,8 @@ def generate_sail_description(path, extensions_list):
                                     if op1.isdigit:
                                         prefix = register_parsed[ref].prefix
                                         element = prefix.upper() + op1
-                                        if element in alias_register_dict.keys():
-                                            alias = alias_register_dict[element]
+                                        if element in generation_context.alias_register_dict.keys():
+                                            alias = generation_context.alias_register_dict[element]
                                             op1 = alias
                         elif element in instrfield_imm.keys():
                             if right_op2.startswith(element) is False:
@@ -14748,7 +14991,7 @@ def generate_sail_description(path, extensions_list):
                         if instr not in instruction_parsed_and_printed:
                             instruction_parsed_and_printed.append(instr)
                             file_name = path.replace("ext", element.lower())
-                            f = open(file_name, 'a')
+                            f = emitter.open(file_name, 'a')
                             f.write(ast_clause)
                             f.write("\n\n")
                             f.write(statement + "\n" + "\t" + "\n" + content + "\n" + "\t" + if_statement)
@@ -14766,7 +15009,7 @@ def generate_sail_description(path, extensions_list):
                                 instruction_parsed_and_printed.append(instr)
                                 file_name = path.replace("ext", element.replace("LLVMExt", "").lower())
                                 file_name = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', file_name)
-                                f = open(file_name, 'a')
+                                f = emitter.open(file_name, 'a')
                                 f.write(ast_clause)
                                 f.write("\n\n")
                                 f.write(statement + "\n" + "\t" + "\n" + content + "\n" + "\t" + if_statement)
@@ -14808,7 +15051,7 @@ def generate_extension_definition(file_name, extension_list):
     major_version = ""
     minor_version = ""
     description = ""
-    f = open(file_name, "a")
+    f = emitter.open(file_name, "a")
     legalDisclaimer.get_copyright(file_name)
     for attribute in attributes:
         if "LLVMExt" + attribute.capitalize() in config_variables.keys():
@@ -5,6 +5,7 @@
 # The module which generates legal information about the current project
 from datetime import date
 import os
+import emitter
 
 
 def get_copyright(filename):
@@ -30,10 +31,7 @@ def get_copyright(filename):
     list_dir = list()
     for fname in os.listdir("."):
         list_dir.append(fname)
-    if os.path.exists(filename) is False:
-        f = open(filename, "x")
-        f.close()
-    f = open(filename, "w")
+    f = emitter.open(filename, "w")
     f.write(string)
     f.close()
 
@@ -73,15 +71,15 @@ def get_generated_file(filename):
     if "tools" not in list_dir:
         if filename.startswith("./"):
             filename = "." + filename
-            f = open(filename, "a")
+            f = emitter.open(filename, "a")
             f.write(string)
             f.close()
         else:
-            f = open(filename, "w")
+            f = emitter.open(filename, "w")
             f.write(string)
             f.close()
     else:
-        f = open(filename, "a")
+        f = emitter.open(filename, "a")
         f.write(string)
         f.close()
 
@@ -114,14 +112,14 @@ def add_sail_license(filename):
     if "tools" not in list_dir:
         if filename.startswith("./"):
             filename = "." + filename
-            f = open(filename, "w")
+            f = emitter.open(filename, "w")
             f.write(string)
             f.close()
         else:
-            f = open(filename, "w")
+            f = emitter.open(filename, "w")
             f.write(string)
             f.close()
     else:
-        f = open(filename, "w")
+        f = emitter.open(filename, "w")
         f.write(string)
         f.close()
\ No newline at end of file
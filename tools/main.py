@@ -5,28 +5,88 @@
 # The main module which must be run to generate all the td files
 import adl_parser
 import files
+import emitter
 import config
 import legalDisclaimer
+import model_cache
 import os
 import sys
 import argparse
 import shutil
-import make_td
+import glob
+import pipeline
+import profiling
 
 
-def main():
+def parse_extensions(extensions: str) -> list:
     """
-    Main entry point that orchestrates all generation steps required for the build.
+    Splits the value of the --extension command line option.
+
+    Args:
+        extensions (str): Comma separated extension names, optionally written as a list (e.g. "['zilsd','zclsd']").
+
+    Returns:
+        list: The extension names.
+    """
+    extensions = extensions.replace("'", "").replace("[", "").replace("]", "")
+    return extensions.split(",")
+
+
+def command_line_parser() -> argparse.ArgumentParser:
+    """
+    Builds the parser of the command line of main.py and make_td.py.
+
+    Every option takes its value either after "=" or as the next argument.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("file", type=str)
+    parser.add_argument("--target", dest="target", type=str)
+    parser.add_argument("--extension", "-e", dest="extension", type=str)
+    parser.add_argument("--output", "-o", dest='output', type=str)
+    # Also accepted as --no-sail=True
+    parser.add_argument("--no-sail", dest="no_sail", type=str, nargs="?", const="True")
+    parser.add_argument("--no-cache", dest="no_cache", action="store_true")
+    parser.add_argument("--jobs", "-j", dest="jobs", type=int, default=1)
+    parser.add_argument("--force", dest="force", action="store_true")
+    parser.add_argument("--profile", dest="profile", action="store_true")
+    parser.add_argument("--profile-json", dest="profile_json", type=str)
+    parser.add_argument("--profile-dir", dest="profile_dir", type=str)
+    return parser
+
+
+def run_pipeline(
+    adl_path, target=None, extensions=None, output_dir=None, no_sail=False, jobs=1, force=False, profiler=None
+):
+    """
+    Runs all the generation steps required for the build inside the current process.
 
     Note:
         Modify values only in the `config.txt` file when needed. This function
         reads configuration, triggers the generation of instruction formats,
         registers, intrinsics, scheduling tests, Sail descriptions, and all
-        other required LLVM TableGen outputs.
+        other required LLVM TableGen outputs. It may be called several times
+        from the same interpreter, for example to generate several targets.
+        The stages whose build stamp matches are skipped (see pipeline), so
+        regenerating unchanged files is almost free.
+
+    Args:
+        adl_path (str): The ADL file describing the architecture.
+        target (str): The LLVM target (riscv32 or riscv64), None if not specified.
+        extensions (Iterable[str]): The extensions to generate, None or empty for all of them.
+        output_dir (str): The folder where the files are written, None to write them inside the repository.
+        no_sail (bool): True to skip the generation of the Sail description.
+        jobs (int): The number of generation stages run at the same time (see pipeline).
+        force (bool): True to run every stage, even the ones whose build stamp matches.
+        profiler (profiling.Profiler): Records the measures of every stage, None
+            to run the stages without measuring them (see profile_pipeline()).
 
     Returns:
         None
     """
+    generation_context = files.GenerationContext(target=target, adl_path=adl_path)
     config_file = "config.txt"
     llvm_config = "llvm_config.txt"
     path = os.getcwd()
@@ -35,41 +95,9 @@ def main():
         list_dir.append(fname)
     config_file = os.path.dirname(__file__).replace("\\", "/") + "/" + "config.txt"
     llvm_config = os.path.dirname(__file__).replace("\\", "/") + "/" + "llvm_config.txt"
+    # The stages read the ADL file through config.override() (see pipeline), config.txt is left untouched
     config_variables = config.config_environment(config_file, llvm_config)
-    f = open(config_file, "r")
-    lines = f.readlines()
-    line_copy = ""
-    for line in lines:
-        line_list = list(str(line).split(" "))
-        if "ADLName" in line_list:
-            if len(line_list) == 3:
-                line_list.remove(line_list[2])
-                line_list.append(sys.argv[1])
-                line_copy = line_list
-    f.close()
-    content = ""
-    for elem in range(len(line_copy) - 1):
-        content += line_copy[elem]
-        content += " "
-    content += line_copy[len(line_copy) - 1]
-    f = open(config_file, "w")
-    f.write(lines[0])
-    f.close()
-    f = open(config_file, "a")
-    for line in lines[1:]:
-        line_list = list(str(line).split(" "))
-        if "ADLName" in line_list:
-            f.write(str(content))
-            f.write("\n")
-        else:
-            f.write(line)
-    f.close()
-    config_variables = config.config_environment(config_file, llvm_config)
-    regclass = adl_parser.parse_registers_from_adl(config_variables["ADLName"])
-    alias_regs = adl_parser.get_alias_for_regs(config_variables["ADLName"])
-    instrfield = adl_parser.get_instrfield_offset(config_variables["ADLName"])
-    instrfield_offset = instrfield[0]
-    instrfield_ref = instrfield[1]
+    config_variables["ADLName"] = adl_path
     config_variables["RegisterInfoFile"] = (
         os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', config_variables["RegisterInfoFile"])
     )
@@ -91,372 +119,501 @@ def main():
         os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', config_variables["CallingConventionFile"])
     )
     config_variables["RelocationFile"] = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', config_variables["RelocationFile"])
-    extensions_list = list()
-    output_dir = ""
-    no_sail = False
-    parser = argparse.ArgumentParser()
-    parser.add_argument("file", type=str)
-    parser.add_argument("--target", dest="target", type=str)
-    parser.add_argument("--extension", "-e", dest="extension", type=str)  # Elimină "="
-    parser.add_argument("--output", "-o", dest='output', type=str)
-    parser.add_argument("--no-sail", dest="no_sail", type=str)
-    args = parser.parse_args()
-    if args.extension is None:
-        extensions_list = list()
-    else:
-        extensions = args.extension
-        extensions = extensions.replace("'", "").replace("[", "").replace("]", "")
-        extensions_list = extensions.split(",")
-    output_dir = args.output
-    no_sail = args.no_sail
-    if no_sail is None:
-        no_sail = False
-    output_dir_refresh = False
-    if output_dir != "" and output_dir is not None:
-        file_name = os.path.basename(config_variables["RegisterInfoFile"])
-        output_dir = os.path.abspath(output_dir).replace("\\","/")
-        if output_dir.endswith("/") is False:
-            output_dir += "/"
-        if os.path.exists(output_dir):
-            if output_dir_refresh is False:
-                shutil.rmtree(output_dir, ignore_errors=True)    
-                output_dir_refresh = True
-                if os.path.exists(output_dir) is False:
-                    os.makedirs(output_dir)
-                    os.chmod(output_dir, 0o777)
-        else:
-            os.makedirs(output_dir)
-            os.chmod(output_dir, 0o777)
-            output_dir_refresh = True
-        config_variables['RegisterInfoFile'] = output_dir + file_name
-        legalDisclaimer.get_copyright(config_variables["RegisterInfoFile"])
-        files.generate_file(
-            regclass,
-            config_variables["RegisterInfoFile"],
-            config_variables,
-            alias_regs,
-            instrfield_offset,
-            instrfield_ref,
-        )
-        files.generate_accumulator_register(
-            config_variables["RegisterInfoFile"],
-            config_variables["RegAltNameIndex"],
-            config_variables["RegisterClass"],
-            config_variables["Namespace"],
-        )
-    else:
-        if os.path.exists(config_variables["RegisterInfoFile"]):
-            os.remove(config_variables["RegisterInfoFile"])
-        legalDisclaimer.get_copyright(config_variables["RegisterInfoFile"])
-        files.generate_file(
-            regclass,
-            config_variables["RegisterInfoFile"],
-            config_variables,
-            alias_regs,
-            instrfield_offset,
-            instrfield_ref,
-        )
-        files.generate_accumulator_register(
-            config_variables["RegisterInfoFile"],
-            config_variables["RegAltNameIndex"],
-            config_variables["RegisterClass"],
-            config_variables["Namespace"],
+    extensions_list = list(extensions) if extensions else list()
+    tools_dir = os.path.dirname(os.path.abspath(__file__))
+    try:
+        digest = model_cache.cache_key(
+            generation_context.adl_path,
+            [config_file, llvm_config] + sorted(glob.glob(os.path.join(tools_dir, "*.py"))),
         )
-    files.generate_sched_tests(config_variables["TestScheduling"], extensions_list)
-    files.generate_scheduling_ref(config_variables["TestScheduling"], extensions_list)
-    if output_dir != "" and output_dir is not None:
-        file_name = os.path.basename(config_variables["ScheduleFileTable"])
-        scheduling_table_dict = adl_parser.parse_sched_table_from_adl(config_variables["ADLName"])
-        output_dir = os.path.abspath(output_dir).replace("\\","/")
-        if output_dir.endswith("/") is False:
-            output_dir += "/"
-        if os.path.exists(output_dir):
-            if output_dir_refresh is False:
-                shutil.rmtree(output_dir, ignore_errors=True)    
-                output_dir_refresh = True
-                os.makedirs(output_dir)
-                os.chmod(output_dir, 0o777)
-        else:
-            os.makedirs(output_dir)
-            os.chmod(output_dir, 0o777)
-            output_dir_refresh = True
-        config_variables['ScheduleFileTable'] = output_dir + file_name
-        config_variables['SchedulePath'] = output_dir
-        files.generate_scheduling_table(config_variables["ScheduleFileTable"], config_variables['SchedulePath'])
-    else:
-        files.generate_scheduling_table(config_variables["ScheduleFileTable"], config_variables['SchedulePath'])
+    except FileNotFoundError:
+        # Reported by the first stage reading the model
+        digest = None
+    build_key = pipeline.run_key(digest, target, extensions_list, no_sail) if digest else None
     if output_dir != "" and output_dir is not None:
-        file_name = os.path.basename(config_variables["InstructionInfoFile"])
-        output_dir = os.path.abspath(output_dir).replace("\\","/")
-        if output_dir.endswith("/") is False:
-            output_dir += "/"
-        if os.path.exists(output_dir):
-            if output_dir_refresh is False:
-                shutil.rmtree(output_dir, ignore_errors=True)    
-                output_dir_refresh = True
-                os.makedirs(output_dir)
-                os.chmod(output_dir, 0o777)
-        else:
-            os.makedirs(output_dir)
-            os.chmod(output_dir, 0o777)
-            output_dir_refresh = True
-        config_variables['InstructionInfoFile'] = output_dir + file_name
-        legalDisclaimer.get_copyright(config_variables["InstructionInfoFile"])
-        files.generate_file_instructions(
-            config_variables["InstructionInfoFile"], extensions_list
-        )
+        output_dir, stale = _prepare_output_dir(output_dir, force or build_key is None, build_key)
+        for key in [
+            "RegisterInfoFile",
+            "ScheduleFileTable",
+            "InstructionInfoFile",
+            "InstructionFormatFile",
+            "OperandsFile",
+            "OperandsFile16",
+            "CallingConventionFile",
+            "RelocationFile",
+            "IntrinsicsFile",
+            "BuiltinFile",
+            "BuiltinHeader",
+            "MemoryOperand",
+            "SailDescription",
+        ]:
+            config_variables[key] = output_dir + os.path.basename(config_variables[key])
+        config_variables["SchedulePath"] = output_dir
+        include_path = os.path.abspath(output_dir).replace("\\","/")
     else:
-        if os.path.exists(config_variables["InstructionInfoFile"]):
-            os.remove(config_variables["InstructionInfoFile"])
-        legalDisclaimer.get_copyright(config_variables["InstructionInfoFile"])
-        files.generate_file_instructions(
-            config_variables["InstructionInfoFile"], extensions_list
+        output_dir = None
+        for key in ["CallingConventionFile", "IntrinsicsFile", "BuiltinHeader", "BuiltinFile", "MemoryOperand", "SailDescription"]:
+            config_variables[key] = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', config_variables[key])
+        stale = list()
+        include_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', os.path.dirname(config_variables['BuiltinHeader'])).replace("\\","/")
+    scheduling_tests = os.path.join(tools_dir, config_variables["TestScheduling"])
+    stages = [
+        pipeline.Stage(
+            "register_info",
+            _generate_register_info,
+            (config_variables,),
+            outputs=(
+                "registers_define",
+                "register_classes",
+                "register_references",
+                "reg_instrfields",
+                "instrfields_values",
+                "alias_register_dict",
+                "register_classes_width",
+                "RegisterInfoFile",
+            ),
+            products=(config_variables["RegisterInfoFile"],),
+        ),
+        pipeline.Stage(
+            "sched_tests",
+            files.generate_sched_tests,
+            (config_variables["TestScheduling"], extensions_list),
+            inputs=("register_classes", "reg_instrfields", "instrfields_values", "alias_register_dict"),
+            outputs=(
+                "scheduling_tests_struct",
+                "sched_app_regs_dep",
+                "sched_app_regs",
+                "aux_scheduling_table_param",
+                "TestScheduling",
+            ),
+            products=(scheduling_tests,),
+        ),
+        pipeline.Stage(
+            "sched_ref",
+            files.generate_scheduling_ref,
+            (config_variables["TestScheduling"], extensions_list),
+            inputs=("scheduling_tests_struct", "sched_app_regs_dep", "sched_app_regs", "aux_scheduling_table_param"),
+            outputs=("TestScheduling",),
+            products=(scheduling_tests,),
+        ),
+        pipeline.Stage(
+            "sched_table",
+            files.generate_scheduling_table,
+            (config_variables["ScheduleFileTable"], config_variables["SchedulePath"]),
+            inputs=("alias_register_dict", "aux_scheduling_table_param"),
+            outputs=("scheduling_instr_info", "ScheduleFileTable"),
+            products=(config_variables["ScheduleFileTable"],),
+        ),
+        pipeline.Stage(
+            "instr_info",
+            _generate_instruction_info,
+            (config_variables, extensions_list),
+            inputs=("register_classes", "scheduling_instr_info"),
+            outputs=(
+                "instrfield_classes",
+                "alias_instruction_syntax_dict",
+                "instructions_load_store",
+                "register_references",
+                "register_pairs",
+                "instruction_encoding_dict",
+                "memory_operands_registers_list",
+                "instruction_registers_used_ins",
+                "instruction_registers_used_outs",
+                "register_classes_width",
+                "InstructionInfoFile",
+            ),
+            products=(config_variables["InstructionInfoFile"],),
+        ),
+        pipeline.Stage(
+            "register_pairs",
+            files.generate_register_pairs,
+            (config_variables["RegisterInfoFile"],),
+            inputs=("register_pairs",),
+            outputs=("RegisterInfoFile",),
+            products=(config_variables["RegisterInfoFile"],),
+        ),
+        pipeline.Stage(
+            "instr_formats",
+            _generate_instruction_formats,
+            (config_variables, output_dir),
+            outputs=("InstructionFormatFile",),
+            products=(config_variables["InstructionFormatFile"],),
+        ),
+        pipeline.Stage(
+            "operands",
+            _generate_operands,
+            (config_variables,),
+            inputs=("instrfield_classes",),
+            outputs=("singleton_list", "OperandsFile"),
+            products=(config_variables["OperandsFile"], config_variables["OperandsFile16"]),
+        ),
+        pipeline.Stage(
+            "aliases",
+            _generate_aliases,
+            (config_variables, extensions_list),
+            inputs=(
+                "register_classes",
+                "alias_instruction_syntax_dict",
+                "memory_operands_registers_list",
+                "instruction_registers_used_ins",
+                "instruction_registers_used_outs",
+            ),
+            outputs=("register_classes_width", "InstructionInfoFile"),
+            products=(config_variables["InstructionInfoFile"],),
+        ),
+        pipeline.Stage(
+            "calling_convention",
+            _generate_calling_convention,
+            (config_variables,),
+            outputs=("CallingConventionFile",),
+            products=(config_variables["CallingConventionFile"],),
+        ),
+        pipeline.Stage(
+            "relocations",
+            _generate_relocations,
+            (config_variables,),
+            outputs=("RelocationFile",),
+            products=(config_variables["RelocationFile"],),
+        ),
+        pipeline.Stage(
+            "intrinsics",
+            _generate_intrinsics,
+            (config_variables, extensions_list),
+            outputs=("attributes_list", "attributes_list_intrinsics", "IntrinsicsFile"),
+            products=(
+                config_variables["IntrinsicsFile"],
+                config_variables["BuiltinFile"],
+                config_variables["BuiltinHeader"],
+            ),
+        ),
+        pipeline.Stage(
+            "memory_operand",
+            files.generate_operand_mem_wrapper_class,
+            (config_variables["MemoryOperand"],),
+            inputs=("instructions_load_store", "register_references"),
+            outputs=("MemoryOperand",),
+            products=(config_variables["MemoryOperand"],),
+        ),
+        pipeline.Stage(
+            "intrinsic_tests",
+            _generate_intrinsic_tests,
+            (config_variables["TestIntrinsics"], include_path),
+            outputs=("TestIntrinsics",),
+            products=(os.path.join(tools_dir, config_variables["TestIntrinsics"], "tests_intrinsics"),),
+        ),
+    ]
+    if no_sail is False:
+        stages.append(
+            pipeline.Stage(
+                "sail",
+                files.generate_sail_description,
+                (config_variables["SailDescription"], extensions_list),
+                inputs=("alias_register_dict", "instruction_encoding_dict"),
+                outputs=("SailDescription",),
+                products=(config_variables["SailDescription"],),
+            )
         )
-    if output_dir != "" and output_dir is not None:
-        file_name = os.path.basename(config_variables["RegisterInfoFile"])
-        output_dir = os.path.abspath(output_dir).replace("\\","/")
-        if output_dir.endswith("/") is False:
-            output_dir += "/"
-        if os.path.exists(output_dir):
-            if output_dir_refresh is False:
-                shutil.rmtree(output_dir, ignore_errors=True)    
-                output_dir_refresh = True
-                os.makedirs(output_dir)
-                os.chmod(output_dir, 0o777)
-        else:
-            os.makedirs(output_dir)
-            os.chmod(output_dir, 0o777)
-            output_dir_refresh = True
-        config_variables['RegisterInfoFile'] = output_dir + file_name
-        files.generate_register_pairs(config_variables["RegisterInfoFile"])
-    else:
-        files.generate_register_pairs(config_variables["RegisterInfoFile"])
-    if output_dir != "" and output_dir is not None:
+    stamp_dir = os.path.join(os.path.dirname(config_variables["RegisterInfoFile"]), pipeline.STAMP_DIR)
+    if force and os.path.exists(stamp_dir):
+        shutil.rmtree(stamp_dir, ignore_errors=True)
+    if digest is None:
+        stamp_dir = None
+    pipeline.run_stages(stages, generation_context, jobs, stamp_dir, digest, stale, profiler)
+    if stamp_dir is not None:
+        pipeline.store_run_key(stamp_dir, build_key)
+    del config_variables
+
+
+def profile_pipeline(adl_path, profile_json=None, cprofile_dir=None, **kwargs):
+    """
+    Runs run_pipeline() with every stage measured, then prints the measures
+    sorted by wall time (see profiling).
+
+    Args:
+        adl_path (str): The ADL file describing the architecture.
+        profile_json (str): The file where the measures are written as JSON, None to only print them.
+        cprofile_dir (str): The folder where a cProfile dump is written for every stage, None to skip them.
+        **kwargs: The other arguments of run_pipeline().
+
+    Returns:
+        profiling.Profiler: The measures of the run.
+    """
+    profiler = profiling.Profiler(cprofile_dir)
+    with profiler.run():
+        run_pipeline(adl_path, profiler=profiler, **kwargs)
+    print(profiler.report())
+    if profile_json is not None:
+        profiler.write_json(profile_json)
+    return profiler
+
+
+def _prepare_output_dir(output_dir: str, force: bool, key: str) -> tuple:
+    """
+    Creates the output folder. The files of a previous run are left in place
+    for the stages to regenerate them (see emitter.write_if_changed()), and
+    the ones the run does not generate again are removed once it completes. If
+    the folder holds the build stamps of a run with the same key, only the
+    stages whose stamp does not match replace their own files.
+
+    Args:
+        output_dir (str): The output folder given on the command line.
+        force (bool): True to remove the files of a previous run even if the
+            folder holds matching build stamps.
+        key (str): The key of the run, see pipeline.run_key().
+
+    Returns:
+        Tuple[str, List[str]]: The absolute path of the folder, ending with "/",
+            and the files of a previous run to remove unless the run generates
+            them again (see pipeline.run_stages()).
+    """
+    output_dir = os.path.abspath(output_dir).replace("\\","/")
+    if output_dir.endswith("/") is False:
+        output_dir += "/"
+    stale = list()
+    stamp_dir = output_dir + pipeline.STAMP_DIR
+    if os.path.exists(output_dir) and (force or pipeline.load_run_key(stamp_dir) != key):
+        # Without stamps every stage runs
+        shutil.rmtree(stamp_dir, ignore_errors=True)
+        for root, _, file_names in os.walk(output_dir):
+            stale.extend(os.path.join(root, file_name) for file_name in file_names)
+    if os.path.exists(output_dir) is False:
+        os.makedirs(output_dir)
+        os.chmod(output_dir, 0o777)
+    return output_dir, stale
+
+
+def _remove_previous(file_name: str):
+    """
+    Removes a file generated by a previous run, once the stage completes
+    without generating it again (see emitter).
+
+    Args:
+        file_name (str): The generated file.
+
+    Returns:
+        None
+    """
+    emitter.remove(file_name)
+
+
+def _generate_register_info(config_variables: dict, generation_context: files.GenerationContext):
+    """
+    Generates the register definitions of RegisterInfoFile.
+
+    Args:
+        config_variables (dict): The configuration of the run.
+        generation_context (files.GenerationContext): The context of the run.
+
+    Returns:
+        None
+    """
+    regclass = adl_parser.parse_registers_from_adl(config_variables["ADLName"])
+    alias_regs = adl_parser.get_alias_for_regs(config_variables["ADLName"])
+    instrfield = adl_parser.get_instrfield_offset(config_variables["ADLName"])
+    instrfield_offset = instrfield[0]
+    instrfield_ref = instrfield[1]
+    _remove_previous(config_variables["RegisterInfoFile"])
+    legalDisclaimer.get_copyright(config_variables["RegisterInfoFile"])
+    files.generate_file(
+        regclass,
+        config_variables["RegisterInfoFile"],
+        config_variables,
+        alias_regs,
+        instrfield_offset,
+        instrfield_ref,
+        generation_context=generation_context,
+    )
+    files.generate_accumulator_register(
+        config_variables["RegisterInfoFile"],
+        config_variables["RegAltNameIndex"],
+        config_variables["RegisterClass"],
+        config_variables["Namespace"],
+        generation_context=generation_context,
+    )
+
+
+def _generate_instruction_info(config_variables: dict, extensions_list: list, generation_context: files.GenerationContext):
+    """
+    Generates the instruction definitions of InstructionInfoFile.
+
+    Args:
+        config_variables (dict): The configuration of the run.
+        extensions_list (list): The extensions to generate.
+        generation_context (files.GenerationContext): The context of the run.
+
+    Returns:
+        None
+    """
+    _remove_previous(config_variables["InstructionInfoFile"])
+    legalDisclaimer.get_copyright(config_variables["InstructionInfoFile"])
+    files.generate_file_instructions(
+        config_variables["InstructionInfoFile"], extensions_list, generation_context=generation_context
+    )
+
+
+def _generate_instruction_formats(config_variables: dict, output_dir: str, generation_context: files.GenerationContext):
+    """
+    Generates the instruction formats of InstructionFormatFile.
+
+    Args:
+        config_variables (dict): The configuration of the run.
+        output_dir (str): The output folder, None when generating inside the repository.
+        generation_context (files.GenerationContext): The context of the run.
+
+    Returns:
+        None
+    """
+    _remove_previous(config_variables["InstructionFormatFile"])
+    legalDisclaimer.get_copyright(config_variables["InstructionFormatFile"])
+    if output_dir is not None:
         file_name = os.path.basename(config_variables["InstructionFormatFile"])
-        output_dir = os.path.abspath(output_dir).replace("\\","/")
-        if output_dir.endswith("/") is False:
-            output_dir += "/"
-        if os.path.exists(output_dir):
-            if output_dir_refresh is False:
-                shutil.rmtree(output_dir, ignore_errors=True)    
-                output_dir_refresh = True
-                os.makedirs(output_dir)
-                os.chmod(output_dir, 0o777)
-        else:
-            os.makedirs(output_dir)
-            os.chmod(output_dir, 0o777)
-            output_dir_refresh = True
-        config_variables['InstructionFormatFile'] = output_dir + file_name
-        legalDisclaimer.get_copyright(config_variables["InstructionFormatFile"])
         files.generate_instruction_format(config_variables["InstructionFormatFile"], config_variables["InstructionFormatFile"].replace(file_name, ""))
     else:
-        if os.path.exists(config_variables["InstructionFormatFile"]):
-            os.remove(config_variables["InstructionFormatFile"])
-        legalDisclaimer.get_copyright(config_variables["InstructionFormatFile"])
         files.generate_instruction_format(config_variables["InstructionFormatFile"], config_variables["InstructionFormatFile"])
-    if output_dir != "" and output_dir is not None:
-        file_name = os.path.basename(config_variables["OperandsFile"])
-        file_name_c = os.path.basename(config_variables["OperandsFile16"])
-        output_dir = os.path.abspath(output_dir).replace("\\","/")
-        if output_dir.endswith("/") is False:
-            output_dir += "/"
-        if os.path.exists(output_dir):
-            if output_dir_refresh is False:
-                shutil.rmtree(output_dir, ignore_errors=True)    
-                output_dir_refresh = True
-                os.makedirs(output_dir)
-                os.chmod(output_dir, 0o777)
-        else:
-            os.makedirs(output_dir)
-            os.chmod(output_dir, 0o777)
-            output_dir_refresh = True
-        config_variables['OperandsFile'] = output_dir + file_name
-        config_variables['OperandsFile16'] = output_dir + file_name_c
-        legalDisclaimer.get_copyright(config_variables["OperandsFile"])
-        legalDisclaimer.get_copyright(config_variables["OperandsFile16"])
-        files.write_imms_classes(
-            config_variables["OperandsFile"],
-            config_variables["OperandsFile16"],
-            files.instrfield_classes,
-            adl_parser.parse_instructions_from_adl(config_variables["ADLName"])[0],
-        )
-    else:
-        if os.path.exists(config_variables["OperandsFile"]):
-            os.remove(config_variables["OperandsFile"])
-        legalDisclaimer.get_copyright(config_variables["OperandsFile"])
-        if os.path.exists(config_variables["OperandsFile16"]):
-            os.remove(config_variables["OperandsFile16"])
-        legalDisclaimer.get_copyright(config_variables["OperandsFile16"])
-        files.write_imms_classes(
-            config_variables["OperandsFile"],
-            config_variables["OperandsFile16"],
-            files.instrfield_classes,
-            adl_parser.parse_instructions_from_adl(config_variables["ADLName"])[0],
-        )
-    if output_dir != "" and output_dir is not None:
-        file_name = os.path.basename(config_variables["InstructionInfoFile"])
-        output_dir = os.path.abspath(output_dir).replace("\\","/")
-        if output_dir.endswith("/") is False:
-            output_dir += "/"
-        if os.path.exists(output_dir):
-            if output_dir_refresh is False:
-                shutil.rmtree(output_dir, ignore_errors=True)    
-                output_dir_refresh = True
-                os.makedirs(output_dir)
-                os.chmod(output_dir, 0o777)
-        else:
-            os.makedirs(output_dir)
-            os.chmod(output_dir, 0o777)
-            output_dir_refresh = True
-        config_variables['InstructionInfoFile'] = output_dir + file_name
-        adl_parser.parse_instructions_aliases_from_adl(config_variables["ADLName"])
-        files.write_instructions_aliases(
-            config_variables["InstructionInfoFile"], config_variables["InstructionInfoFile"], extensions_list
-        )
-    else:
-        adl_parser.parse_instructions_aliases_from_adl(config_variables["ADLName"])
-        files.write_instructions_aliases(
-            config_variables["InstructionInfoFile"], config_variables["InstructionInfoFile"], extensions_list
-        )
+
+
+def _generate_operands(config_variables: dict, generation_context: files.GenerationContext):
+    """
+    Generates the operand classes of OperandsFile and OperandsFile16.
+
+    Args:
+        config_variables (dict): The configuration of the run.
+        generation_context (files.GenerationContext): The context of the run.
+
+    Returns:
+        None
+    """
+    _remove_previous(config_variables["OperandsFile"])
+    legalDisclaimer.get_copyright(config_variables["OperandsFile"])
+    _remove_previous(config_variables["OperandsFile16"])
+    legalDisclaimer.get_copyright(config_variables["OperandsFile16"])
+    files.write_imms_classes(
+        config_variables["OperandsFile"],
+        config_variables["OperandsFile16"],
+        generation_context.instrfield_classes,
+        adl_parser.parse_instructions_from_adl(config_variables["ADLName"])[0],
+        generation_context=generation_context,
+    )
+
+
+def _generate_aliases(config_variables: dict, extensions_list: list, generation_context: files.GenerationContext):
+    """
+    Appends the instruction aliases to InstructionInfoFile.
+
+    Args:
+        config_variables (dict): The configuration of the run.
+        extensions_list (list): The extensions to generate.
+        generation_context (files.GenerationContext): The context of the run.
+
+    Returns:
+        None
+    """
+    adl_parser.parse_instructions_aliases_from_adl(config_variables["ADLName"])
+    files.write_instructions_aliases(
+        config_variables["InstructionInfoFile"], config_variables["InstructionInfoFile"], extensions_list,
+        generation_context=generation_context,
+    )
+
+
+def _generate_calling_convention(config_variables: dict, generation_context: files.GenerationContext):
+    """
+    Generates the calling convention of CallingConventionFile.
+
+    Args:
+        config_variables (dict): The configuration of the run.
+        generation_context (files.GenerationContext): The context of the run.
+
+    Returns:
+        None
+    """
     adl_parser.parse_registers_subregs(config_variables["ADLName"])
-    if output_dir != "" and output_dir is not None:
-        file_name = os.path.basename(config_variables["CallingConventionFile"])
-        output_dir = os.path.abspath(output_dir).replace("\\","/")
-        if output_dir.endswith("/") is False:
-            output_dir += "/"
-        if os.path.exists(output_dir):
-            if output_dir_refresh is False:
-                shutil.rmtree(output_dir, ignore_errors=True)    
-                output_dir_refresh = True
-                os.makedirs(output_dir)
-                os.chmod(output_dir, 0o777)
-        else:
-            os.makedirs(output_dir)
-            os.chmod(output_dir, 0o777)
-            output_dir_refresh = True
-        config_variables['CallingConventionFile'] = output_dir + file_name
-        legalDisclaimer.get_copyright(config_variables["CallingConventionFile"])
-        files.write_calling_convention(config_variables["CallingConventionFile"])
-    else:
-        config_variables["CallingConventionFile"] = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', config_variables["CallingConventionFile"])
-        if os.path.exists(config_variables["CallingConventionFile"]):
-            os.remove(config_variables["CallingConventionFile"])
-            legalDisclaimer.get_copyright(config_variables["CallingConventionFile"])
-        else:
-            legalDisclaimer.get_copyright(config_variables["CallingConventionFile"])
-        files.write_calling_convention(config_variables["CallingConventionFile"])
+    _remove_previous(config_variables["CallingConventionFile"])
+    legalDisclaimer.get_copyright(config_variables["CallingConventionFile"])
+    files.write_calling_convention(config_variables["CallingConventionFile"])
+
+
+def _generate_relocations(config_variables: dict, generation_context: files.GenerationContext):
+    """
+    Generates the relocation definitions of RelocationFile.
+
+    Args:
+        config_variables (dict): The configuration of the run.
+        generation_context (files.GenerationContext): The context of the run.
+
+    Returns:
+        None
+    """
     adl_parser.parse_relocations(config_variables["ADLName"])
-    if output_dir != "" and output_dir is not None:
-        file_name = os.path.basename(config_variables["RelocationFile"])
-        output_dir = os.path.abspath(output_dir).replace("\\","/")
-        if output_dir.endswith("/") is False:
-            output_dir += "/"
-        if os.path.exists(output_dir):
-            if output_dir_refresh is False:
-                shutil.rmtree(output_dir, ignore_errors=True)    
-                output_dir_refresh = True
-                os.makedirs(output_dir)
-                os.chmod(output_dir, 0o777)
-        else:
-            os.makedirs(output_dir)
-            os.chmod(output_dir, 0o777)
-            output_dir_refresh = True
-        config_variables['RelocationFile'] = output_dir + file_name
-        legalDisclaimer.get_copyright(config_variables["RelocationFile"])
-        files.generate_relocation_define(config_variables["RelocationFile"])
-    else:
-        if os.path.exists(config_variables["RelocationFile"]):
-            os.remove(config_variables["RelocationFile"])
-            legalDisclaimer.get_copyright(config_variables["RelocationFile"])
-        else:
-            legalDisclaimer.get_copyright(config_variables["RelocationFile"])
-        files.generate_relocation_define(config_variables["RelocationFile"])
-    if output_dir != "" and output_dir is not None:
-        file_name = os.path.basename(config_variables["IntrinsicsFile"])
-        builtin_file = os.path.basename(config_variables["BuiltinFile"])
-        header_file = os.path.basename(config_variables["BuiltinHeader"])
-        output_dir = os.path.abspath(output_dir).replace("\\","/")
-        if output_dir.endswith("/") is False:
-            output_dir += "/"
-        if os.path.exists(output_dir):
-            if output_dir_refresh is False:
-                shutil.rmtree(output_dir, ignore_errors=True)    
-                output_dir_refresh = True
-                os.makedirs(output_dir)
-                os.chmod(output_dir, 0o777)
-        else:
-            os.makedirs(output_dir)
-            os.chmod(output_dir, 0o777)
-            output_dir_refresh = True
-        config_variables['IntrinsicsFile'] = output_dir + file_name
-        config_variables['BuiltinFile'] = output_dir + builtin_file
-        config_variables['BuiltinHeader'] = output_dir + header_file
-        files.generate_intrinsics(config_variables["IntrinsicsFile"], extensions_list)
-        files.generate_builtin(
-            config_variables["BuiltinFile"],
-            config_variables["BuiltinHeader"],
-            extensions_list,
-        )
-    else:
-        if os.path.exists(config_variables["IntrinsicsFile"]):
-            os.remove(config_variables["IntrinsicsFile"])
-        config_variables["IntrinsicsFile"] = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', config_variables["IntrinsicsFile"])
-        config_variables["BuiltinHeader"] = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', config_variables["BuiltinHeader"])
-        config_variables["BuiltinFile"] = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', config_variables["BuiltinFile"])
-        files.generate_intrinsics(config_variables["IntrinsicsFile"], extensions_list)
-        files.generate_builtin(
-            config_variables["BuiltinFile"],
-            config_variables["BuiltinHeader"],
-            extensions_list,
-        )
-    if output_dir != "" and output_dir is not None:
-        file_name = os.path.basename(config_variables["MemoryOperand"])
-        output_dir = os.path.abspath(output_dir).replace("\\","/")
-        if output_dir.endswith("/") is False:
-            output_dir += "/"
-        if os.path.exists(output_dir):
-            if output_dir_refresh is False:
-                shutil.rmtree(output_dir, ignore_errors=True)    
-                output_dir_refresh = True
-                os.makedirs(output_dir)
-                os.chmod(output_dir, 0o777)
-        else:
-            os.makedirs(output_dir)
-            os.chmod(output_dir, 0o777)
-            output_dir_refresh = True
-        config_variables['MemoryOperand'] = output_dir + file_name
-        files.generate_operand_mem_wrapper_class(config_variables["MemoryOperand"])
-    else:
-        config_variables["MemoryOperand"] = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', config_variables["MemoryOperand"])
-        files.generate_operand_mem_wrapper_class(config_variables["MemoryOperand"])
-    if output_dir != "" and output_dir is not None:
-        include_path = os.path.abspath(output_dir).replace("\\","/")
-        files.generate_intrinsic_tests(config_variables['TestIntrinsics'], include_path)
+    _remove_previous(config_variables["RelocationFile"])
+    legalDisclaimer.get_copyright(config_variables["RelocationFile"])
+    files.generate_relocation_define(config_variables["RelocationFile"])
+
+
+def _generate_intrinsics(config_variables: dict, extensions_list: list, generation_context: files.GenerationContext):
+    """
+    Generates the intrinsics and the builtin definitions.
+
+    Args:
+        config_variables (dict): The configuration of the run.
+        extensions_list (list): The extensions to generate.
+        generation_context (files.GenerationContext): The context of the run.
+
+    Returns:
+        None
+    """
+    _remove_previous(config_variables["IntrinsicsFile"])
+    files.generate_intrinsics(config_variables["IntrinsicsFile"], extensions_list, generation_context=generation_context)
+    files.generate_builtin(
+        config_variables["BuiltinFile"],
+        config_variables["BuiltinHeader"],
+        extensions_list,
+        generation_context=generation_context,
+    )
+
+
+def _generate_intrinsic_tests(folder: str, include_path: str, generation_context: files.GenerationContext):
+    """
+    Generates the intrinsic tests.
+
+    Args:
+        folder (str): The folder of the intrinsic tests.
+        include_path (str): The folder of the builtin header included by the tests.
+        generation_context (files.GenerationContext): The context of the run.
+
+    Returns:
+        None
+    """
+    files.generate_intrinsic_tests(folder, include_path)
+
+
+def main():
+    """
+    Main entry point that orchestrates all generation steps required for the build.
+
+    Parses the command line and calls run_pipeline().
+
+    Returns:
+        None
+    """
+    args = command_line_parser().parse_args()
+    if args.no_cache:
+        model_cache.disable_cache()
+    extensions_list = list()
+    if args.extension is not None:
+        extensions_list = parse_extensions(args.extension)
+    arguments = dict(
+        target=args.target,
+        extensions=extensions_list,
+        output_dir=args.output,
+        no_sail=args.no_sail is not None,
+        jobs=args.jobs,
+        force=args.force,
+    )
+    if args.profile or args.profile_json is not None or args.profile_dir is not None:
+        profile_pipeline(args.file, args.profile_json, args.profile_dir, **arguments)
     else:
-        include_path = os.path.abspath(os.path.dirname(config_variables['BuiltinHeader'])).replace("\\","/")
-        include_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', os.path.dirname(config_variables['BuiltinHeader'])).replace("\\","/")
-        files.generate_intrinsic_tests(config_variables['TestIntrinsics'], include_path)
-    if no_sail is False:
-        if output_dir != "" and output_dir is not None:
-            file_name = os.path.basename(config_variables["SailDescription"])
-            output_dir = os.path.abspath(output_dir).replace("\\","/")
-            if output_dir.endswith("/") is False:
-                output_dir += "/"
-            if os.path.exists(output_dir):
-                if output_dir_refresh is False:
-                    shutil.rmtree(output_dir, ignore_errors=True)    
-                    output_dir_refresh = True
-                    os.makedirs(output_dir)
-                    os.chmod(output_dir, 0o777)
-            else:
-                os.makedirs(output_dir)
-                os.chmod(output_dir, 0o777)
-                output_dir_refresh = True
-            config_variables['SailDescription'] = output_dir + file_name
-            files.generate_sail_description(config_variables["SailDescription"], extensions_list)
-        else:
-            config_variables["SailDescription"] = os.path.join(os.path.abspath(os.path.dirname(__file__)), '..', config_variables["SailDescription"])
-            files.generate_sail_description(config_variables["SailDescription"], extensions_list)
-    del config_variables
+        run_pipeline(args.file, **arguments)
+
 
-main()
+if __name__ == "__main__":
+    main()
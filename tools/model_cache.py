@@ -0,0 +1,261 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+## @package model_cache
+#
+# Persistent on-disk cache for parsed ADL models
+#
+# Parsed models are stored as pickle blobs inside a local cache directory
+# (~/.cache/tools_adl by default). Each blob is keyed by the SHA-256 of the ADL
+# file, the tool version and the sources of the modules producing the model, so
+# a warm start loads the blob instead of walking the XML element tree again.
+# The least recently used blobs are evicted once the directory grows past its
+# size cap.
+#
+# Environment variables:
+#   TOOLS_ADL_CACHE_DIR   - overrides the cache directory
+#   TOOLS_ADL_CACHE_SIZE  - size cap of the cache directory in MB (default 512)
+#   TOOLS_ADL_NO_CACHE    - disables the cache when set to a non-zero value
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+
+## Default size cap of the cache directory, in MB
+DEFAULT_CACHE_SIZE = 512
+
+## Suffix of the files stored inside the cache directory
+CACHE_SUFFIX = ".pickle"
+
+## Set to False by disable_cache() (for example by the --no-cache command line switch)
+_enabled = True
+
+## Tool version, read once per process
+_tool_version = None
+
+
+def disable_cache():
+    """
+    Disables the on-disk cache for the rest of the process.
+
+    Returns:
+        None
+    """
+    global _enabled
+    _enabled = False
+
+
+def cache_enabled() -> bool:
+    """
+    Checks whether parsed models may be read from or written to the cache.
+
+    Returns:
+        bool: False if the cache was disabled by disable_cache() or through the
+            TOOLS_ADL_NO_CACHE environment variable, True otherwise.
+    """
+    return _enabled and os.environ.get("TOOLS_ADL_NO_CACHE", "") in ("", "0")
+
+
+def cache_dir() -> str:
+    """
+    Returns the directory where the parsed models are stored.
+
+    Returns:
+        str: TOOLS_ADL_CACHE_DIR if set, otherwise tools_adl inside
+            XDG_CACHE_HOME or ~/.cache.
+    """
+    if os.environ.get("TOOLS_ADL_CACHE_DIR"):
+        return os.environ["TOOLS_ADL_CACHE_DIR"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "tools_adl")
+
+
+def cache_size_limit() -> int:
+    """
+    Returns the size cap of the cache directory.
+
+    Returns:
+        int: The size cap in bytes, taken from TOOLS_ADL_CACHE_SIZE (in MB) or
+            DEFAULT_CACHE_SIZE.
+    """
+    try:
+        size = int(os.environ.get("TOOLS_ADL_CACHE_SIZE", DEFAULT_CACHE_SIZE))
+    except ValueError:
+        size = DEFAULT_CACHE_SIZE
+    return size * 1024 * 1024
+
+
+def tool_version() -> str:
+    """
+    Returns the version of tools_adl.
+
+    The version is taken from the installed package metadata or, for a source
+    checkout, from pyproject.toml.
+
+    Returns:
+        str: The tool version, or "unknown" if it cannot be determined.
+    """
+    global _tool_version
+    if _tool_version is None:
+        _tool_version = "unknown"
+        try:
+            from importlib.metadata import version
+
+            _tool_version = version("tools_adl")
+        except Exception:
+            pyproject = os.path.join(
+                os.path.dirname(os.path.abspath(__file__)), "..", "pyproject.toml"
+            )
+            if os.path.exists(pyproject):
+                with open(pyproject, "r") as f:
+                    match = re.search(r'^version\s*=\s*"([^"]+)"', f.read(), re.M)
+                if match:
+                    _tool_version = match.group(1)
+    return _tool_version
+
+
+def _hash_file(digest, file_name):
+    """
+    Feeds the contents of a file into a hash object.
+
+    Args:
+        digest (hashlib._Hash): The hash object to update.
+        file_name (str): The file to read.
+
+    Returns:
+        None
+    """
+    with open(file_name, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+
+
+def cache_key(adl_file: str, dependencies=()) -> str:
+    """
+    Computes the cache key of a parsed model.
+
+    Args:
+        adl_file (str): The ADL file from which the model is parsed.
+        dependencies (Iterable[str]): Additional files (parser sources, configuration
+            files) whose contents affect the parsed model.
+
+    Returns:
+        str: The hexadecimal SHA-256 of the ADL file contents, the tool version and
+            the contents of the dependencies.
+
+    Raises:
+        FileNotFoundError: If the ADL file cannot be found.
+    """
+    digest = hashlib.sha256()
+    _hash_file(digest, adl_file)
+    digest.update(tool_version().encode())
+    for dependency in dependencies:
+        digest.update(b"\0")
+        if os.path.exists(dependency):
+            _hash_file(digest, dependency)
+    return digest.hexdigest()
+
+
+def _cache_path(namespace, key):
+    return os.path.join(cache_dir(), namespace + "-" + key + CACHE_SUFFIX)
+
+
+def load(namespace: str, key: str):
+    """
+    Loads a parsed model from the cache.
+
+    Args:
+        namespace (str): The name of the parser which stored the model.
+        key (str): The key returned by cache_key().
+
+    Returns:
+        Any: The cached model, or None if the cache is disabled, the model is not
+            cached or the cached blob cannot be read.
+    """
+    if cache_enabled() is False:
+        return None
+    path = _cache_path(namespace, key)
+    try:
+        with open(path, "rb") as f:
+            model = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+    try:
+        # The modification time records the last use for LRU eviction
+        os.utime(path)
+    except OSError:
+        pass
+    return model
+
+
+def store(namespace: str, key: str, model):
+    """
+    Stores a parsed model inside the cache and evicts the least recently used
+    models if the cache grows past its size cap.
+
+    Failing to write the cache is not an error, the model will simply be parsed
+    again next time.
+
+    Args:
+        namespace (str): The name of the parser which produced the model.
+        key (str): The key returned by cache_key().
+        model (Any): The picklable parsed model.
+
+    Returns:
+        None
+    """
+    if cache_enabled() is False:
+        return
+    directory = cache_dir()
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, _cache_path(namespace, key))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        prune(cache_size_limit())
+    except (OSError, pickle.PicklingError):
+        pass
+
+
+def prune(size_limit: int):
+    """
+    Removes the least recently used models until the cache fits its size cap.
+
+    Args:
+        size_limit (int): The maximum size of the cache directory in bytes.
+
+    Returns:
+        None
+    """
+    directory = cache_dir()
+    entries = list()
+    for fname in os.listdir(directory):
+        if fname.endswith(CACHE_SUFFIX):
+            path = os.path.join(directory, fname)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+    total = sum(entry[1] for entry in entries)
+    for _, size, path in sorted(entries):
+        if total <= size_limit:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
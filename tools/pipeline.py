@@ -0,0 +1,579 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+## @package pipeline
+#
+# Dependency graph of the generation stages run by main.run_pipeline()
+#
+# Every stage declares what it reads (inputs) and what it writes (outputs). The
+# names are either tables of files.GenerationContext (see GENERATION_STATE) or
+# output resources (the configuration key of the file or folder a stage
+# writes). A stage depends on every earlier stage which writes one of its
+# inputs or outputs, or which reads one of its outputs, so any schedule
+# respecting the graph produces the same files as running the stages one after
+# another in declaration order.
+#
+# Every stage function is called with the arguments of the stage and the
+# generation_context keyword argument, the ADL file of the context replacing the
+# one of config.txt (see config.override()). The files it generates are buffered by
+# the emitter module and written once the stage completes. With one job the
+# stages run in declaration order inside the current process and share the
+# context of the run. With more jobs the ready stages are submitted to a
+# process pool: the worker receives a context holding the tables the stage
+# reads or updates, and the tables it writes are merged back into the context
+# of the run once it completes.
+#
+# Build stamps: when a stamp folder is given, a stamp file is written for every
+# stage which completes. It holds the hash of the run digest (tool version,
+# generator sources, ADL file and configuration files), of the arguments of the
+# stage, of the target and ADL file of the context and of the tables it reads,
+# together with the tables it writes and the size and modification time of its
+# products. A stage whose stamp matches and whose products are unchanged since
+# the stamp was written is skipped and its tables are restored from the stamp.
+# A stage reruns when one of the stages it depends on reruns, and stages
+# appending to the same output file rerun together. The stamps are written once
+# all the stages have run. The files of an output folder generated by another
+# run (other extensions, target or model) are removed once the run completes,
+# unless it generates them again, see run_key().
+#
+# Unchanged outputs: every stage writes its files through the emitter, which
+# leaves the files regenerated with the same contents untouched, so that an ADL
+# change only touches the files whose contents depend on it.
+import concurrent.futures
+import contextlib
+import copy
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import config
+import emitter
+import files
+import profiling
+
+
+@dataclass
+class Stage:
+    """
+    Represents a generation step together with the context tables and outputs it touches.
+
+    The products are the files or folders the stage generates. A stage is only
+    skipped by its stamp when none of them was removed or modified since the
+    stamp was written.
+    """
+
+    name: str
+    function: Callable[..., Any]
+    args: Tuple[Any, ...] = ()
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    products: Tuple[str, ...] = ()
+
+    def state(self) -> List[str]:
+        """
+        Returns the context tables the stage reads or writes.
+
+        Returns:
+            List[str]: The table names, in GENERATION_STATE order.
+        """
+        used = set(self.inputs) | set(self.outputs)
+        return [name for name in files.GENERATION_STATE if name in used]
+
+
+def dependencies(stages: List[Stage]) -> Dict[str, Set[str]]:
+    """
+    Computes the stages each stage has to wait for.
+
+    Args:
+        stages (List[Stage]): The stages, in the order in which they run serially.
+
+    Returns:
+        Dict[str, Set[str]]: The names of the earlier stages each stage depends on.
+    """
+    graph = dict()
+    for index, stage in enumerate(stages):
+        reads = set(stage.inputs)
+        writes = set(stage.outputs)
+        graph[stage.name] = set()
+        for previous in stages[:index]:
+            if set(previous.outputs) & (reads | writes) or set(previous.inputs) & writes:
+                graph[stage.name].add(previous.name)
+    return graph
+
+## Version of the stamp format, part of every stamp key
+STAMP_VERSION = "1"
+
+## Name of the stamp folder, created inside the output folder
+STAMP_DIR = ".stamps"
+
+## Suffix of the stamp files stored inside the stamp folder
+STAMP_SUFFIX = ".stamp"
+
+## Name of the stamp recording the run which generated the output folder
+RUN_STAMP = "run" + STAMP_SUFFIX
+
+
+def _stamp_path(stamp_dir: str, stage: Stage) -> str:
+    return os.path.join(stamp_dir, stage.name + STAMP_SUFFIX)
+
+
+def _fingerprint(products: Tuple[str, ...]) -> List[Any]:
+    """
+    Describes the current state of the products of a stage.
+
+    Args:
+        products (Tuple[str, ...]): The files or folders generated by the stage.
+
+    Returns:
+        List[Any]: The size and modification time of every product file, None
+            for the missing products.
+    """
+    fingerprint = list()
+    for product in products:
+        if os.path.isdir(product):
+            entries = list()
+            for root, _, file_names in os.walk(product):
+                for file_name in file_names:
+                    path = os.path.join(root, file_name)
+                    stat = os.stat(path)
+                    entries.append((os.path.relpath(path, product), stat.st_size, stat.st_mtime_ns))
+            fingerprint.append(sorted(entries))
+        elif os.path.isfile(product):
+            stat = os.stat(product)
+            fingerprint.append((stat.st_size, stat.st_mtime_ns))
+        else:
+            fingerprint.append(None)
+    return fingerprint
+
+
+def stage_key(stage: Stage, generation_context: files.GenerationContext, digest: str) -> str:
+    """
+    Computes the stamp key of a stage.
+
+    Args:
+        stage (Stage): The stage.
+        generation_context (files.GenerationContext): The context holding the
+            target, the ADL file and the tables the stage reads, as they are
+            when the stage starts.
+        digest (str): The run digest, which covers the tool version, the
+            generator sources, the ADL file and the configuration files.
+
+    Returns:
+        str: The hexadecimal SHA-256 of the stage inputs.
+    """
+    key = hashlib.sha256()
+    for part in (
+        STAMP_VERSION,
+        digest,
+        stage.name,
+        repr(stage.args),
+        repr(generation_context.target),
+        repr(generation_context.adl_path),
+    ):
+        key.update(part.encode())
+        key.update(b"\0")
+    for name in stage.state():
+        key.update(name.encode())
+        key.update(pickle.dumps(getattr(generation_context, name), protocol=4))
+    return key.hexdigest()
+
+
+def load_stamp(stamp_dir: str, stage: Stage, key: str) -> Optional[Dict[str, Any]]:
+    """
+    Reads the tables written by a stage from its stamp.
+
+    Args:
+        stamp_dir (str): The stamp folder.
+        stage (Stage): The stage.
+        key (str): The key returned by stage_key().
+
+    Returns:
+        Dict[str, Any]: The tables written by the stage, or None if the stamp is
+            missing, does not match the key or a product of the stage was removed
+            or modified.
+    """
+    try:
+        with open(_stamp_path(stamp_dir, stage), "rb") as f:
+            stamp = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(stamp, dict) or stamp.get("key") != key:
+        return None
+    if stamp.get("products") != _fingerprint(stage.products):
+        return None
+    return stamp["state"]
+
+
+def store_stamp(stamp_dir: str, stage: Stage, key: str, state: Dict[str, Any]):
+    """
+    Writes the stamp of a completed stage, recording the current state of its products.
+
+    Failing to write the stamp is not an error, the stage will simply run again
+    next time.
+
+    Args:
+        stamp_dir (str): The stamp folder.
+        stage (Stage): The stage.
+        key (str): The key returned by stage_key() when the stage started.
+        state (Dict[str, Any]): The tables written by the stage.
+
+    Returns:
+        None
+    """
+    try:
+        os.makedirs(stamp_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=stamp_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                stamp = {"key": key, "state": state, "products": _fingerprint(stage.products)}
+                pickle.dump(stamp, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, _stamp_path(stamp_dir, stage))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except (OSError, pickle.PicklingError):
+        pass
+
+
+def remove_stamp(stamp_dir: str, stage: Stage):
+    """
+    Removes the stamp of a stage which is about to run, so that an interrupted
+    run never leaves a matching stamp next to partially written files.
+
+    Args:
+        stamp_dir (str): The stamp folder.
+        stage (Stage): The stage.
+
+    Returns:
+        None
+    """
+    try:
+        os.remove(_stamp_path(stamp_dir, stage))
+    except OSError:
+        pass
+
+
+def run_key(digest: str, *arguments: Any) -> str:
+    """
+    Computes the key of a run, which decides the set of files it generates.
+
+    Args:
+        digest (str): The run digest.
+        arguments: The arguments of the run (target, extensions...).
+
+    Returns:
+        str: The hexadecimal SHA-256 of the run.
+    """
+    key = hashlib.sha256()
+    for part in (STAMP_VERSION, digest, repr(arguments)):
+        key.update(part.encode())
+        key.update(b"\0")
+    return key.hexdigest()
+
+
+def load_run_key(stamp_dir: str) -> Optional[str]:
+    """
+    Reads the key of the run which generated the stamps of a folder.
+
+    Args:
+        stamp_dir (str): The stamp folder.
+
+    Returns:
+        str: The key given to store_run_key(), None if there is none.
+    """
+    try:
+        with open(os.path.join(stamp_dir, RUN_STAMP), "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def store_run_key(stamp_dir: str, key: str):
+    """
+    Records the key of the run which generated the stamps of a folder.
+
+    Args:
+        stamp_dir (str): The stamp folder.
+        key (str): The key returned by run_key().
+
+    Returns:
+        None
+    """
+    try:
+        os.makedirs(stamp_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=stamp_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(key)
+        os.replace(tmp_path, os.path.join(stamp_dir, RUN_STAMP))
+    except OSError:
+        pass
+
+
+def _written_state(stage: Stage, generation_context: files.GenerationContext) -> Dict[str, Any]:
+    return {
+        name: getattr(generation_context, name)
+        for name in stage.state()
+        if name in stage.outputs
+    }
+
+
+def plan_stages(
+    stages: List[Stage],
+    generation_context: files.GenerationContext,
+    stamp_dir: str,
+    digest: str,
+) -> Set[str]:
+    """
+    Finds the stages which can be skipped because their stamp matches, and
+    restores the tables they write into the context.
+
+    Args:
+        stages (List[Stage]): The stages, in the order in which they run serially.
+        generation_context (files.GenerationContext): The context of the run.
+        stamp_dir (str): The stamp folder.
+        digest (str): The run digest (see stage_key()).
+
+    Returns:
+        Set[str]: The names of the stages to skip.
+    """
+    graph = dependencies(stages)
+    restored = dict()
+    for stage in stages:
+        if graph[stage.name] <= restored.keys():
+            state = load_stamp(stamp_dir, stage, stage_key(stage, generation_context, digest))
+            if state is not None:
+                for name, value in state.items():
+                    setattr(generation_context, name, value)
+                restored[stage.name] = state
+    # A stage runs again when a stage it depends on runs, or when a later stage
+    # appending to one of its output files runs
+    changed = True
+    while changed:
+        changed = False
+        for index, stage in enumerate(stages):
+            if stage.name not in restored:
+                continue
+            products = set(stage.outputs) - set(files.GENERATION_STATE)
+            for other in stages:
+                if other.name not in restored and (
+                    other.name in graph[stage.name]
+                    or (products & set(other.outputs) and stages.index(other) > index)
+                ):
+                    del restored[stage.name]
+                    changed = True
+                    break
+    # Only the tables of the skipped stages are kept, the other stages produce
+    # theirs again
+    for name in files.GENERATION_STATE:
+        setattr(generation_context, name, type(getattr(generation_context, name))())
+    for stage in stages:
+        if stage.name in restored:
+            for name, value in restored[stage.name].items():
+                setattr(generation_context, name, value)
+    return set(restored.keys())
+
+
+def _run_stage(
+    stage: Stage,
+    generation_context: files.GenerationContext,
+    profile: bool = False,
+    cprofile_dir: Optional[str] = None,
+) -> Tuple[Dict[str, Any], Optional[profiling.StageProfile], Set[str]]:
+    """
+    Runs a stage inside a worker process.
+
+    Args:
+        stage (Stage): The stage to run.
+        generation_context (files.GenerationContext): The target of the run and the
+            tables the stage reads or updates.
+        profile (bool): True to measure the stage (see profiling).
+        cprofile_dir (str): The folder of the cProfile dumps, None to skip them.
+
+    Returns:
+        Tuple[Dict[str, Any], profiling.StageProfile, Set[str]]: The tables
+            written by the stage, its measures, None if it is not measured, and
+            the files it generated (see emitter.take_flushed()).
+    """
+    emitter.take_flushed()
+    try:
+        stage_profile = _call_stage(stage, generation_context, profile, cprofile_dir)
+    finally:
+        sys.stdout.flush()
+    return _written_state(stage, generation_context), stage_profile, emitter.take_flushed()
+
+
+def _call_stage(
+    stage: Stage,
+    generation_context: files.GenerationContext,
+    profile: bool = False,
+    cprofile_dir: Optional[str] = None,
+) -> Optional[profiling.StageProfile]:
+    """
+    Calls the function of a stage and writes the files it generated (see emitter).
+
+    The files are left untouched if the stage fails.
+
+    Args:
+        stage (Stage): The stage to run.
+        generation_context (files.GenerationContext): The context passed to the stage.
+        profile (bool): True to measure the stage (see profiling).
+        cprofile_dir (str): The folder of the cProfile dumps, None to skip them.
+
+    Returns:
+        profiling.StageProfile: The measures of the stage, None if it is not measured.
+    """
+    with contextlib.ExitStack() as stack:
+        if generation_context.adl_path is not None:
+            stack.enter_context(config.override(ADLName=generation_context.adl_path))
+        stage_profile = None
+        if profile:
+            stage_profile = stack.enter_context(profiling.measure(stage.name, cprofile_dir))
+        try:
+            stage.function(*stage.args, generation_context=generation_context)
+        except BaseException:
+            emitter.discard()
+            raise
+        emitter.flush()
+    return stage_profile
+
+
+def run_stages(
+    stages: List[Stage],
+    generation_context: files.GenerationContext,
+    jobs: int = 1,
+    stamp_dir: Optional[str] = None,
+    digest: Optional[str] = None,
+    stale: Iterable[str] = (),
+    profiler: Optional[profiling.Profiler] = None,
+):
+    """
+    Runs the generation stages, at most `jobs` of them at the same time.
+
+    The products of the stages which run keep their modification time when
+    their contents do not change (see emitter.write_if_changed()).
+
+    Args:
+        stages (List[Stage]): The stages, in the order in which they run serially.
+        generation_context (files.GenerationContext): The context of the run, which
+            holds the tables produced by the stages once they complete.
+        jobs (int): The number of worker processes, 1 to run every stage in the
+            current process.
+        stamp_dir (str): The folder holding the stage stamps, None to run every
+            stage without reading or writing stamps.
+        digest (str): The run digest (see stage_key()), required with a stamp folder.
+        stale (Iterable[str]): The files of a previous run, removed once every
+            stage has run unless one of them generated the file again.
+        profiler (profiling.Profiler): Records the measures of every stage, None
+            to run the stages without measuring them.
+
+    Returns:
+        None
+    """
+    skipped = set()
+    if stamp_dir is not None:
+        skipped = plan_stages(stages, generation_context, stamp_dir, digest)
+    if profiler is not None:
+        for stage in stages:
+            if stage.name in skipped:
+                profiler.add(profiling.StageProfile(stage.name, skipped=True))
+    keys = dict()
+    written = dict()
+    generated = set()
+    emitter.take_flushed()
+    if jobs <= 1:
+        for stage in stages:
+            if stage.name in skipped:
+                continue
+            if stamp_dir is not None:
+                remove_stamp(stamp_dir, stage)
+                keys[stage.name] = stage_key(stage, generation_context, digest)
+            stage_profile = _call_stage(
+                stage,
+                generation_context,
+                profiler is not None,
+                profiler.cprofile_dir if profiler is not None else None,
+            )
+            if stage_profile is not None:
+                profiler.add(stage_profile)
+            # Copied, as the following stages may update the same tables
+            written[stage.name] = copy.deepcopy(_written_state(stage, generation_context))
+        generated = emitter.take_flushed()
+    else:
+        _run_parallel(
+            stages, generation_context, jobs, skipped, stamp_dir, digest, keys, written, generated, profiler
+        )
+    for path in stale:
+        if os.path.abspath(path) not in generated:
+            emitter.remove(path)
+    emitter.flush()
+    if stamp_dir is not None:
+        for stage in stages:
+            if stage.name in written:
+                store_stamp(stamp_dir, stage, keys[stage.name], written[stage.name])
+
+
+def _run_parallel(
+    stages, generation_context, jobs, skipped, stamp_dir, digest, keys, written, generated, profiler=None
+):
+    """
+    Runs the stages which are not skipped inside a process pool (see run_stages()).
+
+    Args:
+        stages (List[Stage]): The stages, in the order in which they run serially.
+        generation_context (files.GenerationContext): The context of the run.
+        jobs (int): The number of worker processes.
+        skipped (Set[str]): The stages skipped because of their stamp.
+        stamp_dir (str): The stamp folder, None without stamps.
+        digest (str): The run digest (see stage_key()).
+        keys (Dict[str, str]): Filled with the stamp key of every stage run.
+        written (Dict[str, Dict[str, Any]]): Filled with the tables written by
+            every stage run.
+        generated (Set[str]): Filled with the files generated by every stage run.
+        profiler (profiling.Profiler): Records the measures of every stage run,
+            None to run the stages without measuring them.
+
+    Returns:
+        None
+    """
+    graph = dependencies(stages)
+    remaining = [stage for stage in stages if stage.name not in skipped]
+    completed = set(skipped)
+    running = dict()
+    sys.stdout.flush()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        while remaining or running:
+            for stage in list(remaining):
+                if graph[stage.name] <= completed:
+                    remaining.remove(stage)
+                    if stamp_dir is not None:
+                        remove_stamp(stamp_dir, stage)
+                        keys[stage.name] = stage_key(stage, generation_context, digest)
+                    worker_context = files.GenerationContext(
+                        target=generation_context.target,
+                        adl_path=generation_context.adl_path,
+                        **{name: getattr(generation_context, name) for name in stage.state()},
+                    )
+                    running[
+                        pool.submit(
+                            _run_stage,
+                            stage,
+                            worker_context,
+                            profiler is not None,
+                            profiler.cprofile_dir if profiler is not None else None,
+                        )
+                    ] = stage
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                stage = running.pop(future)
+                written[stage.name], stage_profile, stage_files = future.result()
+                generated.update(stage_files)
+                if stage_profile is not None:
+                    profiler.add(stage_profile, in_worker=True)
+                for name, value in written[stage.name].items():
+                    setattr(generation_context, name, value)
+                completed.add(stage.name)
@@ -0,0 +1,176 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+## @package profiling
+#
+# Per-stage profiling of the generation pipeline (--profile)
+#
+# Every stage run by pipeline.run_stages() is measured inside the process which
+# runs it: wall time, CPU time, peak memory allocated by Python (tracemalloc)
+# and number of ADL documents and configuration files parsed. The measures are
+# printed as a table sorted by wall time once the run completes, and may be
+# written as a JSON report. A cProfile dump may be written for every stage as
+# well, to be explored with pstats or snakeviz.
+import contextlib
+import cProfile
+import dataclasses
+import json
+import os
+import time
+import tracemalloc
+from typing import List, Optional
+
+import adl_model
+import config
+
+
+@dataclasses.dataclass
+class StageProfile:
+    """
+    Represents the measures of one generation stage.
+    """
+
+    ## Name of the stage
+    name: str
+    ## Elapsed wall time, in seconds
+    wall: float = 0.0
+    ## CPU time of the process running the stage, in seconds
+    cpu: float = 0.0
+    ## Peak memory allocated by Python while the stage ran, in bytes
+    peak_memory: int = 0
+    ## Number of ADL documents parsed by the stage
+    adl_parses: int = 0
+    ## Number of times the stage parsed the configuration files
+    config_loads: int = 0
+    ## True if the stage was skipped because of its build stamp
+    skipped: bool = False
+
+
+class Profiler:
+    """
+    Collects the measures of the stages of a run.
+
+    Args:
+        cprofile_dir (str): The folder where a cProfile dump is written for every
+            stage, None to skip the dumps.
+    """
+
+    def __init__(self, cprofile_dir: Optional[str] = None):
+        self.cprofile_dir = cprofile_dir
+        self.stages: List[StageProfile] = list()
+        self.total = StageProfile("total")
+        self._in_workers: List[StageProfile] = list()
+
+    @contextlib.contextmanager
+    def run(self):
+        """
+        Measures a whole run, whose stages are measured with measure() and
+        recorded with add().
+
+        The peak memory of the run is the largest peak of the run and of its
+        stages, and its parse counts include the stages run by worker processes.
+
+        Yields:
+            StageProfile: The measures of the run, filled when the run completes.
+        """
+        with measure("total") as self.total:
+            yield self.total
+        for profile in self.stages:
+            self.total.peak_memory = max(self.total.peak_memory, profile.peak_memory)
+        for profile in self._in_workers:
+            self.total.adl_parses += profile.adl_parses
+            self.total.config_loads += profile.config_loads
+
+    def add(self, profile: StageProfile, in_worker: bool = False):
+        """
+        Records the measures of a stage.
+
+        Args:
+            profile (StageProfile): The measures of the stage, as returned by measure().
+            in_worker (bool): True if the stage ran inside a worker process.
+
+        Returns:
+            None
+        """
+        self.stages.append(profile)
+        if in_worker:
+            self._in_workers.append(profile)
+
+    def report(self) -> str:
+        """
+        Formats the measures as a table sorted by wall time.
+
+        Returns:
+            str: The table, one line per stage and a final line for the run.
+        """
+        profiles = sorted(self.stages, key=lambda profile: profile.wall, reverse=True) + [self.total]
+        names = [profile.name + (" (skipped)" if profile.skipped else "") for profile in profiles]
+        width = max([len("stage")] + [len(name) for name in names])
+        lines = [
+            f"{'stage':{width}s} {'wall ms':>10s} {'cpu ms':>10s} {'peak MB':>9s} {'adl':>4s} {'cfg':>4s}"
+        ]
+        for name, profile in zip(names, profiles):
+            lines.append(
+                f"{name:{width}s} {profile.wall * 1000:10.1f} {profile.cpu * 1000:10.1f} "
+                f"{profile.peak_memory / (1024 * 1024):9.1f} {profile.adl_parses:4d} {profile.config_loads:4d}"
+            )
+        return "\n".join(lines)
+
+    def write_json(self, file_name: str):
+        """
+        Writes the measures as a JSON report.
+
+        Args:
+            file_name (str): The report file.
+
+        Returns:
+            None
+        """
+        report = {
+            "stages": [dataclasses.asdict(profile) for profile in self.stages],
+            "total": dataclasses.asdict(self.total),
+        }
+        with open(file_name, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+
+@contextlib.contextmanager
+def measure(name: str, cprofile_dir: Optional[str] = None):
+    """
+    Measures the code run inside the context, in the current process.
+
+    Args:
+        name (str): The name of the measured stage.
+        cprofile_dir (str): The folder where the cProfile dump of the stage is
+            written, as <name>.prof, None to skip the dump.
+
+    Yields:
+        StageProfile: The measures, filled when the context exits.
+    """
+    profile = StageProfile(name)
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    adl_parses = adl_model.parse_count
+    config_loads = config.parse_count
+    profiler = None
+    if cprofile_dir is not None:
+        profiler = cProfile.Profile()
+        profiler.enable()
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    try:
+        yield profile
+    finally:
+        profile.wall = time.perf_counter() - wall
+        profile.cpu = time.process_time() - cpu
+        if profiler is not None:
+            profiler.disable()
+            os.makedirs(cprofile_dir, exist_ok=True)
+            profiler.dump_stats(os.path.join(cprofile_dir, name + ".prof"))
+        profile.peak_memory = tracemalloc.get_traced_memory()[1]
+        if started_tracing:
+            tracemalloc.stop()
+        profile.adl_parses = adl_model.parse_count - adl_parses
+        profile.config_loads = config.parse_count - config_loads
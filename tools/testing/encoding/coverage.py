@@ -0,0 +1,122 @@
+# Copyright 2023-2026 NXP
+# SPDX-License-Identifier: BSD-2-Clause
+
+import itertools
+import math
+import random
+from typing import Iterator, List, Optional, Tuple
+
+## Coverage modes of make_test --coverage
+COVERAGE_MODES = ("sweep", "pairwise", "exhaustive", "random")
+
+
+def pairwise(value_counts: List[int]) -> Iterator[Tuple[int, ...]]:
+    """
+    Generate a covering array of strength 2: every pair of values of every two
+    operands appears in at least one test case.
+
+    The array is built with the In-Parameter-Order (IPOG) algorithm. The first
+    two operands start as their full product. Each following operand extends
+    the existing test cases with the value covering the most uncovered pairs
+    (horizontal growth). New test cases are then added for the pairs left
+    uncovered (vertical growth). Only the covering array is held in memory,
+    which grows with the square of the largest number of values rather than
+    with the product of all of them.
+
+    Args:
+        value_counts: Number of values of each operand
+
+    Returns:
+        Iterator[Tuple[int, ...]]: The index of the value of each operand, for every test case
+    """
+    if len(value_counts) < 2:
+        yield from itertools.product(*(range(count) for count in value_counts))
+        return
+    # None marks the positions any value may fill
+    rows: List[List[Optional[int]]] = [
+        [first, second] + [None] * (len(value_counts) - 2)
+        for first in range(value_counts[0])
+        for second in range(value_counts[1])
+    ]
+    for position in range(2, len(value_counts)):
+        uncovered = {
+            (previous, previous_value, value)
+            for previous in range(position)
+            for previous_value in range(value_counts[previous])
+            for value in range(value_counts[position])
+        }
+        # Horizontal growth
+        for row in rows:
+            best_value, best_gain = 0, -1
+            for value in range(value_counts[position]):
+                gain = sum(
+                    (previous, row[previous], value) in uncovered
+                    for previous in range(position)
+                )
+                if gain > best_gain:
+                    best_value, best_gain = value, gain
+            row[position] = best_value
+            uncovered.difference_update(
+                (previous, row[previous], best_value) for previous in range(position)
+            )
+        # Vertical growth
+        for previous, previous_value, value in sorted(uncovered):
+            for row in rows:
+                if row[position] == value and row[previous] is None:
+                    row[previous] = previous_value
+                    break
+            else:
+                row = [None] * len(value_counts)
+                row[previous] = previous_value
+                row[position] = value
+                rows.append(row)
+    for row in rows:
+        yield tuple(0 if value is None else value for value in row)
+
+
+def exhaustive(value_counts: List[int], budget: int) -> Iterator[Tuple[int, ...]]:
+    """
+    Generate every combination of the values of the operands, up to a budget.
+
+    When there are more combinations than the budget, the test cases are spread
+    evenly over the combinations, in the order of the full product, so that
+    every operand still varies.
+
+    Args:
+        value_counts: Number of values of each operand
+        budget: Maximum number of test cases
+
+    Returns:
+        Iterator[Tuple[int, ...]]: The index of the value of each operand, for every test case
+    """
+    total = math.prod(value_counts)
+    if total <= budget:
+        yield from itertools.product(*(range(count) for count in value_counts))
+        return
+    for case in range(budget):
+        index = case * total // budget
+        values = []
+        for count in reversed(value_counts):
+            index, value = divmod(index, count)
+            values.append(value)
+        yield tuple(reversed(values))
+
+
+def random_cases(
+    value_counts: List[int], count: int, seed: str
+) -> Iterator[Tuple[int, ...]]:
+    """
+    Generate test cases drawing the value of every operand at random.
+
+    Args:
+        value_counts: Number of values of each operand
+        count: Number of test cases
+        seed: Seed of the random generator; the same seed draws the same test cases
+
+    Returns:
+        Iterator[Tuple[int, ...]]: The index of the value of each operand, for every test case
+    """
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield tuple(rng.randrange(value_count) for value_count in value_counts)
+
@@ -5,6 +5,7 @@ import logging
 import os
 import shutil
 import sys
+from tools import model_cache
 from tools.testing import parse
 from tools.testing import utils
 from tools.testing.encoding import write_refs
@@ -29,12 +30,14 @@ def main() -> None:
     try:
         args = parse.parse_encoding_command_line_args()
         logger.info(f"Using ADL file: {args.adl_file_path}")
+        if args.no_cache:
+            model_cache.disable_cache()
     except Exception as e:
         logger.error(f"Failed to parse command line arguments: {e}")
         sys.exit(1)
 
     try:
-        cores = parse.get_cores_element(args.adl_file_path)
+        adl_model = parse.load_adl_model(args.adl_file_path)
         logger.info("Parsed info from ADL file.")
     except Exception as e:
         logger.error(f"Failed to parse ADL file: {e}")
@@ -42,7 +45,7 @@ def main() -> None:
 
     try:
         instructions = utils.filter_instructions(
-            parse.parse_instructions(cores), utils.load_llvm_config(), args.extensions
+            adl_model.instructions, utils.load_llvm_config(), args.extensions
         )
         logger.info(f"Loaded {len(instructions)} instructions.")
     except Exception as e:
@@ -97,13 +100,18 @@ def main() -> None:
         os.makedirs(path, exist_ok=True)
         logger.debug(f"Created directory: {path}")
 
-    logger.info("Starting encoding tests generation.")
-    write_tests.write_tests()
-    logger.info("Test generation completed.")
+    if args.two_pass:
+        logger.info("Starting encoding tests generation.")
+        write_tests.write_tests()
+        logger.info("Test generation completed.")
 
-    logger.info("Starting refs generation.")
-    write_refs.write_refs()
-    logger.info("Refs generation completed.")
+        logger.info("Starting refs generation.")
+        write_refs.write_refs()
+        logger.info("Refs generation completed.")
+    else:
+        logger.info("Starting encoding tests and refs generation.")
+        write_tests.write_tests(write_references=True)
+        logger.info("Test and refs generation completed.")
 
     logger.info("All operations completed successfully.")
 
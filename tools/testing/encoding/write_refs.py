@@ -4,23 +4,226 @@
 import os
 import re
 from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, TextIO
 from tools.testing import parse
 from tools.testing import utils
 
 
+def parse_test_line(
+    instruction: utils.Instruction, test_line: str
+) -> Optional[Dict[str, str]]:
+    """
+    Match the operand values of a test line with the operand names of the instruction syntax.
+
+    Args:
+        instruction: The Instruction object tested by the line
+        test_line: A line of the test file
+
+    Returns:
+        Dict[str, str]: The value of each operand, as written in the line, or None
+            if the line is not a test case of the instruction
+    """
+    # Pattern to match instruction lines
+    instruction_line_pattern = r"^\t" + re.escape(instruction.name)
+    if not re.match(instruction_line_pattern, test_line):
+        return None
+    current_line_instruction_parts = test_line.strip().split()
+    if len(current_line_instruction_parts) > 1:
+        current_line_operands = current_line_instruction_parts[1]
+    else:
+        current_line_operands = None
+
+    syntax_operands = re.findall(r"[\w]+", str(instruction.syntax.split()[1]))
+    current_line_operands_values = re.findall(r"[-\w]+", str(current_line_operands))
+    return {
+        key: value
+        for key, value in zip(syntax_operands, current_line_operands_values)
+    }
+
+
+def compile_encoders(
+    instruction: utils.Instruction,
+    instruction_map: Dict[str, utils.Instruction],
+    instrfield_map: Dict[str, utils.InstrField],
+) -> List[utils.InstructionEncoder]:
+    """
+    Compile the encoders of the test cases of an instruction.
+
+    Args:
+        instruction: The Instruction object tested by the test cases
+        instruction_map: All the instructions of the model by name, used to resolve aliases
+        instrfield_map: All the instruction fields of the model by name
+
+    Returns:
+        List[utils.InstructionEncoder]: The encoder of the instruction, or the
+            encoder of each instruction it is an alias of
+    """
+    # Check if instruction is alias
+    if instruction.aliases is None:
+        # Compile the encoder of a regular instruction
+        return [
+            utils.compile_instruction_encoder(
+                instruction.fields, instrfield_map, is_alias=False
+            )
+        ]
+    encoders = []
+    for alias in instruction.aliases:
+        # Build full field set: alias fields override base instruction fields
+        alias_fields = instruction_map[alias.name].fields.copy()
+        alias_fields.update(alias.fields)
+
+        encoders.append(
+            utils.compile_instruction_encoder(
+                alias_fields, instrfield_map, is_alias=True
+            )
+        )
+    return encoders
+
+
+def calculate_references(
+    instruction: utils.Instruction,
+    instruction_map: Dict[str, utils.Instruction],
+    instrfield_map: Dict[str, utils.InstrField],
+    operand_values: Dict[str, str],
+    encoders: Optional[List[utils.InstructionEncoder]] = None,
+) -> List[int]:
+    """
+    Calculate the expected encodings of a test case.
+
+    Args:
+        instruction: The Instruction object tested by the test case
+        instruction_map: All the instructions of the model by name, used to resolve aliases
+        instrfield_map: All the instruction fields of the model by name
+        operand_values: The value of each operand of the test case
+        encoders: The encoders returned by compile_encoders() for the instruction,
+            compiled for this test case only if None
+
+    Returns:
+        List[int]: The encoding of the instruction, or the encoding of each
+            instruction it is an alias of
+    """
+    if encoders is None:
+        encoders = compile_encoders(instruction, instruction_map, instrfield_map)
+    return [encoder.encode(operand_values) for encoder in encoders]
+
+
+def write_reference_header(f: TextIO) -> None:
+    """
+    Write the header of a reference file.
+
+    Args:
+        f: The reference file
+
+    Returns:
+        None
+    """
+    now = datetime.now()
+    f.write(f"# Copyright (c) {now.strftime('%Y')} NXP\n")
+    f.write("# SPDX-License-Identifier: BSD-2-Clause\n\n")
+
+
+def format_reference(ref: int, width: int, bit_endianness: str) -> Optional[str]:
+    """
+    Format an expected encoding as a line of a reference file.
+
+    Args:
+        ref: The expected encoding
+        width: Width of the instruction in bits
+        bit_endianness: Bit endianness of the model, "little" or "big"
+
+    Returns:
+        str: The line of the reference file, or None if the width or the bit
+            endianness is not supported
+    """
+    # Check instruction width
+    if width == 32:
+        return f".word {hex(ref)}\n"
+    if width != 16 or bit_endianness not in ("little", "big"):
+        return None
+    ref = str(hex(ref))
+    ref = ref[2:]
+    # Determine the length of the hex number
+    length = len(ref)
+    # Check bit endianness
+    if bit_endianness == "little":
+        # Move the last two bytes to the front and add '0x' as necessary
+        formatted_ref = (
+            "0x"
+            + ref[length - 2 :]
+            + ",0x"
+            + ("0" + ref[: length - 2] if len(ref) > 2 else "0" + ref[: length - 2])
+        )
+    else:
+        # Format by splitting with a comma and adding '0x' as necessary
+        formatted_ref = (
+            "0x"
+            + ("0" + ref[: length - 2] if len(ref) > 2 else "0" + ref[: length - 2])
+            + ",0x"
+            + ref[length - 2 :]
+        )
+    return f".byte {formatted_ref}\n"
+
+
+def write_reference_file(
+    ref_output_file: str,
+    instruction: utils.Instruction,
+    references_list: Iterable[int],
+    bit_endianness: str,
+) -> None:
+    """
+    Write the reference file holding the expected encodings of an instruction test file.
+
+    Args:
+        ref_output_file: Path to the reference file
+        instruction: The Instruction object
+        references_list: The expected encodings, in the order of the test cases
+        bit_endianness: Bit endianness of the model, "little" or "big"
+
+    Returns:
+        None
+    """
+    with open(ref_output_file, "w") as f:
+        write_reference_header(f)
+        for ref in references_list:
+            line = format_reference(ref, int(instruction.width), bit_endianness)
+            if line is not None:
+                f.write(line)
+
+
+## State shared with the processes writing the references, see _init_worker()
+_shared: Optional[Dict[str, Any]] = None
+
+
+def _init_worker(shared: Dict[str, Any]) -> None:
+    """
+    Install the state shared by all the instructions in the current process.
+
+    Args:
+        shared: The parsed command line and model information of write_refs()
+
+    Returns:
+        None
+    """
+    global _shared
+    _shared = shared
+
+
 def write_refs():
     """
     Generate reference files containing expected encoded values for instruction tests.
 
     Reads the generated test files, calculates the expected binary encoding for each
     test case, and writes reference files that can be used to validate the assembler output.
+    This is the two-pass mode of make_test; write_tests.write_tests() computes the
+    same references while it writes the tests. With --jobs, the instructions are
+    distributed over a process pool.
     """
     args = parse.parse_encoding_command_line_args()
     llvm_config = utils.load_llvm_config()
-    cores = parse.get_cores_element(args.adl_file_path)
+    adl_model = parse.load_adl_model(args.adl_file_path)
 
     # Parse ALL instructions first (before filtering to avoid alias errors)
-    all_instructions = parse.parse_instructions(cores)
+    all_instructions = adl_model.instructions
 
     # Create instruction_map from ALL instructions (not just filtered ones)
     instruction_map = {
@@ -32,10 +235,44 @@ def write_refs():
         all_instructions, llvm_config, args.extensions
     )
 
-    instrfields = parse.parse_instrfields(cores)
+    instrfields = adl_model.instrfields
     instrfield_map = {field.name: field for field in instrfields}
 
-    for instruction in instructions:
+    shared = {
+        "args": args,
+        "bit_endianness": adl_model.bit_endianness,
+        "instructions": instructions,
+        "instrfield_map": instrfield_map,
+        "instruction_map": instruction_map,
+    }
+    results = utils.run_instruction_jobs(
+        _write_instruction_refs,
+        _init_worker,
+        shared,
+        utils.group_instructions_by_name(instructions),
+        args.jobs,
+    )
+    for messages in results:
+        for message in messages:
+            print(message)
+
+
+def _write_instruction_refs(indices: List[int]) -> List[str]:
+    """
+    Write the reference file of instructions from their test file.
+
+    Args:
+        indices: Positions of the instructions in the filtered instruction list
+
+    Returns:
+        List[str]: The errors met, to be printed by the caller
+    """
+    args = _shared["args"]
+    instrfield_map = _shared["instrfield_map"]
+    instruction_map = _shared["instruction_map"]
+    messages = []
+
+    for instruction in [_shared["instructions"][index] for index in indices]:
         test_output_folder = utils.prepare_encoding_tests_output_folder(
             args.output_dir, args.adl_file_name, args.extensions, instruction.name
         )
@@ -45,121 +282,33 @@ def write_refs():
         )
         ref_output_file = os.path.join(ref_output_folder, f"{instruction.name}.asm")
 
-        # Pattern to match instruction lines
-        instruction_line_pattern = r"^\t" + re.escape(instruction.name)
-
         try:
             with open(test_output_file, "r") as f:
-
-                # Find all test lines
-                all_lines = f.readlines()
-                test_lines = [
-                    line.strip()
-                    for line in all_lines
-                    if re.match(instruction_line_pattern, line)
-                ]
-
                 # List to store references for each instruction test file
                 references_list = []
+                encoders = compile_encoders(
+                    instruction, instruction_map, instrfield_map
+                )
 
                 # For each test line, match the operand's name with its value
-                for current_test_line in test_lines:
-                    current_line_instruction_parts = current_test_line.split()
-                    if len(current_line_instruction_parts) > 1:
-                        current_line_instruction = current_line_instruction_parts[0]
-                        current_line_operands = current_line_instruction_parts[1]
-                    else:
-                        current_line_instruction = current_line_instruction_parts[0]
-                        current_line_operands = None
-
-                    syntax_operands = re.findall(
-                        r"[\w]+", str(instruction.syntax.split()[1])
-                    )
-                    current_line_operands_values = re.findall(
-                        r"[-\w]+", str(current_line_operands)
-                    )
-                    current_line_operand_value_dict = {
-                        key: value
-                        for key, value in zip(
-                            syntax_operands, current_line_operands_values
-                        )
-                    }
-                    reference = 0
-
-                    # Check if instruction is alias
-                    if instruction.aliases is None:
-                        # Calculate reference for regular instruction
-                        reference = utils.calculate_instruction_reference(
-                            instruction.fields,
-                            instrfield_map,
-                            current_line_operand_value_dict,
-                            is_alias=False,
-                        )
-                        references_list.append(reference)
-                    else:
-                        # Alias instruction
-                        for alias in instruction.aliases:
-                            # Build full field set: alias fields override base instruction fields
-                            alias_fields = instruction_map[alias.name].fields.copy()
-                            alias_fields.update(alias.fields)
-
-                            reference = utils.calculate_instruction_reference(
-                                alias_fields,
+                for line in f.readlines():
+                    current_line_operand_value_dict = parse_test_line(instruction, line)
+                    if current_line_operand_value_dict is not None:
+                        references_list.extend(
+                            calculate_references(
+                                instruction,
+                                instruction_map,
                                 instrfield_map,
                                 current_line_operand_value_dict,
-                                is_alias=True,
+                                encoders,
                             )
-                            references_list.append(reference)
-                f.close()
+                        )
         except IOError as e:
-            print(f"Error reading file {test_output_file}: {e}")
+            messages.append(f"Error reading file {test_output_file}: {e}")
             continue
 
         # Write the matched line to the corresponding file in the "references" directory
-        with open(ref_output_file, "w") as f:
-            now = datetime.now()
-            f.write(f"# Copyright (c) {now.strftime('%Y')} NXP\n")
-            f.write("# SPDX-License-Identifier: BSD-2-Clause\n\n")
-            # Check instruction width
-            if int(instruction.width) == 32:
-                for ref in references_list:
-                    f.write(f".word {hex(ref)}\n")
-            if int(instruction.width) == 16:
-                # Check bit endianness
-                if parse.bit_endianness(cores) == "little":
-                    for ref in references_list:
-                        ref = str(hex(ref))
-                        ref = ref[2:]
-                        # Determine the length of the hex number
-                        length = len(ref)
-                        # Move the last two bytes to the front and add '0x' as necessary
-                        formatted_ref = (
-                            "0x"
-                            + ref[length - 2 :]
-                            + ",0x"
-                            + (
-                                "0" + ref[: length - 2]
-                                if len(ref) > 2
-                                else "0" + ref[: length - 2]
-                            )
-                        )
-                        f.write(f".byte {formatted_ref}\n")
-                elif parse.bit_endianness(cores) == "big":
-                    for ref in references_list:
-                        ref = str(hex(ref))
-                        ref = ref[2:]
-                        # Determine the length of the hex number
-                        length = len(ref)
-                        # Format by splitting with a comma and adding '0x' as necessary
-                        formatted_ref = (
-                            "0x"
-                            + (
-                                "0" + ref[: length - 2]
-                                if len(ref) > 2
-                                else "0" + ref[: length - 2]
-                            )
-                            + ",0x"
-                            + ref[length - 2 :]
-                        )
-                        f.write(f".byte {formatted_ref}\n")
-            f.close()
+        write_reference_file(
+            ref_output_file, instruction, references_list, _shared["bit_endianness"]
+        )
+    return messages
@@ -1,10 +1,15 @@
 # Copyright 2023-2026 NXP
 # SPDX-License-Identifier: BSD-2-Clause
 
+import contextlib
 import os
 from datetime import datetime
+import math
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
 from tools.testing import utils
 from tools.testing import parse
+from tools.testing.encoding import coverage
+from tools.testing.encoding import write_refs
 
 
 def _write_header(
@@ -71,24 +76,213 @@ def _write_header(
         f.write(f"\n")
 
 
-def write_tests() -> None:
+## State shared with the processes writing the tests, see _init_worker()
+_shared: Optional[Dict[str, Any]] = None
+
+
+def _init_worker(shared: Dict[str, Any]) -> None:
+    """
+    Install the state shared by all the instructions in the current process.
+
+    Args:
+        shared: The parsed command line, model information and options of write_tests()
+
+    Returns:
+        None
+    """
+    global _shared
+    _shared = shared
+
+
+def write_tests(write_references: bool = False) -> None:
     """
     Generate encoding test cases for all instructions.
 
     Creates comprehensive test files by generating all possible operand value combinations
     for each instruction, writing assembly test cases that exercise different encoding scenarios.
+    With --jobs, the instructions are distributed over a process pool; each instruction
+    has its own output files, so the result is the same as a serial run.
+
+    Args:
+        write_references: Also calculate the expected encoding of each test case while it
+            is written, and write the reference file of each instruction next to its
+            tests, instead of reading the tests back with write_refs.write_refs()
     """
     args = parse.parse_encoding_command_line_args()
     llvm_config = utils.load_llvm_config()
-    cores = parse.get_cores_element(args.adl_file_path)
-    architecture, attributes, mattrib = parse.asm_config_info(cores)
+    adl_model = parse.load_adl_model(args.adl_file_path)
+    architecture, attributes, mattrib = adl_model.asm_config_info()
 
     instructions = utils.filter_instructions(
-        parse.parse_instructions(cores), llvm_config, args.extensions
+        adl_model.instructions, llvm_config, args.extensions
     )
-    instrfields = parse.parse_instrfields(cores)
+    instrfields = adl_model.instrfields
 
     instrfield_map = {field.name: field for field in instrfields}
+    # Aliases are resolved against ALL instructions, not just filtered ones
+    instruction_map = {
+        instruction.name: instruction for instruction in adl_model.instructions
+    }
+
+    shared = {
+        "args": args,
+        "architecture": architecture,
+        "mattrib": mattrib,
+        "bit_endianness": adl_model.bit_endianness,
+        "instructions": instructions,
+        "instrfield_map": instrfield_map,
+        "instruction_map": instruction_map,
+        "write_references": write_references,
+    }
+    utils.run_instruction_jobs(
+        _write_instruction_tests,
+        _init_worker,
+        shared,
+        utils.group_instructions_by_name(instructions),
+        args.jobs,
+    )
+
+
+def _operand_comment(
+    operand: str,
+    instrfield_map: Dict[str, utils.InstrField],
+    operand_values: Dict[str, List[str]],
+) -> str:
+    """
+    Describe the values tested for an operand.
+
+    Args:
+        operand: The operand name
+        instrfield_map: All the instruction fields of the model by name
+        operand_values: The values tested for each operand of the instruction
+
+    Returns:
+        str: The comment line of the test file
+    """
+    # Get the instrfield for this operand to find bit information
+    instrfield = instrfield_map.get(operand)
+    if not instrfield:
+        return f"#Testing operand {operand} with value {operand}\n"
+    # Calculate the number of bits for this operand
+    total_bits = (
+        sum(range_vals[0] - range_vals[1] + 1 for range_vals in instrfield.ranges)
+        if instrfield.ranges
+        else (instrfield.width or 0)
+    )
+    # Get the list of values for this operand
+    values_list = operand_values.get(operand, [operand])
+    return f"#Testing operand {operand} encoded on {total_bits} bits with {len(values_list)} values: {values_list}\n"
+
+
+def _coverage_comment(args: utils.EncodingCommandLineArgs, value_counts: List[int]) -> str:
+    """
+    Describe the operand combinations tested by a coverage mode other than sweep.
+
+    Args:
+        args: Command line arguments object
+        value_counts: Number of values of each operand
+
+    Returns:
+        str: The comment line of the test file
+    """
+    if args.coverage == "pairwise":
+        return "#Testing every pair of operand values\n"
+    if args.coverage == "exhaustive":
+        total = math.prod(value_counts)
+        if total <= args.coverage_budget:
+            return f"#Testing all the {total} combinations of operand values\n"
+        return f"#Testing {args.coverage_budget} of the {total} combinations of operand values\n"
+    return f"#Testing {args.random_count} random combinations of operand values (seed {args.seed})\n"
+
+
+def _coverage_cases(
+    args: utils.EncodingCommandLineArgs,
+    instruction: utils.Instruction,
+    value_counts: List[int],
+) -> Iterator[Tuple[int, ...]]:
+    """
+    Generate the operand combinations of a coverage mode other than sweep.
+
+    Args:
+        args: Command line arguments object
+        instruction: The Instruction object
+        value_counts: Number of values of each operand
+
+    Returns:
+        Iterator[Tuple[int, ...]]: The index of the value of each operand, for every test case
+    """
+    if args.coverage == "pairwise":
+        return coverage.pairwise(value_counts)
+    if args.coverage == "exhaustive":
+        return coverage.exhaustive(value_counts, args.coverage_budget)
+    # Seeded per instruction, so the test cases do not depend on --jobs
+    return coverage.random_cases(
+        value_counts, args.random_count, f"{args.seed}:{instruction.name}"
+    )
+
+
+def _write_test_case(
+    f: TextIO,
+    refs_file: Optional[TextIO],
+    instruction: utils.Instruction,
+    current: Dict[str, str],
+    encoders: Optional[List[utils.InstructionEncoder]],
+) -> None:
+    """
+    Write the test line of a test case, and the lines of its expected encodings.
+
+    Args:
+        f: The test file
+        refs_file: The reference file, None to skip the references
+        instruction: The Instruction object
+        current: The value of each operand of the test case
+        encoders: The encoders of the instruction, compiled by write_refs.compile_encoders()
+
+    Returns:
+        None
+    """
+    # Build operand string in original syntax order
+    mnemonic = instruction.syntax.split()[0]
+    operands_str = utils.substitute_operand_values(instruction.syntax, current)
+    f.write(f"\t{mnemonic} {operands_str}\n")
+    # Same test cases as write_refs.parse_test_line() finds in the written file
+    if refs_file is None or not mnemonic.startswith(instruction.name):
+        return
+    operand_value_dict = {
+        operand: str(current.get(operand, operand))
+        for operand in utils.get_instruction_operands(instruction.syntax)
+    }
+    for ref in write_refs.calculate_references(
+        instruction,
+        _shared["instruction_map"],
+        _shared["instrfield_map"],
+        operand_value_dict,
+        encoders,
+    ):
+        line = write_refs.format_reference(
+            ref, int(instruction.width), _shared["bit_endianness"]
+        )
+        if line is not None:
+            refs_file.write(line)
+
+
+def _write_instruction_tests(indices: List[int]) -> None:
+    """
+    Write the test file of instructions, and their reference file with write_references.
+
+    Args:
+        indices: Positions of the instructions in the filtered instruction list
+
+    Returns:
+        None
+    """
+    args = _shared["args"]
+    architecture = _shared["architecture"]
+    mattrib = _shared["mattrib"]
+    instrfield_map = _shared["instrfield_map"]
+    instruction_map = _shared["instruction_map"]
+    write_references = _shared["write_references"]
+    instructions = [_shared["instructions"][index] for index in indices]
 
     for instruction in instructions:
         output_folder = utils.prepare_encoding_tests_output_folder(
@@ -125,8 +319,23 @@ def write_tests() -> None:
                     instruction.excluded_values,
                     operand_name,
                 )
-        # Now, for each operand, sweep through its possible values
-        with open(output_file, "a") as f:
+        # Now, write the combinations of operand values of the coverage mode,
+        # streaming the expected encodings to the reference file with write_references
+        with contextlib.ExitStack() as stack:
+            f = stack.enter_context(open(output_file, "a"))
+            refs_file = None
+            encoders = None
+            if write_references:
+                encoders = write_refs.compile_encoders(
+                    instruction, instruction_map, instrfield_map
+                )
+                ref_output_folder = utils.prepare_encoding_refs_output_folder(
+                    args.output_dir, args.adl_file_name, args.extensions
+                )
+                refs_file = stack.enter_context(
+                    open(os.path.join(ref_output_folder, f"{instruction.name}.asm"), "w")
+                )
+                write_refs.write_reference_header(refs_file)
             # Build a default operand value mapping: for each operand, use its last value if available,
             # or the operand string itself if it's a fixed literal from the syntax.
             defaults = {
@@ -134,44 +343,37 @@ def write_tests() -> None:
                 for op in syntax_operands
             }
             f.write(f"{instruction.name}:\n")
-            # Iterate over each operand to sweep its possible values while keeping others at default
-            for target_operand in syntax_operands:
-                # Get the instrfield for this operand to find bit information
-                instrfield = instrfield_map.get(target_operand)
-                if instrfield:
-                    # Calculate the number of bits for this operand
-                    total_bits = (
-                        sum(
-                            range_vals[0] - range_vals[1] + 1
-                            for range_vals in instrfield.ranges
-                        )
-                        if instrfield.ranges
-                        else (instrfield.width or 0)
-                    )
-
-                    # Get the list of values for this operand
-                    values_list = operand_values.get(target_operand, [target_operand])
-
-                    # Print the testing information
+            if args.coverage == "sweep":
+                # Iterate over each operand to sweep its possible values while keeping others at default
+                for target_operand in syntax_operands:
                     f.write(
-                        f"#Testing operand {target_operand} encoded on {total_bits} bits with {len(values_list)} values: {values_list}\n"
+                        _operand_comment(target_operand, instrfield_map, operand_values)
                     )
-                else:
-                    f.write(
-                        f"#Testing operand {target_operand} with value {target_operand}\n"
-                    )
-                # Get the list of possible values for this operand, or just the operand string if none defined
-                for value in operand_values.get(target_operand, [target_operand]):
-                    # Copy defaults and replace current operand with the test value
-                    current = defaults.copy()
-                    current[target_operand] = value
-
-                    # Build operand string in original syntax order
-                    mnemonic = instruction.syntax.split()[0]
-                    operands_str = utils.substitute_operand_values(
-                        instruction.syntax, current
-                    )
-                    f.write(f"\t{mnemonic} {operands_str}\n")
+                    # Get the list of possible values for this operand, or just the operand string if none defined
+                    for value in operand_values.get(target_operand, [target_operand]):
+                        # Copy defaults and replace current operand with the test value
+                        current = defaults.copy()
+                        current[target_operand] = value
+                        _write_test_case(f, refs_file, instruction, current, encoders)
+                    f.write("\n")
+            elif syntax_operands:
+                # Combine the values of all the operands, streaming one test case at a time
+                operands = list(defaults)
+                values_lists = [
+                    operand_values.get(operand, [operand]) for operand in operands
+                ]
+                value_counts = [len(values) for values in values_lists]
+                for operand in operands:
+                    f.write(_operand_comment(operand, instrfield_map, operand_values))
+                f.write(_coverage_comment(args, value_counts))
+                for indices in _coverage_cases(args, instruction, value_counts):
+                    current = {
+                        operand: values[index]
+                        for operand, values, index in zip(
+                            operands, values_lists, indices
+                        )
+                    }
+                    _write_test_case(f, refs_file, instruction, current, encoders)
                 f.write("\n")
             f.write(f".{instruction.name}_end:\n")
             f.write(
@@ -5,6 +5,7 @@ import logging
 import os
 import shutil
 import sys
+from tools import model_cache
 from tools.testing import parse
 from tools.testing import utils
 from tools.testing.relocations import write_reloc_tests
@@ -31,12 +32,14 @@ def main() -> None:
     try:
         args = parse.parse_relocation_command_line_args()
         logger.info(f"Using ADL file: {args.adl_file_path}")
+        if args.no_cache:
+            model_cache.disable_cache()
     except Exception as e:
         logger.error(f"Failed to parse command line arguments: {e}")
         sys.exit(1)
 
     try:
-        cores = parse.get_cores_element(args.adl_file_path)
+        adl_model = parse.load_adl_model(args.adl_file_path)
         logger.info("Parsed info from ADL file.")
     except Exception as e:
         logger.error(f"Failed to parse ADL file: {e}")
@@ -44,7 +47,7 @@ def main() -> None:
 
     try:
         instructions = utils.filter_instructions(
-            parse.parse_instructions(cores), utils.load_llvm_config(), args.extensions
+            adl_model.instructions, utils.load_llvm_config(), args.extensions
         )
         logger.info(f"Loaded {len(instructions)} instructions.")
     except Exception as e:
@@ -72,7 +75,7 @@ def main() -> None:
         sys.exit(f"Available extensions: {sorted(available_attributes)}")
 
     # Check if any instructions use relocations
-    instrfields = parse.parse_instrfields(cores)
+    instrfields = adl_model.instrfields
     relocations_instructions_map = utils.get_relocation_instruction_mapping(
         instructions, instrfields
     )
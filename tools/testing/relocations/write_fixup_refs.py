@@ -105,13 +105,13 @@ def _setup_parsing_context(args):
                 relocation_abbrev_dict, relocation_field_width,
                 relocation_dependency_dict, bit_endianness)
     """
-    cores = parse.get_cores_element(args.adl_file_path)
+    adl_model = parse.load_adl_model(args.adl_file_path)
 
     # Parse ADL data
-    all_instructions = parse.parse_instructions(cores)
-    instrfields = parse.parse_instrfields(cores)
-    relocations = parse.parse_relocations(cores)
-    bit_endianness = parse.bit_endianness(cores)
+    all_instructions = adl_model.instructions
+    instrfields = adl_model.instrfields
+    relocations = adl_model.relocations
+    bit_endianness = adl_model.bit_endianness
 
     # Create mappings
     instruction_map = {instr.name: instr for instr in all_instructions}
@@ -458,8 +458,9 @@ def _calculate_references_for_file(
         instruction_width_dict,
     )
 
-    # Calculate references for each line
+    # Calculate references for each line, compiling each instruction encoder once
     references_list = []
+    encoders = {}
     for line in matching_lines:
         # Calculate fixup value
         fixup_value = _calculate_fixup_value(
@@ -512,9 +513,11 @@ def _calculate_references_for_file(
         )
 
         # Calculate reference
-        reference = utils.calculate_instruction_reference(
-            fields, instrfield_map, current_line_operand_value_dict, is_alias=is_alias
-        )
+        if line_instruction not in encoders:
+            encoders[line_instruction] = utils.compile_instruction_encoder(
+                fields, instrfield_map, is_alias=is_alias
+            )
+        reference = encoders[line_instruction].encode(current_line_operand_value_dict)
         references_list.append(reference)
 
     return references_list
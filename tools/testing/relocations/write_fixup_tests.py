@@ -21,21 +21,21 @@ def generate_fixup_tests() -> None:
 
     # Get command line arguments
     args = parse.parse_relocation_command_line_args()
-    cores = parse.get_cores_element(args.adl_file_path)
+    adl_model = parse.load_adl_model(args.adl_file_path)
 
     # Parse ADL data
     llvm_config = utils.load_llvm_config()
 
     # Parse all instructions first (before filtering)
-    all_instructions = parse.parse_instructions(cores)
+    all_instructions = adl_model.instructions
 
     # Filter instructions based on extensions
     instructions = utils.filter_instructions(
         all_instructions, llvm_config, args.extensions
     )
 
-    relocations = parse.parse_relocations(cores)
-    instrfields = parse.parse_instrfields(cores)
+    relocations = adl_model.relocations
+    instrfields = adl_model.instrfields
 
     # Create mappings
     instruction_map = {instr.name: instr for instr in instructions}
@@ -100,7 +100,7 @@ def generate_fixup_tests() -> None:
     os.makedirs(tests_dir, exist_ok=True)
 
     # Get architecture info using existing functions
-    architecture, attributes, mattrib = parse.asm_config_info(cores)
+    architecture, attributes, mattrib = adl_model.asm_config_info()
     base_arch = llvm_config.get("BaseArchitecture", "rv32")
     extension_versions = utils.get_extension_versions(attributes, base_arch)
 
@@ -304,9 +304,9 @@ def _write_header(
         from tools.testing import parse
 
         # Parse instructions to get dependency instruction details
-        cores = parse.get_cores_element(args.adl_file_path)
-        all_instructions = parse.parse_instructions(cores)
-        instrfields = parse.parse_instrfields(cores)
+        adl_model = parse.load_adl_model(args.adl_file_path)
+        all_instructions = adl_model.instructions
+        instrfields = adl_model.instrfields
 
         # Create instruction map
         instruction_map = {instr.name: instr for instr in all_instructions}
@@ -21,21 +21,21 @@ def generate_reloc_references() -> None:
 
     # Get command line arguments
     args = parse.parse_relocation_command_line_args()
-    cores = parse.get_cores_element(args.adl_file_path)
+    adl_model = parse.load_adl_model(args.adl_file_path)
 
     # Parse ADL data
     llvm_config = utils.load_llvm_config()
 
     # Parse all instructions first (before filtering)
-    all_instructions = parse.parse_instructions(cores)
+    all_instructions = adl_model.instructions
 
     # Filter instructions based on extensions
     instructions = utils.filter_instructions(
         all_instructions, llvm_config, args.extensions
     )
 
-    relocations = parse.parse_relocations(cores)
-    instrfields = parse.parse_instrfields(cores)
+    relocations = adl_model.relocations
+    instrfields = adl_model.instrfields
 
     # Create mappings
     instruction_map = {instr.name: instr for instr in instructions}
@@ -250,13 +250,13 @@ def generate_labels() -> None:
 
     # Get the command line arguments using the new parser
     args = parse.parse_relocation_command_line_args()
-    cores = parse.get_cores_element(args.adl_file_path)
+    adl_model = parse.load_adl_model(args.adl_file_path)
 
     # Parse required data
     instructions = utils.filter_instructions(
-        parse.parse_instructions(cores), utils.load_llvm_config(), args.extensions
+        adl_model.instructions, utils.load_llvm_config(), args.extensions
     )
-    instrfields = parse.parse_instrfields(cores)
+    instrfields = adl_model.instrfields
 
     # Create instrfield mapping for quick lookup
     instrfield_map = {field.name: field for field in instrfields}
@@ -364,19 +364,19 @@ def write_header() -> None:
 
     args = parse.parse_relocation_command_line_args()
     llvm_config = utils.load_llvm_config()
-    cores = parse.get_cores_element(args.adl_file_path)
-    architecture, attributes, mattrib = parse.asm_config_info(cores)
+    adl_model = parse.load_adl_model(args.adl_file_path)
+    architecture, attributes, mattrib = adl_model.asm_config_info()
 
     # Parse all instructions first (before filtering)
-    all_instructions = parse.parse_instructions(cores)
+    all_instructions = adl_model.instructions
 
     # Filter instructions based on extensions
     instructions = utils.filter_instructions(
         all_instructions, llvm_config, args.extensions
     )
 
-    instrfields = parse.parse_instrfields(cores)
-    relocations = parse.parse_relocations(cores)
+    instrfields = adl_model.instrfields
+    relocations = adl_model.relocations
 
     # Get relocation-instruction mapping using filtered instructions
     relocations_instructions_map = utils.get_relocation_instruction_mapping(
@@ -464,8 +464,8 @@ def generate_data_relocations() -> None:
     args = parse.parse_relocation_command_line_args()
 
     # Parse relocations from ADL file
-    cores = parse.get_cores_element(args.adl_file_path)
-    relocations = parse.parse_relocations(cores)
+    adl_model = parse.load_adl_model(args.adl_file_path)
+    relocations = adl_model.relocations
 
     # Process each relocation that has a directive
     for relocation in relocations:
@@ -524,21 +524,21 @@ def generate_relocations() -> None:
 
     # Get the command line arguments
     args = parse.parse_relocation_command_line_args()
-    cores = parse.get_cores_element(args.adl_file_path)
+    adl_model = parse.load_adl_model(args.adl_file_path)
 
     # Load LLVM configuration and parse ADL data
     llvm_config = utils.load_llvm_config()
 
     # Parse all instructions (before filtering)
-    all_instructions = parse.parse_instructions(cores)
+    all_instructions = adl_model.instructions
 
     # Filter instructions based on extensions
     instructions = utils.filter_instructions(
         all_instructions, llvm_config, args.extensions
     )
 
-    instrfields = parse.parse_instrfields(cores)
-    relocations = parse.parse_relocations(cores)
+    instrfields = adl_model.instrfields
+    relocations = adl_model.relocations
 
     # Create necessary mappings
     instrfield_map = {field.name: field for field in instrfields}
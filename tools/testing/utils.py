@@ -1,85 +1,30 @@
 # Copyright 2023-2026 NXP
 # SPDX-License-Identifier: BSD-2-Clause
 
+import concurrent.futures
+import multiprocessing
 import os
 import re
+import numpy as np
 from dataclasses import dataclass, field
 from datetime import datetime
 from importlib.resources import files
 from pathlib import Path
 from tools import config
-from typing import List, Dict, Tuple, Optional
 
+# The classes of the parsed ADL model are shared with the TD generator
+from tools.adl_model import (
+    AdlModel,
+    Alias,
+    EnumOption,
+    Instruction,
+    InstrField,
+    Relocation,
+)
+from typing import Any, Callable, List, Dict, Mapping, Tuple, Optional
 
-### Data Classes
-
-
-@dataclass
-class EnumOption:
-    """Represents an enumerated option with a name-value pair."""
-
-    name: str
-    value: str
-
-
-@dataclass
-class InstrField:
-    """Represents an instruction field with its encoding properties and constraints."""
-
-    name: str
-    ranges: List[List[int]] = field(default_factory=list)
-    width: Optional[int] = None
-    size: Optional[int] = None
-    shift: Optional[int] = None
-    offset: Optional[int] = None
-    sign_extension: Optional[int] = None
-    mask: Optional[str] = None
-    enumerated: List[EnumOption] = field(default_factory=list)
-    addr: Optional[str] = None
-    display: Optional[str] = None
-    type: Optional[str] = None
-    ref: Optional[str] = None
-    signed: Optional[str] = None
-    reloc: List[str] = field(default_factory=list)
-
-
-@dataclass
-class Alias:
-    """Represents an alias mapping for an instruction."""
-
-    name: str
-    fields: Dict[str, Optional[str]]
-
-
-@dataclass
-class Instruction:
-    """Represents a machine instruction with metadata and structure."""
-
-    name: str
-    width: int
-    syntax: str
-    dsyntax: str
-    attributes: List[str]
-    fields: Optional[Dict[str, Optional[str]]]
-    inputs: List[str]
-    outputs: List[str]
-    aliases: Optional[List[Alias]] = field(default_factory=list)
-    excluded_values: Optional[Dict[str, Optional[str]]] = None
-
-
-@dataclass
-class Relocation:
-    """Represents a relocation with its properties and encoding details."""
 
-    name: str
-    abbrev: str
-    field_width: int
-    pcrel: str
-    value: int
-    right_shift: int
-    action: str
-    directive: str
-    dependency: List[str] = field(default_factory=list)
+### Data Classes
 
 
 @dataclass
@@ -91,6 +36,13 @@ class EncodingCommandLineArgs:
     extensions: list[str]
     output_dir: str
     display_extensions: bool
+    no_cache: bool = False
+    two_pass: bool = False
+    jobs: int = 1
+    coverage: str = "sweep"
+    random_count: int = 0
+    coverage_budget: int = 4096
+    seed: int = 0
 
 
 @dataclass
@@ -103,38 +55,33 @@ class RelocationCommandLineArgs:
     extensions: list[str]
     output_dir: str
     display_extensions: bool
+    no_cache: bool = False
 
 
 ### Configuration
 
-_llvm_config_cache = None
-
 
-def load_llvm_config() -> Dict[str, str]:
+def load_llvm_config() -> Mapping[str, Any]:
     """
-    Loads and caches the LLVM configuration environment.
+    Loads the LLVM configuration environment.
 
     This function reads configuration files from the `tools` package directory:
     - `config.txt`
     - `llvm_config.txt`
 
-    It uses a global cache to avoid reloading the configuration on subsequent calls.
+    The configuration is shared with the TD generators through config.load_config,
+    which parses the files again only when one of them changes.
 
     Returns:
-        dict: A dictionary representing the LLVM configuration environment.
+        Mapping: A read-only mapping representing the LLVM configuration environment.
 
     Raises:
         FileNotFoundError: If the configuration files are not found.
     """
-    global _llvm_config_cache
-    if _llvm_config_cache is None:
-        tools_pkg = files("tools")
-        config_path = tools_pkg / "config.txt"
-        llvm_config_path = tools_pkg / "llvm_config.txt"
-        _llvm_config_cache = config.config_environment(
-            str(config_path), str(llvm_config_path)
-        )
-    return _llvm_config_cache
+    tools_pkg = files("tools")
+    config_path = tools_pkg / "config.txt"
+    llvm_config_path = tools_pkg / "llvm_config.txt"
+    return config.load_config(str(config_path), str(llvm_config_path))
 
 
 ### Instruction Processing
@@ -142,7 +89,7 @@ def load_llvm_config() -> Dict[str, str]:
 
 def filter_instructions(
     instructions: List[Instruction],
-    llvm_config_dict: Dict[str, str],
+    llvm_config_dict: Mapping[str, Any],
     target_extensions: Optional[List[str]] = None,
 ) -> List[Instruction]:
     """
@@ -600,6 +547,182 @@ def calculate_instruction_reference(
     return reference
 
 
+@dataclass
+class InstructionEncoder:
+    """
+    Static encoder of an instruction, built by compile_instruction_encoder().
+
+    Encoding a test case ORs the operand bits into the constant bits of the
+    instruction, using the masks and shifts computed once when compiling.
+    """
+
+    ## Bits of the constant fields (opcode, funct3...)
+    constant: int = 0
+    ## Operand name and encoding of each enumerated value, for registers and enumerated immediates
+    enumerated: List[Tuple[str, Dict[str, int]]] = field(default_factory=list)
+    ## Operand name and encoding of each enumerated option number, used by encode_batch()
+    enumerated_numbers: List[Tuple[str, Dict[int, int]]] = field(
+        default_factory=list
+    )
+    ## Operand name and (mask, shift right, shift left) of each range, for immediates
+    immediates: List[Tuple[str, List[Tuple[int, int, int]]]] = field(
+        default_factory=list
+    )
+
+    def encode(self, operand_values: Dict[str, str]) -> int:
+        """
+        Calculate the reference value of a test case.
+
+        Args:
+            operand_values: Dictionary of operand values from the test line
+
+        Returns:
+            int: The calculated reference value, as calculate_instruction_reference() does
+        """
+        reference = self.constant
+        for operand_key, encodings in self.enumerated:
+            reference |= encodings.get(operand_values.get(operand_key), 0)
+        for operand_key, ranges in self.immediates:
+            operand_value = int(operand_values.get(operand_key, "0"), 16)
+            for mask, right, left in ranges:
+                reference |= ((mask & operand_value) >> right) << left
+        return reference
+
+    def encode_batch(self, operand_values: Dict[str, Any]) -> np.ndarray:
+        """
+        Calculate the reference values of many test cases at once.
+
+        Every operand is given as an array of uint64 values, one per test case
+        (signed integers are taken modulo 2**64, as two's complement). An
+        immediate is the value of the operand, a register or an enumerated
+        immediate is the number of its enumerated option (5 for x5); numbers
+        which are not enumerated options encode as 0, like unknown values in
+        encode(). The arrays are broadcast against each other, and a missing
+        operand encodes as 0.
+
+        Args:
+            operand_values: Dictionary of operand names to arrays of values
+
+        Returns:
+            np.ndarray: The uint64 reference value of every test case
+        """
+        arrays = {
+            operand_key: np.asarray(values).astype(np.uint64, copy=False)
+            for operand_key, values in operand_values.items()
+        }
+        shape = np.broadcast_shapes(*(values.shape for values in arrays.values()))
+        references = np.full(shape, self.constant, dtype=np.uint64)
+        for operand_key, encodings in self.enumerated_numbers:
+            if operand_key not in arrays:
+                continue
+            # Lookup table indexed by the option number, 0 for the other numbers
+            numbers = [number for number in encodings if number >= 0]
+            table = np.zeros(max(numbers, default=-1) + 2, dtype=np.uint64)
+            for number in numbers:
+                table[number] = encodings[number]
+            indices = np.minimum(arrays[operand_key], np.uint64(len(table) - 1))
+            references |= table[indices.astype(np.intp)]
+        for operand_key, ranges in self.immediates:
+            if operand_key not in arrays:
+                continue
+            values = arrays[operand_key]
+            for mask, right, left in ranges:
+                references |= ((values & np.uint64(mask)) >> np.uint64(right)) << np.uint64(
+                    left
+                )
+        return references
+
+
+def compile_instruction_encoder(
+    fields, instrfield_map, is_alias=False
+) -> InstructionEncoder:
+    """
+    Compile the fields of an instruction into a static encoder.
+
+    The encoder returns the same values as calculate_instruction_reference(),
+    which remains the reference implementation.
+
+    Args:
+        fields: Dictionary of field names to values
+        instrfield_map: Dictionary mapping field names to instrfield objects
+        is_alias: Boolean indicating if this is for an alias instruction
+
+    Returns:
+        InstructionEncoder: The encoder of the instruction
+    """
+    default_mask = 0xFFFFFFFF
+    encoder = InstructionEncoder()
+
+    for field_name, field_value in fields.items():
+        if field_name not in instrfield_map:
+            continue  # Field not defined in ADL
+
+        instrfield = instrfield_map[field_name]
+        shift = instrfield.shift or 0
+        range_masks = [
+            (
+                (default_mask << int(range_vals[1]))
+                ^ (default_mask << (int(range_vals[0]) + 1))
+            )
+            & default_mask
+            for range_vals in reversed(instrfield.ranges)
+        ]
+
+        if is_alias:
+            is_constant = isinstance(field_value, int) or (
+                isinstance(field_value, str) and field_value.lstrip("-").isdigit()
+            )
+        else:
+            is_constant = field_value is not None
+
+        if is_constant:
+            for mask, range_vals in zip(range_masks, reversed(instrfield.ranges)):
+                encoder.constant |= mask & (int(field_value) << range_vals[1])
+            continue
+
+        operand_key = field_name if not is_alias else field_value
+        if instrfield.type == "regfile" or (
+            instrfield.type == "imm" and instrfield.enumerated
+        ):
+            # The first enumerated option of a value wins, as in the linear scan
+            encodings: Dict[str, int] = {}
+            number_encodings: Dict[int, int] = {}
+            for enum in instrfield.enumerated:
+                bits = 0
+                for mask, range_vals in zip(
+                    range_masks, reversed(instrfield.ranges)
+                ):
+                    bits |= mask & (int(enum.name) << range_vals[1] >> shift)
+                encodings.setdefault(enum.value, bits)
+                number_encodings.setdefault(int(enum.name), bits)
+            if range_masks:
+                encoder.enumerated.append((operand_key, encodings))
+                encoder.enumerated_numbers.append((operand_key, number_encodings))
+        elif instrfield.type == "imm":
+            ranges = []
+            old_range_diff = 0
+            for i, range_vals in enumerate(reversed(instrfield.ranges)):
+                range_diff = int(range_vals[0]) - int(range_vals[1])
+                if i == 0:
+                    mask = (
+                        (default_mask << shift)
+                        ^ (default_mask << (shift + range_diff + 1))
+                    ) & default_mask
+                    ranges.append((mask, shift, range_vals[1]))
+                    old_range_diff = range_diff + shift
+                else:
+                    mask = (
+                        (default_mask << (old_range_diff + 1))
+                        ^ (default_mask << (old_range_diff + 2 + range_diff))
+                    ) & default_mask
+                    ranges.append((mask, old_range_diff + 1, range_vals[1]))
+                    old_range_diff += range_diff + 1
+            if ranges:
+                encoder.immediates.append((operand_key, ranges))
+
+    return encoder
+
+
 ### String Processing
 
 
@@ -837,3 +960,64 @@ def prepare_fixup_refs_output_folder(
         folder = os.path.join(base_dir, f"fixup_results_{adl_file_name}", "refs_all")
     os.makedirs(folder, exist_ok=True)
     return folder
+
+
+def group_instructions_by_name(instructions: List[Instruction]) -> List[List[int]]:
+    """
+    Group the positions of instructions writing the same output files.
+
+    Args:
+        instructions: List of Instruction objects
+
+    Returns:
+        List[List[int]]: The positions of the instructions of each name, in the
+            order in which the names first appear
+    """
+    groups: Dict[str, List[int]] = {}
+    for index, instruction in enumerate(instructions):
+        groups.setdefault(instruction.name, []).append(index)
+    return list(groups.values())
+
+
+def run_instruction_jobs(
+    worker: Callable[[Any], Any],
+    initializer: Callable[[Any], None],
+    shared: Any,
+    tasks: List[Any],
+    jobs: int = 1,
+) -> List[Any]:
+    """
+    Run a worker function on every task, serially or in a process pool.
+
+    The state shared by the tasks (parsed model, InstrField map...) is installed
+    by initializer(shared) in every worker process. The pool forks its workers
+    where the platform supports it, so the state is inherited instead of being
+    pickled for every process. The tasks must write disjoint files: their output
+    does not depend on the order in which they run. Workers should return their
+    messages instead of printing them, so that the caller reports them in the
+    order of a serial run.
+
+    Args:
+        worker: Function called with each task
+        initializer: Function installing the shared state in the current process
+        shared: The state passed to the initializer
+        tasks: The tasks, in the order of a serial run
+        jobs: Number of worker processes, 1 to run the tasks in the current process
+
+    Returns:
+        List[Any]: The result of the worker for every task, in the order of the tasks
+    """
+    if jobs <= 1 or len(tasks) <= 1:
+        initializer(shared)
+        return [worker(task) for task in tasks]
+    context = None
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=context,
+        initializer=initializer,
+        initargs=(shared,),
+    ) as pool:
+        return list(pool.map(worker, tasks, chunksize=chunksize))